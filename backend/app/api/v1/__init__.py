@@ -3,6 +3,9 @@
 from fastapi import APIRouter
 from . import browser
 from . import system
+from . import profiles
+from . import tasks
+from . import events
 
 # Create v1 router
 router = APIRouter()
@@ -10,5 +13,8 @@ router = APIRouter()
 # Register v1 endpoints
 router.include_router(browser.router, prefix="/browser", tags=["browser"])
 router.include_router(system.router, prefix="/system", tags=["system"])
+router.include_router(profiles.router, prefix="/profiles", tags=["profiles"])
+router.include_router(tasks.router, prefix="/tasks", tags=["tasks"])
+router.include_router(events.router, prefix="/events", tags=["events"])
 
 __all__ = ['router']
@@ -1,60 +1,185 @@
 """Browser management API endpoints."""
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from typing import List
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Tuple
+import asyncio
+import json
 from loguru import logger
 
+from app.config import Config
 from app.core.browser_manager import BrowserManager
-from app.schemas.browser import BrowserResponse, CreateInstanceRequest, VisitUrlRequest
+from app.core.admission import AdmissionRejected
+from app.browser.launch_profiles import LaunchProfiles
+from app.browser.page_load import normalize_wait
+from app.browser.resource_blocking import normalize_policy
+from app.schemas.browser import (
+    BrowserResponse,
+    CreateInstanceRequest,
+    VisitUrlRequest,
+    BatchVisitRequest,
+    ZoomRequest,
+    LaunchJobResponse,
+    LaunchProfileResponse,
+    ResourcePolicy
+)
 from app.core.browser_manager_instance import get_browser_manager
 
 router = APIRouter()
 
+def _resource_policy(policy: Optional[ResourcePolicy]) -> Optional[dict]:
+    """校验资源拦截策略并展开预设，无效时返回400"""
+    try:
+        return normalize_policy(policy.model_dump() if policy else None)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def _load_condition(wait_until: Optional[str], selector: Optional[str]) -> Tuple[str, Optional[str]]:
+    """校验页面加载完成条件，无效时返回400"""
+    try:
+        return normalize_wait(wait_until, selector)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 # 获取浏览器管理器实例
 browser_manager = get_browser_manager()
 
-@router.post("/instances", response_model=List[BrowserResponse])
+@router.post("/instances", response_model=LaunchJobResponse, status_code=202)
 async def create_instances(request: CreateInstanceRequest):
-    """创建新的浏览器实例"""
+    """创建新的浏览器实例（后台任务），立即返回任务ID；资源不足且不排队时返回503；ephemeral 实例的配置文件保存在内存中；launch_profile 选择启动配置"""
     try:
-        instances = []
-        for i in range(request.count):
-            instance_id = str(len(browser_manager.chrome_processes) + 1)
-            success = browser_manager.create_instance(instance_id)
-            if success:
-                instance = browser_manager.get_instance_info(instance_id)
-                if instance:
-                    instances.append(instance)
-                else:
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"Failed to get instance info for {instance_id}"
-                    )
-            else:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Failed to create instance {instance_id}"
-                )
-        return instances
+        launch_profile = LaunchProfiles.resolve(request.launch_profile)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    resource_policy = _resource_policy(request.resource_policy)
+    if Config.ADMISSION_ENABLED and Config.ADMISSION_QUEUE_TIMEOUT <= 0:
+        reason = browser_manager.admission.check()
+        if reason:
+            raise HTTPException(
+                status_code=503,
+                detail=reason,
+                headers={"Retry-After": str(Config.ADMISSION_RETRY_AFTER)}
+            )
+    try:
+        return browser_manager.launch_jobs.submit(
+            request.count, ephemeral=request.ephemeral, persist=request.persist,
+            launch_profile=launch_profile, resource_policy=resource_policy
+        )
     except Exception as e:
         logger.error(f"Error creating instances: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/launch-profiles", response_model=List[LaunchProfileResponse])
+async def get_launch_profiles():
+    """获取可用的启动配置（standard、headless、density）及其 Chrome 参数"""
+    return LaunchProfiles.describe()
+
+@router.get("/jobs", response_model=List[LaunchJobResponse])
+async def get_jobs():
+    """获取所有实例创建任务"""
+    return browser_manager.launch_jobs.list_jobs()
+
+@router.get("/jobs/{job_id}", response_model=LaunchJobResponse)
+async def get_job(job_id: str):
+    """获取实例创建任务的进度"""
+    job = browser_manager.launch_jobs.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@router.get("/jobs/{job_id}/events")
+async def stream_job(job_id: str):
+    """以 Server-Sent Events 推送实例创建任务的进度"""
+    if not browser_manager.launch_jobs.get_job(job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def events():
+        version = None
+        while True:
+            job = browser_manager.launch_jobs.get_job(job_id)
+            if not job:
+                return
+            if job['version'] != version:
+                version = job['version']
+                yield f"data: {json.dumps(LaunchJobResponse(**job).model_dump())}\n\n"
+            if job['finished_at']:
+                return
+            await asyncio.sleep(0.25)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
 @router.get("/instances", response_model=List[BrowserResponse])
-async def get_instances():
-    """获取所有浏览器实例"""
+async def get_instances(max_age: Optional[float] = Query(None, ge=0)):
+    """获取所有浏览器实例，max_age 为可接受的缓存状态最大时长（秒）"""
     try:
-        instances = browser_manager.get_all_instances()
+        instances = await browser_manager.get_all_instances(max_age)
         return list(instances.values())
     except Exception as e:
         logger.error(f"Error getting instances: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/instances/batch/visit")
+async def batch_visit_url(request: BatchVisitRequest):
+    """批量控制多个浏览器实例并发访问指定URL"""
+    if not request.instance_ids:
+        raise HTTPException(status_code=400, detail="No instance IDs provided")
+
+    wait_until, selector = _load_condition(request.wait_until, request.selector)
+    return await browser_manager.batch_visit(
+        request.instance_ids,
+        str(request.url),
+        max_parallel=request.max_parallel,
+        timeout=request.timeout,
+        resource_policy=_resource_policy(request.resource_policy),
+        wait_until=wait_until,
+        selector=selector,
+        humanize=request.humanize
+    )
+
+@router.delete("/instances/batch")
+async def batch_delete_instances(instance_ids: List[str]):
+    """批量删除多个浏览器实例"""
+    if not instance_ids:
+        raise HTTPException(status_code=400, detail="No instance IDs provided")
+
+    loop = asyncio.get_running_loop()
+    results = []
+    for instance_id in instance_ids:
+        try:
+            success = await loop.run_in_executor(None, browser_manager.delete_instance, instance_id)
+            results.append({
+                "instance_id": instance_id,
+                "success": success
+            })
+        except Exception as e:
+            logger.error(f"Error deleting instance {instance_id}: {str(e)}")
+            results.append({
+                "instance_id": instance_id,
+                "success": False,
+                "error": str(e)
+            })
+    return results
+
+@router.get("/instances/metrics")
+async def get_all_instance_metrics():
+    """获取所有实例进程树的资源占用（按内存从高到低排序）"""
+    metrics = browser_manager.process_metrics.get_all()
+    return sorted(
+        ({'instance_id': instance_id, **m} for instance_id, m in metrics.items()),
+        key=lambda m: m['rss_mb'],
+        reverse=True
+    )
+
+@router.get("/instances/resources")
+async def get_all_resource_stats():
+    """获取所有实例的资源拦截策略及拦截/放行请求计数"""
+    return browser_manager.get_resource_stats()
+
 @router.get("/instances/{instance_id}", response_model=BrowserResponse)
-async def get_instance(instance_id: str):
-    """获取指定浏览器实例的信息"""
+async def get_instance(instance_id: str, max_age: Optional[float] = Query(None, ge=0)):
+    """获取指定浏览器实例的信息，max_age 为可接受的缓存状态最大时长（秒）"""
     try:
-        instance = browser_manager.get_instance_info(instance_id)
+        instance = await browser_manager.get_instance_info(instance_id, max_age)
         if not instance:
             raise HTTPException(status_code=404, detail="Instance not found")
         return instance
@@ -65,10 +190,13 @@ async def get_instance(instance_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/instances/{instance_id}")
-async def delete_instance(instance_id: str):
-    """删除指定的浏览器实例"""
+async def delete_instance(instance_id: str, recycle: bool = False):
+    """删除指定的浏览器实例，recycle=true 时立即删除预热池实例的配置文件，由预热池以全新配置文件补充"""
     try:
-        success = browser_manager.delete_instance(instance_id)
+        loop = asyncio.get_running_loop()
+        success = await loop.run_in_executor(
+            None, browser_manager.delete_instance, instance_id, recycle
+        )
         if not success:
             raise HTTPException(status_code=404, detail="Instance not found")
         return {"status": "success"}
@@ -80,9 +208,14 @@ async def delete_instance(instance_id: str):
 
 @router.post("/instances/{instance_id}/visit")
 async def visit_url(instance_id: str, request: VisitUrlRequest):
-    """控制浏览器实例访问指定URL"""
+    """控制浏览器实例访问指定URL；resource_policy 指定本次访问拦截的资源；wait_until 指定页面加载完成条件（domcontentloaded、load、networkidle、selector）；humanize 为 true 时模拟人类操作"""
+    resource_policy = _resource_policy(request.resource_policy)
+    wait_until, selector = _load_condition(request.wait_until, request.selector)
     try:
-        success = await browser_manager.visit_url(instance_id, str(request.url))
+        success = await browser_manager.visit_url(
+            instance_id, str(request.url), resource_policy, wait_until, selector, request.timeout,
+            request.humanize
+        )
         if not success:
             raise HTTPException(status_code=404, detail="Instance not found")
         return {"status": "success"}
@@ -92,19 +225,70 @@ async def visit_url(instance_id: str, request: VisitUrlRequest):
         logger.error(f"Error visiting URL for instance {instance_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/instances/{instance_id}/zoom")
+async def set_zoom_level(instance_id: str, request: ZoomRequest):
+    """设置浏览器实例的缩放比例"""
+    try:
+        success = await browser_manager.set_zoom_level(instance_id, request.zoom_level)
+        if not success:
+            raise HTTPException(status_code=404, detail="Instance not found")
+        return {"status": "success"}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error setting zoom for instance {instance_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/instances/{instance_id}/focus")
+async def focus_window(instance_id: str):
+    """将浏览器实例窗口置于前台"""
+    try:
+        success = await browser_manager.focus_window(instance_id)
+        if not success:
+            raise HTTPException(status_code=404, detail="Instance not found")
+        return {"status": "success"}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error focusing instance {instance_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/instances/{instance_id}/metrics")
+async def get_instance_metrics(instance_id: str):
+    """获取指定实例进程树的CPU、内存、渲染进程数和文件描述符占用"""
+    loop = asyncio.get_running_loop()
+    metrics = await loop.run_in_executor(None, browser_manager.get_instance_metrics, instance_id)
+    if metrics is None:
+        raise HTTPException(status_code=404, detail="Instance not found")
+    return metrics
+
+@router.get("/instances/{instance_id}/resources")
+async def get_resource_stats(instance_id: str):
+    """获取指定实例的资源拦截策略及拦截/放行请求计数"""
+    stats = browser_manager.get_resource_stats(instance_id)
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Instance not found")
+    return stats
+
 @router.post("/instances/{instance_id}/start", response_model=BrowserResponse)
 async def start_instance(instance_id: str):
     """启动浏览器实例"""
     try:
-        success = browser_manager.create_instance(instance_id)
+        success = await browser_manager.launch_jobs.launch(instance_id)
         if not success:
             raise HTTPException(status_code=404, detail="Instance not found or cannot be started")
-        instance = browser_manager.get_instance_info(instance_id)
+        instance = await browser_manager.get_instance_info(instance_id)
         if not instance:
             raise HTTPException(status_code=404, detail="Instance info not found")
         return instance
     except HTTPException:
         raise
+    except AdmissionRejected as e:
+        raise HTTPException(
+            status_code=503,
+            detail=e.reason,
+            headers={"Retry-After": str(int(e.retry_after))}
+        )
     except Exception as e:
         logger.error(f"Error starting instance {instance_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -113,7 +297,8 @@ async def start_instance(instance_id: str):
 async def stop_instance(instance_id: str):
     """停止浏览器实例"""
     try:
-        success = browser_manager.delete_instance(instance_id)
+        loop = asyncio.get_running_loop()
+        success = await loop.run_in_executor(None, browser_manager.delete_instance, instance_id)
         if not success:
             raise HTTPException(status_code=404, detail="Instance not found")
         return {"status": "success"}
@@ -123,48 +308,33 @@ async def stop_instance(instance_id: str):
         logger.error(f"Error stopping instance {instance_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/instances/batch/visit")
-async def batch_visit_url(instance_ids: List[str], request: VisitUrlRequest):
-    """批量控制多个浏览器实例访问指定URL"""
-    if not instance_ids:
-        raise HTTPException(status_code=400, detail="No instance IDs provided")
+@router.post("/instances/{instance_id}/hibernate")
+async def hibernate_instance(instance_id: str):
+    """休眠浏览器实例：关闭浏览器进程但保留配置文件与页面状态，下次操作时自动恢复"""
+    loop = asyncio.get_running_loop()
+    success = await loop.run_in_executor(None, browser_manager.hibernate_instance, instance_id)
+    if not success:
+        raise HTTPException(status_code=409, detail="Instance not running or busy")
+    return {"status": "hibernated"}
 
-    results = []
-    for instance_id in instance_ids:
-        try:
-            success = await browser_manager.visit_url(instance_id, str(request.url))
-            results.append({
-                "instance_id": instance_id,
-                "success": success
-            })
-        except Exception as e:
-            logger.error(f"Error visiting URL for instance {instance_id}: {str(e)}")
-            results.append({
-                "instance_id": instance_id,
-                "success": False,
-                "error": str(e)
-            })
-    return results
-
-@router.delete("/instances/batch")
-async def batch_delete_instances(instance_ids: List[str]):
-    """批量删除多个浏览器实例"""
-    if not instance_ids:
-        raise HTTPException(status_code=400, detail="No instance IDs provided")
+@router.post("/instances/{instance_id}/resume", response_model=BrowserResponse)
+async def resume_instance(instance_id: str):
+    """恢复已休眠的浏览器实例"""
+    if instance_id not in browser_manager.hibernated and instance_id not in browser_manager.chrome_processes:
+        raise HTTPException(status_code=404, detail="Instance not found")
+    try:
+        success = await browser_manager.resume(instance_id)
+    except AdmissionRejected as e:
+        raise HTTPException(
+            status_code=503,
+            detail=e.reason,
+            headers={"Retry-After": str(int(e.retry_after))}
+        )
+    if not success:
+        raise HTTPException(status_code=500, detail="Failed to resume instance")
+    return await browser_manager.get_instance_info(instance_id)
 
-    results = []
-    for instance_id in instance_ids:
-        try:
-            success = browser_manager.delete_instance(instance_id)
-            results.append({
-                "instance_id": instance_id,
-                "success": success
-            })
-        except Exception as e:
-            logger.error(f"Error deleting instance {instance_id}: {str(e)}")
-            results.append({
-                "instance_id": instance_id,
-                "success": False,
-                "error": str(e)
-            })
-    return results
+@router.get("/pool")
+async def get_pool_stats():
+    """获取预热实例池状态"""
+    return browser_manager.get_pool_stats()
@@ -0,0 +1,56 @@
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from loguru import logger
+import asyncio
+
+from app.config import Config
+from app.core.browser_manager_instance import get_browser_manager
+
+router = APIRouter()
+
+# 获取浏览器管理器实例
+browser_manager = get_browser_manager()
+
+async def _send_snapshot(websocket: WebSocket) -> int:
+    """发送当前状态快照，返回快照对应的事件序号"""
+    seq = browser_manager.events.seq
+    snapshot = browser_manager.get_live_snapshot()
+    await websocket.send_json({"type": "snapshot", "seq": seq, **snapshot})
+    return seq
+
+@router.websocket("/ws")
+async def event_stream(websocket: WebSocket):
+    """
+    推送实例与系统指标的增量事件
+
+    连接后先发送一次完整快照，之后只推送变化：instance.created、instance.stopped、
+    instance.navigated、instance.updated、instance.hibernated、instance.crashed
+    以及周期性的 metrics 增量。客户端处理过慢导致事件积压时会重新收到快照。
+    所有连接共享同一个状态跟踪循环，连接数量不增加浏览器或系统的采样开销。
+    """
+    await websocket.accept()
+    subscription = browser_manager.events.subscribe(Config.EVENTS_QUEUE_SIZE)
+    # 客户端不需要发送消息，接收端仅用于及时发现断开
+    receiver = asyncio.create_task(websocket.receive_text())
+    try:
+        seq = await _send_snapshot(websocket)
+        while True:
+            if subscription.overflowed:
+                subscription.reset()
+                seq = await _send_snapshot(websocket)
+            getter = asyncio.create_task(subscription.get())
+            done, _ = await asyncio.wait({getter, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            if receiver in done:
+                getter.cancel()
+                receiver.result()
+                receiver = asyncio.create_task(websocket.receive_text())
+                continue
+            event = getter.result()
+            if event['seq'] > seq:
+                await websocket.send_json(event)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.warning(f"Event stream closed: {str(e)}")
+    finally:
+        receiver.cancel()
+        browser_manager.events.unsubscribe(subscription)
@@ -0,0 +1,125 @@
+"""Profile snapshot API endpoints."""
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Optional
+import asyncio
+from loguru import logger
+
+from app.core.browser_manager_instance import get_browser_manager
+from app.utils.profile_snapshot import ChunkReader, SnapshotError
+
+router = APIRouter()
+
+browser_manager = get_browser_manager()
+
+def _profile_manager():
+    return browser_manager.driver_manager.profile_manager
+
+def _ensure_stopped(profile_id: str) -> None:
+    if browser_manager.is_profile_in_use(profile_id):
+        raise HTTPException(status_code=409, detail=f"Profile {profile_id} is in use")
+
+def _log_aborted_import(future: asyncio.Future) -> None:
+    if not future.cancelled() and future.exception():
+        logger.warning(f"Snapshot import aborted: {str(future.exception())}")
+
+@router.get("/snapshots")
+async def list_snapshots(profile_id: Optional[str] = Query(None)):
+    """获取配置文件快照列表"""
+    return _profile_manager().snapshots.list(profile_id)
+
+@router.post("/{profile_id}/snapshots")
+async def create_snapshot(profile_id: str):
+    """为已停止的配置文件创建快照（仅存储变化的内容）"""
+    _ensure_stopped(profile_id)
+    loop = asyncio.get_running_loop()
+    try:
+        manifest = await loop.run_in_executor(None, _profile_manager().snapshot_profile, profile_id)
+    except SnapshotError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {k: v for k, v in manifest.items() if k not in ('files', 'state')}
+
+@router.get("/snapshots/{snapshot_id}/export")
+async def export_snapshot(snapshot_id: str, base: Optional[str] = Query(None)):
+    """以 gzip 压缩的 tar 流导出快照；指定 base 时只包含 base 中没有的内容"""
+    try:
+        chunks = _profile_manager().snapshots.export_stream(snapshot_id, base)
+    except SnapshotError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return StreamingResponse(
+        chunks,
+        media_type="application/gzip",
+        headers={"Content-Disposition": f'attachment; filename="{snapshot_id}.tar.gz"'}
+    )
+
+@router.post("/snapshots/import")
+async def import_snapshot(
+    request: Request,
+    profile_id: Optional[str] = Query(None),
+    restore: bool = Query(False)
+):
+    """流式导入快照归档；restore 为 true 时需指定 profile_id，将快照恢复到该配置文件"""
+    # The archive's own profile id belongs to the host that exported it, so
+    # restoring requires naming the local profile to overwrite
+    if restore and not profile_id:
+        raise HTTPException(status_code=400, detail="profile_id is required to restore an imported snapshot")
+    if restore:
+        _ensure_stopped(profile_id)
+    reader = ChunkReader()
+    loop = asyncio.get_running_loop()
+
+    def run_import():
+        manifest = _profile_manager().import_snapshot(reader, restore=False)
+        if restore:
+            if browser_manager.is_profile_in_use(profile_id):
+                raise SnapshotError(f"Profile {profile_id} is in use, snapshot imported but not restored")
+            _profile_manager().restore_snapshot(manifest['snapshot_id'], profile_id)
+        return manifest
+
+    future = loop.run_in_executor(None, run_import)
+    # Feed the body to the importer as it arrives, pausing while it catches up
+    try:
+        async for chunk in request.stream():
+            while not future.done() and not reader.feed(chunk):
+                await asyncio.sleep(0.01)
+            if future.done():
+                break
+        while not future.done() and not reader.feed(None):
+            await asyncio.sleep(0.01)
+    except BaseException:
+        # The upload broke off: fail the importer so it releases the snapshot store
+        reader.cancel()
+        future.add_done_callback(_log_aborted_import)
+        raise
+
+    try:
+        manifest = await future
+    except SnapshotError as e:
+        logger.warning(f"Snapshot import failed: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    return {k: v for k, v in manifest.items() if k not in ('files', 'state')}
+
+@router.post("/snapshots/{snapshot_id}/restore")
+async def restore_snapshot(snapshot_id: str, profile_id: Optional[str] = Query(None)):
+    """将快照恢复到已停止的配置文件"""
+    manifest = _profile_manager().snapshots.get(snapshot_id)
+    if manifest is None:
+        raise HTTPException(status_code=404, detail="Snapshot not found")
+    _ensure_stopped(profile_id or manifest['profile_id'])
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(
+            None, _profile_manager().restore_snapshot, snapshot_id, profile_id
+        )
+    except SnapshotError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "success", "snapshot_id": snapshot_id}
+
+@router.delete("/snapshots/{snapshot_id}")
+async def delete_snapshot(snapshot_id: str):
+    """删除快照及不再被引用的内容"""
+    loop = asyncio.get_running_loop()
+    if not await loop.run_in_executor(None, _profile_manager().snapshots.delete, snapshot_id):
+        raise HTTPException(status_code=404, detail="Snapshot not found")
+    return {"status": "success"}
@@ -1,58 +1,91 @@
-from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Query
 from typing import Dict
+import asyncio
 
-from app.core.browser_manager import BrowserManager
-from app.schemas.browser import SystemStats
+from app.core.browser_manager_instance import get_browser_manager
+from app.schemas.browser import SystemStats, SystemHistoryResponse
 router = APIRouter()
 
-class SystemStats(BaseModel):
-    total_instances: int
-    running_instances: int
-    cpu_usage: float
-    memory_usage: float
-    disk_usage: float
+# 获取浏览器管理器实例
+browser_manager = get_browser_manager()
 
 @router.get("/stats", response_model=SystemStats)
 async def get_system_stats():
-    """获取系统状态信息"""
-    instances = browser_manager.get_all_instances()
-    running_instances = sum(1 for i in instances.values() if i['status'] == 'running')
-    
-    return {
-        "total_instances": len(instances),
-        "running_instances": running_instances,
-        "cpu_usage": psutil.cpu_percent(),
-        "memory_usage": psutil.virtual_memory().percent,
-        "disk_usage": psutil.disk_usage('/').percent
-    }
+    """获取系统状态信息（实例数量来自内存记录，系统指标来自后台采样）"""
+    return browser_manager.get_system_stats()
 
 @router.get("/performance")
 async def get_performance_metrics():
-    """获取详细性能指标"""
+    """获取详细性能指标（最近一次后台采样）"""
+    sample = browser_manager.get_metrics_sampler().latest()
     return {
-        "cpu": {
-            "percent": psutil.cpu_percent(interval=1, percpu=True),
-            "frequency": psutil.cpu_freq()._asdict() if psutil.cpu_freq() else None,
-            "count": psutil.cpu_count()
-        },
-        "memory": {
-            "total": psutil.virtual_memory().total,
-            "available": psutil.virtual_memory().available,
-            "percent": psutil.virtual_memory().percent,
-            "used": psutil.virtual_memory().used,
-            "free": psutil.virtual_memory().free
-        },
-        "disk": {
-            "total": psutil.disk_usage('/').total,
-            "used": psutil.disk_usage('/').used,
-            "free": psutil.disk_usage('/').free,
-            "percent": psutil.disk_usage('/').percent
-        },
-        "network": {
-            "bytes_sent": psutil.net_io_counters().bytes_sent,
-            "bytes_recv": psutil.net_io_counters().bytes_recv,
-            "packets_sent": psutil.net_io_counters().packets_sent,
-            "packets_recv": psutil.net_io_counters().packets_recv
-        }
+        "timestamp": sample['timestamp'],
+        "cpu": sample['cpu'],
+        "memory": sample['memory'],
+        "disk": sample['disk'],
+        "network": sample['network']
     }
+
+@router.get("/history", response_model=SystemHistoryResponse)
+async def get_metrics_history(
+    window: float = Query(300, gt=0),
+    points: int = Query(120, ge=1, le=1000)
+):
+    """获取系统指标历史（降采样后的时间序列）"""
+    sampler = browser_manager.get_metrics_sampler()
+    return {
+        "interval": sampler.interval,
+        "window": window,
+        "points": sampler.history(window, points)
+    }
+
+@router.get("/admission")
+async def get_admission_stats():
+    """获取实例准入控制的资源预算与统计"""
+    return browser_manager.admission.get_stats()
+
+@router.get("/capacity")
+async def get_capacity():
+    """获取本机可容纳的实例余量（集群调度依据：内存余量、实例数、启动队列）"""
+    return browser_manager.get_capacity()
+
+@router.get("/driver")
+async def get_driver_info():
+    """获取 Chrome 与 ChromeDriver 的解析结果（路径、版本、来源）"""
+    return browser_manager.driver_manager.resolver.get_info()
+
+@router.get("/profile-template")
+async def get_profile_template():
+    """获取模板配置文件状态与克隆统计"""
+    return browser_manager.driver_manager.profile_manager.template.get_stats()
+
+@router.post("/profile-template/rebuild")
+async def rebuild_profile_template():
+    """重新构建模板配置文件"""
+    loop = asyncio.get_running_loop()
+    success = await loop.run_in_executor(None, browser_manager.driver_manager.build_profile_template)
+    if not success:
+        raise HTTPException(status_code=500, detail="Failed to build profile template")
+    return browser_manager.driver_manager.profile_manager.template.get_stats()
+
+@router.get("/maintenance")
+async def get_maintenance_stats():
+    """获取配置文件维护（缓存清理、磁盘配额、异步删除）的统计"""
+    return browser_manager.get_maintenance_stats()
+
+@router.post("/maintenance/run")
+async def run_maintenance():
+    """立即执行一次配置文件维护"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, browser_manager.run_maintenance)
+
+@router.get("/cache")
+async def get_cache_stats():
+    """获取共享 HTTP 缓存代理的命中率、节省流量与存储占用"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, browser_manager.get_cache_stats)
+
+@router.get("/event-loop")
+async def get_event_loop_stats():
+    """获取事件循环阻塞情况（累计阻塞时间、卡顿次数、延迟分位数）"""
+    return browser_manager.loop_monitor.get_stats()
@@ -0,0 +1,87 @@
+"""Visit task queue API endpoints."""
+
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional
+import asyncio
+
+from app.config import Config
+from app.core import sharding
+from app.core.browser_manager_instance import get_browser_manager
+from app.schemas.tasks import TaskResponse, VisitTaskBatchRequest, VisitTaskRequest
+
+router = APIRouter()
+
+browser_manager = get_browser_manager()
+
+def _check_target(instance_id: Optional[str]) -> None:
+    """Reject tasks aimed at instances that could never run them."""
+    if instance_id is None:
+        return
+    if not sharding.owns_instance(instance_id):
+        # Local shards share the task store, so the owning shard picks the task up
+        if Config.CLUSTER_AGENT:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Instance {instance_id} belongs to shard {sharding.shard_of(instance_id)}"
+            )
+        return
+    known = (
+        instance_id in browser_manager.chrome_processes
+        or instance_id in browser_manager.hibernated
+        or instance_id in browser_manager.launch_jobs.pending_instance_ids()
+    )
+    if not known:
+        raise HTTPException(status_code=404, detail=f"Instance {instance_id} not found")
+
+def _to_spec(task: VisitTaskRequest) -> dict:
+    spec = task.model_dump()
+    spec['url'] = str(task.url)
+    return spec
+
+@router.post("", response_model=TaskResponse, status_code=202)
+async def submit_task(request: VisitTaskRequest):
+    """提交一个访问任务到持久化队列（可指定优先级、截止时间、目标实例与重试策略）"""
+    _check_target(request.instance_id)
+    task_id = browser_manager.task_queue.submit([_to_spec(request)])[0]
+    return browser_manager.task_queue.get_task(task_id)
+
+@router.post("/batch", status_code=202)
+async def submit_tasks(request: VisitTaskBatchRequest):
+    """批量提交访问任务"""
+    for target in {task.instance_id for task in request.tasks}:
+        _check_target(target)
+    loop = asyncio.get_running_loop()
+    task_ids = await loop.run_in_executor(
+        None, browser_manager.task_queue.submit, [_to_spec(task) for task in request.tasks]
+    )
+    return {"count": len(task_ids), "task_ids": task_ids}
+
+@router.get("", response_model=List[TaskResponse])
+async def list_tasks(
+    status: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1, le=10000)
+):
+    """获取任务列表（最新提交的在前）"""
+    return browser_manager.task_queue.list_tasks(status, limit)
+
+@router.get("/stats")
+async def get_task_stats():
+    """获取队列深度与吞吐量"""
+    return browser_manager.task_queue.get_stats()
+
+@router.get("/{task_id}", response_model=TaskResponse)
+async def get_task(task_id: str):
+    """获取任务状态"""
+    task = browser_manager.task_queue.get_task(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
+
+@router.delete("/{task_id}")
+async def cancel_task(task_id: str):
+    """取消尚未开始的任务"""
+    if browser_manager.task_queue.cancel(task_id):
+        return {"message": f"Task {task_id} cancelled"}
+    if not browser_manager.task_queue.get_task(task_id):
+        raise HTTPException(status_code=404, detail="Task not found")
+    raise HTTPException(status_code=409, detail="Task has already started or finished")
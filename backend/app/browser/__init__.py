@@ -6,12 +6,14 @@ Contains all browser manipulation functionality.
 
 from .driver_manager import ChromeDriverManager
 from .fingerprint import FingerprintGenerator
+from .launch_profiles import LaunchProfiles
 from .stealth import StealthBrowser
 from .window_manager import WindowManager
 
 __all__ = [
     'ChromeDriverManager',
     'FingerprintGenerator',
+    'LaunchProfiles',
     'StealthBrowser',
     'WindowManager'
 ]
\ No newline at end of file
@@ -0,0 +1,272 @@
+# File: backend/app/browser/devtools.py
+"""
+Chrome DevTools Protocol client module.
+Talks to a page target directly over WebSocket, bypassing chromedriver.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import itertools
+import json
+import urllib.request
+from loguru import logger
+from selenium.webdriver import Chrome
+
+try:
+    import websockets
+except ImportError:  # Selenium remains the transport without websockets
+    websockets = None
+
+class DevToolsError(Exception):
+    """Raised when a DevTools command fails or the connection is lost."""
+
+class DevToolsClient:
+    """
+    Persistent, asyncio-based DevTools connection to one page target.
+    All methods must be awaited on the event loop that opened the connection.
+    """
+
+    def __init__(self, ws_url: str, timeout: float = 10):
+        """
+        Initialize the client.
+
+        Args:
+            ws_url: WebSocket debugger URL of the page target
+            timeout: Default timeout in seconds for commands
+        """
+        self.ws_url = ws_url
+        self.timeout = timeout
+        self._ws = None
+        self._reader: Optional[asyncio.Task] = None
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._listeners: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+        self.commands_sent = 0
+
+    @staticmethod
+    def available() -> bool:
+        """Whether the websockets dependency is installed."""
+        return websockets is not None
+
+    @classmethod
+    async def for_driver(cls, driver: Chrome, timeout: float = 10) -> "DevToolsClient":
+        """
+        Connect to the page target behind a Selenium driver.
+
+        Args:
+            driver: Chrome WebDriver instance
+            timeout: Default timeout in seconds for commands
+
+        Returns:
+            DevToolsClient: Connected client
+        """
+        if not cls.available():
+            raise DevToolsError("websockets is not installed")
+
+        address = driver.capabilities.get('goog:chromeOptions', {}).get('debuggerAddress')
+        if not address:
+            raise DevToolsError("Driver does not expose a debugger address")
+
+        # chromedriver uses DevTools target ids as window handles
+        handle = driver.current_window_handle
+        loop = asyncio.get_running_loop()
+        targets = await loop.run_in_executor(None, cls._list_targets, address, timeout)
+        pages = [t for t in targets if t.get('type') == 'page']
+        target = next((t for t in pages if t.get('id') == handle), pages[0] if pages else None)
+        if not target or 'webSocketDebuggerUrl' not in target:
+            raise DevToolsError(f"No page target found at {address}")
+
+        client = cls(target['webSocketDebuggerUrl'], timeout=timeout)
+        await client.connect()
+        return client
+
+    @staticmethod
+    def _list_targets(address: str, timeout: float) -> List[Dict[str, Any]]:
+        """Fetch the target list from Chrome's DevTools HTTP endpoint."""
+        with urllib.request.urlopen(f"http://{address}/json/list", timeout=timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    @property
+    def connected(self) -> bool:
+        """Whether the WebSocket connection is open."""
+        return self._ws is not None and self._reader is not None and not self._reader.done()
+
+    async def connect(self) -> None:
+        """Open the WebSocket connection and start reading messages."""
+        self._ws = await websockets.connect(
+            self.ws_url, max_size=None, ping_interval=None, open_timeout=self.timeout
+        )
+        self._reader = asyncio.create_task(self._read_loop())
+        logger.info(f"Connected to DevTools target {self.ws_url}")
+
+    async def close(self) -> None:
+        """Close the connection and fail any outstanding commands."""
+        if self._reader:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except (asyncio.CancelledError, Exception):
+                pass
+        if self._ws:
+            try:
+                await self._ws.close()
+            except Exception:
+                pass
+        self._fail_pending(DevToolsError("Connection closed"))
+        self._ws = None
+        self._reader = None
+
+    async def send(self, method: str, params: Optional[Dict[str, Any]] = None,
+                   timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Send a DevTools command and wait for its result.
+
+        Args:
+            method: Protocol method, e.g. "Runtime.evaluate"
+            params: Optional command parameters
+            timeout: Optional timeout in seconds
+
+        Returns:
+            Dict[str, Any]: Command result
+        """
+        if not self.connected:
+            raise DevToolsError("Not connected")
+
+        message_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        try:
+            await self._ws.send(json.dumps({
+                'id': message_id,
+                'method': method,
+                'params': params or {}
+            }))
+            self.commands_sent += 1
+            return await asyncio.wait_for(future, timeout or self.timeout)
+        except asyncio.TimeoutError:
+            raise DevToolsError(f"{method} timed out")
+        finally:
+            self._pending.pop(message_id, None)
+
+    def on(self, event: str, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Register a callback for a protocol event."""
+        self._listeners.setdefault(event, []).append(callback)
+
+    def off(self, event: str, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Remove a previously registered event callback."""
+        callbacks = self._listeners.get(event, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    async def evaluate(self, expression: str, await_promise: bool = False,
+                       timeout: Optional[float] = None) -> Any:
+        """
+        Evaluate JavaScript in the page and return its value.
+
+        Args:
+            expression: JavaScript expression
+            await_promise: Whether to wait for a returned promise
+            timeout: Optional timeout in seconds
+
+        Returns:
+            Any: JSON-serializable result value
+        """
+        result = await self.send('Runtime.evaluate', {
+            'expression': expression,
+            'returnByValue': True,
+            'awaitPromise': await_promise
+        }, timeout=timeout)
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            raise DevToolsError(
+                details.get('exception', {}).get('description') or details.get('text')
+            )
+        return result.get('result', {}).get('value')
+
+    async def call_script(self, script: str, *args: Any, await_promise: bool = False,
+                          timeout: Optional[float] = None) -> Any:
+        """
+        Run a Selenium-style script body with its `arguments` bound to args.
+
+        Args:
+            script: Script body as passed to execute_script
+            *args: JSON-serializable arguments
+            await_promise: Whether to wait for a returned promise
+            timeout: Optional timeout in seconds
+
+        Returns:
+            Any: Value returned by the script
+        """
+        expression = f"(function() {{ {script} \n}}).apply(null, {json.dumps(list(args))})"
+        return await self.evaluate(expression, await_promise=await_promise, timeout=timeout)
+
+    async def navigate(self, url: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Start navigation to a URL.
+
+        Args:
+            url: URL to navigate to
+            timeout: Optional timeout in seconds
+
+        Returns:
+            Dict[str, Any]: Navigation result with frameId and loaderId
+        """
+        result = await self.send('Page.navigate', {'url': url}, timeout=timeout)
+        if result.get('errorText'):
+            raise DevToolsError(f"Navigation to {url} failed: {result['errorText']}")
+        return result
+
+    async def get_window_bounds(self) -> Dict[str, Any]:
+        """Get the bounds and state of the window hosting this target."""
+        window = await self.send('Browser.getWindowForTarget')
+        return window['bounds']
+
+    async def set_window_bounds(self, bounds: Dict[str, Any]) -> None:
+        """
+        Set the bounds of the window hosting this target.
+
+        Args:
+            bounds: Any of left, top, width, height and windowState
+        """
+        window = await self.send('Browser.getWindowForTarget')
+        await self.send('Browser.setWindowBounds', {
+            'windowId': window['windowId'],
+            'bounds': bounds
+        })
+
+    async def enable_page_events(self) -> None:
+        """Enable page domain and lifecycle events."""
+        await self.send('Page.enable')
+        await self.send('Page.setLifecycleEventsEnabled', {'enabled': True})
+
+    async def _read_loop(self) -> None:
+        """Dispatch command results and events until the connection closes."""
+        try:
+            async for raw in self._ws:
+                message = json.loads(raw)
+                if 'id' in message:
+                    future = self._pending.get(message['id'])
+                    if future and not future.done():
+                        if 'error' in message:
+                            future.set_exception(DevToolsError(message['error'].get('message')))
+                        else:
+                            future.set_result(message.get('result', {}))
+                    continue
+                for callback in list(self._listeners.get(message.get('method'), [])):
+                    try:
+                        callback(message.get('params', {}))
+                    except Exception as e:
+                        logger.warning(f"DevTools event handler failed: {str(e)}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"DevTools connection lost: {str(e)}")
+        finally:
+            self._fail_pending(DevToolsError("Connection lost"))
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every command still waiting for a response."""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
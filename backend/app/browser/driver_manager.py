@@ -11,35 +11,29 @@ from webdriver_manager.chrome import ChromeDriverManager as WDManager
 import os
 import time
 import random
-import subprocess
+import shutil
 from datetime import datetime
 from pathlib import Path
 from loguru import logger
 
 from ..config import Config
 from .fingerprint import FingerprintGenerator
+from .launch_profiles import LaunchProfiles
+from .page_load import page_load_strategy
+from .simulated_driver import SimulatedDriver
 from .stealth import StealthBrowser
 from .window_manager import WindowManager
+from .driver_resolver import DriverResolver
 
 class ChromeDriverManager:
     def __init__(self):
         """Initialize ChromeDriverManager with necessary components."""
         self.fingerprints = {}
         self._profile_manager = None
-        self._service = None
-        self._check_chrome_version()
-
-    def _check_chrome_version(self):
-        """Check Chrome version"""
-        try:
-            chrome_path = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
-            result = subprocess.check_output([chrome_path, '--version'])
-            version = result.decode('utf-8').strip().split()[-1]
-            logger.info(f"Chrome version: {version}")
-            return version
-        except Exception as e:
-            logger.warning(f"Unable to get Chrome version: {e}")
-            return None
+        # Shared caching proxy, attached by the browser manager when enabled
+        self.cache_proxy = None
+        # Chrome is probed lazily (or by prefetch), never on construction
+        self.resolver = DriverResolver(installer=lambda: WDManager().install())
 
     @property
     def profile_manager(self):
@@ -50,20 +44,28 @@ class ChromeDriverManager:
         return self._profile_manager
 
     @property
-    def service(self):
-        """Lazy initialization of ChromeDriver service"""
-        if self._service is None:
-            try:
-                driver_path = WDManager().install()
-                self._service = Service(driver_path)
-                logger.info(f"ChromeDriver installed at: {driver_path}")
-            except Exception as e:
-                logger.error(f"Failed to initialize ChromeDriver service: {e}")
-                raise
-        return self._service
+    def driver_path(self) -> str:
+        """Lazy resolution of the ChromeDriver executable path"""
+        try:
+            return self.resolver.driver_path()
+        except Exception as e:
+            logger.error(f"Failed to initialize ChromeDriver service: {e}")
+            raise
+
+    def create_service(self) -> Service:
+        """
+        Create a ChromeDriver service for a single driver.
+
+        Each driver needs its own service: a shared Service object only tracks
+        the last chromedriver process it started, so quitting one driver would
+        stop the chromedriver of another, and concurrent launches would race.
+        """
+        return Service(self.driver_path)
 
     def create_driver(self, instance_id: int, profile_name: str = None,
-                     load_profile: bool = True) -> webdriver.Chrome:
+                     load_profile: bool = True, fingerprint: dict = None,
+                     use_template: bool = True, ephemeral: bool = False,
+                     launch_profile: str = None) -> webdriver.Chrome:
         """
         Create a new Chrome WebDriver instance with custom configuration.
 
@@ -71,26 +73,41 @@ class ChromeDriverManager:
             instance_id: Unique identifier for the browser instance
             profile_name: Optional name for the browser profile
             load_profile: Whether to load an existing profile
+            fingerprint: Optional fingerprint to reuse instead of generating one
+            use_template: Seed an empty profile directory from the template profile
+            ephemeral: Keep the profile in EPHEMERAL_PROFILES_DIR (RAM) instead of on disk
+            launch_profile: Name of the launch profile (defaults to DEFAULT_LAUNCH_PROFILE)
 
         Returns:
             Chrome WebDriver instance configured with custom settings
         """
         try:
             logger.info(f"Creating Chrome driver for instance {instance_id}")
+            profile_name = profile_name or f"profile_{instance_id}"
             
             # Configure Chrome options
-            options = self._get_chrome_options(instance_id, profile_name)
+            options = self._get_chrome_options(
+                instance_id, profile_name, fingerprint, ephemeral, launch_profile
+            )
             
             # Create profile directory if needed
-            profile_dir = os.path.join(Config.PROFILES_DIR, f"profile_{instance_id}")
+            profile_dir = self.get_profile_dir(profile_name, ephemeral)
+            if ephemeral:
+                self._seed_ephemeral_profile(profile_name, use_template)
+            elif use_template and Config.PROFILE_TEMPLATE_ENABLED:
+                self.profile_manager.template.clone_into(profile_dir)
             os.makedirs(profile_dir, exist_ok=True)
             
             # Create driver instance
-            driver = webdriver.Chrome(service=self.service, options=options)
+            if Config.SIMULATED_DRIVER:
+                driver = SimulatedDriver(options=options)
+            else:
+                driver = webdriver.Chrome(service=self.create_service(), options=options)
             logger.info("Chrome driver created successfully")
             
-            # Configure window first
-            self._configure_window(driver, instance_id)
+            # Configure window first; headless instances have none to lay out
+            if not LaunchProfiles.is_headless(launch_profile):
+                self._configure_window(driver, instance_id)
             
             # Apply basic settings last
             if load_profile:
@@ -102,37 +119,137 @@ class ChromeDriverManager:
             logger.error(f"Failed to create driver: {e}")
             raise Exception(f"Failed to create driver: {str(e)}")
 
-    def _get_chrome_options(self, instance_id: int, profile_name: str = None) -> Options:
+    def build_profile_template(self) -> bool:
+        """
+        Build the template profile new profiles are cloned from.
+
+        Returns:
+            bool: True if the template was built
+        """
+        def launch(profile_name: str) -> webdriver.Chrome:
+            return self.create_driver(
+                0, profile_name=profile_name, load_profile=False, use_template=False
+            )
+
+        try:
+            return self.profile_manager.template.build(launch, Config.PROFILE_TEMPLATE_SETTLE)
+        finally:
+            self.fingerprints.pop(0, None)
+
+    def get_profile_dir(self, profile_name: str, ephemeral: bool = False) -> Path:
+        """
+        Get the user data directory of a profile.
+
+        Args:
+            profile_name: Profile directory name
+            ephemeral: Whether the profile lives in EPHEMERAL_PROFILES_DIR
+
+        Returns:
+            Path: Profile directory
+        """
+        root = Config.EPHEMERAL_PROFILES_DIR if ephemeral else Config.PROFILES_DIR
+        return Path(root) / profile_name
+
+    def _seed_ephemeral_profile(self, profile_name: str, use_template: bool = True):
+        """Fill an ephemeral profile from its saved disk profile, or from the template."""
+        ram_dir = self.get_profile_dir(profile_name, ephemeral=True)
+        disk_dir = self.get_profile_dir(profile_name)
+        shutil.rmtree(ram_dir, ignore_errors=True)
+        if disk_dir.is_dir() and any(disk_dir.iterdir()):
+            shutil.copytree(disk_dir, ram_dir, symlinks=True)
+            logger.info(f"Loaded profile {profile_name} into {ram_dir}")
+        elif use_template and Config.PROFILE_TEMPLATE_ENABLED:
+            self.profile_manager.template.clone_into(ram_dir)
+
+    def persist_ephemeral_profile(self, profile_name: str) -> bool:
+        """
+        Copy a stopped ephemeral profile to its disk location, replacing it.
+
+        Args:
+            profile_name: Profile directory name
+
+        Returns:
+            bool: True if the profile was persisted
+        """
+        ram_dir = self.get_profile_dir(profile_name, ephemeral=True)
+        disk_dir = self.get_profile_dir(profile_name)
+        staging = disk_dir.with_name(disk_dir.name + '.persisting')
+        try:
+            shutil.rmtree(staging, ignore_errors=True)
+            shutil.copytree(
+                ram_dir, staging, symlinks=True,
+                ignore=shutil.ignore_patterns('Cache', 'Code Cache', 'GPUCache',
+                                              'SingletonLock', 'SingletonSocket', 'SingletonCookie')
+            )
+            if disk_dir.exists():
+                self.profile_manager.maintenance.trash(disk_dir)
+            staging.rename(disk_dir)
+            logger.info(f"Persisted ephemeral profile {profile_name} to {disk_dir}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to persist ephemeral profile {profile_name}: {e}")
+            shutil.rmtree(staging, ignore_errors=True)
+            return False
+
+    def discard_ephemeral_profile(self, profile_name: str):
+        """Delete an ephemeral profile, freeing its memory."""
+        shutil.rmtree(self.get_profile_dir(profile_name, ephemeral=True), ignore_errors=True)
+
+    def cleanup_ephemeral_profiles(self, owns=None):
+        """
+        Delete ephemeral profiles left behind by a previous run.
+
+        Args:
+            owns: Optional predicate on profile names limiting which profiles
+                this process may delete
+        """
+        root = Path(Config.EPHEMERAL_PROFILES_DIR)
+        if root.is_dir():
+            for entry in root.iterdir():
+                if owns and not owns(entry.name):
+                    continue
+                shutil.rmtree(entry, ignore_errors=True)
+                logger.info(f"Removed stale ephemeral profile {entry}")
+
+    def _get_chrome_options(self, instance_id: int, profile_name: str = None,
+                            fingerprint: dict = None, ephemeral: bool = False,
+                            launch_profile: str = None) -> Options:
         """Configure Chrome options for a new instance."""
         try:
             options = Options()
+            binary = None if Config.SIMULATED_DRIVER else self.resolver.chrome_binary()
+            if binary:
+                options.binary_location = binary
             
             # Set up profile directory
-            profile_path = os.path.join(
-                Config.PROFILES_DIR,
-                profile_name or f"profile_{instance_id}"
-            )
+            profile_path = self.get_profile_dir(profile_name or f"profile_{instance_id}", ephemeral)
             options.add_argument(f'--user-data-dir={profile_path}')
             logger.info(f"Using profile directory: {profile_path}")
             
-            # Essential Chrome options
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--disable-extensions')
-            options.add_argument('--disable-software-rasterizer')
-            options.add_argument('--remote-debugging-port=0')
+            # Essential Chrome options and those of the launch profile
+            LaunchProfiles.apply(options, launch_profile)
             options.add_argument(f'--js-flags=--max-old-space-size={Config.MAX_MEMORY_PER_INSTANCE}')
+            cache_mb = Config.EPHEMERAL_DISK_CACHE_MB if ephemeral else Config.PROFILE_DISK_CACHE_MB
+            if cache_mb > 0:
+                options.add_argument(f'--disk-cache-size={cache_mb * 1024 * 1024}')
+            if self.cache_proxy is not None and self.cache_proxy.proxy_url:
+                options.add_argument(f'--proxy-server={self.cache_proxy.proxy_url}')
+                if Config.CACHE_PROXY_BYPASS:
+                    options.add_argument(f'--proxy-bypass-list={Config.CACHE_PROXY_BYPASS}')
+            
+            # How long driver.get blocks; visits wait for their own load condition
+            options.page_load_strategy = page_load_strategy()
             
             # Automation settings
             options.add_experimental_option('excludeSwitches', ['enable-automation'])
             options.add_experimental_option('useAutomationExtension', False)
             options.add_experimental_option('w3c', True)
             
-            # Generate fingerprint
-            fingerprint = FingerprintGenerator.generate()
+            # Generate fingerprint, unless an existing identity is being restored
+            if not fingerprint:
+                fingerprint = FingerprintGenerator.generate()
+                logger.info("Generated browser fingerprint")
             self.fingerprints[instance_id] = fingerprint
-            logger.info("Generated browser fingerprint")
             
             # Apply basic fingerprint settings only
             options.add_argument(f'--user-agent={fingerprint["user_agent"]}')
@@ -0,0 +1,209 @@
+# File: backend/app/browser/driver_resolver.py
+"""
+Chrome and ChromeDriver resolution module.
+Locates the Chrome binary and a matching chromedriver without touching the
+network when a usable driver is already known.
+"""
+
+from typing import Any, Callable, Dict, Optional
+from pathlib import Path
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from loguru import logger
+
+from ..config import Config
+
+class DriverResolver:
+    """
+    Resolves the Chrome binary, its version and the chromedriver to use.
+
+    Resolution order for the driver is CHROME_DRIVER_PATH, then the on-disk
+    cache entry for the detected Chrome version, then a chromedriver on PATH
+    whose major version matches, and only then a download through
+    webdriver-manager, which is skipped when DRIVER_OFFLINE is set. Every
+    step runs at most once per process.
+    """
+
+    # Typical install locations, tried after CHROME_BINARY_PATH
+    BINARY_CANDIDATES = {
+        'darwin': [
+            '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+            '/Applications/Chromium.app/Contents/MacOS/Chromium'
+        ],
+        'win32': [
+            r'C:\Program Files\Google\Chrome\Application\chrome.exe',
+            r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe'
+        ],
+        'linux': [
+            'google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser'
+        ]
+    }
+
+    VERSION_PATTERN = re.compile(r'(\d+)\.(\d+)\.(\d+)\.(\d+)')
+
+    def __init__(self, installer: Callable[[], str]):
+        """
+        Initialize the resolver.
+
+        Args:
+            installer: Callable downloading a chromedriver and returning its path
+        """
+        self.installer = installer
+        self._lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+        self._binary: Optional[str] = None
+        self._version: Optional[str] = None
+        self._probed = False
+        self._driver_path: Optional[str] = None
+        self.driver_source: Optional[str] = None
+
+    def chrome_binary(self) -> Optional[str]:
+        """Get the Chrome executable, or None if it cannot be found."""
+        self._probe()
+        return self._binary
+
+    def chrome_version(self) -> Optional[str]:
+        """Get the installed Chrome version, or None if unknown."""
+        self._probe()
+        return self._version
+
+    def driver_path(self) -> str:
+        """
+        Get the chromedriver executable for the installed Chrome.
+
+        Returns:
+            str: Path of the chromedriver executable
+
+        Raises:
+            RuntimeError: If no driver is available and downloading is disabled or fails
+        """
+        with self._lock:
+            if self._driver_path:
+                return self._driver_path
+            path, source = self._resolve_driver()
+            self._driver_path, self.driver_source = path, source
+            logger.info(f"Using ChromeDriver {path} ({source})")
+            return path
+
+    def prefetch(self) -> threading.Thread:
+        """Resolve Chrome and the driver on a background thread so launches never wait."""
+        def run():
+            try:
+                self.driver_path()
+            except Exception as e:
+                logger.warning(f"ChromeDriver prefetch failed: {str(e)}")
+
+        thread = threading.Thread(target=run, name="driver-resolver", daemon=True)
+        thread.start()
+        return thread
+
+    def get_info(self) -> Dict[str, Any]:
+        """Get the resolved paths and version without resolving anything new."""
+        return {
+            'chrome_binary': self._binary,
+            'chrome_version': self._version,
+            'driver_path': self._driver_path,
+            'driver_source': self.driver_source,
+            'offline': Config.DRIVER_OFFLINE
+        }
+
+    def _probe(self) -> None:
+        """Find the Chrome binary and read its version, once."""
+        if self._probed:
+            return
+        with self._probe_lock:
+            if self._probed:
+                return
+            self._binary = self._find_binary()
+            if self._binary:
+                self._version = self._read_version([self._binary, '--version'])
+            if self._version:
+                logger.info(f"Chrome version: {self._version} ({self._binary})")
+            else:
+                logger.warning(f"Unable to get Chrome version (binary: {self._binary})")
+            self._probed = True
+
+    def _find_binary(self) -> Optional[str]:
+        """Locate the Chrome executable."""
+        if Config.CHROME_BINARY_PATH:
+            if os.path.exists(Config.CHROME_BINARY_PATH):
+                return Config.CHROME_BINARY_PATH
+            logger.warning(f"CHROME_BINARY_PATH {Config.CHROME_BINARY_PATH} does not exist")
+        platform = 'linux' if sys.platform.startswith('linux') else sys.platform
+        for candidate in self.BINARY_CANDIDATES.get(platform, []):
+            found = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+            if found and os.path.exists(found):
+                return found
+        return None
+
+    def _read_version(self, command) -> Optional[str]:
+        """Run a --version command and extract the version number."""
+        try:
+            output = subprocess.run(
+                command, capture_output=True, timeout=10, check=False
+            ).stdout.decode('utf-8', errors='replace')
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug(f"Version probe {command[0]} failed: {str(e)}")
+            return None
+        match = self.VERSION_PATTERN.search(output)
+        return match.group(0) if match else None
+
+    def _resolve_driver(self):
+        """Walk the resolution order; returns (path, source)."""
+        if Config.CHROME_DRIVER_PATH:
+            if os.path.exists(Config.CHROME_DRIVER_PATH):
+                return Config.CHROME_DRIVER_PATH, 'configured'
+            logger.warning(f"CHROME_DRIVER_PATH {Config.CHROME_DRIVER_PATH} does not exist")
+
+        version = self.chrome_version()
+        cache = self._load_cache()
+        key = version or 'unknown'
+        cached = cache.get(key)
+        if cached and os.path.exists(cached):
+            return cached, 'cache'
+
+        local = shutil.which('chromedriver')
+        if local:
+            local_version = self._read_version([local, '--version'])
+            if not version or (local_version and local_version.split('.')[0] == version.split('.')[0]):
+                self._save_cache(cache, key, local)
+                return local, 'path'
+            logger.info(f"chromedriver on PATH is {local_version}, Chrome is {version}")
+
+        if Config.DRIVER_OFFLINE:
+            raise RuntimeError(
+                f"No ChromeDriver for Chrome {version} is cached or configured and "
+                f"DRIVER_OFFLINE is set; set CHROME_DRIVER_PATH"
+            )
+        path = self.installer()
+        self._save_cache(cache, key, path)
+        return path, 'download'
+
+    @staticmethod
+    def _load_cache() -> Dict[str, str]:
+        """Read the version to driver path cache."""
+        try:
+            with open(Config.DRIVER_CACHE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_cache(cache: Dict[str, str], version: str, path: str) -> None:
+        """Record the driver resolved for a Chrome version."""
+        cache = {v: p for v, p in cache.items() if os.path.exists(p)}
+        cache[version] = path
+        try:
+            cache_file = Path(Config.DRIVER_CACHE_FILE)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2)
+            temp.replace(cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to write ChromeDriver cache: {str(e)}")
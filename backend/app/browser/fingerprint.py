@@ -76,6 +76,96 @@ class FingerprintGenerator:
         'Asia/Tokyo', 'Asia/Shanghai', 'Asia/Singapore'
     ]
 
+    # Script that overrides fingerprintable properties; arguments[0] is the fingerprint
+    INJECTION_SCRIPT = """
+        (() => {
+            const fingerprint = arguments[0];
+            
+            // Basic property overrides
+            const overrides = {
+                'navigator': {
+                    'webdriver': undefined,
+                    'userAgent': fingerprint.user_agent,
+                    'language': fingerprint.language,
+                    'languages': [fingerprint.language],
+                    'platform': fingerprint.platform,
+                    'hardwareConcurrency': fingerprint.cpu_cores,
+                    'deviceMemory': Math.floor(fingerprint.memory_size / 1024),
+                    'maxTouchPoints': fingerprint.touch_points
+                },
+                'screen': {
+                    'width': fingerprint.screen_width,
+                    'height': fingerprint.screen_height,
+                    'colorDepth': fingerprint.color_depth,
+                    'pixelDepth': fingerprint.color_depth,
+                    'availWidth': fingerprint.screen_width,
+                    'availHeight': fingerprint.screen_height,
+                    'devicePixelRatio': fingerprint.pixel_ratio
+                }
+            };
+
+            // Apply overrides
+            for (const [objectKey, overrideObj] of Object.entries(overrides)) {
+                for (const [key, value] of Object.entries(overrideObj)) {
+                    try {
+                        Object.defineProperty(window[objectKey], key, {
+                            get: () => value,
+                            configurable: true
+                        });
+                    } catch (e) {}
+                }
+            }
+            
+            // WebGL fingerprint override
+            const getParameterProxy = WebGLRenderingContext.prototype.getParameter;
+            WebGLRenderingContext.prototype.getParameter = function(parameter) {
+                // Override vendor-specific parameters
+                const vendorSpecific = {
+                    37445: fingerprint.gpu_info.vendor,    // UNMASKED_VENDOR_WEBGL
+                    37446: fingerprint.gpu_info.renderer,  // UNMASKED_RENDERER_WEBGL
+                    35661: fingerprint.gpu_info.version    // VERSION
+                };
+                
+                if (parameter in vendorSpecific) {
+                    return vendorSpecific[parameter];
+                }
+                return getParameterProxy.apply(this, arguments);
+            };
+            
+            // Font fingerprint handling
+            const fontCheck = document.createElement('canvas').getContext('2d');
+            fontCheck.measureText = new Proxy(fontCheck.measureText, {
+                apply: function(target, thisArg, argumentsList) {
+                    const result = target.apply(thisArg, argumentsList);
+                    if (thisArg.font) {
+                        const fontFamily = thisArg.font.split(' ').pop();
+                        if (!fingerprint.fonts.includes(fontFamily)) {
+                            result.width *= 0.9;
+                        }
+                    }
+                    return result;
+                }
+            });
+
+            // Plugin override
+            Object.defineProperty(navigator, 'plugins', {
+                get: () => {
+                    const plugins = [];
+                    fingerprint.plugins.forEach(plugin => {
+                        plugins.push({
+                            name: plugin.name,
+                            filename: plugin.filename,
+                            description: plugin.description,
+                            length: 1
+                        });
+                    });
+                    return plugins;
+                }
+            });
+            
+        })();
+        """
+
     @classmethod
     def generate(cls) -> Dict[str, Any]:
         """
@@ -189,92 +279,4 @@ class FingerprintGenerator:
             driver: Selenium WebDriver instance
             fingerprint: Fingerprint data to inject
         """
-        script = """
-        (() => {
-            const fingerprint = arguments[0];
-            
-            // Basic property overrides
-            const overrides = {
-                'navigator': {
-                    'webdriver': undefined,
-                    'userAgent': fingerprint.user_agent,
-                    'language': fingerprint.language,
-                    'languages': [fingerprint.language],
-                    'platform': fingerprint.platform,
-                    'hardwareConcurrency': fingerprint.cpu_cores,
-                    'deviceMemory': Math.floor(fingerprint.memory_size / 1024),
-                    'maxTouchPoints': fingerprint.touch_points
-                },
-                'screen': {
-                    'width': fingerprint.screen_width,
-                    'height': fingerprint.screen_height,
-                    'colorDepth': fingerprint.color_depth,
-                    'pixelDepth': fingerprint.color_depth,
-                    'availWidth': fingerprint.screen_width,
-                    'availHeight': fingerprint.screen_height,
-                    'devicePixelRatio': fingerprint.pixel_ratio
-                }
-            };
-
-            // Apply overrides
-            for (const [objectKey, overrideObj] of Object.entries(overrides)) {
-                for (const [key, value] of Object.entries(overrideObj)) {
-                    try {
-                        Object.defineProperty(window[objectKey], key, {
-                            get: () => value,
-                            configurable: true
-                        });
-                    } catch (e) {}
-                }
-            }
-            
-            // WebGL fingerprint override
-            const getParameterProxy = WebGLRenderingContext.prototype.getParameter;
-            WebGLRenderingContext.prototype.getParameter = function(parameter) {
-                // Override vendor-specific parameters
-                const vendorSpecific = {
-                    37445: fingerprint.gpu_info.vendor,    // UNMASKED_VENDOR_WEBGL
-                    37446: fingerprint.gpu_info.renderer,  // UNMASKED_RENDERER_WEBGL
-                    35661: fingerprint.gpu_info.version    // VERSION
-                };
-                
-                if (parameter in vendorSpecific) {
-                    return vendorSpecific[parameter];
-                }
-                return getParameterProxy.apply(this, arguments);
-            };
-            
-            // Font fingerprint handling
-            const fontCheck = document.createElement('canvas').getContext('2d');
-            fontCheck.measureText = new Proxy(fontCheck.measureText, {
-                apply: function(target, thisArg, argumentsList) {
-                    const result = target.apply(thisArg, argumentsList);
-                    if (thisArg.font) {
-                        const fontFamily = thisArg.font.split(' ').pop();
-                        if (!fingerprint.fonts.includes(fontFamily)) {
-                            result.width *= 0.9;
-                        }
-                    }
-                    return result;
-                }
-            });
-
-            // Plugin override
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => {
-                    const plugins = [];
-                    fingerprint.plugins.forEach(plugin => {
-                        plugins.push({
-                            name: plugin.name,
-                            filename: plugin.filename,
-                            description: plugin.description,
-                            length: 1
-                        });
-                    });
-                    return plugins;
-                }
-            });
-            
-        })();
-        """
-        driver.execute_script(script, fingerprint)
+        driver.execute_script(FingerprintGenerator.INJECTION_SCRIPT, fingerprint)
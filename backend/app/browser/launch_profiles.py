@@ -0,0 +1,147 @@
+# File: backend/app/browser/launch_profiles.py
+"""
+Launch profile module.
+Named sets of Chrome flags that trade features for footprint, selectable
+per instance when it is created.
+"""
+
+from typing import Any, Dict, List
+from selenium.webdriver.chrome.options import Options
+
+from ..config import Config
+
+class LaunchProfiles:
+    """
+    Registry of launch profiles.
+
+    Every profile starts from the flags all instances need; a profile adds
+    its own flags and may run Chrome headless. Headless instances skip window
+    layout, since they have no window to place.
+    """
+
+    # Flags shared by every profile
+    BASE_ARGUMENTS = [
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-gpu',
+        '--disable-extensions',
+        '--disable-software-rasterizer',
+        '--remote-debugging-port=0',
+    ]
+
+    # Background services an automation-only browser never needs
+    BACKGROUND_SERVICE_ARGUMENTS = [
+        '--disable-background-networking',
+        '--disable-component-update',
+        '--disable-default-apps',
+        '--disable-sync',
+        '--disable-client-side-phishing-detection',
+        '--disable-domain-reliability',
+        '--disable-breakpad',
+        '--metrics-recording-only',
+        '--no-first-run',
+        '--no-default-browser-check',
+        '--no-pings',
+        '--mute-audio',
+        '--hide-scrollbars',
+        '--disable-features=Translate,OptimizationHints,MediaRouter,DialMediaRouteProvider,'
+        'AutofillServerCommunication,CertificateTransparencyComponentUpdater,'
+        'InterestFeedContentSuggestions,BackForwardCache,'
+        # One renderer per site would defeat the renderer process limit
+        'IsolateOrigins,site-per-process',
+    ]
+
+    PROFILES: Dict[str, Dict[str, Any]] = {
+        'standard': {
+            'description': 'Headed browser with full rendering',
+            'headless': False,
+            'arguments': [],
+            'renderer_process_limit': False,
+        },
+        'headless': {
+            'description': 'New headless mode, otherwise identical to standard',
+            'headless': True,
+            'arguments': [],
+            'renderer_process_limit': False,
+        },
+        'density': {
+            'description': (
+                'New headless mode with background services disabled and a capped '
+                'number of renderer processes, for automation-only instances'
+            ),
+            'headless': True,
+            'arguments': BACKGROUND_SERVICE_ARGUMENTS,
+            'renderer_process_limit': True,
+        },
+    }
+
+    @classmethod
+    def names(cls) -> List[str]:
+        """Get the names of all launch profiles."""
+        return list(cls.PROFILES)
+
+    @classmethod
+    def resolve(cls, name: str = None) -> str:
+        """
+        Resolve a launch profile name, falling back to DEFAULT_LAUNCH_PROFILE.
+
+        Args:
+            name: Requested profile name, or None for the default
+
+        Returns:
+            str: Name of an existing profile
+
+        Raises:
+            ValueError: If the profile does not exist
+        """
+        name = name or Config.DEFAULT_LAUNCH_PROFILE
+        if name not in cls.PROFILES:
+            raise ValueError(
+                f"Unknown launch profile '{name}', expected one of {', '.join(cls.PROFILES)}"
+            )
+        return name
+
+    @classmethod
+    def is_headless(cls, name: str = None) -> bool:
+        """Whether a launch profile runs Chrome without a window."""
+        return cls.PROFILES[cls.resolve(name)]['headless']
+
+    @classmethod
+    def arguments(cls, name: str = None) -> List[str]:
+        """
+        Get the command line flags of a launch profile.
+
+        Args:
+            name: Profile name, or None for the default
+
+        Returns:
+            List[str]: Chrome flags
+        """
+        profile = cls.PROFILES[cls.resolve(name)]
+        arguments = list(cls.BASE_ARGUMENTS)
+        if profile['headless']:
+            arguments.append('--headless=new')
+        arguments.extend(profile['arguments'])
+        if profile['renderer_process_limit'] and Config.DENSITY_RENDERER_PROCESS_LIMIT > 0:
+            arguments.append(f'--renderer-process-limit={Config.DENSITY_RENDERER_PROCESS_LIMIT}')
+        return arguments
+
+    @classmethod
+    def apply(cls, options: Options, name: str = None) -> None:
+        """Add a launch profile's flags to Chrome options."""
+        for argument in cls.arguments(name):
+            options.add_argument(argument)
+
+    @classmethod
+    def describe(cls) -> List[Dict[str, Any]]:
+        """Describe every launch profile for the API."""
+        return [
+            {
+                'name': name,
+                'description': profile['description'],
+                'headless': profile['headless'],
+                'default': name == Config.DEFAULT_LAUNCH_PROFILE,
+                'arguments': cls.arguments(name)
+            }
+            for name, profile in cls.PROFILES.items()
+        ]
@@ -0,0 +1,248 @@
+# File: backend/app/browser/page_load.py
+"""
+Page load module.
+Decides when a navigation is complete from browser lifecycle events, so a
+visit returns as soon as the condition its caller asked for holds.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+import asyncio
+import time
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver import Chrome
+from loguru import logger
+
+from ..config import Config
+from .devtools import DevToolsClient, DevToolsError
+
+# Conditions a visit can wait for, earliest first
+WAIT_CONDITIONS = ['domcontentloaded', 'load', 'networkidle', 'selector']
+
+# WebDriver page load strategies: how long driver.get itself blocks
+PAGE_LOAD_STRATEGIES = ['normal', 'eager', 'none']
+
+# Page.lifecycleEvent names that satisfy each condition; a selector is
+# looked for as soon as the new document is committed
+LIFECYCLE_EVENTS = {
+    'domcontentloaded': {'DOMContentLoaded'},
+    'load': {'load'},
+    'networkidle': {'networkIdle'},
+    'selector': {'init', 'commit'},
+}
+
+# Resolves once a selector matches, watching DOM mutations instead of polling
+SELECTOR_SCRIPT = """
+    const selector = arguments[0];
+    return new Promise(resolve => {
+        if (document.querySelector(selector)) return resolve(true);
+        const observer = new MutationObserver(() => {
+            if (document.querySelector(selector)) {
+                observer.disconnect();
+                resolve(true);
+            }
+        });
+        observer.observe(document, {childList: true, subtree: true, attributes: true});
+    });
+"""
+
+# Resolves on the document's own DOMContentLoaded or load event
+READY_STATE_SCRIPT = """
+    const event = arguments[0];
+    const reached = () => event === 'DOMContentLoaded'
+        ? document.readyState !== 'loading'
+        : document.readyState === 'complete';
+    return new Promise(resolve => {
+        if (reached()) return resolve(true);
+        (event === 'load' ? window : document).addEventListener(event, () => resolve(true), {once: true});
+    });
+"""
+
+# Approximates network idle without DevTools: resolves after load once no
+# resource has finished loading for idleMs
+NETWORK_IDLE_SCRIPT = """
+    const idleMs = arguments[0];
+    return new Promise(resolve => {
+        let timer = null;
+        const arm = () => {
+            clearTimeout(timer);
+            timer = setTimeout(() => { observer.disconnect(); resolve(true); }, idleMs);
+        };
+        const observer = new PerformanceObserver(arm);
+        observer.observe({type: 'resource', buffered: false});
+        if (document.readyState === 'complete') arm();
+        else window.addEventListener('load', arm, {once: true});
+    });
+"""
+
+class NavigationNotStarted(DevToolsError):
+    """Raised when DevTools could not start a navigation, so WebDriver should."""
+
+def normalize_wait(wait_until: Optional[str] = None,
+                   selector: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    """
+    Validate a visit's load condition.
+
+    Args:
+        wait_until: domcontentloaded, load, networkidle or selector; defaults
+            to selector when a selector is given, else DEFAULT_WAIT_UNTIL
+        selector: CSS selector the selector condition waits for
+
+    Returns:
+        Tuple[str, Optional[str]]: Condition and selector
+
+    Raises:
+        ValueError: If the condition is unknown or lacks its selector
+    """
+    wait_until = (wait_until or ('selector' if selector else Config.DEFAULT_WAIT_UNTIL)).lower()
+    if wait_until not in WAIT_CONDITIONS:
+        raise ValueError(
+            f"Unknown load condition '{wait_until}', expected one of {', '.join(WAIT_CONDITIONS)}"
+        )
+    if wait_until == 'selector' and not selector:
+        raise ValueError("The selector condition requires a selector")
+    return wait_until, selector if wait_until == 'selector' else None
+
+def _document_replaced(error: Exception) -> bool:
+    """Whether a script failed because navigation replaced its document."""
+    message = str(error).lower()
+    return any(hint in message for hint in ('context', 'unloaded', 'navigated'))
+
+def page_load_strategy() -> str:
+    """PAGE_LOAD_STRATEGY if it is a valid WebDriver strategy, else normal."""
+    strategy = Config.PAGE_LOAD_STRATEGY.lower()
+    if strategy not in PAGE_LOAD_STRATEGIES:
+        logger.warning(
+            f"Unknown PAGE_LOAD_STRATEGY '{Config.PAGE_LOAD_STRATEGY}', expected one of "
+            f"{', '.join(PAGE_LOAD_STRATEGIES)}; using normal"
+        )
+        return 'normal'
+    return strategy
+
+class LifecycleWatcher:
+    """
+    Records the page lifecycle events of one navigation.
+
+    Attach it before the navigation starts: the events of a fast page can
+    arrive before Page.navigate returns the loader id they belong to.
+    """
+
+    def __init__(self, devtools: DevToolsClient):
+        """
+        Start recording lifecycle events.
+
+        Args:
+            devtools: Client with page lifecycle events enabled
+        """
+        self.devtools = devtools
+        self._events: Dict[str, set] = {}
+        self._changed = asyncio.Event()
+        devtools.on('Page.lifecycleEvent', self._on_event)
+
+    def _on_event(self, params: Dict[str, Any]) -> None:
+        self._events.setdefault(params.get('loaderId'), set()).add(params.get('name'))
+        self._changed.set()
+
+    async def wait(self, loader_id: str, condition: str, timeout: float) -> None:
+        """
+        Wait for the loader's lifecycle event that satisfies a condition.
+
+        Raises:
+            asyncio.TimeoutError: If the event does not arrive within timeout
+        """
+        names = LIFECYCLE_EVENTS[condition]
+        deadline = time.monotonic() + timeout
+        while not names & self._events.get(loader_id, set()):
+            self._changed.clear()
+            await asyncio.wait_for(self._changed.wait(), max(0, deadline - time.monotonic()))
+
+    def close(self) -> None:
+        """Stop recording."""
+        self.devtools.off('Page.lifecycleEvent', self._on_event)
+
+async def navigate_via_devtools(devtools: DevToolsClient, url: str, condition: str,
+                                selector: Optional[str], timeout: float) -> None:
+    """
+    Navigate over DevTools and return once a load condition holds.
+
+    Args:
+        devtools: Client with page lifecycle events enabled
+        url: URL to visit
+        condition: Normalized load condition
+        selector: CSS selector of the selector condition
+        timeout: Seconds the whole visit may take
+
+    Raises:
+        NavigationNotStarted: If navigation could not be started over DevTools
+        asyncio.TimeoutError: If the condition does not hold within timeout
+        DevToolsError: If the page fails while waiting
+    """
+    deadline = time.monotonic() + timeout
+    watcher = LifecycleWatcher(devtools)
+    try:
+        try:
+            result = await devtools.navigate(url, timeout=timeout)
+        except DevToolsError as e:
+            raise NavigationNotStarted(str(e)) from e
+        # Same-document navigations complete without a new loader
+        if result.get('loaderId'):
+            await watcher.wait(result['loaderId'], condition, max(0, deadline - time.monotonic()))
+    finally:
+        watcher.close()
+    if condition != 'selector':
+        return
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise asyncio.TimeoutError(f"Selector {selector} did not appear within {timeout:g}s")
+        try:
+            await devtools.call_script(SELECTOR_SCRIPT, selector, await_promise=True, timeout=remaining)
+            return
+        except DevToolsError as e:
+            if deadline - time.monotonic() <= 0:
+                continue
+            # A redirect replaced the document being watched; watch the new one
+            if not devtools.connected or not _document_replaced(e):
+                raise
+
+def wait_via_webdriver(driver: Chrome, condition: str, selector: Optional[str],
+                       timeout: float) -> None:
+    """
+    Wait for a load condition after driver.get has returned.
+
+    Scripts wait on the page's own events rather than polling; with the
+    normal strategy driver.get has already waited for load. Network idle is
+    approximated by the absence of new resource requests, as in-flight
+    requests are not visible without DevTools.
+
+    Args:
+        driver: Selenium WebDriver instance
+        condition: Normalized load condition
+        selector: CSS selector of the selector condition
+        timeout: Seconds the condition may take
+
+    Raises:
+        TimeoutException: If the condition does not hold within timeout
+    """
+    if condition == 'selector':
+        script, argument = SELECTOR_SCRIPT, selector
+    elif condition == 'networkidle':
+        script, argument = NETWORK_IDLE_SCRIPT, Config.NETWORK_IDLE_MS
+    else:
+        script, argument = READY_STATE_SCRIPT, 'DOMContentLoaded' if condition == 'domcontentloaded' else 'load'
+
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutException(f"Page did not reach {condition} within {timeout:g}s")
+        driver.set_script_timeout(remaining)
+        try:
+            driver.execute_script(script, argument)
+            return
+        except TimeoutException:
+            raise
+        except WebDriverException as e:
+            # The document was replaced while waiting; wait on the new one
+            if not _document_replaced(e):
+                raise
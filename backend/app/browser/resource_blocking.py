@@ -0,0 +1,266 @@
+# File: backend/app/browser/resource_blocking.py
+"""
+Resource blocking module.
+Keeps instances from downloading resources a workload does not need, by
+resource type or URL pattern, using the browser's own network interception.
+"""
+
+from typing import Any, Dict, List, Optional
+from collections import Counter
+from fnmatch import fnmatchcase
+import asyncio
+from loguru import logger
+from selenium.webdriver import Chrome
+
+from .devtools import DevToolsClient
+
+# DevTools resource types that may be blocked; documents never are, or
+# navigation itself would fail
+RESOURCE_TYPES = [
+    'Stylesheet', 'Image', 'Media', 'Font', 'Script', 'TextTrack', 'XHR', 'Fetch',
+    'Prefetch', 'EventSource', 'WebSocket', 'Manifest', 'SignedExchange', 'Ping',
+    'CSPViolationReport', 'Preflight', 'Other'
+]
+
+# Common third-party analytics and advertising hosts
+TRACKER_PATTERNS = [
+    '*://*.doubleclick.net/*',
+    '*://*.google-analytics.com/*',
+    '*://*.googletagmanager.com/*',
+    '*://*.googlesyndication.com/*',
+    '*://*.googleadservices.com/*',
+    '*://*.facebook.net/*',
+    '*://*.hotjar.com/*',
+    '*://*.scorecardresearch.com/*',
+    '*://*.adnxs.com/*',
+    '*://*.criteo.com/*',
+    '*://*.taboola.com/*',
+    '*://*.outbrain.com/*',
+    '*://*.amazon-adsystem.com/*',
+    '*://*.segment.io/*',
+    '*://*.mixpanel.com/*',
+]
+
+PRESETS: Dict[str, Dict[str, List[str]]] = {
+    'trackers': {'block_types': [], 'block_patterns': TRACKER_PATTERNS},
+    'media': {'block_types': ['Image', 'Media', 'Font'], 'block_patterns': []},
+    'dom': {
+        'block_types': [
+            'Image', 'Media', 'Font', 'Stylesheet', 'TextTrack', 'Manifest', 'Ping',
+            'Prefetch', 'CSPViolationReport'
+        ],
+        'block_patterns': TRACKER_PATTERNS
+    },
+}
+
+# File extensions standing in for resource types when only WebDriver is available
+TYPE_EXTENSIONS = {
+    'Image': ['png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp'],
+    'Media': ['mp4', 'webm', 'mp3', 'ogg', 'wav', 'm4a', 'm3u8'],
+    'Font': ['woff', 'woff2', 'ttf', 'otf', 'eot'],
+    'Stylesheet': ['css'],
+    'Script': ['js'],
+}
+
+def normalize_policy(policy: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Validate a resource policy and expand its preset.
+
+    Args:
+        policy: Policy with optional preset, block_types, block_patterns and
+            allow_patterns; resource types are matched case-insensitively
+
+    Returns:
+        Optional[Dict[str, Any]]: Normalized policy, or None if none was given
+
+    Raises:
+        ValueError: If the preset or a resource type is unknown
+    """
+    if policy is None:
+        return None
+    preset = policy.get('preset')
+    if preset and preset not in PRESETS:
+        raise ValueError(f"Unknown resource preset '{preset}', expected one of {', '.join(PRESETS)}")
+    base = PRESETS.get(preset) or {'block_types': [], 'block_patterns': []}
+
+    types_by_name = {t.lower(): t for t in RESOURCE_TYPES}
+    block_types = []
+    for name in list(base['block_types']) + list(policy.get('block_types') or []):
+        resource_type = types_by_name.get(name.lower())
+        if not resource_type:
+            raise ValueError(
+                f"Resource type '{name}' cannot be blocked, expected one of {', '.join(RESOURCE_TYPES)}"
+            )
+        if resource_type not in block_types:
+            block_types.append(resource_type)
+
+    return {
+        'preset': preset,
+        'block_types': block_types,
+        'block_patterns': list(dict.fromkeys(
+            list(base['block_patterns']) + list(policy.get('block_patterns') or [])
+        )),
+        'allow_patterns': list(dict.fromkeys(policy.get('allow_patterns') or []))
+    }
+
+def blocks_anything(policy: Optional[Dict[str, Any]]) -> bool:
+    """Whether a normalized policy blocks any request."""
+    return bool(policy and (policy['block_types'] or policy['block_patterns']))
+
+def extension_patterns(resource_type: str) -> List[str]:
+    """
+    Get Network.setBlockedURLs patterns approximating a resource type.
+
+    The extension is anchored at the end of the path, so hosts and paths
+    that merely contain it, such as www.webmd.com for webm, are not blocked.
+
+    Args:
+        resource_type: DevTools resource type
+
+    Returns:
+        List[str]: URL patterns, empty if the type has no known extensions
+    """
+    return [
+        pattern.format(ext)
+        for ext in TYPE_EXTENSIONS.get(resource_type, [])
+        for pattern in ('*.{}', '*.{}?*', '*.{}#*')
+    ]
+
+class ResourceBlocker:
+    """
+    Applies one instance's resource policy and counts what it blocks.
+
+    Over DevTools, the Fetch domain pauses only requests matching a blocked
+    type or pattern, so allowed requests never wait on this process; paused
+    requests are failed unless an allow pattern matches. Completed requests
+    are counted as allowed. Without DevTools, blocking falls back to
+    Network.setBlockedURLs through WebDriver, which only knows URL patterns,
+    so resource types are approximated by file extension and nothing is
+    counted.
+    """
+
+    def __init__(self):
+        """Initialize an idle blocker."""
+        self.policy: Optional[Dict[str, Any]] = None
+        self.mode: Optional[str] = None
+        self.blocked = 0
+        self.allowed = 0
+        self.blocked_by_type: Counter = Counter()
+        self._client: Optional[DevToolsClient] = None
+
+    async def apply(self, devtools: DevToolsClient, policy: Optional[Dict[str, Any]],
+                    driver: Optional[Chrome] = None) -> None:
+        """
+        Apply a policy over a DevTools connection; a no-op if already applied.
+
+        Args:
+            devtools: Connected client of the instance's page
+            policy: Normalized policy, or None to stop blocking
+            driver: WebDriver of the instance, used to clear URLs blocked by
+                an earlier WebDriver fallback
+        """
+        if self.mode == 'webdriver' and driver is not None:
+            self.reset_webdriver(driver)
+        if devtools is self._client and policy == self.policy:
+            return
+        if devtools is not self._client:
+            self._detach()
+            self._client = devtools
+            self.policy = None
+            devtools.on('Fetch.requestPaused', self._on_paused)
+            devtools.on('Network.loadingFinished', self._on_finished)
+
+        if blocks_anything(policy):
+            patterns = [
+                {'urlPattern': '*', 'resourceType': t, 'requestStage': 'Request'}
+                for t in policy['block_types']
+            ] + [
+                {'urlPattern': p, 'requestStage': 'Request'} for p in policy['block_patterns']
+            ]
+            if not blocks_anything(self.policy):
+                await devtools.send('Network.enable')
+            await devtools.send('Fetch.enable', {'patterns': patterns})
+        elif blocks_anything(self.policy):
+            await devtools.send('Fetch.disable')
+            await devtools.send('Network.disable')
+        self.policy = policy
+        self.mode = 'devtools'
+
+    def apply_via_webdriver(self, driver: Chrome, policy: Optional[Dict[str, Any]]) -> None:
+        """
+        Apply a policy through WebDriver when DevTools is unavailable.
+
+        Args:
+            driver: Chrome WebDriver instance
+            policy: Normalized policy, or None to stop blocking
+        """
+        if self.mode == 'webdriver' and policy == self.policy:
+            return
+        self._detach()
+        urls = []
+        if blocks_anything(policy):
+            urls = list(policy['block_patterns'])
+            for resource_type in policy['block_types']:
+                urls.extend(extension_patterns(resource_type))
+            driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': urls})
+        self.policy = policy
+        self.mode = 'webdriver'
+
+    def reset_webdriver(self, driver: Chrome) -> None:
+        """Clear WebDriver-applied blocking before the driver is reused."""
+        if self.mode == 'webdriver' and blocks_anything(self.policy):
+            try:
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+            except Exception as e:
+                logger.warning(f"Failed to clear blocked URLs: {str(e)}")
+        self.policy = None
+        self.mode = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the active policy and request counters.
+
+        Returns:
+            Dict[str, Any]: Policy, mode, and blocked and allowed counts
+            (None when blocking goes through WebDriver, which cannot count)
+        """
+        counting = self.mode == 'devtools'
+        return {
+            'policy': self.policy,
+            'mode': self.mode,
+            'blocked': self.blocked if counting else None,
+            'allowed': self.allowed if counting else None,
+            'blocked_by_type': dict(self.blocked_by_type) if counting else None
+        }
+
+    def _detach(self) -> None:
+        """Stop listening to a previous connection."""
+        if self._client:
+            self._client.off('Fetch.requestPaused', self._on_paused)
+            self._client.off('Network.loadingFinished', self._on_finished)
+            self._client = None
+
+    def _on_paused(self, params: Dict[str, Any]) -> None:
+        """Fail a paused request unless an allow pattern matches it."""
+        url = params.get('request', {}).get('url', '')
+        allow = self.policy and any(fnmatchcase(url, p) for p in self.policy['allow_patterns'])
+        if allow:
+            command = self._client.send('Fetch.continueRequest', {'requestId': params['requestId']})
+        else:
+            self.blocked += 1
+            self.blocked_by_type[params.get('resourceType', 'Other')] += 1
+            command = self._client.send('Fetch.failRequest', {
+                'requestId': params['requestId'],
+                'errorReason': 'BlockedByClient'
+            })
+        asyncio.ensure_future(command).add_done_callback(self._log_failure)
+
+    def _on_finished(self, params: Dict[str, Any]) -> None:
+        """Count a request that completed."""
+        self.allowed += 1
+
+    @staticmethod
+    def _log_failure(future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception():
+            logger.debug(f"Paused request could not be resolved: {future.exception()}")
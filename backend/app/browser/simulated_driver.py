@@ -0,0 +1,163 @@
+# File: backend/app/browser/simulated_driver.py
+"""
+Simulated driver module.
+A stand-in for Chrome WebDriver used when SIMULATED_DRIVER is enabled, so
+the service and its benchmarks run on hosts without Chrome.
+"""
+
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+import itertools
+import time
+import uuid
+from selenium.webdriver.chrome.options import Options
+
+from ..config import Config
+
+class _SimulatedProcess:
+    """Process handle of a driver that has no chromedriver process."""
+    pid = None
+
+    def poll(self) -> Optional[int]:
+        return None
+
+class _SimulatedService:
+    def __init__(self):
+        self.process = _SimulatedProcess()
+
+class _SimulatedSwitchTo:
+    def __init__(self, driver: "SimulatedDriver"):
+        self._driver = driver
+
+    def window(self, handle: str) -> None:
+        if handle not in self._driver.window_handles:
+            raise ValueError(f"No window with handle {handle}")
+        self._driver.current_window_handle = handle
+
+class SimulatedDriver:
+    """
+    Implements the subset of webdriver.Chrome the service uses.
+
+    Every call blocks for a configurable latency, as a real WebDriver round
+    trip would: SIMULATED_LAUNCH_SECONDS on creation, SIMULATED_NAVIGATION_SECONDS
+    per navigation and SIMULATED_COMMAND_SECONDS per other command. Scripts
+    are not run; execute_script answers the queries the service makes. The
+    driver exposes no debugger address, so instances use the WebDriver path
+    rather than DevTools, and no process, so it is never reported as crashed.
+    """
+
+    _handles = itertools.count(1)
+
+    def __init__(self, options: Optional[Options] = None, **kwargs):
+        """
+        Start a simulated browser.
+
+        Args:
+            options: Chrome options; the user agent and window size flags are honoured
+        """
+        time.sleep(Config.SIMULATED_LAUNCH_SECONDS)
+        arguments = options.arguments if options else []
+        flags = dict(arg.lstrip('-').split('=', 1) for arg in arguments if '=' in arg)
+        width, _, height = flags.get('window-size', '1280,800').partition(',')
+
+        self.session_id = uuid.uuid4().hex
+        self.service = _SimulatedService()
+        self.capabilities: Dict[str, Any] = {'browserName': 'chrome', 'simulated': True}
+        self.user_agent = flags.get('user-agent', 'Mozilla/5.0 (Simulated)')
+        self.window_handles: List[str] = [f"sim-{next(self._handles)}"]
+        self.current_window_handle = self.window_handles[0]
+        self.switch_to = _SimulatedSwitchTo(self)
+        self.current_url = 'data:,'
+        self.title = ''
+        self.zoom_level = 100
+        self.rect = {'x': 0, 'y': 0, 'width': int(width), 'height': int(height)}
+        self.commands = 0
+        self.quit_called = False
+
+    def _command(self, seconds: Optional[float] = None) -> None:
+        """Account one WebDriver round trip."""
+        if self.quit_called:
+            raise RuntimeError("Simulated browser has quit")
+        self.commands += 1
+        time.sleep(Config.SIMULATED_COMMAND_SECONDS if seconds is None else seconds)
+
+    def get(self, url: str) -> None:
+        self._command(Config.SIMULATED_NAVIGATION_SECONDS)
+        self.current_url = url
+        host = urlparse(url).hostname
+        self.title = host or url
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        self._command()
+        if 'navigator.userAgent' in script:
+            return self.user_agent
+        if 'window.__zoom_level = arguments[0]' in script and args:
+            self.zoom_level = args[0]
+            return None
+        if '__zoom_level' in script:
+            return self.zoom_level
+        if 'hasFocus' in script:
+            return True
+        if 'readyState' in script:
+            return 'complete'
+        if 'fitToWindow' in script:
+            return 100
+        # Load condition scripts resolve immediately
+        if 'Promise' in script:
+            return True
+        return None
+
+    async def execute_async_script(self, script: str, *args: Any) -> Any:
+        self._command()
+        return True
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: Dict[str, Any]) -> Dict[str, Any]:
+        self._command()
+        return {}
+
+    def set_page_load_timeout(self, time_to_wait: float) -> None:
+        pass
+
+    def set_script_timeout(self, time_to_wait: float) -> None:
+        pass
+
+    def set_window_position(self, x: int, y: int, windowHandle: str = 'current') -> None:
+        self._command()
+        self.rect.update(x=x, y=y)
+
+    def set_window_size(self, width: int, height: int, windowHandle: str = 'current') -> None:
+        self._command()
+        self.rect.update(width=width, height=height)
+
+    def set_window_rect(self, x: int = None, y: int = None, width: int = None,
+                        height: int = None) -> Dict[str, int]:
+        self._command()
+        self.rect.update({
+            key: value for key, value in
+            {'x': x, 'y': y, 'width': width, 'height': height}.items() if value is not None
+        })
+        return dict(self.rect)
+
+    def get_window_position(self, windowHandle: str = 'current') -> Dict[str, int]:
+        self._command()
+        return {'x': self.rect['x'], 'y': self.rect['y']}
+
+    def get_window_size(self, windowHandle: str = 'current') -> Dict[str, int]:
+        self._command()
+        return {'width': self.rect['width'], 'height': self.rect['height']}
+
+    def get_window_rect(self) -> Dict[str, int]:
+        self._command()
+        return dict(self.rect)
+
+    def maximize_window(self) -> None:
+        self.set_window_rect(0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
+
+    def close(self) -> None:
+        self._command()
+        if len(self.window_handles) > 1:
+            self.window_handles.remove(self.current_window_handle)
+            self.current_window_handle = self.window_handles[0]
+
+    def quit(self) -> None:
+        self.quit_called = True
@@ -5,7 +5,6 @@ Provides functionality for evading detection and simulating human behavior.
 """
 
 from selenium.webdriver import Chrome
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from typing import Optional, Dict, Any, List, Callable
 import random
@@ -13,6 +12,9 @@ import time
 import asyncio
 import math
 
+from .devtools import DevToolsClient
+from . import page_load
+
 class StealthBrowser:
     """
     Implements stealth browsing capabilities and human behavior simulation.
@@ -30,7 +32,12 @@ class StealthBrowser:
 
     @classmethod
     async def stealth_page_visit(cls, driver: Chrome, url: str, 
-                                logger: Optional[Callable] = None) -> None:
+                                logger: Optional[Callable] = None,
+                                devtools: Optional[DevToolsClient] = None,
+                                wait_until: str = 'load',
+                                selector: Optional[str] = None,
+                                timeout: Optional[float] = None,
+                                humanize: bool = False) -> None:
         """
         Visit a webpage using stealth techniques.
 
@@ -38,10 +45,20 @@ class StealthBrowser:
             driver: Selenium WebDriver instance
             url: URL to visit
             logger: Optional logging function
+            devtools: Optional DevTools connection used for navigation instead
+                of WebDriver; Selenium is used if it fails
+            wait_until: Load condition after which the page counts as visited
+                (domcontentloaded, load, networkidle or selector)
+            selector: CSS selector the selector condition waits for
+            timeout: Seconds the page may take to reach the condition
+                (random between 10 and 20 if not given)
+            humanize: Whether to add a random referrer, mouse movement and
+                pauses before the visit and scrolling after it; otherwise the
+                visit returns as soon as the load condition holds
         """
         try:
             # Set random referrer
-            if random.choice([True, False]):  # 50% chance to use referrer
+            if humanize and random.choice([True, False]):  # 50% chance to use referrer
                 chosen_referrer = random.choice(cls.REFERRERS)
                 if chosen_referrer:
                     driver.execute_script(
@@ -49,30 +66,56 @@ class StealthBrowser:
                     )
 
             # Randomize page load timeout
-            timeout = random.uniform(10, 20)
-            driver.set_page_load_timeout(timeout)
+            timeout = timeout or random.uniform(10, 20)
 
             # Pre-visit mouse movement
-            cls.simulate_human_mouse_movement(driver)
-            await asyncio.sleep(random.uniform(0.5, 1.5))
+            if humanize:
+                cls.simulate_human_mouse_movement(driver)
+                await asyncio.sleep(random.uniform(0.5, 1.5))
 
             # Visit page
-            driver.get(url)
+            if not (devtools and await cls._navigate_via_devtools(
+                    devtools, url, wait_until, selector, timeout, logger)):
+                started = time.monotonic()
+                driver.set_page_load_timeout(timeout)
+                driver.get(url)
 
-            # Wait for page load with random timeout
-            WebDriverWait(driver, timeout).until(
-                lambda d: d.execute_script('return document.readyState') == 'complete'
-            )
+                # Wait for the condition on the page's own events
+                page_load.wait_via_webdriver(
+                    driver, wait_until, selector, max(0.1, timeout - (time.monotonic() - started))
+                )
 
             # Post-load interaction
-            await asyncio.sleep(random.uniform(1, 2))
-            cls.simulate_human_scrolling(driver)
+            if humanize:
+                await asyncio.sleep(random.uniform(1, 2))
+                cls.simulate_human_scrolling(driver)
 
         except Exception as e:
             if logger:
                 logger(f"Stealth page visit failed: {str(e)}")
             raise
 
+    @staticmethod
+    async def _navigate_via_devtools(devtools: DevToolsClient, url: str, wait_until: str,
+                                     selector: Optional[str], timeout: float,
+                                     logger: Optional[Callable] = None) -> bool:
+        """
+        Navigate and wait for the load condition over DevTools.
+
+        Returns:
+            bool: True if the page loaded, False if the caller should fall back
+
+        Raises:
+            asyncio.TimeoutError: If the page does not load within timeout
+        """
+        try:
+            await page_load.navigate_via_devtools(devtools, url, wait_until, selector, timeout)
+            return True
+        except page_load.NavigationNotStarted as e:
+            if logger:
+                logger(f"DevTools navigation failed, falling back to WebDriver: {str(e)}")
+            return False
+
     @staticmethod
     def simulate_human_mouse_movement(driver: Chrome) -> None:
         """
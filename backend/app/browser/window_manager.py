@@ -9,6 +9,7 @@ from typing import Dict, Any, Tuple
 import random
 import time
 from ..config import Config
+from .devtools import DevToolsClient
 
 class WindowManager:
     """
@@ -16,6 +17,19 @@ class WindowManager:
     Provides functionality for window manipulation and layout management.
     """
 
+    ZOOM_SCRIPT = """
+        // Set zoom using multiple methods for compatibility
+        document.body.style.zoom = arguments[0] + '%';
+        document.documentElement.style.setProperty('--zoom-level', arguments[0]/100);
+        
+        // Set transform origin for smooth zooming
+        document.body.style.transformOrigin = 'top left';
+        document.body.style.transform = 'scale(' + (arguments[0]/100) + ')';
+        
+        // Store zoom level for persistence
+        window.__zoom_level = arguments[0];
+    """
+
     @staticmethod
     def position_window(driver: Chrome, instance_id: int, randomize: bool = True) -> None:
         """
@@ -26,6 +40,40 @@ class WindowManager:
             instance_id: Instance identifier
             randomize: Whether to add random offset to position
         """
+        bounds = WindowManager.grid_bounds(instance_id, randomize)
+        
+        # Set window position and size
+        driver.set_window_position(bounds['x'], bounds['y'])
+        driver.set_window_size(bounds['width'], bounds['height'])
+
+    @staticmethod
+    async def set_window_bounds_via_devtools(client: DevToolsClient, bounds: Dict[str, int]) -> None:
+        """
+        Move and resize a window over a direct DevTools connection.
+
+        Args:
+            client: Connected DevTools client for the page
+            bounds: Window x, y, width and height
+        """
+        await client.set_window_bounds({
+            'left': bounds['x'],
+            'top': bounds['y'],
+            'width': bounds['width'],
+            'height': bounds['height']
+        })
+
+    @staticmethod
+    def grid_bounds(instance_id: int, randomize: bool = True) -> Dict[str, int]:
+        """
+        Calculate the bounds of an instance's cell in the grid layout.
+
+        Args:
+            instance_id: Instance identifier
+            randomize: Whether to add random offset to position
+
+        Returns:
+            Dictionary with x, y, width and height
+        """
         # Calculate base window dimensions
         window_width = (Config.SCREEN_WIDTH // Config.GRID_COLS) - 4
         window_height = (Config.SCREEN_HEIGHT // Config.GRID_ROWS) - 4
@@ -45,9 +93,7 @@ class WindowManager:
             window_width += random.randint(-10, 10)
             window_height += random.randint(-10, 10)
         
-        # Set window position and size
-        driver.set_window_position(x_pos, y_pos)
-        driver.set_window_size(window_width, window_height)
+        return {'x': x_pos, 'y': y_pos, 'width': window_width, 'height': window_height}
 
     @staticmethod
     def set_zoom_level(driver: Chrome, zoom_level: float) -> None:
@@ -60,20 +106,19 @@ class WindowManager:
         """
         # Ensure zoom level is within valid range
         zoom_level = max(25, min(200, zoom_level))
-        
-        script = """
-            // Set zoom using multiple methods for compatibility
-            document.body.style.zoom = arguments[0] + '%';
-            document.documentElement.style.setProperty('--zoom-level', arguments[0]/100);
-            
-            // Set transform origin for smooth zooming
-            document.body.style.transformOrigin = 'top left';
-            document.body.style.transform = 'scale(' + (arguments[0]/100) + ')';
-            
-            // Store zoom level for persistence
-            window.__zoom_level = arguments[0];
+        driver.execute_script(WindowManager.ZOOM_SCRIPT, zoom_level)
+
+    @staticmethod
+    async def set_zoom_level_via_devtools(client: DevToolsClient, zoom_level: float) -> None:
+        """
+        Set the zoom level over a direct DevTools connection.
+
+        Args:
+            client: Connected DevTools client for the page
+            zoom_level: Zoom level percentage (25-200)
         """
-        driver.execute_script(script, zoom_level)
+        zoom_level = max(25, min(200, zoom_level))
+        await client.call_script(WindowManager.ZOOM_SCRIPT, zoom_level)
 
     @staticmethod
     def fit_content_to_window(driver: Chrome) -> float:
@@ -215,6 +260,32 @@ class WindowManager:
             'is_maximized': WindowManager._is_window_maximized(driver)
         }
 
+    @staticmethod
+    async def get_window_state_via_devtools(client: DevToolsClient) -> Dict[str, Any]:
+        """
+        Get window state over a direct DevTools connection.
+        Needs two protocol round-trips instead of five WebDriver calls.
+
+        Args:
+            client: Connected DevTools client for the page
+
+        Returns:
+            Dictionary containing window state information
+        """
+        bounds = await client.get_window_bounds()
+        page = await client.evaluate(
+            '({zoom_level: window.__zoom_level || 100, is_focused: document.hasFocus()})'
+        )
+        size = {'width': bounds.get('width'), 'height': bounds.get('height')}
+        return {
+            'position': {'x': bounds.get('left'), 'y': bounds.get('top')},
+            'size': size,
+            'zoom_level': page['zoom_level'],
+            'is_focused': page['is_focused'],
+            'is_maximized': (bounds.get('windowState') == 'maximized'
+                             or WindowManager._is_size_maximized(size))
+        }
+
     @staticmethod
     def _is_window_maximized(driver: Chrome) -> bool:
         """
@@ -226,6 +297,10 @@ class WindowManager:
         Returns:
             Boolean indicating if window is maximized
         """
-        window_size = driver.get_window_size()
+        return WindowManager._is_size_maximized(driver.get_window_size())
+
+    @staticmethod
+    def _is_size_maximized(window_size: Dict[str, int]) -> bool:
+        """Check if a window size covers the configured screen."""
         return (window_size['width'] >= Config.SCREEN_WIDTH - 20 and
                 window_size['height'] >= Config.SCREEN_HEIGHT - 40)
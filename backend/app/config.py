@@ -3,6 +3,7 @@
 Application configuration module.
 """
 import os
+import tempfile
 from pathlib import Path
 from typing import List
 
@@ -13,10 +14,123 @@ class Config:
     DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
     
     # Browser configuration
-    PROFILES_DIR = PROJECT_DIR / "chrome_profiles"
+    # Read at import time: the browser manager is created before load_env runs
+    PROFILES_DIR = Path(os.getenv('PROFILES_DIR', str(PROJECT_DIR / "chrome_profiles")))
     MAX_MEMORY_PER_INSTANCE = 512  # MB
     DEFAULT_ZOOM = 100  # Default zoom level
     ENCRYPT_PROFILES = False  # Whether to encrypt profiles
+    PROFILE_TEMPLATE_ENABLED = True  # Seed new profiles from a pre-initialized template profile
+    PROFILE_TEMPLATE_SETTLE = 3  # Seconds Chrome runs while the template is built
+    
+    # Warm pool configuration
+    WARM_POOL_SIZE = 0  # Pre-launched instances kept ready (0 disables the pool)
+    WARM_POOL_RECYCLE = True  # Whether deleting a pool instance with recycle discards its profile at once for a fresh replacement
+    
+    # Launch configuration
+    LAUNCH_CONCURRENCY = 4  # Instances started in parallel by background jobs
+    LAUNCH_MAX_COUNT = 50  # Instances a single creation request may ask for
+    LAUNCH_JOB_HISTORY = 100  # Finished launch jobs kept for polling
+    
+    # Batch visit configuration
+    BATCH_VISIT_MAX_PARALLEL = 10  # Concurrent visits per batch request
+    BATCH_VISIT_TIMEOUT = 60  # Seconds before a single instance's visit is reported as timed out
+    
+    # DevTools configuration
+    DEVTOOLS_ENABLED = True  # Use a direct DevTools connection for hot-path commands
+    DEVTOOLS_TIMEOUT = 10  # Seconds per DevTools command
+    DEVTOOLS_RETRY_INTERVAL = 60  # Seconds before reconnecting after a failed connection
+    
+    # Page load configuration
+    PAGE_LOAD_STRATEGY = "normal"  # WebDriver page load strategy of new instances (normal, eager, none)
+    DEFAULT_WAIT_UNTIL = "load"  # Load condition of visits that do not set one (domcontentloaded, load, networkidle)
+    NETWORK_IDLE_MS = 500  # Quiet period approximating network idle when DevTools is unavailable
+    HUMANIZE_VISITS = False  # Add human-like pauses, mouse movement and scrolling around visits
+    
+    # Instance state cache configuration
+    STATE_CACHE_MAX_AGE = 5  # Seconds a cached instance state may be served without a refresh
+    STATE_REFRESH_INTERVAL = 30  # Seconds between background refreshes of stale states
+    STATE_REFRESH_CONCURRENCY = 10  # Instances refreshed in parallel by the background refresher
+    
+    # System metrics configuration
+    METRICS_SAMPLE_INTERVAL = 2  # Seconds between system metrics samples
+    METRICS_HISTORY_SIZE = 1800  # Samples kept for /system/history (1 hour at the default interval)
+    PROCESS_SAMPLE_INTERVAL = 5  # Seconds between per-instance process tree samples
+    PROCESS_METRICS_PSS = False  # Also read proportional set size (slower, reads smaps)
+    
+    # Hibernation configuration
+    HIBERNATE_IDLE_TIMEOUT = 0  # Seconds without commands before an instance is hibernated (0 disables)
+    HIBERNATE_MAX_LIVE = 0  # Running instances kept before least recently used ones hibernate (0 = no limit)
+    HIBERNATE_CHECK_INTERVAL = 30  # Seconds between hibernation sweeps
+    
+    # Admission control configuration
+    ADMISSION_ENABLED = True  # Refuse cold launches that would exceed the host budget
+    ADMISSION_MEMORY_RESERVE_MB = 1024  # Memory kept free for the OS and this service
+    ADMISSION_MAX_CPU_PERCENT = 90  # Host CPU usage above which launches wait
+    ADMISSION_CPU_WINDOW = 10  # Seconds of CPU history averaged for admission
+    ADMISSION_QUEUE_TIMEOUT = 30  # Seconds a launch waits for budget before it is rejected
+    ADMISSION_RETRY_AFTER = 15  # Seconds suggested to clients after a rejection
+    
+    # Profile maintenance configuration
+    PROFILE_MAINTENANCE_INTERVAL = 600  # Seconds between cache pruning and quota sweeps
+    PROFILE_QUOTA_MB = 0  # Size above which a stopped profile is evicted once its caches are pruned (0 disables)
+    PROFILES_TOTAL_QUOTA_MB = 0  # Total size above which least recently used stopped profiles are evicted (0 disables)
+    PROFILE_DISK_CACHE_MB = 0  # HTTP cache limit passed to Chrome per profile (0 = Chrome default)
+    
+    # Ephemeral profile configuration
+    EPHEMERAL_PROFILES_DIR = (
+        Path("/dev/shm") if Path("/dev/shm").is_dir() else Path(tempfile.gettempdir())
+    ) / "liebexplorer_profiles"  # RAM-backed directory for ephemeral instance profiles
+    EPHEMERAL_MIN_FREE_MB = 512  # Free space the RAM disk must keep for an ephemeral launch
+    EPHEMERAL_DISK_CACHE_MB = 32  # HTTP cache limit of ephemeral profiles
+    EPHEMERAL_PERSIST = False  # Copy ephemeral profiles to disk when their instance stops
+    
+    # Resource blocking configuration
+    RESOURCE_POLICY_PRESET = ""  # Blocking preset of instances created without a policy (trackers, media, dom; empty disables)
+    
+    # Caching proxy configuration
+    CACHE_PROXY_ENABLED = False  # Route every instance through a local proxy sharing one HTTP cache
+    CACHE_PROXY_HOST = "127.0.0.1"  # Address the caching proxy listens on
+    CACHE_PROXY_PORT = 0  # Port of the caching proxy (0 = any free port)
+    CACHE_PROXY_DIR = None  # Directory of the shared cache (None = http_cache in PROFILES_DIR)
+    CACHE_PROXY_MAX_MB = 1024  # Size above which least recently used responses are evicted
+    CACHE_PROXY_MAX_OBJECT_MB = 50  # Largest response that is stored
+    CACHE_PROXY_HEURISTIC_MAX = 86400  # Longest heuristic freshness of responses without an explicit lifetime
+    CACHE_PROXY_TIMEOUT = 30  # Seconds the proxy waits for an origin
+    CACHE_PROXY_BYPASS = ""  # Chrome --proxy-bypass-list (Chrome bypasses loopback hosts unless it contains <-loopback>)
+    
+    # Launch profile configuration
+    DEFAULT_LAUNCH_PROFILE = "standard"  # Launch profile of instances created without one (standard, headless, density)
+    DENSITY_RENDERER_PROCESS_LIMIT = 2  # Renderer processes per instance in the density profile (0 = Chrome default)
+    
+    # Sharding configuration
+    SHARD_COUNT = 1  # Worker processes instances are partitioned across (1 disables sharding)
+    SHARD_INDEX = 0  # Shard owned by this process
+    SHARD_HOST = "127.0.0.1"  # Address shard processes listen on
+    SHARD_BASE_PORT = 0  # Port of shard 0; shard i listens on SHARD_BASE_PORT + i (0 = router port + 1)
+    SHARD_REQUEST_TIMEOUT = 300  # Seconds the router waits for a shard
+    
+    # Cluster configuration
+    CLUSTER_AGENTS: List[str] = []  # Agent base URLs the coordinator routes to (empty = local shards)
+    CLUSTER_AGENT = False  # This process is an agent with a host of its own
+    CLUSTER_CAPACITY_TTL = 2.0  # Seconds the coordinator reuses agent capacity reports
+    
+    # Task queue configuration
+    TASK_QUEUE_ENABLED = True  # Drain queued visit tasks with idle instances
+    TASK_QUEUE_DB = None  # SQLite file of the task queue (None = task_queue.db in PROFILES_DIR)
+    TASK_QUEUE_CONCURRENCY = 0  # Tasks run at once by this process (0 = one per instance)
+    TASK_POLL_INTERVAL = 0.5  # Seconds between checks for tasks queued by other processes
+    TASK_VISIT_TIMEOUT = 60  # Seconds a single task attempt may take
+    TASK_MAX_ATTEMPTS = 3  # Default attempts per task
+    TASK_RETRY_DELAY = 5  # Default seconds before the first retry; doubles on each further attempt
+    TASK_RETENTION = 86400  # Seconds finished tasks are kept (0 keeps them forever)
+    
+    # Push event configuration
+    EVENTS_INTERVAL = 2  # Seconds between crash checks and metric pushes (0 disables them)
+    EVENTS_QUEUE_SIZE = 1000  # Events buffered per push client before it is resynchronized
+    
+    # Event loop monitor configuration
+    LOOP_MONITOR_INTERVAL = 0.1  # Seconds between event loop lag probes (0 disables the monitor)
+    LOOP_STALL_THRESHOLD = 0.1  # Lag in seconds above which the event loop counts as stalled
     
     # Window layout configuration
     SCREEN_WIDTH = 1920
@@ -31,6 +145,14 @@ class Config:
     # Chrome configuration
     CHROME_DRIVER_PATH = None  # If None, download automatically
     CHROME_BINARY_PATH = None  # Chrome browser executable path
+    DRIVER_CACHE_FILE = PROJECT_DIR / ".chromedriver_cache.json"  # Resolved driver paths keyed by Chrome version
+    DRIVER_OFFLINE = False  # Never download ChromeDriver; use configured, cached or PATH drivers only
+    
+    # Simulated driver configuration
+    SIMULATED_DRIVER = False  # Run instances on a simulated driver instead of Chrome (benchmarks, development)
+    SIMULATED_LAUNCH_SECONDS = 0.5  # Time a simulated launch blocks
+    SIMULATED_NAVIGATION_SECONDS = 0.2  # Time a simulated navigation blocks
+    SIMULATED_COMMAND_SECONDS = 0.002  # Time any other simulated WebDriver command blocks
     
     # API configuration
     API_VERSION = "v1"
@@ -63,6 +185,121 @@ class Config:
         cls.DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
         cls.MAX_MEMORY_PER_INSTANCE = int(os.getenv('MAX_MEMORY_PER_INSTANCE', '512'))
         cls.ENCRYPT_PROFILES = os.getenv('ENCRYPT_PROFILES', 'False').lower() == 'true'
+        cls.PROFILE_TEMPLATE_ENABLED = os.getenv('PROFILE_TEMPLATE_ENABLED', str(cls.PROFILE_TEMPLATE_ENABLED)).lower() == 'true'
+        cls.PROFILE_TEMPLATE_SETTLE = float(os.getenv('PROFILE_TEMPLATE_SETTLE', str(cls.PROFILE_TEMPLATE_SETTLE)))
+        
+        # Warm pool configuration
+        cls.WARM_POOL_SIZE = int(os.getenv('WARM_POOL_SIZE', str(cls.WARM_POOL_SIZE)))
+        cls.WARM_POOL_RECYCLE = os.getenv('WARM_POOL_RECYCLE', str(cls.WARM_POOL_RECYCLE)).lower() == 'true'
+        
+        # Launch configuration
+        cls.LAUNCH_CONCURRENCY = int(os.getenv('LAUNCH_CONCURRENCY', str(cls.LAUNCH_CONCURRENCY)))
+        cls.LAUNCH_MAX_COUNT = int(os.getenv('LAUNCH_MAX_COUNT', str(cls.LAUNCH_MAX_COUNT)))
+        cls.LAUNCH_JOB_HISTORY = int(os.getenv('LAUNCH_JOB_HISTORY', str(cls.LAUNCH_JOB_HISTORY)))
+        
+        # Batch visit configuration
+        cls.BATCH_VISIT_MAX_PARALLEL = int(os.getenv('BATCH_VISIT_MAX_PARALLEL', str(cls.BATCH_VISIT_MAX_PARALLEL)))
+        cls.BATCH_VISIT_TIMEOUT = float(os.getenv('BATCH_VISIT_TIMEOUT', str(cls.BATCH_VISIT_TIMEOUT)))
+        
+        # DevTools configuration
+        cls.DEVTOOLS_ENABLED = os.getenv('DEVTOOLS_ENABLED', str(cls.DEVTOOLS_ENABLED)).lower() == 'true'
+        cls.DEVTOOLS_TIMEOUT = float(os.getenv('DEVTOOLS_TIMEOUT', str(cls.DEVTOOLS_TIMEOUT)))
+        cls.DEVTOOLS_RETRY_INTERVAL = float(os.getenv('DEVTOOLS_RETRY_INTERVAL', str(cls.DEVTOOLS_RETRY_INTERVAL)))
+        
+        # Page load configuration
+        cls.PAGE_LOAD_STRATEGY = os.getenv('PAGE_LOAD_STRATEGY', cls.PAGE_LOAD_STRATEGY)
+        cls.DEFAULT_WAIT_UNTIL = os.getenv('DEFAULT_WAIT_UNTIL', cls.DEFAULT_WAIT_UNTIL)
+        cls.NETWORK_IDLE_MS = int(os.getenv('NETWORK_IDLE_MS', str(cls.NETWORK_IDLE_MS)))
+        cls.HUMANIZE_VISITS = os.getenv('HUMANIZE_VISITS', str(cls.HUMANIZE_VISITS)).lower() == 'true'
+        
+        # Instance state cache configuration
+        cls.STATE_CACHE_MAX_AGE = float(os.getenv('STATE_CACHE_MAX_AGE', str(cls.STATE_CACHE_MAX_AGE)))
+        cls.STATE_REFRESH_INTERVAL = float(os.getenv('STATE_REFRESH_INTERVAL', str(cls.STATE_REFRESH_INTERVAL)))
+        cls.STATE_REFRESH_CONCURRENCY = int(os.getenv('STATE_REFRESH_CONCURRENCY', str(cls.STATE_REFRESH_CONCURRENCY)))
+        
+        # System metrics configuration
+        cls.METRICS_SAMPLE_INTERVAL = float(os.getenv('METRICS_SAMPLE_INTERVAL', str(cls.METRICS_SAMPLE_INTERVAL)))
+        cls.METRICS_HISTORY_SIZE = int(os.getenv('METRICS_HISTORY_SIZE', str(cls.METRICS_HISTORY_SIZE)))
+        cls.PROCESS_SAMPLE_INTERVAL = float(os.getenv('PROCESS_SAMPLE_INTERVAL', str(cls.PROCESS_SAMPLE_INTERVAL)))
+        cls.PROCESS_METRICS_PSS = os.getenv('PROCESS_METRICS_PSS', str(cls.PROCESS_METRICS_PSS)).lower() == 'true'
+        
+        # Hibernation configuration
+        cls.HIBERNATE_IDLE_TIMEOUT = float(os.getenv('HIBERNATE_IDLE_TIMEOUT', str(cls.HIBERNATE_IDLE_TIMEOUT)))
+        cls.HIBERNATE_MAX_LIVE = int(os.getenv('HIBERNATE_MAX_LIVE', str(cls.HIBERNATE_MAX_LIVE)))
+        cls.HIBERNATE_CHECK_INTERVAL = float(os.getenv('HIBERNATE_CHECK_INTERVAL', str(cls.HIBERNATE_CHECK_INTERVAL)))
+        
+        # Admission control configuration
+        cls.ADMISSION_ENABLED = os.getenv('ADMISSION_ENABLED', str(cls.ADMISSION_ENABLED)).lower() == 'true'
+        cls.ADMISSION_MEMORY_RESERVE_MB = int(os.getenv('ADMISSION_MEMORY_RESERVE_MB', str(cls.ADMISSION_MEMORY_RESERVE_MB)))
+        cls.ADMISSION_MAX_CPU_PERCENT = float(os.getenv('ADMISSION_MAX_CPU_PERCENT', str(cls.ADMISSION_MAX_CPU_PERCENT)))
+        cls.ADMISSION_CPU_WINDOW = float(os.getenv('ADMISSION_CPU_WINDOW', str(cls.ADMISSION_CPU_WINDOW)))
+        cls.ADMISSION_QUEUE_TIMEOUT = float(os.getenv('ADMISSION_QUEUE_TIMEOUT', str(cls.ADMISSION_QUEUE_TIMEOUT)))
+        cls.ADMISSION_RETRY_AFTER = int(os.getenv('ADMISSION_RETRY_AFTER', str(cls.ADMISSION_RETRY_AFTER)))
+        
+        # Profile maintenance configuration
+        cls.PROFILE_MAINTENANCE_INTERVAL = float(os.getenv('PROFILE_MAINTENANCE_INTERVAL', str(cls.PROFILE_MAINTENANCE_INTERVAL)))
+        cls.PROFILE_QUOTA_MB = int(os.getenv('PROFILE_QUOTA_MB', str(cls.PROFILE_QUOTA_MB)))
+        cls.PROFILES_TOTAL_QUOTA_MB = int(os.getenv('PROFILES_TOTAL_QUOTA_MB', str(cls.PROFILES_TOTAL_QUOTA_MB)))
+        cls.PROFILE_DISK_CACHE_MB = int(os.getenv('PROFILE_DISK_CACHE_MB', str(cls.PROFILE_DISK_CACHE_MB)))
+        
+        # Ephemeral profile configuration
+        cls.EPHEMERAL_PROFILES_DIR = Path(os.getenv('EPHEMERAL_PROFILES_DIR', str(cls.EPHEMERAL_PROFILES_DIR)))
+        cls.EPHEMERAL_MIN_FREE_MB = int(os.getenv('EPHEMERAL_MIN_FREE_MB', str(cls.EPHEMERAL_MIN_FREE_MB)))
+        cls.EPHEMERAL_DISK_CACHE_MB = int(os.getenv('EPHEMERAL_DISK_CACHE_MB', str(cls.EPHEMERAL_DISK_CACHE_MB)))
+        cls.EPHEMERAL_PERSIST = os.getenv('EPHEMERAL_PERSIST', str(cls.EPHEMERAL_PERSIST)).lower() == 'true'
+        
+        # Resource blocking configuration
+        cls.RESOURCE_POLICY_PRESET = os.getenv('RESOURCE_POLICY_PRESET', cls.RESOURCE_POLICY_PRESET)
+        
+        # Caching proxy configuration
+        cls.CACHE_PROXY_ENABLED = os.getenv('CACHE_PROXY_ENABLED', str(cls.CACHE_PROXY_ENABLED)).lower() == 'true'
+        cls.CACHE_PROXY_HOST = os.getenv('CACHE_PROXY_HOST', cls.CACHE_PROXY_HOST)
+        cls.CACHE_PROXY_PORT = int(os.getenv('CACHE_PROXY_PORT', str(cls.CACHE_PROXY_PORT)))
+        cls.CACHE_PROXY_DIR = os.getenv('CACHE_PROXY_DIR', cls.CACHE_PROXY_DIR)
+        cls.CACHE_PROXY_MAX_MB = int(os.getenv('CACHE_PROXY_MAX_MB', str(cls.CACHE_PROXY_MAX_MB)))
+        cls.CACHE_PROXY_MAX_OBJECT_MB = int(os.getenv('CACHE_PROXY_MAX_OBJECT_MB', str(cls.CACHE_PROXY_MAX_OBJECT_MB)))
+        cls.CACHE_PROXY_HEURISTIC_MAX = int(os.getenv('CACHE_PROXY_HEURISTIC_MAX', str(cls.CACHE_PROXY_HEURISTIC_MAX)))
+        cls.CACHE_PROXY_TIMEOUT = float(os.getenv('CACHE_PROXY_TIMEOUT', str(cls.CACHE_PROXY_TIMEOUT)))
+        cls.CACHE_PROXY_BYPASS = os.getenv('CACHE_PROXY_BYPASS', cls.CACHE_PROXY_BYPASS)
+        
+        # Launch profile configuration
+        cls.DEFAULT_LAUNCH_PROFILE = os.getenv('DEFAULT_LAUNCH_PROFILE', cls.DEFAULT_LAUNCH_PROFILE)
+        cls.DENSITY_RENDERER_PROCESS_LIMIT = int(os.getenv('DENSITY_RENDERER_PROCESS_LIMIT', str(cls.DENSITY_RENDERER_PROCESS_LIMIT)))
+        
+        # Sharding configuration
+        cls.SHARD_COUNT = max(1, int(os.getenv('SHARD_COUNT', str(cls.SHARD_COUNT))))
+        cls.SHARD_INDEX = int(os.getenv('SHARD_INDEX', str(cls.SHARD_INDEX)))
+        cls.SHARD_HOST = os.getenv('SHARD_HOST', cls.SHARD_HOST)
+        cls.SHARD_BASE_PORT = int(os.getenv('SHARD_BASE_PORT', str(cls.SHARD_BASE_PORT)))
+        cls.SHARD_REQUEST_TIMEOUT = float(os.getenv('SHARD_REQUEST_TIMEOUT', str(cls.SHARD_REQUEST_TIMEOUT)))
+        
+        # Cluster configuration
+        cluster_agents = os.getenv('CLUSTER_AGENTS')
+        if cluster_agents:
+            cls.CLUSTER_AGENTS = [url.strip().rstrip('/') for url in cluster_agents.split(',') if url.strip()]
+        if cls.CLUSTER_AGENTS:
+            # Agent i owns the instances whose id is i modulo the number of agents
+            cls.SHARD_COUNT = len(cls.CLUSTER_AGENTS)
+        cls.CLUSTER_AGENT = os.getenv('CLUSTER_AGENT', str(cls.CLUSTER_AGENT)).lower() == 'true'
+        cls.CLUSTER_CAPACITY_TTL = float(os.getenv('CLUSTER_CAPACITY_TTL', str(cls.CLUSTER_CAPACITY_TTL)))
+        
+        # Task queue configuration
+        cls.TASK_QUEUE_ENABLED = os.getenv('TASK_QUEUE_ENABLED', str(cls.TASK_QUEUE_ENABLED)).lower() == 'true'
+        cls.TASK_QUEUE_DB = os.getenv('TASK_QUEUE_DB', cls.TASK_QUEUE_DB)
+        cls.TASK_QUEUE_CONCURRENCY = int(os.getenv('TASK_QUEUE_CONCURRENCY', str(cls.TASK_QUEUE_CONCURRENCY)))
+        cls.TASK_POLL_INTERVAL = float(os.getenv('TASK_POLL_INTERVAL', str(cls.TASK_POLL_INTERVAL)))
+        cls.TASK_VISIT_TIMEOUT = float(os.getenv('TASK_VISIT_TIMEOUT', str(cls.TASK_VISIT_TIMEOUT)))
+        cls.TASK_MAX_ATTEMPTS = int(os.getenv('TASK_MAX_ATTEMPTS', str(cls.TASK_MAX_ATTEMPTS)))
+        cls.TASK_RETRY_DELAY = float(os.getenv('TASK_RETRY_DELAY', str(cls.TASK_RETRY_DELAY)))
+        cls.TASK_RETENTION = float(os.getenv('TASK_RETENTION', str(cls.TASK_RETENTION)))
+        
+        # Push event configuration
+        cls.EVENTS_INTERVAL = float(os.getenv('EVENTS_INTERVAL', str(cls.EVENTS_INTERVAL)))
+        cls.EVENTS_QUEUE_SIZE = int(os.getenv('EVENTS_QUEUE_SIZE', str(cls.EVENTS_QUEUE_SIZE)))
+        
+        # Event loop monitor configuration
+        cls.LOOP_MONITOR_INTERVAL = float(os.getenv('LOOP_MONITOR_INTERVAL', str(cls.LOOP_MONITOR_INTERVAL)))
+        cls.LOOP_STALL_THRESHOLD = float(os.getenv('LOOP_STALL_THRESHOLD', str(cls.LOOP_STALL_THRESHOLD)))
         
         # Proxy configuration
         cls.PROXY_ENABLED = os.getenv('PROXY_ENABLED', 'False').lower() == 'true'
@@ -73,6 +310,14 @@ class Config:
         # Chrome configuration
         cls.CHROME_DRIVER_PATH = os.getenv('CHROME_DRIVER_PATH', cls.CHROME_DRIVER_PATH)
         cls.CHROME_BINARY_PATH = os.getenv('CHROME_BINARY_PATH', cls.CHROME_BINARY_PATH)
+        cls.DRIVER_CACHE_FILE = Path(os.getenv('DRIVER_CACHE_FILE', str(cls.DRIVER_CACHE_FILE)))
+        cls.DRIVER_OFFLINE = os.getenv('DRIVER_OFFLINE', str(cls.DRIVER_OFFLINE)).lower() == 'true'
+        
+        # Simulated driver configuration
+        cls.SIMULATED_DRIVER = os.getenv('SIMULATED_DRIVER', str(cls.SIMULATED_DRIVER)).lower() == 'true'
+        cls.SIMULATED_LAUNCH_SECONDS = float(os.getenv('SIMULATED_LAUNCH_SECONDS', str(cls.SIMULATED_LAUNCH_SECONDS)))
+        cls.SIMULATED_NAVIGATION_SECONDS = float(os.getenv('SIMULATED_NAVIGATION_SECONDS', str(cls.SIMULATED_NAVIGATION_SECONDS)))
+        cls.SIMULATED_COMMAND_SECONDS = float(os.getenv('SIMULATED_COMMAND_SECONDS', str(cls.SIMULATED_COMMAND_SECONDS)))
         
         # Logging configuration
         cls.LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
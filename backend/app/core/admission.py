@@ -0,0 +1,166 @@
+# File: backend/app/core/admission.py
+"""Memory and CPU budgeted admission control for new instances."""
+
+from typing import Any, Dict, Optional
+import threading
+import time
+import psutil
+from loguru import logger
+
+from app.config import Config
+
+class AdmissionRejected(Exception):
+    """Raised when launching another instance would exceed the host budget."""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+class AdmissionController:
+    """
+    Decides whether the host can afford one more Chrome instance.
+
+    The cost of an instance is estimated from the measured memory of the
+    instances already running, falling back to MAX_MEMORY_PER_INSTANCE before
+    any have been measured. Launches that have been admitted but are not yet
+    visible in host memory are reserved against the budget until they finish.
+    """
+
+    def __init__(self, browser_manager):
+        """
+        Initialize the controller.
+
+        Args:
+            browser_manager: BrowserManager providing process and system metrics
+        """
+        self.browser_manager = browser_manager
+        self._cond = threading.Condition()
+        self._reserved = 0
+        self._waiting = 0
+
+        # Statistics
+        self.admitted = 0
+        self.rejected = 0
+
+    def estimate_instance_mb(self) -> float:
+        """Estimate the memory one more instance will use, in MB."""
+        measured = [
+            m['pss_mb'] if m.get('pss_mb') is not None else m['rss_mb']
+            for m in self.browser_manager.process_metrics.get_all().values()
+            if m.get('rss_mb')
+        ]
+        if measured:
+            return sum(measured) / len(measured)
+        return float(Config.MAX_MEMORY_PER_INSTANCE)
+
+    def check(self) -> Optional[str]:
+        """
+        Check whether one more launch fits the budget right now.
+
+        Returns:
+            Optional[str]: Reason for rejection, or None if the launch fits
+        """
+        with self._cond:
+            return self._check(self._reserved)
+
+    def acquire(self, timeout: Optional[float] = None) -> None:
+        """
+        Reserve budget for one launch, waiting up to timeout for room.
+
+        Args:
+            timeout: Seconds to queue for budget (defaults to ADMISSION_QUEUE_TIMEOUT)
+
+        Raises:
+            AdmissionRejected: If the budget did not allow the launch in time
+        """
+        if not Config.ADMISSION_ENABLED:
+            return
+        if timeout is None:
+            timeout = Config.ADMISSION_QUEUE_TIMEOUT
+        deadline = time.monotonic() + max(0, timeout)
+        with self._cond:
+            while True:
+                reason = self._check(self._reserved)
+                if reason is None:
+                    self._reserved += 1
+                    self.admitted += 1
+                    return
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.rejected += 1
+                    logger.warning(f"Instance launch rejected: {reason}")
+                    raise AdmissionRejected(reason, Config.ADMISSION_RETRY_AFTER)
+                # Memory is also freed outside our control, so re-check periodically
+                self._waiting += 1
+                try:
+                    self._cond.wait(min(remaining, 1.0))
+                finally:
+                    self._waiting -= 1
+
+    def try_acquire(self) -> bool:
+        """Reserve budget for one launch if it fits right now, without counting a rejection."""
+        if not Config.ADMISSION_ENABLED:
+            return True
+        with self._cond:
+            if self._check(self._reserved) is not None:
+                return False
+            self._reserved += 1
+            self.admitted += 1
+            return True
+
+    def release(self) -> None:
+        """Return the budget reserved by acquire once a launch has finished."""
+        if not Config.ADMISSION_ENABLED:
+            return
+        with self._cond:
+            self._reserved = max(0, self._reserved - 1)
+            self._cond.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the current budget and admission counters.
+
+        Returns:
+            Dict[str, Any]: Admission statistics
+        """
+        memory = psutil.virtual_memory()
+        with self._cond:
+            return {
+                'enabled': Config.ADMISSION_ENABLED,
+                'available_mb': round(memory.available / 1024 / 1024, 1),
+                'reserve_mb': Config.ADMISSION_MEMORY_RESERVE_MB,
+                'instance_estimate_mb': round(self.estimate_instance_mb(), 1),
+                'cpu_usage': self._recent_cpu(),
+                'max_cpu_percent': Config.ADMISSION_MAX_CPU_PERCENT,
+                'launching': self._reserved,
+                'waiting': self._waiting,
+                'admitted': self.admitted,
+                'rejected': self.rejected,
+                'blocked_reason': self._check(self._reserved)
+            }
+
+    def _check(self, reserved: int) -> Optional[str]:
+        """Evaluate the budget with the given number of launches in flight."""
+        estimate = self.estimate_instance_mb()
+        available_mb = psutil.virtual_memory().available / 1024 / 1024
+        needed_mb = estimate * (reserved + 1) + Config.ADMISSION_MEMORY_RESERVE_MB
+        if available_mb < needed_mb:
+            return (
+                f"Insufficient memory: {available_mb:.0f} MB available, "
+                f"{needed_mb:.0f} MB needed for {reserved + 1} launch(es) "
+                f"of ~{estimate:.0f} MB plus {Config.ADMISSION_MEMORY_RESERVE_MB} MB reserve"
+            )
+
+        cpu = self._recent_cpu()
+        if cpu is not None and cpu > Config.ADMISSION_MAX_CPU_PERCENT:
+            return f"CPU usage {cpu:.0f}% exceeds {Config.ADMISSION_MAX_CPU_PERCENT}%"
+        return None
+
+    def _recent_cpu(self) -> Optional[float]:
+        """Average host CPU usage over the last few samples."""
+        sampler = self.browser_manager.metrics_sampler
+        if not sampler:
+            return None
+        points = sampler.history(Config.ADMISSION_CPU_WINDOW, 1)
+        return points[0]['cpu_usage'] if points else None
@@ -1,9 +1,14 @@
 # File: backend/app/core/browser_manager.py
 """Browser instance management module."""
 
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import Future
+from datetime import datetime
 import asyncio
 import os
+import re
+import shutil
+import threading
 import time
 from loguru import logger
 from selenium import webdriver
@@ -14,17 +19,130 @@ from app.browser import (
     ChromeDriverManager,
     WindowManager,
     FingerprintGenerator,
+    LaunchProfiles,
     StealthBrowser
 )
+from app.browser.devtools import DevToolsClient
+from app.browser.page_load import normalize_wait
+from app.browser.resource_blocking import ResourceBlocker, normalize_policy
+from .instance_pool import InstancePool
+from .instance_worker import InstanceWorker
+from .launch_jobs import LaunchJobManager
+from .task_queue import TaskQueue
+from .event_bus import EventBus
+from .loop_monitor import EventLoopMonitor
+from .cache_proxy import CachingProxy
+from .metrics_sampler import SystemMetricsSampler
+from .process_metrics import ProcessTreeAccountant
+from .admission import AdmissionController, AdmissionRejected
+from .state_cache import InstanceStateCache
+from . import sharding
+
+class InstanceNotFoundError(KeyError):
+    """Raised when a command targets an instance that is not running."""
 
 class BrowserManager:
     def __init__(self):
         """Initialize browser manager."""
         logger.info("Initializing BrowserManager")
         self.chrome_processes: Dict[str, webdriver.Chrome] = {}
+        self.instance_meta: Dict[str, Dict[str, Any]] = {}
+        self.workers: Dict[str, InstanceWorker] = {}
+        self.devtools: Dict[str, DevToolsClient] = {}
+        self.resource_blockers: Dict[str, ResourceBlocker] = {}
+        self.hibernated: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._launching = set()
+        self._resuming: Dict[str, Future] = {}
+        self._next_instance_id: Optional[int] = None
         self.driver_manager = ChromeDriverManager()
+        self.cache_proxy = CachingProxy()
+        self.driver_manager.cache_proxy = self.cache_proxy
+        self.process_metrics = ProcessTreeAccountant(Config.PROCESS_SAMPLE_INTERVAL)
+        self.admission = AdmissionController(self)
+        self.instance_pool = InstancePool(
+            self.driver_manager, self._verify_instance, admission=self.admission
+        )
+        self.launch_jobs = LaunchJobManager(self)
+        self.task_queue = TaskQueue(self)
+        self.events = EventBus()
+        self.state_cache = InstanceStateCache(self._load_instance_info, on_change=self._on_state_change)
+        self._state_refresher: Optional[asyncio.Task] = None
+        self._event_watcher: Optional[asyncio.Task] = None
+        self._hibernator: Optional[asyncio.Task] = None
+        self.metrics_sampler: Optional[SystemMetricsSampler] = None
+        self.loop_monitor = EventLoopMonitor(Config.LOOP_MONITOR_INTERVAL, Config.LOOP_STALL_THRESHOLD)
         self._ensure_directories()
         logger.info("BrowserManager initialization completed")
+
+    def start_background_tasks(self):
+        """Start background services once configuration has been loaded."""
+        # A simulated driver needs neither Chrome nor ChromeDriver
+        if not Config.SIMULATED_DRIVER:
+            self.driver_manager.resolver.prefetch()
+        # Started first, so pooled instances are launched through it too
+        if Config.CACHE_PROXY_ENABLED:
+            try:
+                self.cache_proxy.start()
+            except Exception as e:
+                logger.error(f"Failed to start caching proxy, instances will connect directly: {str(e)}")
+        if Config.WARM_POOL_SIZE > 0:
+            self.instance_pool.start(Config.WARM_POOL_SIZE)
+        self.get_metrics_sampler().start()
+        self.process_metrics.interval = Config.PROCESS_SAMPLE_INTERVAL
+        self.process_metrics.include_pss = Config.PROCESS_METRICS_PSS
+        self.process_metrics.start()
+        if (Config.PROFILE_TEMPLATE_ENABLED and sharding.is_primary()
+                and not self.driver_manager.profile_manager.template.ready):
+            threading.Thread(
+                target=self.driver_manager.build_profile_template,
+                name="profile-template-builder",
+                daemon=True
+            ).start()
+        self.driver_manager.cleanup_ephemeral_profiles(sharding.owns_profile)
+        # Instances hibernated before a restart can still be resumed
+        self.hibernated.update({
+            instance_id: record
+            for instance_id, record in self.driver_manager.profile_manager.list_hibernated().items()
+            if sharding.owns_instance(instance_id)
+        })
+        if Config.PROFILE_MAINTENANCE_INTERVAL > 0:
+            self._get_maintenance().start(Config.PROFILE_MAINTENANCE_INTERVAL)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("No running event loop, instance state refresher not started")
+            return
+        if Config.STATE_REFRESH_INTERVAL > 0 and not self._state_refresher:
+            self._state_refresher = loop.create_task(self._refresh_states())
+        if ((Config.HIBERNATE_IDLE_TIMEOUT > 0 or Config.HIBERNATE_MAX_LIVE > 0)
+                and not self._hibernator):
+            self._hibernator = loop.create_task(self._hibernate_idle())
+        if Config.TASK_QUEUE_ENABLED:
+            self.task_queue.start()
+        if Config.EVENTS_INTERVAL > 0 and not self._event_watcher:
+            self._event_watcher = loop.create_task(self._watch_instances())
+        if Config.LOOP_MONITOR_INTERVAL > 0:
+            self.loop_monitor.interval = Config.LOOP_MONITOR_INTERVAL
+            self.loop_monitor.stall_threshold = Config.LOOP_STALL_THRESHOLD
+            self.loop_monitor.start(loop)
+
+    async def _refresh_states(self):
+        """Periodically reload cached states that have gone stale."""
+        while True:
+            await asyncio.sleep(Config.STATE_REFRESH_INTERVAL)
+            try:
+                instance_ids = list(self.chrome_processes.keys())
+                self.state_cache.prune(instance_ids)
+                refreshed = await self.state_cache.refresh_stale(
+                    instance_ids,
+                    Config.STATE_REFRESH_INTERVAL,
+                    Config.STATE_REFRESH_CONCURRENCY
+                )
+                if refreshed:
+                    logger.debug(f"Refreshed state of {refreshed} instances")
+            except Exception as e:
+                logger.error(f"Instance state refresh failed: {str(e)}")
         
     def _ensure_directories(self):
         """Ensure required directories exist."""
@@ -46,77 +164,109 @@ class BrowserManager:
             logger.error(f"Failed to setup directories: {str(e)}")
             raise
 
-    def create_instance(self, instance_id: str) -> bool:
-        """Create a new browser instance with retry mechanism."""
+    def allocate_instance_id(self) -> str:
+        """
+        Allocate a new, never reused instance id.
+
+        Ids continue after the highest id seen in running instances, saved
+        profile states and profile directories, so an id freed by a delete is
+        not handed out again while its profile still exists.
+
+        Returns:
+            str: Allocated instance id
+        """
+        with self._lock:
+            if self._next_instance_id is None:
+                self._next_instance_id = self._highest_known_instance_id() + 1
+            while True:
+                instance_id = str(self._next_instance_id)
+                self._next_instance_id += 1
+                if (sharding.owns_instance(instance_id)
+                        and instance_id not in self.chrome_processes
+                        and instance_id not in self._launching
+                        and instance_id not in self.hibernated):
+                    return instance_id
+
+    def _highest_known_instance_id(self) -> int:
+        """Find the highest numeric instance id in use or on disk."""
+        known = set(self.chrome_processes) | set(self._launching) | set(self.hibernated)
+        known.update(self.driver_manager.profile_manager.list_profile_ids())
+        try:
+            for entry in os.listdir(Config.PROFILES_DIR):
+                match = re.fullmatch(r'profile_(\d+)', entry)
+                if match:
+                    known.add(match.group(1))
+        except OSError as e:
+            logger.warning(f"Failed to scan profiles directory: {str(e)}")
+        return max((int(i) for i in known if str(i).isdigit()), default=0)
+
+    def create_instance(self, instance_id: str, ephemeral: bool = False,
+                        persist: Optional[bool] = None, launch_profile: Optional[str] = None,
+                        resource_policy: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Create a new browser instance with retry mechanism.
+
+        Args:
+            instance_id: Instance identifier
+            ephemeral: Keep the instance's profile in RAM instead of on disk
+            persist: Copy an ephemeral profile to disk when the instance stops
+                (defaults to EPHEMERAL_PERSIST)
+            launch_profile: Name of the launch profile (defaults to DEFAULT_LAUNCH_PROFILE)
+            resource_policy: Resources the instance never loads (defaults to
+                the RESOURCE_POLICY_PRESET preset)
+        """
         logger.info(f"Starting creation of instance {instance_id}")
+        launch_profile = LaunchProfiles.resolve(launch_profile)
+        resource_policy = normalize_policy(resource_policy)
+        if instance_id in self.hibernated:
+            return self.resume_instance(instance_id)
+        
+        # Check if instance already exists or is being created
+        with self._lock:
+            if instance_id in self.chrome_processes or instance_id in self._launching:
+                logger.warning(f"Instance {instance_id} already exists")
+                return False
+            self._launching.add(instance_id)
+        try:
+            created = self._create_instance(
+                instance_id, ephemeral,
+                Config.EPHEMERAL_PERSIST if persist is None else persist,
+                launch_profile
+            )
+            if created and resource_policy is not None:
+                self.instance_meta[instance_id]['resource_policy'] = resource_policy
+            return created
+        finally:
+            with self._lock:
+                self._launching.discard(instance_id)
+
+    def _create_instance(self, instance_id: str, ephemeral: bool = False,
+                         persist: bool = False, launch_profile: Optional[str] = None) -> bool:
+        """Launch and register an instance whose id has been reserved."""
         try:
             # Log initial state
             logger.info(f"Current processes: {len(self.chrome_processes)}")
             logger.info(f"Profiles directory: {Config.PROFILES_DIR}")
             
-            # Check if instance already exists
-            if instance_id in self.chrome_processes:
-                logger.warning(f"Instance {instance_id} already exists")
-                return False
+            # Fresh instances can take a warm instance from the pool, which
+            # is launched with the default launch profile
+            if (not ephemeral and LaunchProfiles.resolve(launch_profile) == LaunchProfiles.resolve()
+                    and self._can_use_pool(instance_id)):
+                entry = self.instance_pool.checkout()
+                if entry and self._adopt_pool_entry(instance_id, entry):
+                    return True
                 
-            # Create profile directory
-            profile_dir = os.path.join(Config.PROFILES_DIR, f"profile_{instance_id}")
-            os.makedirs(profile_dir, exist_ok=True)
-            logger.info(f"Created/verified profile directory: {profile_dir}")
-            
-            # Create driver with retry logic
-            max_retries = 3
-            retry_delay = 1
-            last_error = None
-            
-            for attempt in range(max_retries):
-                logger.info(f"Attempt {attempt + 1}/{max_retries} to create instance {instance_id}")
-                try:
-                    # Important: Use time.sleep instead of asyncio.sleep
-                    if attempt > 0:
-                        logger.info(f"Waiting {retry_delay} seconds before retry")
-                        time.sleep(retry_delay)
-                
-                    logger.info("Creating Chrome driver...")
-                    driver = self.driver_manager.create_driver(
-                        int(instance_id),
-                        profile_name=f"profile_{instance_id}"
-                    )
-                    logger.info("Chrome driver created successfully")
-                    
-                    # Verify instance
-                    logger.info("Verifying instance...")
-                    if self._verify_instance(driver):
-                        self.chrome_processes[instance_id] = driver
-                        logger.info(f"Successfully created and verified instance {instance_id}")
-                        return True
-                    else:
-                        logger.warning(f"Instance {instance_id} verification failed")
-                        if driver:
-                            try:
-                                driver.quit()
-                                logger.info("Successfully quit failed driver")
-                            except Exception as e:
-                                logger.warning(f"Failed to quit driver: {str(e)}")
-                            
-                except Exception as e:
-                    last_error = e
-                    logger.error(
-                        f"Failed to create instance {instance_id} "
-                        f"(attempt {attempt + 1}/{max_retries}): {str(e)}\n"
-                        f"Error type: {type(e).__name__}"
-                    )
-                    retry_delay *= 2
-                    continue
-            
-            if last_error:
-                logger.error(
-                    f"Failed to create instance after {max_retries} attempts.\n"
-                    f"Last error: {str(last_error)}\n"
-                    f"Error type: {type(last_error).__name__}"
-                )
-            return False
+            # Cold launches must fit the host's memory and CPU budget
+            if ephemeral:
+                self._check_ephemeral_space()
+            self.admission.acquire()
+            try:
+                return self._launch_cold(instance_id, ephemeral, persist, launch_profile)
+            finally:
+                self.admission.release()
             
+        except AdmissionRejected:
+            raise
         except Exception as e:
             logger.error(
                 f"Critical error creating instance {instance_id}:\n"
@@ -125,6 +275,143 @@ class BrowserManager:
             )
             return False
             
+    def _launch_cold(self, instance_id: str, ephemeral: bool = False,
+                     persist: bool = False, launch_profile: Optional[str] = None) -> bool:
+        """Start Chrome for an instance from its own profile, retrying on failure."""
+        # Create profile directory
+        profile_dir = self.driver_manager.get_profile_dir(f"profile_{instance_id}", ephemeral)
+        os.makedirs(profile_dir, exist_ok=True)
+        logger.info(f"Created/verified profile directory: {profile_dir}")
+        
+        # Create driver with retry logic
+        max_retries = 3
+        retry_delay = 1
+        last_error = None
+        
+        for attempt in range(max_retries):
+            logger.info(f"Attempt {attempt + 1}/{max_retries} to create instance {instance_id}")
+            try:
+                # Runs on a launcher thread, so blocking here is fine
+                if attempt > 0:
+                    logger.info(f"Waiting {retry_delay} seconds before retry")
+                    time.sleep(retry_delay)
+            
+                logger.info("Creating Chrome driver...")
+                driver = self.driver_manager.create_driver(
+                    int(instance_id),
+                    profile_name=f"profile_{instance_id}",
+                    ephemeral=ephemeral,
+                    launch_profile=launch_profile
+                )
+                logger.info("Chrome driver created successfully")
+                
+                # Verify instance
+                logger.info("Verifying instance...")
+                if self._verify_instance(driver):
+                    self._register_instance(instance_id, driver, {
+                        'profile_name': f"profile_{instance_id}",
+                        'source': 'cold',
+                        'ephemeral': ephemeral,
+                        'persist': persist,
+                        'launch_profile': LaunchProfiles.resolve(launch_profile)
+                    })
+                    logger.info(f"Successfully created and verified instance {instance_id}")
+                    return True
+                else:
+                    logger.warning(f"Instance {instance_id} verification failed")
+                    if driver:
+                        try:
+                            driver.quit()
+                            logger.info("Successfully quit failed driver")
+                        except Exception as e:
+                            logger.warning(f"Failed to quit driver: {str(e)}")
+                        
+            except Exception as e:
+                last_error = e
+                logger.error(
+                    f"Failed to create instance {instance_id} "
+                    f"(attempt {attempt + 1}/{max_retries}): {str(e)}\n"
+                    f"Error type: {type(e).__name__}"
+                )
+                retry_delay *= 2
+                continue
+        
+        if last_error:
+            logger.error(
+                f"Failed to create instance after {max_retries} attempts.\n"
+                f"Last error: {str(last_error)}\n"
+                f"Error type: {type(last_error).__name__}"
+            )
+        if ephemeral:
+            self.driver_manager.discard_ephemeral_profile(f"profile_{instance_id}")
+        return False
+
+    def _check_ephemeral_space(self):
+        """Refuse an ephemeral launch that would fill the RAM disk."""
+        root = Config.EPHEMERAL_PROFILES_DIR
+        os.makedirs(root, exist_ok=True)
+        free_mb = shutil.disk_usage(root).free / 1024 / 1024
+        if free_mb < Config.EPHEMERAL_MIN_FREE_MB:
+            raise AdmissionRejected(
+                f"Insufficient space for ephemeral profile: {free_mb:.0f} MB free in {root}, "
+                f"{Config.EPHEMERAL_MIN_FREE_MB} MB required",
+                Config.ADMISSION_RETRY_AFTER
+            )
+
+    def _can_use_pool(self, instance_id: str) -> bool:
+        """Check whether an instance is new and may be served from the warm pool."""
+        if not self.instance_pool.enabled:
+            return False
+        if self.driver_manager.profile_manager.get_profile_info(instance_id):
+            return False
+        profile_dir = os.path.join(Config.PROFILES_DIR, f"profile_{instance_id}")
+        return not os.path.isdir(profile_dir) or not os.listdir(profile_dir)
+
+    def _adopt_pool_entry(self, instance_id: str, entry: Dict[str, Any]) -> bool:
+        """Register a warm pool instance under the given instance id."""
+        driver = entry['driver']
+        self.driver_manager.fingerprints[int(instance_id)] = entry['fingerprint']
+        self._register_instance(instance_id, driver, {
+            'profile_name': entry['profile_name'],
+            'source': 'pool',
+            'launch_profile': LaunchProfiles.resolve()
+        })
+        # Moving the window into the instance's grid cell also checks that
+        # the warm browser is still alive
+        try:
+            self.workers[instance_id].submit(self._place_window, driver, instance_id).result(30)
+        except Exception as e:
+            logger.warning(f"Discarding warm instance for {instance_id}: {str(e)}")
+            self.instance_meta[instance_id]['crashed'] = True
+            self.delete_instance(instance_id)
+            return False
+        logger.info(f"Created instance {instance_id} from warm pool")
+        return True
+
+    def _register_instance(self, instance_id: str, driver: webdriver.Chrome,
+                           meta: Dict[str, Any]):
+        """Track a verified driver and start the worker that owns it."""
+        worker = InstanceWorker(instance_id)
+        worker.start()
+        meta['launch_time'] = datetime.now().isoformat()
+        meta['last_active'] = time.time()
+        with self._lock:
+            self.chrome_processes[instance_id] = driver
+            self.instance_meta[instance_id] = meta
+            self.workers[instance_id] = worker
+        # Replaces a restarted instance's previous state; commands update the
+        # entry, and publish their changes, before the refresher first reads it
+        self.state_cache.seed(instance_id, self._build_instance_info(instance_id, None, None))
+        try:
+            self.process_metrics.track(instance_id, driver.service.process.pid)
+        except Exception as e:
+            logger.warning(f"Cannot account processes of instance {instance_id}: {str(e)}")
+        self.events.publish(
+            'instance.created',
+            instance=self._build_instance_info(instance_id, None, None),
+            source=meta.get('source')
+        )
+
     def _verify_instance(self, driver: webdriver.Chrome) -> bool:
         """Verify browser instance is working correctly."""
         try:
@@ -162,24 +449,81 @@ class BrowserManager:
             )
             return False
 
-    def delete_instance(self, instance_id: str) -> bool:
-        """Delete a browser instance."""
+    def delete_instance(self, instance_id: str, recycle: bool = False) -> bool:
+        """
+        Delete a browser instance.
+
+        Args:
+            instance_id: Instance identifier
+            recycle: If the instance came from the warm pool, delete its
+                profile right away and let the pool launch a fresh replacement
+        """
         logger.info(f"Attempting to delete instance {instance_id}")
         try:
-            driver = self.chrome_processes.get(instance_id)
+            with self._lock:
+                driver = self.chrome_processes.pop(instance_id, None)
+                meta = self.instance_meta.pop(instance_id, {})
+                worker = self.workers.pop(instance_id, None)
+            self.state_cache.remove(instance_id)
+            self.process_metrics.untrack(instance_id)
             if not driver:
+                if self.hibernated.pop(instance_id, None) is not None:
+                    self.driver_manager.profile_manager.clear_hibernation(instance_id)
+                    self.events.publish('instance.stopped', id=instance_id, reason='deleted')
+                    logger.info(f"Deleted hibernated instance {instance_id}")
+                    return True
                 logger.warning(f"Instance {instance_id} not found")
                 return False
+            # hibernate_instance registers its record before stopping the browser
+            record = self.hibernated.get(instance_id)
+            if record is not None:
+                self.events.publish(
+                    'instance.hibernated', instance=self._build_hibernated_info(instance_id, record)
+                )
+            else:
+                self.events.publish(
+                    'instance.stopped', id=instance_id,
+                    reason='crashed' if meta.get('crashed') else 'deleted'
+                )
+                
+            fingerprint = self.driver_manager.fingerprints.pop(int(instance_id), {})
+            recycle = (recycle and Config.WARM_POOL_RECYCLE
+                       and meta.get('source') == 'pool')
+            
+            # Quit right away so in-flight commands fail fast
+            if worker:
+                worker.submit(self._close_devtools, instance_id)
+                worker.stop(wait=False)
+            self.resource_blockers.pop(instance_id, None)
+            
+            if recycle:
+                refilled = self.instance_pool.checkin({
+                    'driver': driver,
+                    'profile_name': meta['profile_name'],
+                    'fingerprint': fingerprint,
+                    'launched_at': meta.get('launch_time')
+                })
+                logger.info(
+                    f"Instance {instance_id} retired"
+                    f"{', warm pool refills its slot' if refilled else ''}"
+                )
+                return True
                 
             # Graceful shutdown
+            stopped = False
             try:
                 driver.quit()
+                stopped = True
                 logger.info(f"Successfully quit driver for instance {instance_id}")
             except Exception as e:
                 logger.warning(f"Error during driver quit: {str(e)}")
+            
+            # Ephemeral profiles only outlive the instance if persisted
+            if meta.get('ephemeral'):
+                if stopped and meta.get('persist'):
+                    self.driver_manager.persist_ephemeral_profile(meta['profile_name'])
+                self.driver_manager.discard_ephemeral_profile(meta['profile_name'])
                 
-            # Clean up process
-            del self.chrome_processes[instance_id]
             logger.info(f"Successfully deleted instance {instance_id}")
             return True
             
@@ -187,24 +531,251 @@ class BrowserManager:
             logger.error(f"Error deleting instance {instance_id}: {str(e)}")
             return False
             
-    async def visit_url(self, instance_id: str, url: str) -> bool:
-        """Control browser instance to visit URL."""
-        logger.info(f"Attempting to visit URL {url} with instance {instance_id}")
-        try:
+    async def execute(self, instance_id: str, command: Callable, *args,
+                      timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Run a command against an instance's driver on its worker.
+
+        Args:
+            instance_id: Instance identifier
+            command: Callable or coroutine function taking the driver first
+            timeout: Optional timeout in seconds
+            *args: Additional positional arguments for command
+            **kwargs: Additional keyword arguments for command
+
+        Returns:
+            Any: Result of the command
+
+        A hibernated instance is resumed before the command runs.
+
+        Raises:
+            InstanceNotFoundError: If the instance is not running
+        """
+        if instance_id not in self.chrome_processes and instance_id in self.hibernated:
+            if not await self.resume(instance_id):
+                raise InstanceNotFoundError(instance_id)
+        meta = self.instance_meta.get(instance_id)
+        if meta is not None:
+            meta['last_active'] = time.time()
+        return await self._run_on_worker(instance_id, command, *args, timeout=timeout, **kwargs)
+
+    async def _run_on_worker(self, instance_id: str, command: Callable, *args,
+                             timeout: Optional[float] = None, **kwargs) -> Any:
+        """Run a command on a running instance's worker without resuming or marking it active."""
+        with self._lock:
             driver = self.chrome_processes.get(instance_id)
-            if not driver:
-                logger.warning(f"Instance {instance_id} not found")
+            worker = self.workers.get(instance_id)
+        if not driver or not worker:
+            raise InstanceNotFoundError(instance_id)
+        return await worker.call(command, driver, *args, timeout=timeout, **kwargs)
+
+    async def resume(self, instance_id: str) -> bool:
+        """Resume a hibernated instance on the launcher pool, joining a resume already in flight."""
+        with self._lock:
+            future = self._resuming.get(instance_id)
+            if future is None:
+                future = self.launch_jobs.executor.submit(self.resume_instance, instance_id)
+                self._resuming[instance_id] = future
+                future.add_done_callback(lambda _: self._forget_resume(instance_id))
+        return await asyncio.wrap_future(future)
+
+    def _forget_resume(self, instance_id: str):
+        """Drop a finished resume from the in-flight table."""
+        with self._lock:
+            self._resuming.pop(instance_id, None)
+
+    def hibernate_instance(self, instance_id: str) -> bool:
+        """
+        Quit an idle instance's browser while keeping its profile, so it can be
+        resumed later with the same URL, zoom level, window geometry and fingerprint.
+
+        Args:
+            instance_id: Instance identifier
+
+        Returns:
+            bool: True if the instance was hibernated
+        """
+        with self._lock:
+            driver = self.chrome_processes.get(instance_id)
+            worker = self.workers.get(instance_id)
+            meta = self.instance_meta.get(instance_id, {})
+            if not driver or not worker or worker.busy:
                 return False
-                
+            # Nothing would be left to resume from
+            if meta.get('ephemeral') and not meta.get('persist'):
+                return False
+        logger.info(f"Hibernating instance {instance_id}")
+
+        try:
+            info = worker.call_sync(self._read_instance_info, driver, instance_id, timeout=30) or {}
+        except Exception as e:
+            logger.warning(f"Failed to capture state of instance {instance_id}: {str(e)}")
+            info = {}
+        window_state = info.get('window_state') or {}
+        record = {
+            'profile_name': meta.get('profile_name', f"profile_{instance_id}"),
+            'fingerprint': self.driver_manager.fingerprints.get(int(instance_id), {}),
+            'url': info.get('current_url'),
+            'title': info.get('title'),
+            'zoom_level': window_state.get('zoom_level'),
+            'position': window_state.get('position'),
+            'size': window_state.get('size'),
+            'launch_time': meta.get('launch_time'),
+            'ephemeral': meta.get('ephemeral', False),
+            'launch_profile': meta.get('launch_profile'),
+            'resource_policy': meta.get('resource_policy'),
+            'hibernated_at': datetime.now().isoformat()
+        }
+        if not self.driver_manager.profile_manager.save_hibernation(instance_id, record):
+            return False
+
+        # Register the record first so a command arriving now resumes the instance
+        self.hibernated[instance_id] = record
+        if not self.delete_instance(instance_id):
+            self.hibernated.pop(instance_id, None)
+            self.driver_manager.profile_manager.clear_hibernation(instance_id)
+            return False
+        logger.info(f"Instance {instance_id} hibernated")
+        return True
+
+    def resume_instance(self, instance_id: str) -> bool:
+        """
+        Relaunch a hibernated instance from its profile and saved state.
+
+        Args:
+            instance_id: Instance identifier
+
+        Returns:
+            bool: True if the instance is running
+        """
+        with self._lock:
+            if instance_id in self.chrome_processes:
+                return True
+            record = self.hibernated.get(instance_id)
+            if not record or instance_id in self._launching:
+                return False
+            self._launching.add(instance_id)
+        logger.info(f"Resuming hibernated instance {instance_id}")
+        try:
+            self.admission.acquire()
+            try:
+                # Restores the saved URL and zoom level from the profile
+                driver = self.driver_manager.create_driver(
+                    int(instance_id),
+                    profile_name=record['profile_name'],
+                    fingerprint=record.get('fingerprint'),
+                    ephemeral=record.get('ephemeral', False),
+                    launch_profile=record.get('launch_profile')
+                )
+            finally:
+                self.admission.release()
+
+            self._register_instance(instance_id, driver, {
+                'profile_name': record['profile_name'],
+                'source': 'resumed',
+                'ephemeral': record.get('ephemeral', False),
+                'persist': True,
+                'launch_profile': LaunchProfiles.resolve(record.get('launch_profile')),
+                'resource_policy': record.get('resource_policy')
+            })
+            position, size = record.get('position'), record.get('size')
+            if position and size:
+                try:
+                    self.workers[instance_id].submit(
+                        self._place_window, driver, instance_id, dict(**position, **size)
+                    ).result(30)
+                except Exception as e:
+                    logger.warning(f"Failed to restore window of instance {instance_id}: {str(e)}")
+            self.hibernated.pop(instance_id, None)
+            self.driver_manager.profile_manager.clear_hibernation(instance_id)
+            logger.info(f"Resumed instance {instance_id}")
+            return True
+        except AdmissionRejected:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to resume instance {instance_id}: {str(e)}")
+            return False
+        finally:
+            with self._lock:
+                self._launching.discard(instance_id)
+
+    def _hibernation_candidates(self) -> List[str]:
+        """
+        Pick instances to hibernate, least recently used first: every idle
+        instance past HIBERNATE_IDLE_TIMEOUT, then enough of the rest to get
+        down to HIBERNATE_MAX_LIVE running instances.
+        """
+        now = time.time()
+        with self._lock:
+            live = sorted(
+                (meta.get('last_active', 0), instance_id)
+                for instance_id, meta in self.instance_meta.items()
+                if instance_id in self.chrome_processes
+                and not (meta.get('ephemeral') and not meta.get('persist'))
+            )
+        candidates = []
+        if Config.HIBERNATE_IDLE_TIMEOUT > 0:
+            candidates = [
+                instance_id for last_active, instance_id in live
+                if now - last_active >= Config.HIBERNATE_IDLE_TIMEOUT
+            ]
+        if Config.HIBERNATE_MAX_LIVE > 0:
+            excess = len(live) - len(candidates) - Config.HIBERNATE_MAX_LIVE
+            for _, instance_id in live:
+                if excess <= 0:
+                    break
+                if instance_id not in candidates:
+                    candidates.append(instance_id)
+                    excess -= 1
+        return candidates
+
+    async def _hibernate_idle(self):
+        """Periodically hibernate idle and least recently used instances."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(Config.HIBERNATE_CHECK_INTERVAL)
+            try:
+                for instance_id in self._hibernation_candidates():
+                    await loop.run_in_executor(None, self.hibernate_instance, instance_id)
+            except Exception as e:
+                logger.error(f"Hibernation sweep failed: {str(e)}")
+
+    async def visit_url(self, instance_id: str, url: str,
+                        resource_policy: Optional[Dict[str, Any]] = None,
+                        wait_until: Optional[str] = None,
+                        selector: Optional[str] = None,
+                        timeout: Optional[float] = None,
+                        humanize: Optional[bool] = None) -> bool:
+        """
+        Control browser instance to visit URL.
+
+        Args:
+            instance_id: Instance identifier
+            url: URL to visit
+            resource_policy: Resources not to load, replacing the instance's
+                policy from this visit until the next one without a policy
+            wait_until: Load condition after which the visit returns
+                (domcontentloaded, load, networkidle or selector; defaults
+                to DEFAULT_WAIT_UNTIL)
+            selector: CSS selector the selector condition waits for
+            timeout: Seconds the page may take to reach the condition
+            humanize: Whether to simulate a human around the visit (defaults
+                to HUMANIZE_VISITS)
+        """
+        logger.info(f"Attempting to visit URL {url} with instance {instance_id}")
+        try:
             # Use stealth visit
-            await StealthBrowser.stealth_page_visit(
-                driver, 
-                url,
-                logger=logger.info
+            await self.execute(
+                instance_id, self._stealth_visit, instance_id, url, normalize_policy(resource_policy),
+                *normalize_wait(wait_until, selector), timeout,
+                Config.HUMANIZE_VISITS if humanize is None else humanize
             )
             logger.info(f"Successfully visited URL: {url} with instance {instance_id}")
             return True
             
+        except InstanceNotFoundError:
+            logger.warning(f"Instance {instance_id} not found")
+            return False
         except Exception as e:
             logger.error(
                 f"Error visiting URL for instance {instance_id}:\n"
@@ -213,61 +784,610 @@ class BrowserManager:
             )
             return False
 
-    def get_instance_info(self, instance_id: str) -> Optional[Dict]:
-        """Get information about a browser instance."""
-        logger.info(f"Getting info for instance {instance_id}")
+    async def _stealth_visit(self, driver: webdriver.Chrome, instance_id: str, url: str,
+                             resource_policy: Optional[Dict[str, Any]] = None,
+                             wait_until: str = 'load', selector: Optional[str] = None,
+                             timeout: Optional[float] = None, humanize: bool = False):
+        """Visit a URL, navigating over DevTools when available; runs on the instance worker."""
+        devtools = await self._get_devtools(instance_id, driver)
+        await self._apply_resource_policy(driver, instance_id, devtools, resource_policy)
+        await StealthBrowser.stealth_page_visit(
+            driver,
+            url,
+            logger=logger.info,
+            devtools=devtools,
+            wait_until=wait_until,
+            selector=selector,
+            timeout=timeout,
+            humanize=humanize
+        )
+        await self._record_page(driver, instance_id, devtools)
+
+    async def _apply_resource_policy(self, driver: webdriver.Chrome, instance_id: str,
+                                     devtools: Optional[DevToolsClient],
+                                     override: Optional[Dict[str, Any]] = None):
+        """Apply the visit's or else the instance's resource policy; runs on the instance worker."""
+        policy = override
+        if policy is None:
+            policy = self.instance_meta.get(instance_id, {}).get('resource_policy')
+        if policy is None and Config.RESOURCE_POLICY_PRESET:
+            policy = normalize_policy({'preset': Config.RESOURCE_POLICY_PRESET})
+        blocker = self.resource_blockers.get(instance_id)
+        if blocker is None:
+            if policy is None:
+                return
+            blocker = self.resource_blockers.setdefault(instance_id, ResourceBlocker())
         try:
-            driver = self.chrome_processes.get(instance_id)
-            if not driver:
-                logger.warning(f"Instance {instance_id} not found")
-                return None
-                
-            # Get instance info from driver
-            try:
-                info = {
-                    'id': instance_id,
-                    'status': 'running',
-                    'url': driver.current_url,
-                    'title': driver.title
-                }
-                logger.info(f"Retrieved basic info for instance {instance_id}")
-            except Exception as e:
-                logger.error(f"Failed to get basic instance info: {str(e)}")
+            if devtools:
+                await blocker.apply(devtools, policy, driver)
+            else:
+                blocker.apply_via_webdriver(driver, policy)
+        except Exception as e:
+            logger.warning(f"Failed to apply resource policy to instance {instance_id}: {str(e)}")
+
+    def get_resource_stats(self, instance_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get resource blocking counters.
+
+        Args:
+            instance_id: Instance to report, or None for totals over all instances
+
+        Returns:
+            Optional[Dict[str, Any]]: Policy and counters of the instance, or
+            totals with per-instance entries; None if the instance is not running
+        """
+        if instance_id is not None:
+            if instance_id not in self.chrome_processes:
                 return None
-            
-            # Add window state
-            try:
-                window_state = WindowManager.get_window_state(driver)
-                info['window_state'] = window_state
-                logger.info("Successfully got window state")
-            except Exception as e:
-                logger.warning(f"Failed to get window state: {str(e)}")
-                info['window_state'] = None
-                
+            blocker = self.resource_blockers.get(instance_id)
+            return {'instance_id': instance_id, **(blocker or ResourceBlocker()).get_stats()}
+
+        instances = [
+            {'instance_id': i, **blocker.get_stats()}
+            for i, blocker in list(self.resource_blockers.items())
+        ]
+        counted = [entry for entry in instances if entry['blocked'] is not None]
+        return {
+            'blocked': sum(entry['blocked'] for entry in counted),
+            'allowed': sum(entry['allowed'] for entry in counted),
+            'instances': instances
+        }
+
+    async def _record_page(self, driver: webdriver.Chrome, instance_id: str,
+                           devtools: Optional[DevToolsClient]):
+        """Write the page reached by a navigation into the state cache; runs on the instance worker."""
+        try:
+            if devtools:
+                page = await devtools.evaluate('({url: location.href, title: document.title})')
+            else:
+                page = {'url': driver.current_url, 'title': driver.title}
+        except Exception as e:
+            logger.warning(f"Failed to read page after visit for instance {instance_id}: {str(e)}")
+            self.state_cache.invalidate(instance_id)
+            return
+        self.state_cache.update(
+            instance_id,
+            url=page['url'],
+            current_url=page['url'],
+            title=page['title']
+        )
+
+    async def _get_devtools(self, instance_id: str,
+                            driver: webdriver.Chrome) -> Optional[DevToolsClient]:
+        """
+        Get the instance's DevTools connection, connecting on first use.
+        Must run on the instance worker, which owns the connection's event loop.
+
+        Returns:
+            Optional[DevToolsClient]: Connected client, or None to use Selenium
+        """
+        if not Config.DEVTOOLS_ENABLED or not DevToolsClient.available():
+            return None
+        client = self.devtools.get(instance_id)
+        if client and client.connected:
+            return client
+
+        # Do not retry a failing connection on every command
+        meta = self.instance_meta.get(instance_id, {})
+        failed_at = meta.get('devtools_failed_at')
+        if failed_at and time.time() - failed_at < Config.DEVTOOLS_RETRY_INTERVAL:
+            return None
+
+        try:
+            client = await DevToolsClient.for_driver(driver, timeout=Config.DEVTOOLS_TIMEOUT)
+            await client.enable_page_events()
+        except Exception as e:
+            logger.warning(f"DevTools unavailable for instance {instance_id}, using WebDriver: {str(e)}")
+            meta['devtools_failed_at'] = time.time()
+            if client:
+                await client.close()
+            return None
+        self.devtools[instance_id] = client
+        return client
+
+    async def _close_devtools(self, instance_id: str):
+        """Close the instance's DevTools connection; runs on the instance worker."""
+        client = self.devtools.pop(instance_id, None)
+        if client:
+            await client.close()
+
+    async def batch_visit(self, instance_ids: List[str], url: str,
+                          max_parallel: Optional[int] = None,
+                          timeout: Optional[float] = None,
+                          resource_policy: Optional[Dict[str, Any]] = None,
+                          wait_until: Optional[str] = None,
+                          selector: Optional[str] = None,
+                          humanize: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """
+        Visit a URL with several instances concurrently.
+
+        Args:
+            instance_ids: Instances that should visit the URL
+            url: URL to visit
+            max_parallel: Maximum concurrent visits (defaults to BATCH_VISIT_MAX_PARALLEL)
+            timeout: Per-instance timeout in seconds (defaults to BATCH_VISIT_TIMEOUT)
+            resource_policy: Resources not to load during the visits
+            wait_until: Load condition after which each visit returns
+            selector: CSS selector the selector condition waits for
+            humanize: Whether to simulate a human around each visit
+
+        Returns:
+            List[Dict[str, Any]]: One result per instance, in request order. A
+            visit that exceeds the timeout is reported as failed while the
+            remaining results are still returned.
+        """
+        max_parallel = max(1, max_parallel or Config.BATCH_VISIT_MAX_PARALLEL)
+        timeout = timeout or Config.BATCH_VISIT_TIMEOUT
+        semaphore = asyncio.Semaphore(max_parallel)
+        logger.info(
+            f"Batch visiting {url} with {len(instance_ids)} instances "
+            f"(max_parallel={max_parallel}, timeout={timeout}s)"
+        )
+
+        async def visit_one(instance_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                started = time.monotonic()
+                result = {'instance_id': instance_id, 'success': False}
+                try:
+                    result['success'] = await asyncio.wait_for(
+                        self.visit_url(instance_id, url, resource_policy, wait_until, selector,
+                                       humanize=humanize), timeout
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(f"Visit with instance {instance_id} timed out after {timeout}s")
+                    result['error'] = f"Timed out after {timeout}s"
+                    result['timed_out'] = True
+                except Exception as e:
+                    logger.error(f"Error visiting URL for instance {instance_id}: {str(e)}")
+                    result['error'] = str(e)
+                result['elapsed'] = round(time.monotonic() - started, 3)
+                return result
+
+        # Duplicate ids would only queue behind each other on the same driver
+        unique_ids = list(dict.fromkeys(instance_ids))
+        return await asyncio.gather(*(visit_one(i) for i in unique_ids))
+
+    async def get_instance_info(self, instance_id: str,
+                                max_age: Optional[float] = None) -> Optional[Dict]:
+        """
+        Get information about a browser instance from the state cache.
+
+        Args:
+            instance_id: Instance identifier
+            max_age: Maximum age in seconds of cached info before it is
+                re-read from the browser (defaults to STATE_CACHE_MAX_AGE)
+
+        Returns:
+            Optional[Dict]: Instance info, or None if the instance does not exist.
+            Hibernated instances report their saved state without being resumed.
+        """
+        if instance_id not in self.chrome_processes:
+            record = self.hibernated.get(instance_id)
+            if record:
+                return self._build_hibernated_info(instance_id, record)
+            logger.warning(f"Instance {instance_id} not found")
+            return None
+        if max_age is None:
+            max_age = Config.STATE_CACHE_MAX_AGE
+        try:
+            info = await self.state_cache.get(instance_id, max_age)
+            if info:
+                # Process metrics are sampled separately and always current
+                info['performance'] = self.process_metrics.get(instance_id) or {}
             return info
-            
         except Exception as e:
             logger.error(f"Error getting instance info for {instance_id}: {str(e)}")
             return None
 
-    def get_all_instances(self) -> Dict[str, Dict]:
-        """Get information about all browser instances."""
-        logger.info("Getting info for all instances")
-        instances = {}
-        for instance_id in list(self.chrome_processes.keys()):
+    @staticmethod
+    def _build_hibernated_info(instance_id: str, record: Dict[str, Any]) -> Dict:
+        """Assemble instance info from a hibernation record."""
+        return {
+            'id': instance_id,
+            'status': 'hibernated',
+            'url': record.get('url'),
+            'current_url': record.get('url'),
+            'title': record.get('title'),
+            'fingerprint': record.get('fingerprint') or {},
+            'performance': {},
+            'launch_time': record.get('launch_time') or record['hibernated_at'],
+            'window_state': {
+                'position': record.get('position'),
+                'size': record.get('size'),
+                'zoom_level': record.get('zoom_level')
+            },
+            'ephemeral': record.get('ephemeral', False),
+            'launch_profile': record.get('launch_profile'),
+            'hibernated_at': record['hibernated_at']
+        }
+
+    async def _load_instance_info(self, instance_id: str) -> Optional[Dict]:
+        """Read fresh instance info from the browser for the state cache."""
+        logger.info(f"Reading info for instance {instance_id}")
+        try:
+            return await self._run_on_worker(instance_id, self._read_instance_info, instance_id)
+        except InstanceNotFoundError:
+            return None
+
+    async def _read_instance_info(self, driver: webdriver.Chrome, instance_id: str) -> Optional[Dict]:
+        """Read instance information, over DevTools when available; runs on the instance worker."""
+        devtools = await self._get_devtools(instance_id, driver)
+        if devtools:
             try:
-                info = self.get_instance_info(instance_id)
-                if info:
-                    instances[instance_id] = info
-                    logger.info(f"Retrieved info for instance {instance_id}")
+                page = await devtools.evaluate('({url: location.href, title: document.title})')
+                info = self._build_instance_info(instance_id, page['url'], page['title'])
+                info['window_state'] = await WindowManager.get_window_state_via_devtools(devtools)
+                return info
             except Exception as e:
-                logger.error(f"Error getting info for instance {instance_id}: {str(e)}")
-                continue
+                logger.warning(f"DevTools info failed for instance {instance_id}, using WebDriver: {str(e)}")
+        return self._collect_instance_info(driver, instance_id)
+
+    def _build_instance_info(self, instance_id: str, url: str, title: str) -> Dict:
+        """Assemble the instance info dictionary."""
+        return {
+            'id': instance_id,
+            'status': 'running',
+            'url': url,
+            'current_url': url,
+            'title': title,
+            'fingerprint': self.driver_manager.fingerprints.get(int(instance_id), {}),
+            'performance': {},
+            'launch_time': self.instance_meta.get(instance_id, {}).get('launch_time'),
+            'ephemeral': self.instance_meta.get(instance_id, {}).get('ephemeral', False),
+            'launch_profile': self.instance_meta.get(instance_id, {}).get('launch_profile')
+        }
+
+    def _collect_instance_info(self, driver: webdriver.Chrome, instance_id: str) -> Optional[Dict]:
+        """Read instance information through WebDriver; runs on the instance worker."""
+        try:
+            info = self._build_instance_info(instance_id, driver.current_url, driver.title)
+            logger.info(f"Retrieved basic info for instance {instance_id}")
+        except Exception as e:
+            logger.error(f"Failed to get basic instance info: {str(e)}")
+            return None
+        
+        # Add window state
+        try:
+            window_state = WindowManager.get_window_state(driver)
+            info['window_state'] = window_state
+            logger.info("Successfully got window state")
+        except Exception as e:
+            logger.warning(f"Failed to get window state: {str(e)}")
+            info['window_state'] = None
+            
+        return info
+
+    async def get_all_instances(self, max_age: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Get information about all browser instances.
+
+        Cached info is returned as is; stale entries are re-read in parallel.
+
+        Args:
+            max_age: Maximum age in seconds of cached info (defaults to STATE_CACHE_MAX_AGE)
+
+        Returns:
+            Dict[str, Dict]: Instance info keyed by instance id
+        """
+        logger.info("Getting info for all instances")
+        instance_ids = list(self.chrome_processes.keys())
+        instance_ids += [i for i in list(self.hibernated) if i not in self.chrome_processes]
+        results = await asyncio.gather(
+            *(self.get_instance_info(instance_id, max_age) for instance_id in instance_ids),
+            return_exceptions=True
+        )
+        instances = {}
+        for instance_id, info in zip(instance_ids, results):
+            if isinstance(info, Exception):
+                logger.error(f"Error getting info for instance {instance_id}: {str(info)}")
+            elif info:
+                instances[instance_id] = info
         logger.info(f"Retrieved info for {len(instances)} instances")
         return instances
 
+    def get_system_stats(self) -> Dict[str, Any]:
+        """Get instance counts and the latest host metrics without touching any browser."""
+        counts = self.get_instance_counts()
+        sample = self.get_metrics_sampler().latest()
+        return {
+            'total_instances': counts['running'] + counts['launching'] + counts['hibernated'],
+            'running_instances': counts['running'],
+            'cpu_usage': sample['cpu_usage'],
+            'memory_usage': sample['memory_usage'],
+            'disk_usage': sample['disk_usage']
+        }
+
+    def get_live_snapshot(self) -> Dict[str, Any]:
+        """
+        Get the state push clients start from, built from memory only.
+
+        Running instances are described by their cached info, or by what is
+        known from launch if they have not been read yet.
+
+        Returns:
+            Dict[str, Any]: Instances, their process metrics and system stats
+        """
+        cached = self.state_cache.snapshot()
+        with self._lock:
+            running = list(self.chrome_processes)
+            hibernated = dict(self.hibernated)
+        instances = [cached.get(i) or self._build_instance_info(i, None, None) for i in running]
+        for info in instances:
+            if self.instance_meta.get(info['id'], {}).get('crashed'):
+                info['status'] = 'crashed'
+        instances += [
+            self._build_hibernated_info(i, record)
+            for i, record in hibernated.items() if i not in running
+        ]
+        return {
+            'instances': instances,
+            'metrics': self._instance_metric_values(),
+            'stats': self.get_system_stats()
+        }
+
+    def _instance_metric_values(self) -> Dict[str, Dict[str, Any]]:
+        """Per-instance process metrics as pushed to clients."""
+        keys = ('rss_mb', 'cpu_percent', 'processes', 'renderers')
+        return {
+            instance_id: {key: m.get(key) for key in keys}
+            for instance_id, m in self.process_metrics.get_all().items()
+        }
+
+    def _on_state_change(self, instance_id: str, changes: Dict[str, Any]) -> None:
+        """Publish changes to an instance's cached info."""
+        if 'url' in changes or 'title' in changes:
+            self.events.publish('instance.navigated', id=instance_id, changes=changes)
+        else:
+            self.events.publish('instance.updated', id=instance_id, changes=changes)
+
+    def _is_crashed(self, instance_id: str, driver: webdriver.Chrome) -> bool:
+        """Whether an instance's chromedriver has exited or its browser processes are gone."""
+        process = getattr(getattr(driver, 'service', None), 'process', None)
+        if process is not None and hasattr(process, 'poll') and process.poll() is not None:
+            return True
+        metrics = self.process_metrics.get(instance_id)
+        return bool(metrics) and metrics.get('processes', 2) <= 1
+
+    async def _watch_instances(self):
+        """
+        Detect crashed instances and push metric changes to subscribers.
+
+        Runs once for all subscribers; metric deltas are only computed while
+        someone is listening and carry just the values that changed.
+        """
+        last_stats: Dict[str, Any] = {}
+        last_metrics: Dict[str, Dict[str, Any]] = {}
+        while True:
+            await asyncio.sleep(Config.EVENTS_INTERVAL)
+            try:
+                with self._lock:
+                    running = [
+                        (i, d) for i, d in self.chrome_processes.items()
+                        if not self.instance_meta.get(i, {}).get('crashed')
+                    ]
+                for instance_id, driver in running:
+                    if self._is_crashed(instance_id, driver):
+                        logger.warning(f"Instance {instance_id} has crashed")
+                        self.instance_meta.get(instance_id, {})['crashed'] = True
+                        self.events.publish('instance.crashed', id=instance_id)
+
+                if not self.events.subscriber_count:
+                    last_stats, last_metrics = {}, {}
+                    continue
+                stats = self.get_system_stats()
+                metrics = self._instance_metric_values()
+                stats_delta = {k: v for k, v in stats.items() if last_stats.get(k) != v}
+                metrics_delta = {i: m for i, m in metrics.items() if last_metrics.get(i) != m}
+                removed = [i for i in last_metrics if i not in metrics]
+                if stats_delta or metrics_delta or removed:
+                    self.events.publish(
+                        'metrics', stats=stats_delta, instances=metrics_delta, removed=removed
+                    )
+                last_stats, last_metrics = stats, metrics
+            except Exception as e:
+                logger.error(f"Instance watch failed: {str(e)}")
+
+    def get_instance_counts(self) -> Dict[str, int]:
+        """Count running and launching instances without touching any browser."""
+        with self._lock:
+            return {
+                'running': len(self.chrome_processes),
+                'launching': len(self._launching),
+                'hibernated': len(self.hibernated)
+            }
+
+    def get_capacity(self) -> Dict[str, Any]:
+        """
+        Report how many more instances this host can take.
+
+        Headroom is the number of further instances that fit in available
+        memory above the admission reserve, minus launches still queued or in
+        progress whose memory is not visible yet.
+
+        Returns:
+            Dict[str, Any]: Capacity report used for cluster placement
+        """
+        counts = self.get_instance_counts()
+        admission = self.admission.get_stats()
+        queued = self.launch_jobs.queued_count()
+        estimate = max(1.0, admission['instance_estimate_mb'])
+        free_mb = admission['available_mb'] - admission['reserve_mb']
+        return {
+            'shard': Config.SHARD_INDEX,
+            'instances': counts['running'] + counts['launching'],
+            'hibernated': counts['hibernated'],
+            'launch_queue': queued,
+            'available_mb': admission['available_mb'],
+            'reserve_mb': admission['reserve_mb'],
+            'instance_estimate_mb': admission['instance_estimate_mb'],
+            'headroom': max(0, int(free_mb // estimate) - queued),
+            'blocked_reason': admission['blocked_reason']
+        }
+
+    async def set_zoom_level(self, instance_id: str, zoom_level: float) -> bool:
+        """Set the zoom level of an instance's window."""
+        try:
+            await self.execute(instance_id, self._set_zoom_level, instance_id, zoom_level)
+            return True
+        except InstanceNotFoundError:
+            logger.warning(f"Instance {instance_id} not found")
+            return False
+
+    async def _set_zoom_level(self, driver: webdriver.Chrome, instance_id: str, zoom_level: float):
+        """Apply a zoom level, over DevTools when available; runs on the instance worker."""
+        devtools = await self._get_devtools(instance_id, driver)
+        if devtools:
+            try:
+                await WindowManager.set_zoom_level_via_devtools(devtools, zoom_level)
+                self.state_cache.update(instance_id, window_state={'zoom_level': zoom_level})
+                return
+            except Exception as e:
+                logger.warning(f"DevTools zoom failed for instance {instance_id}, using WebDriver: {str(e)}")
+        WindowManager.set_zoom_level(driver, zoom_level)
+        self.state_cache.update(instance_id, window_state={'zoom_level': zoom_level})
+
+    async def _place_window(self, driver: webdriver.Chrome, instance_id: str,
+                            bounds: Optional[Dict[str, int]] = None):
+        """
+        Move and resize an instance's window, over DevTools when available;
+        runs on the instance worker.
+
+        Args:
+            driver: Instance driver
+            instance_id: Instance identifier
+            bounds: Window x, y, width and height (defaults to the instance's grid cell)
+        """
+        bounds = bounds or WindowManager.grid_bounds(int(instance_id))
+        devtools = await self._get_devtools(instance_id, driver)
+        if devtools:
+            try:
+                await WindowManager.set_window_bounds_via_devtools(devtools, bounds)
+                return
+            except Exception as e:
+                logger.warning(f"DevTools window bounds failed for instance {instance_id}, using WebDriver: {str(e)}")
+        driver.set_window_rect(bounds['x'], bounds['y'], bounds['width'], bounds['height'])
+
+    async def focus_window(self, instance_id: str) -> bool:
+        """Bring an instance's window to the front."""
+        try:
+            await self.execute(instance_id, WindowManager.focus_window)
+            for other_id in list(self.chrome_processes.keys()):
+                self.state_cache.update(
+                    other_id, window_state={'is_focused': other_id == instance_id}
+                )
+            return True
+        except InstanceNotFoundError:
+            logger.warning(f"Instance {instance_id} not found")
+            return False
+
+    def get_instance_metrics(self, instance_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get resource usage of an instance's process tree.
+
+        Args:
+            instance_id: Instance identifier
+
+        Returns:
+            Optional[Dict[str, Any]]: Latest metrics, sampled on demand if the
+            background sampler has not reached the instance yet; empty if the
+            process tree is unknown and None if the instance is not running
+        """
+        if instance_id not in self.chrome_processes:
+            return None
+        metrics = self.process_metrics.get(instance_id)
+        if metrics is None:
+            metrics = self.process_metrics.sample().get(instance_id)
+        return metrics or {}
+
+    def get_metrics_sampler(self) -> SystemMetricsSampler:
+        """Get the system metrics sampler, creating it from the loaded configuration."""
+        with self._lock:
+            if not self.metrics_sampler:
+                self.metrics_sampler = SystemMetricsSampler(
+                    Config.METRICS_SAMPLE_INTERVAL, Config.METRICS_HISTORY_SIZE
+                )
+            return self.metrics_sampler
+
+    def _profiles_in_use(self) -> set:
+        """Profile directories that a running or launching Chrome may be using."""
+        with self._lock:
+            names = {meta.get('profile_name') for meta in self.instance_meta.values()}
+            for instance_id in self._launching:
+                record = self.hibernated.get(instance_id)
+                names.add(record['profile_name'] if record else f"profile_{instance_id}")
+        names.update(self.instance_pool.profile_names())
+        names.discard(None)
+        return names
+
+    def _profiles_retained(self) -> set:
+        """Profile directories hibernated instances will resume from."""
+        with self._lock:
+            return {record.get('profile_name') for record in self.hibernated.values()}
+
+    def is_profile_in_use(self, profile_id: str) -> bool:
+        """Whether a profile is open in Chrome or held by a hibernated instance."""
+        name = f"profile_{profile_id}"
+        return name in self._profiles_in_use() or name in self._profiles_retained()
+
+    def _get_maintenance(self):
+        """Get profile maintenance, wired to skip profiles this manager is using."""
+        maintenance = self.driver_manager.profile_manager.maintenance
+        maintenance.active_profiles = self._profiles_in_use
+        maintenance.retained_profiles = self._profiles_retained
+        maintenance.owns_profile = sharding.owns_profile
+        maintenance.processes_per_host = sharding.processes_per_host
+        return maintenance
+
+    def get_maintenance_stats(self) -> Dict[str, Any]:
+        """Get profile maintenance statistics."""
+        return self._get_maintenance().get_stats()
+
+    def run_maintenance(self) -> Dict[str, Any]:
+        """Run profile maintenance now and return its report."""
+        return self._get_maintenance().run()
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get warm pool statistics."""
+        return self.instance_pool.get_stats()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get shared HTTP cache statistics."""
+        return self.cache_proxy.get_stats()
+
     def cleanup(self):
         """Clean up all instances."""
+        for task in (self._state_refresher, self._hibernator, self._event_watcher):
+            if task:
+                task.cancel()
+        self._state_refresher = self._hibernator = self._event_watcher = None
+        self.loop_monitor.stop()
+        self.task_queue.stop()
+        if self.metrics_sampler:
+            self.metrics_sampler.stop()
+        self.process_metrics.stop()
+        self.driver_manager.profile_manager.maintenance.stop()
+        self.launch_jobs.shutdown()
+        self.instance_pool.stop()
         logger.info(f"Starting cleanup of {len(self.chrome_processes)} instances")
         for instance_id in list(self.chrome_processes.keys()):
             try:
@@ -278,4 +1398,5 @@ class BrowserManager:
                     logger.warning(f"Failed to clean up instance {instance_id}")
             except Exception as e:
                 logger.error(f"Error cleaning up instance {instance_id}: {str(e)}")
+        self.cache_proxy.stop()
         logger.info("Completed browser instance cleanup")
\ No newline at end of file
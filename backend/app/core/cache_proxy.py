@@ -0,0 +1,590 @@
+# File: backend/app/core/cache_proxy.py
+"""Local HTTP forward proxy whose response cache is shared by every instance."""
+
+from typing import Any, Dict, List, Optional, Tuple
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+import asyncio
+import threading
+import time
+import httpx
+from loguru import logger
+
+from app.config import Config
+from app.utils.content_store import ContentStore
+
+# Headers that only apply to a single connection
+HOP_HEADERS = {
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization', 'proxy-connection',
+    'te', 'trailer', 'transfer-encoding', 'upgrade'
+}
+
+# Response headers addressed to one client, never stored or replayed from the cache
+PRIVATE_HEADERS = {'set-cookie', 'set-cookie2'}
+
+# Request headers replaced by the proxy's own validators
+CONDITIONAL_HEADERS = {'if-none-match', 'if-modified-since', 'if-match', 'if-unmodified-since', 'if-range'}
+
+# Status codes a shared cache may store (RFC 9111 heuristically cacheable codes)
+CACHEABLE_STATUSES = {200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501}
+
+class _Request:
+    """A request read from a browser connection."""
+
+    def __init__(self, method: str, target: str, version: str,
+                 headers: List[Tuple[str, str]], body: bytes):
+        self.method = method
+        self.target = target
+        self.version = version
+        self.headers = headers
+        self.body = body
+        self.lookup = {name.lower(): value for name, value in headers}
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = (self.lookup.get('proxy-connection') or self.lookup.get('connection') or '').lower()
+        if self.version == 'HTTP/1.0':
+            return connection == 'keep-alive'
+        return connection != 'close'
+
+def _cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header into lower-case directives."""
+    directives = {}
+    for part in (value or '').split(','):
+        name, _, argument = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+def _shared(headers: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """Drop the headers a shared cache must not store or replay."""
+    return [(name, value) for name, value in headers if name.lower() not in PRIVATE_HEADERS]
+
+def _seconds(value: Optional[str]) -> Optional[int]:
+    """Parse a delta-seconds directive argument."""
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return None
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    """Parse an HTTP date into a timestamp."""
+    try:
+        return parsedate_to_datetime(value).timestamp() if value else None
+    except (TypeError, ValueError, IndexError):
+        return None
+
+class CachingProxy:
+    """
+    In-process HTTP forward proxy shared by every instance.
+
+    Plain HTTP responses are cached in a ContentStore according to their
+    cache headers, as a shared cache would: no-store and private responses
+    are never stored, Set-Cookie is never stored or replayed, stale
+    responses are revalidated with their validators, and Vary selects
+    between variants. Concurrent misses for the same URL
+    are coalesced so a fleet visiting one site downloads each asset once.
+    HTTPS traffic is tunnelled through CONNECT and cannot be cached without
+    intercepting TLS, which the proxy deliberately does not do.
+
+    The proxy runs its own event loop on a background thread, so browser
+    traffic never competes with the API for the main loop.
+    """
+
+    def __init__(self):
+        """Initialize a stopped proxy."""
+        self._store: Optional[ContentStore] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._connections = set()
+        self.address: Optional[str] = None
+        self.stats: Counter = Counter()
+        self.started_at: Optional[float] = None
+
+    @property
+    def store(self) -> ContentStore:
+        """Lazily open the store once configuration has been loaded."""
+        if self._store is None:
+            root = Config.CACHE_PROXY_DIR or Path(Config.PROFILES_DIR) / "http_cache"
+            self._store = ContentStore(Path(root), Config.CACHE_PROXY_MAX_MB * 1024 * 1024)
+        return self._store
+
+    @property
+    def proxy_url(self) -> Optional[str]:
+        """URL browsers should use as their proxy, or None while stopped."""
+        return f"http://{self.address}" if self.address else None
+
+    def start(self) -> str:
+        """
+        Start serving on a background thread.
+
+        Returns:
+            str: host:port the proxy listens on
+        """
+        if self.address:
+            return self.address
+        self.store
+        ready = threading.Event()
+        errors: List[Exception] = []
+
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            self._loop = loop
+            try:
+                loop.run_until_complete(self._open())
+            except Exception as e:
+                errors.append(e)
+                ready.set()
+                return
+            ready.set()
+            loop.run_forever()
+            loop.run_until_complete(self._close())
+            loop.close()
+
+        self._thread = threading.Thread(target=run, name="cache-proxy", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+        self.started_at = time.time()
+        logger.info(f"Caching proxy listening on {self.address} ({self.store.root})")
+        return self.address
+
+    def stop(self) -> None:
+        """Stop serving and close upstream connections."""
+        if self._loop and self._thread:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=10)
+        self._thread = self._loop = None
+        self.address = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit ratios and traffic saved.
+
+        Returns:
+            Dict[str, Any]: Request outcomes, byte counts and store usage
+        """
+        stats = dict(self.stats)
+        hits = stats.get('hits', 0)
+        misses = stats.get('misses', 0)
+        saved = stats.get('bytes_saved', 0)
+        fetched = stats.get('bytes_from_origin', 0)
+        return {
+            'enabled': self.address is not None,
+            'address': self.address,
+            'requests': stats.get('requests', 0),
+            'hits': hits,
+            'revalidated': stats.get('revalidated', 0),
+            'misses': misses,
+            'coalesced': stats.get('coalesced', 0),
+            'bypassed': stats.get('bypassed', 0),
+            'tunnels': stats.get('tunnels', 0),
+            'errors': stats.get('errors', 0),
+            'hit_ratio': round(hits / (hits + misses), 3) if hits + misses else None,
+            'bytes_saved': saved,
+            'bytes_from_origin': fetched,
+            'byte_hit_ratio': round(saved / (saved + fetched), 3) if saved + fetched else None,
+            'evictions': stats.get('evictions', 0),
+            'entries': self.store.count() if self._store else 0,
+            'stored_bytes': self.store.total_bytes() if self._store else 0,
+            'max_bytes': Config.CACHE_PROXY_MAX_MB * 1024 * 1024
+        }
+
+    async def _open(self) -> None:
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(Config.CACHE_PROXY_TIMEOUT, connect=10),
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=200),
+            follow_redirects=False
+        )
+        # Forward the browser's headers as they are
+        self._client.headers.clear()
+        self._server = await asyncio.start_server(
+            self._handle, Config.CACHE_PROXY_HOST, Config.CACHE_PROXY_PORT, limit=1024 * 1024
+        )
+        host, port = self._server.sockets[0].getsockname()[:2]
+        self.address = f"{host}:{port}"
+
+    async def _close(self) -> None:
+        if self._server:
+            self._server.close()
+        # Drop connections the browsers still hold open
+        for writer in list(self._connections):
+            writer.close()
+        connections = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        if connections:
+            await asyncio.wait(connections, timeout=5)
+        if self._client:
+            await self._client.aclose()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one browser connection until it closes."""
+        self._connections.add(writer)
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                self.stats['requests'] += 1
+                if request.method == 'CONNECT':
+                    await self._tunnel(request, reader, writer)
+                    return
+                if not await self._proxy(request, writer) or not request.keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.warning(f"Caching proxy connection failed: {str(e)}")
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader) -> Optional[_Request]:
+        """Read a request, or None when the browser closed the connection."""
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.IncompleteReadError:
+            return None
+        lines = head.decode('latin-1').split('\r\n')
+        method, target, version = lines[0].split(' ', 2)
+        headers = []
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(':')
+                headers.append((name.strip(), value.strip()))
+        request = _Request(method.upper(), target, version, headers, b'')
+
+        if request.lookup.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await reader.readuntil(b'\r\n')).split(b';')[0], 16)
+                if size == 0:
+                    await reader.readuntil(b'\r\n')
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            request.body = b''.join(chunks)
+        elif request.lookup.get('content-length'):
+            request.body = await reader.readexactly(int(request.lookup['content-length']))
+        return request
+
+    async def _tunnel(self, request: _Request, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        """Relay a CONNECT tunnel byte for byte."""
+        self.stats['tunnels'] += 1
+        host, _, port = request.target.rpartition(':')
+        try:
+            upstream_reader, upstream_writer = await asyncio.wait_for(
+                asyncio.open_connection(host.strip('[]'), int(port)), Config.CACHE_PROXY_TIMEOUT
+            )
+        except (OSError, ValueError, asyncio.TimeoutError) as e:
+            self.stats['errors'] += 1
+            await self._send_error(writer, 502, f"Cannot connect to {request.target}: {str(e)}")
+            return
+        writer.write(b'HTTP/1.1 200 Connection Established\r\n\r\n')
+        await writer.drain()
+
+        async def pipe(source: asyncio.StreamReader, target: asyncio.StreamWriter):
+            try:
+                while True:
+                    data = await source.read(65536)
+                    if not data:
+                        break
+                    target.write(data)
+                    await target.drain()
+            except ConnectionError:
+                pass
+            finally:
+                target.close()
+
+        await asyncio.gather(pipe(reader, upstream_writer), pipe(upstream_reader, writer))
+
+    async def _proxy(self, request: _Request, writer: asyncio.StreamWriter) -> bool:
+        """
+        Answer a plain HTTP request from the cache or the origin.
+
+        Returns:
+            bool: Whether the connection can be reused
+        """
+        if not request.target.startswith('http://'):
+            await self._send_error(writer, 400, "Only absolute http:// URLs can be proxied")
+            return False
+        request_cc = _cache_control(request.lookup.get('cache-control'))
+        if request.method != 'GET' or 'range' in request.lookup or 'no-store' in request_cc:
+            self.stats['bypassed'] += 1
+            return await self._fetch(request, writer, store=False)
+
+        loop = asyncio.get_running_loop()
+        entry = await loop.run_in_executor(None, self.store.lookup, request.target, request.lookup)
+        if entry is None:
+            # Let concurrent requests for the same URL wait for one download
+            leader = self._inflight.get(request.target)
+            if leader is not None:
+                self.stats['coalesced'] += 1
+                await asyncio.shield(leader)
+                entry = await loop.run_in_executor(None, self.store.lookup, request.target, request.lookup)
+            if entry is None:
+                future = loop.create_future()
+                self._inflight[request.target] = future
+                try:
+                    return await self._fetch(request, writer)
+                finally:
+                    self._inflight.pop(request.target, None)
+                    future.set_result(None)
+
+        must_revalidate = (
+            entry['revalidate'] or time.time() >= entry['expires_at']
+            or 'no-cache' in request_cc or _seconds(request_cc.get('max-age')) == 0
+            or request.lookup.get('pragma', '').lower() == 'no-cache'
+        )
+        if not must_revalidate:
+            body = await loop.run_in_executor(None, self.store.read_body, entry)
+            if body is not None:
+                self.stats['hits'] += 1
+                self.stats['bytes_saved'] += len(body)
+                return await self._send_cached(request, writer, entry, body)
+            return await self._fetch(request, writer)
+        if entry['etag'] or entry['last_modified']:
+            return await self._fetch(request, writer, validate=entry)
+        return await self._fetch(request, writer)
+
+    async def _fetch(self, request: _Request, writer: asyncio.StreamWriter, store: bool = True,
+                     validate: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Forward a request to the origin and stream the response back,
+        storing it when it may be cached.
+
+        Args:
+            request: Browser request
+            writer: Browser connection
+            store: Whether the response may be stored
+            validate: Stored entry to revalidate with its validators
+
+        Returns:
+            bool: Whether the connection can be reused
+        """
+        headers = [
+            (name, value) for name, value in request.headers
+            if name.lower() not in HOP_HEADERS
+            and not (store and name.lower() in CONDITIONAL_HEADERS)
+        ]
+        if validate:
+            if validate['etag']:
+                headers.append(('If-None-Match', validate['etag']))
+            if validate['last_modified']:
+                headers.append(('If-Modified-Since', validate['last_modified']))
+        try:
+            response = await self._client.send(
+                self._client.build_request(
+                    request.method, request.target, headers=headers, content=request.body or None
+                ),
+                stream=True
+            )
+        except httpx.HTTPError as e:
+            self.stats['errors'] += 1
+            await self._send_error(writer, 502, f"Upstream request failed: {str(e)}")
+            return False
+
+        try:
+            now = time.time()
+            response_headers = [
+                (name, value) for name, value in response.headers.multi_items()
+                if name.lower() not in HOP_HEADERS
+            ]
+            if validate and response.status_code == 304:
+                return await self._revalidated(request, writer, validate, response_headers, now)
+
+            if store:
+                self.stats['misses'] += 1
+            policy = self._storage_policy(request, response, now) if store else None
+            limit = Config.CACHE_PROXY_MAX_OBJECT_MB * 1024 * 1024
+            length = response.headers.get('content-length')
+            if policy and length and length.isdigit() and int(length) > limit:
+                policy = None
+
+            chunked = length is None and request.method != 'HEAD' and response.status_code not in (204, 304)
+            extra = [('Transfer-Encoding', 'chunked')] if chunked else []
+            if length is not None:
+                extra.append(('Content-Length', length))
+            status_line = f"HTTP/1.1 {response.status_code} {response.reason_phrase}"
+            self._write_head(writer, status_line, [
+                (n, v) for n, v in response_headers if n.lower() != 'content-length'
+            ] + extra + [('X-Cache', 'MISS' if store else 'BYPASS')])
+
+            body = []
+            size = 0
+            async for chunk in response.aiter_raw():
+                size += len(chunk)
+                self.stats['bytes_from_origin'] += len(chunk)
+                if policy is not None:
+                    if size > limit:
+                        policy, body = None, []
+                    else:
+                        body.append(chunk)
+                writer.write(b'%x\r\n%s\r\n' % (len(chunk), chunk) if chunked else chunk)
+                await writer.drain()
+            if chunked:
+                writer.write(b'0\r\n\r\n')
+                await writer.drain()
+
+            if policy is not None:
+                stored_at, expires_at, revalidate, vary = policy
+                evicted = await asyncio.get_running_loop().run_in_executor(
+                    None, self.store.put, request.target, request.lookup, vary,
+                    response.status_code, _shared(response_headers), b''.join(body),
+                    stored_at, expires_at, revalidate
+                )
+                self.stats['evictions'] += evicted
+            return length is not None or chunked or request.method == 'HEAD'
+        finally:
+            await response.aclose()
+
+    async def _revalidated(self, request: _Request, writer: asyncio.StreamWriter,
+                           entry: Dict[str, Any], response_headers: List[Tuple[str, str]],
+                           now: float) -> bool:
+        """Serve a stored response the origin confirmed with 304 Not Modified."""
+        updated = {name.lower() for name, _ in response_headers}
+        headers = [(n, v) for n, v in entry['headers'] if n.lower() not in updated]
+        headers += [(n, v) for n, v in _shared(response_headers) if n.lower() != 'content-length']
+        freshness = self._freshness({n.lower(): v for n, v in headers}, now)
+        stored_at, expires_at, revalidate = freshness or (now, now, True)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, self.store.refresh, entry, headers, stored_at, expires_at, revalidate
+        )
+        entry.update(headers=headers, stored_at=stored_at)
+        body = await loop.run_in_executor(None, self.store.read_body, entry)
+        if body is None:
+            return await self._fetch(request, writer)
+        self.stats['hits'] += 1
+        self.stats['revalidated'] += 1
+        self.stats['bytes_saved'] += len(body)
+        # Cookies the origin set while validating are passed to this client only
+        own = [(n, v) for n, v in response_headers if n.lower() in PRIVATE_HEADERS]
+        return await self._send_cached(request, writer, entry, body, own)
+
+    def _storage_policy(self, request: _Request, response: httpx.Response,
+                        now: float) -> Optional[Tuple[float, float, bool, List[str]]]:
+        """
+        Decide whether a shared cache may store a response.
+
+        Returns:
+            Optional[Tuple[float, float, bool, List[str]]]: stored_at,
+            expires_at, whether every use must be revalidated and the Vary
+            header names; None if the response must not be stored
+        """
+        headers = {name.lower(): value for name, value in response.headers.items()}
+        cc = _cache_control(headers.get('cache-control'))
+        vary = sorted({v.strip().lower() for v in headers.get('vary', '').split(',') if v.strip()})
+        if (response.status_code not in CACHEABLE_STATUSES or 'no-store' in cc or 'private' in cc
+                or '*' in vary):
+            return None
+        explicitly_shared = 'public' in cc or 's-maxage' in cc or 'must-revalidate' in cc
+        if 'authorization' in request.lookup and not explicitly_shared:
+            return None
+        # Personalized responses are not shared between instances: a response
+        # to a request with cookies is only stored if the origin declares it
+        # public and keys it on the cookies, and Set-Cookie is never stored
+        if 'cookie' in request.lookup and not ('public' in cc and 'cookie' in vary):
+            return None
+        if 'set-cookie' in headers and 'public' not in cc:
+            return None
+        freshness = self._freshness(headers, now)
+        if freshness is None:
+            return None
+        stored_at, expires_at, revalidate = freshness
+        if expires_at <= now and not (headers.get('etag') or headers.get('last-modified')):
+            return None
+        return stored_at, expires_at, revalidate, vary
+
+    @staticmethod
+    def _freshness(headers: Dict[str, str], now: float) -> Optional[Tuple[float, float, bool]]:
+        """
+        Compute when a response was generated and how long it stays fresh.
+
+        Returns:
+            Optional[Tuple[float, float, bool]]: stored_at, expires_at and
+            whether every use must be revalidated
+        """
+        cc = _cache_control(headers.get('cache-control'))
+        age = _seconds(headers.get('age')) or 0
+        stored_at = now - age
+        date = _http_date(headers.get('date')) or now
+        if 's-maxage' in cc or 'max-age' in cc:
+            lifetime = _seconds(cc.get('s-maxage', cc.get('max-age')))
+            if lifetime is None:
+                return None
+        elif 'expires' in headers:
+            expires = _http_date(headers['expires'])
+            lifetime = max(0.0, expires - date) if expires else 0
+        else:
+            # Heuristic freshness: a tenth of the time since the last modification
+            last_modified = _http_date(headers.get('last-modified'))
+            lifetime = min(0.1 * (date - last_modified), Config.CACHE_PROXY_HEURISTIC_MAX) if last_modified else 0
+            lifetime = max(0.0, lifetime)
+        return stored_at, stored_at + lifetime, 'no-cache' in cc
+
+    async def _send_cached(self, request: _Request, writer: asyncio.StreamWriter,
+                           entry: Dict[str, Any], body: bytes,
+                           own_headers: List[Tuple[str, str]] = ()) -> bool:
+        """
+        Serve a stored response, or 304 if it satisfies the browser's own validators.
+
+        Args:
+            request: Request being answered
+            writer: Browser connection
+            entry: Stored entry
+            body: Stored body
+            own_headers: Headers addressed to this client only, sent but not stored
+
+        Returns:
+            bool: Whether the connection can be reused
+        """
+        headers = [(n, v) for n, v in _shared(entry['headers']) if n.lower() not in ('age', 'content-length')]
+        headers += list(own_headers)
+        headers.append(('Age', str(int(max(0, time.time() - entry['stored_at'])))))
+        headers.append(('X-Cache', 'HIT'))
+
+        etag = entry['etag']
+        if_none_match = request.lookup.get('if-none-match')
+        if_modified_since = _http_date(request.lookup.get('if-modified-since'))
+        last_modified = _http_date(entry['last_modified'])
+        not_modified = entry['status'] == 200 and (
+            (if_none_match and etag and (
+                if_none_match.strip() == '*'
+                or etag.removeprefix('W/') in {t.strip().removeprefix('W/') for t in if_none_match.split(',')}
+            ))
+            or (not if_none_match and if_modified_since and last_modified
+                and last_modified <= if_modified_since)
+        )
+        if not_modified:
+            self._write_head(writer, "HTTP/1.1 304 Not Modified", headers)
+        else:
+            status_line = f"HTTP/1.1 {entry['status']} {httpx.codes.get_reason_phrase(entry['status'])}"
+            self._write_head(writer, status_line, headers + [('Content-Length', str(len(body)))])
+            writer.write(body)
+        await writer.drain()
+        return True
+
+    @staticmethod
+    def _write_head(writer: asyncio.StreamWriter, status_line: str,
+                    headers: List[Tuple[str, str]]) -> None:
+        lines = [status_line] + [f"{name}: {value}" for name, value in headers]
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1', errors='replace'))
+
+    async def _send_error(self, writer: asyncio.StreamWriter, status: int, message: str) -> None:
+        body = message.encode('utf-8')
+        self._write_head(writer, f"HTTP/1.1 {status} {httpx.codes.get_reason_phrase(status)}", [
+            ('Content-Type', 'text/plain; charset=utf-8'),
+            ('Content-Length', str(len(body))),
+            ('Connection', 'close')
+        ])
+        writer.write(body)
+        await writer.drain()
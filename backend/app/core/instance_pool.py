@@ -0,0 +1,254 @@
+# File: backend/app/core/instance_pool.py
+"""Warm pool of pre-launched browser instances."""
+
+from typing import Any, Callable, Dict, List, Optional
+from collections import deque
+from datetime import datetime
+import threading
+import time
+import uuid
+from loguru import logger
+from selenium import webdriver
+
+from app.browser import ChromeDriverManager
+from . import sharding
+
+class InstancePool:
+    """
+    Keeps a number of verified Chrome instances running ahead of demand.
+    A background thread refills the pool, so instance creation becomes a
+    checkout instead of a cold start.
+    """
+
+    def __init__(self, driver_manager: ChromeDriverManager,
+                 verify: Callable[[webdriver.Chrome], bool],
+                 admission=None):
+        """
+        Initialize the pool.
+
+        Args:
+            driver_manager: Driver manager used to launch warm instances
+            verify: Callable returning True if a driver is usable
+            admission: Optional AdmissionController that refills must fit
+        """
+        self.driver_manager = driver_manager
+        self.verify = verify
+        self.admission = admission
+        self.target_size = 0
+        self._idle: deque = deque()
+        self._in_flight = 0
+        self._next_slot = 0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.recycled = 0
+        self.launch_failures = 0
+        self._refill_latencies: deque = deque(maxlen=100)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the pool is running with a non-zero target size."""
+        return self._running and self.target_size > 0
+
+    def start(self, size: int) -> None:
+        """
+        Start the background refill thread.
+
+        Args:
+            size: Number of warm instances to keep ready
+        """
+        with self._cond:
+            self.target_size = max(0, size)
+            if self._running or self.target_size == 0:
+                return
+            self._running = True
+        self._thread = threading.Thread(
+            target=self._refill_loop, name="instance-pool-refill", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Warm instance pool started with target size {self.target_size}")
+
+    def stop(self) -> None:
+        """Stop refilling and quit all idle warm instances."""
+        with self._cond:
+            self._running = False
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        for entry in idle:
+            self._quit(entry)
+        logger.info(f"Warm instance pool stopped, released {len(idle)} instances")
+
+    def checkout(self) -> Optional[Dict[str, Any]]:
+        """
+        Take a warm instance from the pool without waiting.
+
+        Returns:
+            Optional[Dict[str, Any]]: Pool entry with driver, profile_name and
+            fingerprint, or None if the pool is empty
+        """
+        with self._cond:
+            if not self._idle:
+                self.misses += 1
+                self._cond.notify_all()
+                return None
+            entry = self._idle.popleft()
+            self.hits += 1
+            self._cond.notify_all()
+        logger.info(f"Checked out warm instance with profile {entry['profile_name']}")
+        return entry
+
+    def checkin(self, entry: Dict[str, Any]) -> bool:
+        """
+        Retire a used warm instance so the pool replaces it with a fresh one.
+
+        A used browser cannot be handed to another caller: storage of iframe
+        and third-party origins, origins pruned from its history and the
+        history database itself survive any per-origin clearing. The instance
+        is quit and its profile deleted; the refill thread launches a new
+        instance on a fresh profile in its place.
+
+        Args:
+            entry: Pool entry previously returned by checkout()
+
+        Returns:
+            bool: True if the pool has room and refills the slot
+        """
+        self._quit(entry)
+        profile_dir = self.driver_manager.get_profile_dir(entry['profile_name'])
+        self.driver_manager.profile_manager.maintenance.trash(profile_dir)
+        with self._cond:
+            has_room = self._running and len(self._idle) + self._in_flight < self.target_size
+            if has_room:
+                self.recycled += 1
+            self._cond.notify_all()
+        logger.info(f"Retired warm instance with profile {entry['profile_name']}")
+        return has_room
+
+    def profile_names(self) -> List[str]:
+        """Get the profile names of the idle warm instances."""
+        with self._cond:
+            return [entry['profile_name'] for entry in self._idle]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool size, hit rate and refill latency.
+
+        Returns:
+            Dict[str, Any]: Pool statistics
+        """
+        with self._cond:
+            requests = self.hits + self.misses
+            latencies = sorted(self._refill_latencies)
+            return {
+                'enabled': self.enabled,
+                'target_size': self.target_size,
+                'idle': len(self._idle),
+                'launching': self._in_flight,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / requests if requests else None,
+                'recycled': self.recycled,
+                'launch_failures': self.launch_failures,
+                'refill_latency': {
+                    'last': self._refill_latencies[-1] if latencies else None,
+                    'avg': sum(latencies) / len(latencies) if latencies else None,
+                    'p95': latencies[int(len(latencies) * 0.95)] if latencies else None
+                }
+            }
+
+    def _refill_loop(self) -> None:
+        """Launch warm instances until the pool reaches its target size."""
+        consecutive_failures = 0
+        while True:
+            with self._cond:
+                while self._running and len(self._idle) + self._in_flight >= self.target_size:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                self._in_flight += 1
+                self._next_slot -= 1
+                slot = self._next_slot
+
+            # Refills only use budget that is free right now
+            if self.admission and not self.admission.try_acquire():
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.wait(5)
+                continue
+            try:
+                entry = self._launch(slot)
+            finally:
+                if self.admission:
+                    self.admission.release()
+
+            with self._cond:
+                self._in_flight -= 1
+                keep = entry is not None and self._running
+                if keep:
+                    self._idle.append(entry)
+                elif entry is None:
+                    self.launch_failures += 1
+            if entry is not None and not keep:
+                # Pool was stopped while this instance was launching
+                self._quit(entry)
+
+            consecutive_failures = 0 if entry else consecutive_failures + 1
+            if consecutive_failures:
+                # Back off so a broken environment does not spin
+                time.sleep(min(30, 2 ** consecutive_failures))
+
+    def _launch(self, slot: int) -> Optional[Dict[str, Any]]:
+        """
+        Launch and verify one warm instance.
+
+        Warm instances use negative slot numbers so their fingerprints never
+        collide with API instance ids; windows are re-positioned on checkout.
+
+        Args:
+            slot: Negative slot number for the warm instance
+
+        Returns:
+            Optional[Dict[str, Any]]: Pool entry, or None if launching failed
+        """
+        profile_name = f"{sharding.pool_profile_prefix()}{uuid.uuid4().hex[:12]}"
+        started = time.monotonic()
+        try:
+            driver = self.driver_manager.create_driver(
+                slot, profile_name=profile_name, load_profile=False
+            )
+        except Exception as e:
+            logger.error(f"Failed to launch warm instance: {str(e)}")
+            return None
+
+        entry = {
+            'driver': driver,
+            'profile_name': profile_name,
+            'fingerprint': self.driver_manager.fingerprints.pop(slot, {}),
+            'launched_at': datetime.now().isoformat()
+        }
+        if not self.verify(driver):
+            logger.warning(f"Warm instance {profile_name} failed verification")
+            self._quit(entry)
+            return None
+
+        elapsed = time.monotonic() - started
+        with self._cond:
+            self._refill_latencies.append(elapsed)
+        logger.info(f"Warm instance {profile_name} ready in {elapsed:.2f}s")
+        return entry
+
+    @staticmethod
+    def _quit(entry: Dict[str, Any]) -> None:
+        """Quit the driver of a pool entry, ignoring errors."""
+        try:
+            entry['driver'].quit()
+        except Exception as e:
+            logger.warning(f"Failed to quit warm instance: {str(e)}")
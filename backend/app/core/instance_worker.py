@@ -0,0 +1,197 @@
+# File: backend/app/core/instance_worker.py
+"""Per-instance command worker."""
+
+from typing import Any, Callable, Optional
+from concurrent.futures import Future
+import asyncio
+import inspect
+import threading
+import time
+from loguru import logger
+
+class InstanceWorker:
+    """
+    Dedicated thread that owns all WebDriver access for one instance.
+
+    Commands are queued and executed one at a time on the worker's own event
+    loop, so commands for one instance stay serialized while different
+    instances run in parallel. Commands may be plain callables or coroutine
+    functions; the worker loop keeps running between commands so per-instance
+    background tasks can live on it.
+    """
+
+    def __init__(self, instance_id: str):
+        """
+        Initialize the worker.
+
+        Args:
+            instance_id: Instance identifier the worker belongs to
+        """
+        self.instance_id = instance_id
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.pending = 0
+        self.running = False
+        self.commands_run = 0
+        self.last_command_at: Optional[float] = None
+        # Guards pending and running, which callers update and busy reads
+        # from other threads than the worker's, and orders every command
+        # submitted before stop ahead of the stop sentinel
+        self._lock = threading.Lock()
+        self._commands: Optional[asyncio.Queue] = None
+        self._started = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"instance-worker-{instance_id}", daemon=True
+        )
+
+    def start(self) -> None:
+        """Start the worker thread and wait until it accepts commands."""
+        self._thread.start()
+        self._started.wait()
+
+    def stop(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Stop the worker after the commands already queued have run.
+
+        Args:
+            wait: Whether to wait for the worker thread to exit
+            timeout: Maximum seconds to wait
+        """
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            if self.loop and not self.loop.is_closed():
+                self.loop.call_soon_threadsafe(self._commands.put_nowait, None)
+        if wait and threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+    @property
+    def busy(self) -> bool:
+        """Whether a command is running or queued."""
+        with self._lock:
+            return self.running or self.pending > 0
+
+    @property
+    def on_worker_thread(self) -> bool:
+        """Whether the caller is running on this worker's thread."""
+        return threading.current_thread() is self._thread
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Queue a command for execution on the worker.
+
+        Args:
+            fn: Callable or coroutine function to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future: Resolves with the command's result
+        """
+        future: Future = Future()
+        with self._lock:
+            if not self._stopped:
+                try:
+                    self.loop.call_soon_threadsafe(
+                        self._commands.put_nowait, (fn, args, kwargs, future)
+                    )
+                except RuntimeError:
+                    # The loop closed without stop, e.g. the thread died
+                    pass
+                else:
+                    self.pending += 1
+                    return future
+        future.set_exception(RuntimeError(f"Worker for instance {self.instance_id} is stopped"))
+        return future
+
+    async def call(self, fn: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Run a command on the worker and await its result from another event loop.
+
+        Args:
+            fn: Callable or coroutine function to run
+            timeout: Optional timeout in seconds
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Any: Result of the command
+        """
+        future = asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+        if timeout is None:
+            return await future
+        return await asyncio.wait_for(future, timeout)
+
+    def call_sync(self, fn: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Run a command on the worker and block until it finishes.
+
+        Calls made from the worker thread itself run inline to avoid deadlock.
+        """
+        if self.on_worker_thread:
+            result = fn(*args, **kwargs)
+            if inspect.isawaitable(result):
+                raise RuntimeError("Cannot run a coroutine inline on the worker thread")
+            return result
+        return self.submit(fn, *args, **kwargs).result(timeout)
+
+    def _run(self) -> None:
+        """Worker thread entry point."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self._commands = asyncio.Queue()
+        self._started.set()
+        try:
+            self.loop.run_until_complete(self._consume())
+        finally:
+            # Cancel background tasks left on the loop, e.g. protocol readers
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                self.loop.run_until_complete(
+                    asyncio.gather(*tasks, return_exceptions=True)
+                )
+            self.loop.close()
+            logger.info(f"Worker for instance {self.instance_id} stopped")
+
+    async def _consume(self) -> None:
+        """Execute queued commands one at a time until stopped."""
+        while True:
+            item = await self._commands.get()
+            if item is None:
+                self._cancel_remaining()
+                return
+            fn, args, kwargs, future = item
+            # Mark the command running before it leaves pending, so busy
+            # never reads False while it is still in flight
+            with self._lock:
+                self.pending -= 1
+                self.running = True
+            if not future.set_running_or_notify_cancel():
+                with self._lock:
+                    self.running = False
+                continue
+            try:
+                result = fn(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+            finally:
+                with self._lock:
+                    self.running = False
+                self.commands_run += 1
+                self.last_command_at = time.time()
+
+    def _cancel_remaining(self) -> None:
+        """Cancel commands that were queued after stop was requested."""
+        while not self._commands.empty():
+            item = self._commands.get_nowait()
+            if item is not None:
+                with self._lock:
+                    self.pending -= 1
+                item[3].cancel()
@@ -0,0 +1,201 @@
+# File: backend/app/core/launch_jobs.py
+"""Background instance creation jobs."""
+
+from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import asyncio
+import threading
+import time
+import uuid
+from loguru import logger
+
+from app.config import Config
+from .admission import AdmissionRejected
+from . import sharding
+
+class LaunchJobManager:
+    """
+    Runs instance creation on a bounded pool of launcher threads.
+    Each request becomes a job whose per-instance progress can be polled
+    or streamed while Chrome starts in the background.
+    """
+
+    def __init__(self, browser_manager):
+        """
+        Initialize the job manager.
+
+        Args:
+            browser_manager: BrowserManager that performs the launches
+        """
+        self.browser_manager = browser_manager
+        self.jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Lazily create the launcher pool sized by LAUNCH_CONCURRENCY."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, Config.LAUNCH_CONCURRENCY),
+                    thread_name_prefix="instance-launcher"
+                )
+            return self._executor
+
+    def submit(self, count: int, **options: Any) -> Dict[str, Any]:
+        """
+        Create a job that launches new instances in the background.
+
+        Args:
+            count: Number of instances to create
+            **options: Launch options passed to BrowserManager.create_instance
+
+        Returns:
+            Dict[str, Any]: Snapshot of the newly created job
+        """
+        instance_ids = [self.browser_manager.allocate_instance_id() for _ in range(count)]
+        job_id = sharding.tag_job_id(uuid.uuid4().hex)
+        job = {
+            'job_id': job_id,
+            'status': 'pending',
+            'created_at': datetime.now().isoformat(),
+            'finished_at': None,
+            'version': 0,
+            'instances': [
+                {
+                    'instance_id': instance_id,
+                    'status': 'pending',
+                    'error': None,
+                    'started_at': None,
+                    'finished_at': None,
+                    'duration': None,
+                    'retry_after': None
+                }
+                for instance_id in instance_ids
+            ]
+        }
+        with self._lock:
+            self.jobs[job_id] = job
+            self._trim_history()
+
+        logger.info(f"Created launch job {job_id} for instances {instance_ids}")
+        for item in job['instances']:
+            self.executor.submit(self._run_item, job, item, options)
+        return self.get_job(job_id)
+
+    async def launch(self, instance_id: str) -> bool:
+        """
+        Create a single instance on the launcher pool without blocking the event loop.
+
+        Args:
+            instance_id: Instance identifier
+
+        Returns:
+            bool: True if the instance was created
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.browser_manager.create_instance, instance_id
+        )
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a consistent snapshot of a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Optional[Dict[str, Any]]: Job snapshot, or None if unknown
+        """
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if not job:
+                return None
+            return self._snapshot(job)
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """Get snapshots of all retained jobs, newest first."""
+        with self._lock:
+            return [self._snapshot(job) for job in reversed(self.jobs.values())]
+
+    def pending_instance_ids(self) -> List[str]:
+        """Get the instances of unfinished jobs that have not finished launching."""
+        with self._lock:
+            return [
+                item['instance_id']
+                for job in self.jobs.values() if job['finished_at'] is None
+                for item in job['instances'] if item['status'] in ('pending', 'launching')
+            ]
+
+    def queued_count(self) -> int:
+        """Count instances of unfinished jobs that have not finished launching."""
+        return len(self.pending_instance_ids())
+
+    def shutdown(self) -> None:
+        """Stop accepting launches and wait for running ones to finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _run_item(self, job: Dict[str, Any], item: Dict[str, Any],
+                  options: Optional[Dict[str, Any]] = None) -> None:
+        """Launch one instance of a job on a launcher thread."""
+        instance_id = item['instance_id']
+        started = time.monotonic()
+        self._update(job, item, status='launching', started_at=datetime.now().isoformat())
+        retry_after = None
+        try:
+            success = self.browser_manager.create_instance(instance_id, **(options or {}))
+            error = None if success else f"Failed to create instance {instance_id}"
+        except AdmissionRejected as e:
+            success, error, retry_after = False, e.reason, e.retry_after
+        except Exception as e:
+            success, error = False, str(e)
+            logger.error(f"Launch job {job['job_id']} failed for {instance_id}: {error}")
+
+        self._update(
+            job, item,
+            status='running' if success else 'failed',
+            error=error,
+            retry_after=retry_after,
+            finished_at=datetime.now().isoformat(),
+            duration=round(time.monotonic() - started, 3)
+        )
+
+    def _update(self, job: Dict[str, Any], item: Dict[str, Any], **changes) -> None:
+        """Apply changes to a job item and recompute the job status."""
+        with self._lock:
+            item.update(changes)
+            statuses = [i['status'] for i in job['instances']]
+            if any(s in ('pending', 'launching') for s in statuses):
+                job['status'] = 'running'
+            else:
+                if all(s == 'running' for s in statuses):
+                    job['status'] = 'completed'
+                elif all(s == 'failed' for s in statuses):
+                    job['status'] = 'failed'
+                else:
+                    job['status'] = 'partial'
+                job['finished_at'] = datetime.now().isoformat()
+            job['version'] += 1
+
+    def _trim_history(self) -> None:
+        """Drop the oldest finished jobs beyond LAUNCH_JOB_HISTORY."""
+        finished = [
+            job_id for job_id, job in self.jobs.items()
+            if job['finished_at'] is not None
+        ]
+        for job_id in finished[:max(0, len(self.jobs) - Config.LAUNCH_JOB_HISTORY)]:
+            del self.jobs[job_id]
+
+    @staticmethod
+    def _snapshot(job: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a job so callers never observe it mid-update."""
+        snapshot = dict(job)
+        snapshot['instances'] = [dict(item) for item in job['instances']]
+        return snapshot
@@ -0,0 +1,111 @@
+# File: backend/app/core/loop_monitor.py
+"""Event loop lag monitoring."""
+
+from typing import Any, Dict, Optional
+from collections import deque
+import asyncio
+import time
+from loguru import logger
+
+class EventLoopMonitor:
+    """
+    Measures how long the event loop is blocked.
+
+    A task sleeps for a fixed interval and records how much later than
+    requested it wakes up; that lag is time the loop spent running other
+    callbacks without yielding, such as a blocking WebDriver call made on
+    the loop. Totals are cumulative, so callers diff two snapshots to get
+    the blocking during a period.
+    """
+
+    def __init__(self, interval: float, stall_threshold: float, window: int = 600):
+        """
+        Initialize the monitor.
+
+        Args:
+            interval: Seconds between probes
+            stall_threshold: Lag in seconds above which a probe counts as a stall
+            window: Number of recent lags kept for percentiles
+        """
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self._lags: deque = deque(maxlen=max(1, window))
+        self._task: Optional[asyncio.Task] = None
+        self.started_at: Optional[float] = None
+        self.probes = 0
+        self.blocked_seconds = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Start probing the running (or given) event loop."""
+        if self.running:
+            return
+        loop = loop or asyncio.get_running_loop()
+        self.started_at = time.time()
+        self._task = loop.create_task(self._run())
+        logger.info(f"Event loop monitor started with interval {self.interval}s")
+
+    def stop(self) -> None:
+        """Stop probing."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def reset(self) -> None:
+        """Clear all measurements."""
+        self._lags.clear()
+        self.started_at = time.time()
+        self.probes = 0
+        self.blocked_seconds = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, time.perf_counter() - expected))
+
+    def record(self, lag: float) -> None:
+        """Record the lag of one probe."""
+        self.probes += 1
+        self.blocked_seconds += lag
+        self.max_lag = max(self.max_lag, lag)
+        if lag >= self.stall_threshold:
+            self.stalls += 1
+        self._lags.append(lag)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get lag statistics.
+
+        Returns:
+            Dict[str, Any]: Cumulative blocked time, stall count and maximum
+            lag, plus percentiles over the recent window, in milliseconds
+            where noted
+        """
+        lags = sorted(self._lags)
+
+        def percentile(fraction: float) -> Optional[float]:
+            if not lags:
+                return None
+            return round(lags[min(len(lags) - 1, int(fraction * len(lags)))] * 1000, 2)
+
+        return {
+            'running': self.running,
+            'interval': self.interval,
+            'stall_threshold': self.stall_threshold,
+            'uptime': round(time.time() - self.started_at, 1) if self.started_at else 0,
+            'probes': self.probes,
+            'blocked_seconds': round(self.blocked_seconds, 4),
+            'stalls': self.stalls,
+            'max_lag_ms': round(self.max_lag * 1000, 2),
+            'lag_p50_ms': percentile(0.50),
+            'lag_p95_ms': percentile(0.95),
+            'lag_p99_ms': percentile(0.99)
+        }
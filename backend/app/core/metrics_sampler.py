@@ -0,0 +1,166 @@
+# File: backend/app/core/metrics_sampler.py
+"""Background system metrics sampling."""
+
+from typing import Any, Dict, List, Optional
+from collections import deque
+import threading
+import time
+import psutil
+from loguru import logger
+
+class SystemMetricsSampler:
+    """
+    Samples host CPU, memory, disk and network metrics on a background
+    thread into a fixed-size ring buffer, so API requests answer from
+    memory instead of calling psutil themselves.
+    """
+
+    # Fields averaged when history is downsampled
+    SERIES_FIELDS = ('cpu_usage', 'memory_usage', 'disk_usage', 'net_sent_rate', 'net_recv_rate')
+
+    def __init__(self, interval: float, history_size: int, disk_path: str = '/'):
+        """
+        Initialize the sampler.
+
+        Args:
+            interval: Seconds between samples
+            history_size: Number of samples kept in the ring buffer
+            disk_path: Path whose filesystem usage is reported
+        """
+        self.interval = interval
+        self.disk_path = disk_path
+        self._samples: deque = deque(maxlen=max(1, history_size))
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_net: Optional[Any] = None
+        self._last_net_at: Optional[float] = None
+
+    def start(self) -> None:
+        """Start the sampling thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        # cpu_percent(interval=None) measures since the previous call, so prime it
+        psutil.cpu_percent(percpu=True)
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="system-metrics-sampler", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"System metrics sampler started with interval {self.interval}s")
+
+    def stop(self) -> None:
+        """Stop the sampling thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def latest(self) -> Dict[str, Any]:
+        """
+        Get the most recent sample, collecting one if none exists yet.
+
+        Returns:
+            Dict[str, Any]: Latest metrics sample
+        """
+        with self._lock:
+            if self._samples:
+                return self._samples[-1]
+        return self._sample()
+
+    def history(self, window: float, points: int) -> List[Dict[str, Any]]:
+        """
+        Get a downsampled time series of recent samples.
+
+        Samples within the window are grouped into at most `points` equally
+        sized buckets and each series is averaged per bucket.
+
+        Args:
+            window: Seconds of history to return
+            points: Maximum number of points
+
+        Returns:
+            List[Dict[str, Any]]: Points with timestamp and averaged series, oldest first
+        """
+        cutoff = time.time() - window
+        with self._lock:
+            samples = [s for s in self._samples if s['timestamp'] >= cutoff]
+        if not samples:
+            return []
+
+        bucket_size = -(-len(samples) // max(1, points))
+        result = []
+        for start in range(0, len(samples), bucket_size):
+            bucket = samples[start:start + bucket_size]
+            point = {'timestamp': bucket[-1]['timestamp']}
+            for field in self.SERIES_FIELDS:
+                values = [s[field] for s in bucket if s[field] is not None]
+                point[field] = round(sum(values) / len(values), 2) if values else None
+            result.append(point)
+        return result
+
+    def _run(self) -> None:
+        """Collect samples until stopped."""
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self._sample()
+            except Exception as e:
+                logger.error(f"Failed to sample system metrics: {str(e)}")
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def _sample(self) -> Dict[str, Any]:
+        """Collect one sample and append it to the ring buffer."""
+        now = time.time()
+        per_cpu = psutil.cpu_percent(percpu=True)
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage(self.disk_path)
+        net = psutil.net_io_counters()
+        try:
+            frequency = psutil.cpu_freq()
+        except Exception:
+            frequency = None
+
+        sent_rate = recv_rate = None
+        with self._lock:
+            if self._last_net is not None and now > self._last_net_at:
+                elapsed = now - self._last_net_at
+                sent_rate = max(0, net.bytes_sent - self._last_net.bytes_sent) / elapsed
+                recv_rate = max(0, net.bytes_recv - self._last_net.bytes_recv) / elapsed
+            self._last_net, self._last_net_at = net, now
+
+        sample = {
+            'timestamp': now,
+            'cpu_usage': sum(per_cpu) / len(per_cpu) if per_cpu else 0.0,
+            'memory_usage': memory.percent,
+            'disk_usage': disk.percent,
+            'net_sent_rate': sent_rate,
+            'net_recv_rate': recv_rate,
+            'cpu': {
+                'percent': per_cpu,
+                'frequency': frequency._asdict() if frequency else None,
+                'count': len(per_cpu)
+            },
+            'memory': {
+                'total': memory.total,
+                'available': memory.available,
+                'percent': memory.percent,
+                'used': memory.used,
+                'free': memory.free
+            },
+            'disk': {
+                'total': disk.total,
+                'used': disk.used,
+                'free': disk.free,
+                'percent': disk.percent
+            },
+            'network': {
+                'bytes_sent': net.bytes_sent,
+                'bytes_recv': net.bytes_recv,
+                'packets_sent': net.packets_sent,
+                'packets_recv': net.packets_recv
+            }
+        }
+        with self._lock:
+            self._samples.append(sample)
+        return sample
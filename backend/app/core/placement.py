@@ -0,0 +1,49 @@
+# File: backend/app/core/placement.py
+"""Capacity-aware placement of new instances across cluster agents."""
+
+from typing import Any, Dict, List
+
+def plan_placement(capacities: Dict[int, Dict[str, Any]], count: int) -> Dict[int, int]:
+    """
+    Spread new instances over agents, one at a time, onto the least-loaded agent.
+
+    Agents are ranked by memory headroom, then by fewest instances and the
+    shortest launch queue. Each placement is charged against the agent's
+    report so a batch spreads out instead of landing on one host; once no
+    agent has headroom left the remaining instances still go to the
+    least-loaded one, whose admission control queues or rejects them.
+
+    Args:
+        capacities: Capacity reports of the reachable agents, by shard index
+        count: Number of instances to place
+
+    Returns:
+        Dict[int, int]: Number of instances to create on each shard
+    """
+    load = {
+        shard: [report['headroom'], report['instances'], report['launch_queue']]
+        for shard, report in capacities.items()
+    }
+    plan: Dict[int, int] = {}
+    for _ in range(count):
+        shard = min(load, key=lambda s: (-load[s][0], load[s][1], load[s][2], s))
+        load[shard][0] -= 1
+        load[shard][1] += 1
+        plan[shard] = plan.get(shard, 0) + 1
+    return plan
+
+def charge(capacities: Dict[int, Dict[str, Any]], plan: Dict[int, int]) -> None:
+    """Apply a placement to cached capacity reports until the agents report again."""
+    for shard, count in plan.items():
+        report = capacities.get(shard)
+        if report:
+            report['headroom'] = max(0, report['headroom'] - count)
+            report['instances'] += count
+            report['launch_queue'] += count
+
+def fallback_order(capacities: Dict[int, Dict[str, Any]], exclude: List[int]) -> List[int]:
+    """Other agents to try when one refuses a placement, best first."""
+    return sorted(
+        (s for s in capacities if s not in exclude),
+        key=lambda s: (-capacities[s]['headroom'], capacities[s]['instances'], s)
+    )
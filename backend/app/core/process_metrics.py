@@ -0,0 +1,182 @@
+# File: backend/app/core/process_metrics.py
+"""Per-instance process tree accounting."""
+
+from typing import Any, Dict, List, Optional
+import threading
+import time
+import psutil
+from loguru import logger
+
+class ProcessTreeAccountant:
+    """
+    Attributes CPU and memory usage to instances by walking each instance's
+    process tree, rooted at its chromedriver service process.
+
+    All instances are sampled together: one pass over the process table
+    builds the parent/child map, and only processes that belong to a tracked
+    tree are inspected further.
+    """
+
+    def __init__(self, interval: float, include_pss: bool = False):
+        """
+        Initialize the accountant.
+
+        Args:
+            interval: Seconds between samples
+            include_pss: Whether to read proportional set size, which is
+                considerably more expensive than RSS
+        """
+        self.interval = interval
+        self.include_pss = include_pss
+        self._roots: Dict[str, int] = {}
+        self._metrics: Dict[str, Dict[str, Any]] = {}
+        self._cpu_totals: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(self, instance_id: str, root_pid: int) -> None:
+        """
+        Start accounting an instance's process tree.
+
+        Args:
+            instance_id: Instance identifier
+            root_pid: PID of the instance's chromedriver process
+        """
+        with self._lock:
+            self._roots[instance_id] = root_pid
+            self._cpu_totals.pop(instance_id, None)
+            self._metrics.pop(instance_id, None)
+
+    def untrack(self, instance_id: str) -> None:
+        """Stop accounting an instance and drop its metrics."""
+        with self._lock:
+            self._roots.pop(instance_id, None)
+            self._cpu_totals.pop(instance_id, None)
+            self._metrics.pop(instance_id, None)
+
+    def get(self, instance_id: str) -> Optional[Dict[str, Any]]:
+        """Get the latest metrics of an instance, or None if not sampled yet."""
+        with self._lock:
+            metrics = self._metrics.get(instance_id)
+            return dict(metrics) if metrics else None
+
+    def get_all(self) -> Dict[str, Dict[str, Any]]:
+        """Get the latest metrics of all sampled instances."""
+        with self._lock:
+            return {instance_id: dict(m) for instance_id, m in self._metrics.items()}
+
+    def start(self) -> None:
+        """Start the sampling thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="process-tree-accountant", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Process tree accounting started with interval {self.interval}s")
+
+    def stop(self) -> None:
+        """Stop the sampling thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Sample until stopped."""
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.sample()
+            except Exception as e:
+                logger.error(f"Failed to sample instance processes: {str(e)}")
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def sample(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Sample every tracked instance in one pass over the process table.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Metrics keyed by instance id
+        """
+        with self._lock:
+            roots = dict(self._roots)
+        if not roots:
+            return {}
+
+        children: Dict[int, List[psutil.Process]] = {}
+        processes: Dict[int, psutil.Process] = {}
+        for proc in psutil.process_iter(['ppid']):
+            processes[proc.pid] = proc
+            children.setdefault(proc.info['ppid'], []).append(proc)
+
+        now = time.monotonic()
+        results = {}
+        for instance_id, root_pid in roots.items():
+            root = processes.get(root_pid)
+            if root is None:
+                continue
+            tree = [root]
+            index = 0
+            while index < len(tree):
+                tree.extend(children.get(tree[index].pid, []))
+                index += 1
+            results[instance_id] = self._measure(instance_id, tree, now)
+
+        with self._lock:
+            for instance_id, metrics in results.items():
+                # Skip instances untracked while they were being measured
+                if self._roots.get(instance_id) == roots[instance_id]:
+                    self._metrics[instance_id] = metrics
+        return results
+
+    def _measure(self, instance_id: str, tree: List[psutil.Process], now: float) -> Dict[str, Any]:
+        """Aggregate resource usage over one instance's process tree."""
+        rss = pss = cpu_time = 0.0
+        fds = renderers = processes = 0
+        pss_available = self.include_pss
+        for proc in tree:
+            try:
+                with proc.oneshot():
+                    cpu = proc.cpu_times()
+                    cpu_time += cpu.user + cpu.system
+                    if pss_available:
+                        try:
+                            memory = proc.memory_full_info()
+                            rss += memory.rss
+                            pss += memory.pss
+                        except (AttributeError, psutil.AccessDenied):
+                            pss_available = False
+                            rss += proc.memory_info().rss
+                    else:
+                        rss += proc.memory_info().rss
+                    try:
+                        fds += proc.num_fds()
+                    except (AttributeError, psutil.AccessDenied):
+                        pass
+                    if '--type=renderer' in proc.cmdline():
+                        renderers += 1
+                processes += 1
+            except (psutil.NoSuchProcess, psutil.ZombieProcess, psutil.AccessDenied):
+                continue
+
+        # CPU percent from the change in CPU time since the previous sample
+        cpu_percent = None
+        previous = self._cpu_totals.get(instance_id)
+        if previous and now > previous[1]:
+            cpu_percent = max(0.0, (cpu_time - previous[0]) / (now - previous[1]) * 100)
+        self._cpu_totals[instance_id] = (cpu_time, now)
+
+        return {
+            'root_pid': tree[0].pid,
+            'processes': processes,
+            'renderers': renderers,
+            'rss_mb': round(rss / 1024 / 1024, 1),
+            'pss_mb': round(pss / 1024 / 1024, 1) if pss_available else None,
+            'cpu_time': round(cpu_time, 2),
+            'cpu_percent': round(cpu_percent, 1) if cpu_percent is not None else None,
+            'open_files': fds,
+            'sampled_at': time.time()
+        }
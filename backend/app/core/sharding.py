@@ -0,0 +1,125 @@
+# File: backend/app/core/sharding.py
+"""
+Instance sharding helpers.
+
+In sharded mode several worker processes each own the instances whose
+numeric id is congruent to their shard index modulo the shard count, along
+with those instances' profiles. A routing process in front of them sends
+each request to the owning shard (see app.shard_router). In cluster mode
+the shards are agents on separate hosts and the routing process is the
+coordinator.
+"""
+
+from typing import List, Optional
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+from loguru import logger
+
+from app.config import Config
+
+_JOB_ID = re.compile(r's(\d+)-')
+
+def enabled() -> bool:
+    """Whether instances are partitioned across several processes."""
+    return Config.SHARD_COUNT > 1
+
+def is_primary() -> bool:
+    """Whether this process runs host-wide chores such as building the profile template."""
+    return Config.SHARD_INDEX == 0 or Config.CLUSTER_AGENT
+
+def processes_per_host() -> int:
+    """Number of shard processes sharing this host's profile directory."""
+    return 1 if Config.CLUSTER_AGENT else Config.SHARD_COUNT
+
+def shard_of(instance_id: str) -> int:
+    """Get the shard owning an instance id; non-numeric ids belong to shard 0."""
+    instance_id = str(instance_id)
+    return int(instance_id) % Config.SHARD_COUNT if instance_id.isdigit() else 0
+
+def owns_instance(instance_id: str) -> bool:
+    """Whether this process owns an instance id."""
+    return shard_of(instance_id) == Config.SHARD_INDEX
+
+def owns_profile(profile_name: str) -> bool:
+    """Whether this process owns a profile directory."""
+    if not enabled():
+        return True
+    match = re.fullmatch(r'profile_(\d+)', profile_name)
+    if match:
+        return owns_instance(match.group(1))
+    match = re.match(r'pool_s(\d+)_', profile_name)
+    if match:
+        return int(match.group(1)) == Config.SHARD_INDEX
+    return is_primary()
+
+def pool_profile_prefix() -> str:
+    """Prefix of warm pool profile names created by this process."""
+    return f"pool_s{Config.SHARD_INDEX}_" if enabled() else "pool_"
+
+def tag_job_id(job_id: str) -> str:
+    """Prefix a job or task id with this shard so the router can find its owner."""
+    return f"s{Config.SHARD_INDEX}-{job_id}" if enabled() else job_id
+
+def shard_of_job(job_id: str) -> Optional[int]:
+    """Get the shard a job or task id was created on, or None if it is not tagged."""
+    match = _JOB_ID.match(job_id)
+    return int(match.group(1)) if match else None
+
+def shard_urls() -> List[str]:
+    """Base URLs of all shard processes, or of the cluster agents."""
+    if Config.CLUSTER_AGENTS:
+        return list(Config.CLUSTER_AGENTS)
+    return [
+        f"http://{Config.SHARD_HOST}:{Config.SHARD_BASE_PORT + index}"
+        for index in range(Config.SHARD_COUNT)
+    ]
+
+def run_cluster(host: str, port: int, shards: int, log_level: str = "info") -> None:
+    """
+    Run shard worker processes plus the routing process in the foreground.
+
+    Args:
+        host: Address the router binds to
+        port: Port the router binds to; shards listen on the following ports
+            unless SHARD_BASE_PORT is set
+        shards: Number of shard processes
+        log_level: Uvicorn log level
+    """
+    import uvicorn
+
+    base_port = Config.SHARD_BASE_PORT or port + 1
+    env = dict(os.environ, SHARD_COUNT=str(shards), SHARD_BASE_PORT=str(base_port))
+    backend_dir = Path(__file__).resolve().parents[2]
+    processes = []
+    for index in range(shards):
+        processes.append(subprocess.Popen(
+            [
+                sys.executable, '-m', 'uvicorn', 'app.main:app',
+                '--host', Config.SHARD_HOST, '--port', str(base_port + index),
+                '--log-level', log_level
+            ],
+            cwd=str(backend_dir),
+            env=dict(env, SHARD_INDEX=str(index))
+        ))
+        logger.info(f"Started shard {index} on port {base_port + index} (pid {processes[-1].pid})")
+
+    os.environ.update(env)
+    Config.load_env()
+    try:
+        uvicorn.run("app.shard_router:app", host=host, port=port, log_level=log_level)
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.send_signal(signal.SIGTERM)
+        deadline = time.monotonic() + 30
+        for process in processes:
+            try:
+                process.wait(timeout=max(0.1, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                process.kill()
+        logger.info("All shards stopped")
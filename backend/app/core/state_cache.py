@@ -0,0 +1,202 @@
+# File: backend/app/core/state_cache.py
+"""Cached instance state."""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import copy
+import threading
+import time
+from loguru import logger
+
+class InstanceStateCache:
+    """
+    In-memory cache of per-instance info.
+
+    Entries are written by commands as they complete and by a low-frequency
+    background refresher; reads are served from memory unless the entry is
+    older than the requested staleness bound. Concurrent refreshes of the same
+    instance share a single load.
+    """
+
+    def __init__(self, loader: Callable[[str], Awaitable[Optional[Dict[str, Any]]]],
+                 on_change: Optional[Callable[[str, Dict[str, Any]], None]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            loader: Coroutine function reading fresh info for an instance id,
+                returning None if the instance is gone
+            on_change: Optional callback receiving an instance id and the
+                top-level fields whose cached value changed
+        """
+        self.loader = loader
+        self.on_change = on_change
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def get(self, instance_id: str, max_age: float) -> Optional[Dict[str, Any]]:
+        """
+        Get instance info no older than max_age seconds.
+
+        Args:
+            instance_id: Instance identifier
+            max_age: Staleness bound in seconds
+
+        Returns:
+            Optional[Dict[str, Any]]: Copy of the instance info, or None
+        """
+        with self._lock:
+            entry = self._entries.get(instance_id)
+            if entry and time.monotonic() - entry['updated_at'] <= max_age:
+                return copy.deepcopy(entry['state'])
+        return await self.refresh(instance_id)
+
+    async def refresh(self, instance_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Reload an instance's info, joining a refresh already in flight.
+
+        Args:
+            instance_id: Instance identifier
+
+        Returns:
+            Optional[Dict[str, Any]]: Copy of the fresh instance info, or None
+        """
+        task = self._inflight.get(instance_id)
+        if task is None:
+            task = asyncio.ensure_future(self._load(instance_id))
+            self._inflight[instance_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(instance_id, None))
+        state = await asyncio.shield(task)
+        return copy.deepcopy(state)
+
+    async def _load(self, instance_id: str) -> Optional[Dict[str, Any]]:
+        """Run the loader and store its result."""
+        state = await self.loader(instance_id)
+        if state is None:
+            self.remove(instance_id)
+        else:
+            self.set(instance_id, state)
+        return state
+
+    def set(self, instance_id: str, state: Dict[str, Any]) -> None:
+        """Replace an instance's cached info. Safe to call from any thread."""
+        with self._lock:
+            previous = self._entries.get(instance_id)
+            self._entries[instance_id] = {
+                'state': copy.deepcopy(state),
+                'updated_at': time.monotonic()
+            }
+        if self.on_change:
+            old = previous['state'] if previous else {}
+            changes = {k: v for k, v in state.items() if old.get(k) != v}
+            if changes:
+                self.on_change(instance_id, copy.deepcopy(changes))
+
+    def seed(self, instance_id: str, state: Dict[str, Any]) -> None:
+        """
+        Cache what is known of a new instance before it is first read.
+
+        The entry counts as stale, so reads still load fresh info, but
+        updates from commands are merged and reported from the start.
+
+        Args:
+            instance_id: Instance identifier
+            state: Initial instance info
+        """
+        with self._lock:
+            self._entries[instance_id] = {
+                'state': copy.deepcopy(state),
+                'updated_at': float('-inf')
+            }
+
+    def invalidate(self, instance_id: str) -> None:
+        """Mark an instance's info stale so the next read reloads it; updates still apply."""
+        with self._lock:
+            entry = self._entries.get(instance_id)
+            if entry:
+                entry['updated_at'] = float('-inf')
+
+    def update(self, instance_id: str, **fields: Any) -> None:
+        """
+        Merge fields into an instance's cached info without resetting its age.
+        Safe to call from any thread; ignored if the instance is not cached,
+        which instances are from registration (see seed) until they stop.
+
+        Args:
+            instance_id: Instance identifier
+            **fields: Top-level fields to replace; dict values are merged
+                into an existing dict field
+        """
+        changes = {}
+        with self._lock:
+            entry = self._entries.get(instance_id)
+            if not entry:
+                return
+            state = entry['state']
+            for key, value in copy.deepcopy(fields).items():
+                before = copy.deepcopy(state.get(key))
+                if isinstance(value, dict) and isinstance(state.get(key), dict):
+                    state[key].update(value)
+                else:
+                    state[key] = value
+                if state[key] != before:
+                    changes[key] = copy.deepcopy(state[key])
+        if changes and self.on_change:
+            self.on_change(instance_id, changes)
+
+    def remove(self, instance_id: str) -> None:
+        """Drop an instance from the cache."""
+        with self._lock:
+            self._entries.pop(instance_id, None)
+
+    def prune(self, live_ids: List[str]) -> None:
+        """Drop cached entries for instances that are no longer running."""
+        live = set(live_ids)
+        with self._lock:
+            for instance_id in [i for i in self._entries if i not in live]:
+                del self._entries[instance_id]
+
+    def age(self, instance_id: str) -> Optional[float]:
+        """Seconds since the instance's info was last loaded, or None if not cached."""
+        with self._lock:
+            entry = self._entries.get(instance_id)
+            return time.monotonic() - entry['updated_at'] if entry else None
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get copies of all cached entries without refreshing anything."""
+        with self._lock:
+            return {
+                instance_id: copy.deepcopy(entry['state'])
+                for instance_id, entry in self._entries.items()
+            }
+
+    async def refresh_stale(self, instance_ids: List[str], max_age: float,
+                            concurrency: int) -> int:
+        """
+        Refresh every listed instance older than max_age.
+
+        Args:
+            instance_ids: Instances to consider
+            max_age: Refresh entries older than this many seconds
+            concurrency: Maximum refreshes in flight
+
+        Returns:
+            int: Number of instances refreshed
+        """
+        ages = {instance_id: self.age(instance_id) for instance_id in instance_ids}
+        stale = [
+            instance_id for instance_id, age in ages.items()
+            if age is None or age > max_age
+        ]
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def refresh_one(instance_id: str) -> None:
+            async with semaphore:
+                try:
+                    await self.refresh(instance_id)
+                except Exception as e:
+                    logger.warning(f"Background refresh failed for instance {instance_id}: {str(e)}")
+
+        await asyncio.gather(*(refresh_one(i) for i in stale))
+        return len(stale)
@@ -0,0 +1,253 @@
+# File: backend/app/core/task_queue.py
+"""Durable, prioritized queue of URL visit tasks drained by running instances."""
+
+from typing import Any, Dict, List, Optional
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+import asyncio
+import socket
+import time
+import uuid
+from loguru import logger
+
+from app.config import Config
+from app.utils.task_store import TaskStore
+from . import sharding
+
+class TaskQueue:
+    """
+    Dispatches queued visit tasks to idle instances.
+
+    Tasks live in a SQLite store, so they outlive client connections and
+    restarts; tasks a previous run left half-done are requeued on start. A
+    dispatcher on the event loop hands each idle running instance the most
+    urgent task it may run, one task per instance at a time, and runs it
+    through BrowserManager.visit_url. Failed visits are retried with
+    exponential backoff until the task's attempts or deadline run out.
+    """
+
+    # Seconds between sweeps for expired tasks, vanished instances and old history
+    SWEEP_INTERVAL = 5
+
+    # Window over which throughput is reported
+    THROUGHPUT_WINDOW = 60
+
+    def __init__(self, browser_manager):
+        """
+        Initialize the queue.
+
+        Args:
+            browser_manager: BrowserManager whose instances run the tasks
+        """
+        self.browser_manager = browser_manager
+        self.worker_id = f"{socket.gethostname()}:{Config.SHARD_INDEX}"
+        self._store: Optional[TaskStore] = None
+        self._busy: Dict[str, asyncio.Task] = {}
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Statistics
+        self.started_at: Optional[float] = None
+        self.outcomes: Counter = Counter()
+
+    @property
+    def store(self) -> TaskStore:
+        """Lazily open the store once configuration has been loaded."""
+        if self._store is None:
+            path = Config.TASK_QUEUE_DB or Path(Config.PROFILES_DIR) / "task_queue.db"
+            self._store = TaskStore(Path(path))
+        return self._store
+
+    def start(self) -> None:
+        """Recover interrupted tasks and start the dispatcher on the running event loop."""
+        if self._dispatcher:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self.worker_id = f"{socket.gethostname()}:{Config.SHARD_INDEX}"
+        self.store.recover(self.worker_id)
+        self.started_at = time.time()
+        self._dispatcher = self._loop.create_task(self._dispatch())
+        logger.info(f"Task queue started ({self.store.db_path})")
+
+    def stop(self) -> None:
+        """Stop dispatching; tasks in flight stay running in the store and are recovered on restart."""
+        if self._dispatcher:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        for task in list(self._busy.values()):
+            task.cancel()
+        self._busy.clear()
+
+    def submit(self, tasks: List[Dict[str, Any]]) -> List[str]:
+        """
+        Queue visit tasks.
+
+        Args:
+            tasks: Task specs with url and optional instance_id (None for any
+                idle instance), priority, deadline (datetime), max_attempts and
+                retry_delay
+
+        Returns:
+            List[str]: Ids of the queued tasks, in order
+        """
+        specs = []
+        for task in tasks:
+            deadline = task.get('deadline')
+            specs.append({
+                'task_id': sharding.tag_job_id(uuid.uuid4().hex),
+                'url': task['url'],
+                'instance_id': task.get('instance_id'),
+                'priority': task.get('priority') or 0,
+                'deadline': deadline.timestamp() if isinstance(deadline, datetime) else deadline,
+                'max_attempts': max(1, task.get('max_attempts') or Config.TASK_MAX_ATTEMPTS),
+                'retry_delay': max(0.0, task.get('retry_delay') if task.get('retry_delay') is not None
+                                   else Config.TASK_RETRY_DELAY)
+            })
+        task_ids = self.store.add(specs)
+        logger.info(f"Queued {len(task_ids)} visit tasks")
+        self._notify()
+        return task_ids
+
+    def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get a task's status."""
+        return self.store.get(task_id)
+
+    def list_tasks(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """List tasks, most recently submitted first."""
+        return self.store.list(status, limit)
+
+    def cancel(self, task_id: str) -> bool:
+        """Cancel a task that has not started."""
+        return self.store.cancel(task_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue depth and throughput.
+
+        Depth and throughput cover every process sharing the store; running
+        and outcomes are this process's own.
+
+        Returns:
+            Dict[str, Any]: Queue statistics
+        """
+        counts = self.store.counts()
+        recent = self.store.finished_since(time.time() - self.THROUGHPUT_WINDOW)
+        return {
+            'depth': counts.get('queued', 0),
+            'ready': self.store.ready_count(),
+            'by_status': counts,
+            'running': len(self._busy),
+            'throughput_window': self.THROUGHPUT_WINDOW,
+            'finished_per_second': round(recent['finished'] / self.THROUGHPUT_WINDOW, 3),
+            'succeeded_per_second': round(recent['succeeded'] / self.THROUGHPUT_WINDOW, 3),
+            'mean_elapsed': recent['mean_elapsed'],
+            'outcomes': dict(self.outcomes),
+            'started_at': datetime.fromtimestamp(self.started_at).isoformat() if self.started_at else None
+        }
+
+    def _notify(self) -> None:
+        """Wake the dispatcher from any thread."""
+        if self._loop and self._wake:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def _dispatch(self) -> None:
+        """Hand ready tasks to idle instances until cancelled."""
+        loop = asyncio.get_running_loop()
+        last_sweep = 0.0
+        while True:
+            try:
+                if time.monotonic() - last_sweep >= self.SWEEP_INTERVAL:
+                    await loop.run_in_executor(None, self._sweep)
+                    last_sweep = time.monotonic()
+                for instance_id, task in await loop.run_in_executor(None, self._claim_ready):
+                    self._busy[instance_id] = loop.create_task(self._run(instance_id, task))
+            except Exception as e:
+                logger.error(f"Task dispatch failed: {str(e)}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), Config.TASK_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def _claim_ready(self) -> List[tuple]:
+        """Claim one task for each idle instance, up to TASK_QUEUE_CONCURRENCY in flight."""
+        manager = self.browser_manager
+        with manager._lock:
+            running = [i for i in manager.chrome_processes if i not in self._busy]
+            hibernated = [i for i in manager.hibernated if i not in self._busy]
+        slots = (Config.TASK_QUEUE_CONCURRENCY - len(self._busy)
+                 if Config.TASK_QUEUE_CONCURRENCY > 0 else len(running) + len(hibernated))
+        claimed = []
+        for instance_id in running:
+            if len(claimed) >= slots:
+                return claimed
+            task = self.store.claim(instance_id, self.worker_id)
+            if task:
+                claimed.append((instance_id, task))
+
+        # Hibernated instances only wake up for tasks aimed at them
+        if hibernated and len(claimed) < slots:
+            pinned = set(self.store.pinned_instances())
+            for instance_id in hibernated:
+                if len(claimed) >= slots:
+                    break
+                if instance_id in pinned:
+                    task = self.store.claim(instance_id, self.worker_id, pinned_only=True)
+                    if task:
+                        claimed.append((instance_id, task))
+        return claimed
+
+    async def _run(self, instance_id: str, task: Dict[str, Any]) -> None:
+        """Run one claimed task and record its outcome."""
+        loop = asyncio.get_running_loop()
+        timeout = Config.TASK_VISIT_TIMEOUT
+        if task['deadline'] is not None:
+            timeout = max(0.1, min(timeout, task['deadline'] - time.time()))
+        started = time.monotonic()
+        try:
+            success = await asyncio.wait_for(
+                self.browser_manager.visit_url(instance_id, task['url']), timeout
+            )
+            error = None if success else f"Visit with instance {instance_id} failed"
+        except asyncio.TimeoutError:
+            success, error = False, f"Timed out after {timeout:.0f}s"
+        except Exception as e:
+            success, error = False, str(e)
+        try:
+            status = await loop.run_in_executor(
+                None, self.store.finish, task, success, time.monotonic() - started, error
+            )
+            self.outcomes['retried' if status == 'queued' else status] += 1
+            if status != 'succeeded':
+                logger.warning(f"Task {task['task_id']} attempt {task['attempts']} {status}: {error}")
+        except Exception as e:
+            logger.error(f"Failed to record outcome of task {task['task_id']}: {str(e)}")
+        finally:
+            self._busy.pop(instance_id, None)
+            self._wake.set()
+
+    def _sweep(self) -> None:
+        """Expire overdue tasks, fail tasks for deleted instances and purge old history."""
+        expired = self.store.expire()
+        if expired:
+            self.outcomes['expired'] += expired
+            logger.info(f"Expired {expired} queued tasks past their deadline")
+
+        manager = self.browser_manager
+        with manager._lock:
+            known = set(manager.chrome_processes) | set(manager._launching) | set(manager.hibernated)
+        known.update(manager.launch_jobs.pending_instance_ids())
+        vanished = [
+            instance_id for instance_id in self.store.pinned_instances()
+            if sharding.owns_instance(instance_id) and instance_id not in known
+        ]
+        if vanished:
+            failed = self.store.fail_pinned(vanished, "Instance no longer exists")
+            self.outcomes['failed'] += failed
+            logger.warning(f"Failed {failed} tasks for deleted instances {vanished}")
+
+        if Config.TASK_RETENTION > 0:
+            self.store.purge(time.time() - Config.TASK_RETENTION)
@@ -1,7 +1,7 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -19,6 +19,7 @@ async def lifespan(app: FastAPI):
     在应用启动时初始化浏览器管理器，在应用关闭时清理资源
     """
     browser_manager = get_browser_manager()
+    browser_manager.start_background_tasks()
     try:
         yield
     finally:
@@ -90,17 +91,17 @@ async def health_check():
 # 全局错误处理
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
-    return {
-        "detail": "Not Found",
+    return JSONResponse(status_code=404, content={
+        "detail": getattr(exc, "detail", "Not Found"),
         "path": request.url.path
-    }
+    })
 
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
-    return {
+    return JSONResponse(status_code=500, content={
         "detail": "Internal Server Error",
         "message": str(exc)
-    }
+    })
 
 # 预检请求处理
 @app.options("/{path:path}")
@@ -3,15 +3,35 @@
 # Import models
 from .browser import (
     BrowserResponse,     # 改为新的类名
+    ResourcePolicy,
     CreateInstanceRequest,
     VisitUrlRequest,
-    SystemStats
+    BatchVisitRequest,
+    ZoomRequest,
+    LaunchProfileResponse,
+    LaunchJobItem,
+    LaunchJobResponse,
+    SystemStats,
+    MetricsPoint,
+    SystemHistoryResponse
 )
+from .tasks import VisitTaskRequest, VisitTaskBatchRequest, TaskResponse
 
 # Export models
 __all__ = [
     'BrowserResponse',   # 改为新的类名
+    'ResourcePolicy',
     'CreateInstanceRequest',
     'VisitUrlRequest',
-    'SystemStats'
+    'BatchVisitRequest',
+    'ZoomRequest',
+    'LaunchProfileResponse',
+    'LaunchJobItem',
+    'LaunchJobResponse',
+    'SystemStats',
+    'MetricsPoint',
+    'SystemHistoryResponse',
+    'VisitTaskRequest',
+    'VisitTaskBatchRequest',
+    'TaskResponse'
 ]
@@ -1,22 +1,93 @@
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, field_validator
 from typing import Dict, Any, Optional, List
 
+from app.config import Config
+
+class ResourcePolicy(BaseModel):
+    """Resources an instance does not load"""
+    preset: Optional[str] = None  # trackers, media or dom
+    block_types: List[str] = []  # DevTools resource types, e.g. Image, Font, Media, Stylesheet
+    block_patterns: List[str] = []  # URL wildcard patterns, e.g. *://*.doubleclick.net/*
+    allow_patterns: List[str] = []  # URL wildcard patterns exempt from blocking
+
 class CreateInstanceRequest(BaseModel):
     """Browser instance creation request"""
-    count: int = 1
+    count: int = Field(1, ge=1)
+    ephemeral: bool = False  # Keep the profile in RAM; it is deleted when the instance stops
+    persist: Optional[bool] = None  # Copy an ephemeral profile to disk on stop (default EPHEMERAL_PERSIST)
+    launch_profile: Optional[str] = None  # Launch profile name (default DEFAULT_LAUNCH_PROFILE)
+    resource_policy: Optional[ResourcePolicy] = None  # Resources the instance never loads (default RESOURCE_POLICY_PRESET)
+
+    @field_validator('count')
+    @classmethod
+    def check_count(cls, count: int) -> int:
+        # Read at validation time so LAUNCH_MAX_COUNT from the environment applies
+        if count > Config.LAUNCH_MAX_COUNT:
+            raise ValueError(f"count must be at most {Config.LAUNCH_MAX_COUNT}")
+        return count
 
 class VisitUrlRequest(BaseModel):
     """URL visit request"""
     url: HttpUrl
+    resource_policy: Optional[ResourcePolicy] = None  # Replaces the instance's policy for this visit
+    wait_until: Optional[str] = None  # domcontentloaded, load, networkidle or selector (default DEFAULT_WAIT_UNTIL)
+    selector: Optional[str] = None  # CSS selector the selector condition waits for
+    timeout: Optional[float] = Field(None, gt=0)  # Seconds the page may take to reach the condition
+    humanize: Optional[bool] = None  # Human-like pauses, mouse movement and scrolling (default HUMANIZE_VISITS)
+
+class BatchVisitRequest(BaseModel):
+    """Batch URL visit request"""
+    instance_ids: List[str]
+    url: HttpUrl
+    max_parallel: Optional[int] = Field(None, ge=1)
+    timeout: Optional[float] = Field(None, gt=0)
+    resource_policy: Optional[ResourcePolicy] = None
+    wait_until: Optional[str] = None
+    selector: Optional[str] = None
+    humanize: Optional[bool] = None
+
+class ZoomRequest(BaseModel):
+    """Window zoom request"""
+    zoom_level: float = Field(..., ge=25, le=200)
 
 class BrowserResponse(BaseModel):
     """Browser instance information response"""
     id: str
     status: str
     current_url: Optional[str] = None
+    title: Optional[str] = None
+    window_state: Optional[Dict[str, Any]] = None
     fingerprint: Dict[str, Any]
     performance: Dict[str, Any]
     launch_time: str
+    ephemeral: bool = False
+    launch_profile: Optional[str] = None
+
+class LaunchProfileResponse(BaseModel):
+    """Launch profile description"""
+    name: str
+    description: str
+    headless: bool
+    default: bool
+    arguments: List[str]
+
+class LaunchJobItem(BaseModel):
+    """Progress of a single instance within a launch job"""
+    instance_id: str
+    status: str
+    error: Optional[str] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    duration: Optional[float] = None
+    retry_after: Optional[float] = None
+
+class LaunchJobResponse(BaseModel):
+    """Background instance creation job"""
+    job_id: str
+    status: str
+    created_at: str
+    finished_at: Optional[str] = None
+    instances: List[LaunchJobItem]
 
 class SystemStats(BaseModel):
     """System statistics"""
@@ -26,10 +97,31 @@ class SystemStats(BaseModel):
     memory_usage: float
     disk_usage: float
 
+class MetricsPoint(BaseModel):
+    """Downsampled system metrics point"""
+    timestamp: float
+    cpu_usage: Optional[float] = None
+    memory_usage: Optional[float] = None
+    disk_usage: Optional[float] = None
+    net_sent_rate: Optional[float] = None
+    net_recv_rate: Optional[float] = None
+
+class SystemHistoryResponse(BaseModel):
+    """System metrics history"""
+    interval: float
+    window: float
+    points: List[MetricsPoint]
+
 # 导出所有模型
 __all__ = [
     'CreateInstanceRequest',
     'VisitUrlRequest',
+    'BatchVisitRequest',
+    'ZoomRequest',
     'BrowserResponse',
-    'SystemStats'
+    'LaunchJobItem',
+    'LaunchJobResponse',
+    'SystemStats',
+    'MetricsPoint',
+    'SystemHistoryResponse'
 ]
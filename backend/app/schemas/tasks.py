@@ -0,0 +1,35 @@
+from pydantic import BaseModel, Field, HttpUrl
+from typing import Optional, List
+from datetime import datetime
+
+class VisitTaskRequest(BaseModel):
+    """Queued URL visit task"""
+    url: HttpUrl
+    instance_id: Optional[str] = None  # Instance that must run the task (None = any idle instance)
+    priority: int = 0  # Higher priorities run first
+    deadline: Optional[datetime] = None  # The task expires if it has not succeeded by then
+    max_attempts: Optional[int] = Field(None, ge=1)  # Defaults to TASK_MAX_ATTEMPTS
+    retry_delay: Optional[float] = Field(None, ge=0)  # Seconds before the first retry (default TASK_RETRY_DELAY)
+
+class VisitTaskBatchRequest(BaseModel):
+    """Batch of queued URL visit tasks"""
+    tasks: List[VisitTaskRequest] = Field(..., min_length=1)
+
+class TaskResponse(BaseModel):
+    """Visit task status"""
+    task_id: str
+    url: str
+    instance_id: Optional[str] = None
+    priority: int
+    deadline: Optional[str] = None
+    max_attempts: int
+    retry_delay: float
+    attempts: int
+    status: str
+    not_before: Optional[str] = None
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    assigned_instance: Optional[str] = None
+    elapsed: Optional[float] = None
+    error: Optional[str] = None
@@ -0,0 +1,669 @@
+# File: backend/app/shard_router.py
+"""
+Routing layer for sharded and cluster mode.
+
+Forwards every API call to the shard process or cluster agent that owns the
+instance it targets and merges the results of cluster-wide calls. New
+instances are placed on the least-loaded shards according to the capacity
+they report. Requests that do not target an instance go to shard 0 unless a
+`shard` query parameter names another one.
+"""
+
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, RedirectResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+import asyncio
+import json
+import time
+import httpx
+import websockets
+from loguru import logger
+
+from .config import Config
+from .core import placement, sharding
+from .schemas.browser import CreateInstanceRequest
+
+Config.initialize()
+
+API = "/api/v1"
+
+# Hop-by-hop headers that must not be forwarded
+HOP_HEADERS = {
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization', 'te',
+    'trailers', 'transfer-encoding', 'upgrade', 'host', 'content-length'
+}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """创建与各分片通信的连接池"""
+    app.state.client = httpx.AsyncClient(
+        timeout=httpx.Timeout(Config.SHARD_REQUEST_TIMEOUT, connect=5),
+        limits=httpx.Limits(max_connections=None, max_keepalive_connections=100)
+    )
+    app.state.shards = sharding.shard_urls()
+    app.state.capacity = {}
+    app.state.capacity_at = 0.0
+    app.state.capacity_lock = asyncio.Lock()
+    logger.info(f"Routing across {len(app.state.shards)} shards: {app.state.shards}")
+    try:
+        yield
+    finally:
+        await app.state.client.aclose()
+
+app = FastAPI(
+    title="Lei Browser API",
+    description="Browser automation and management API (sharded)",
+    version="1.0.0",
+    lifespan=lifespan
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=[
+        "http://localhost:3000",
+        "http://localhost:3001",
+        "http://127.0.0.1:3000",
+        "http://127.0.0.1:3001",
+    ],
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
+    allow_headers=["*"],
+    expose_headers=["*"],
+    max_age=3600,
+)
+
+@app.middleware("http")
+async def report_unavailable_shards(request: Request, call_next):
+    """在合并结果缺少部分分片时，通过 X-Unavailable-Shards 响应头列出这些分片"""
+    response = await call_next(request)
+    unavailable = _unavailable(request)
+    if unavailable:
+        response.headers['X-Unavailable-Shards'] = ','.join(str(shard) for shard in unavailable)
+    return response
+
+def _forward_headers(headers) -> Dict[str, str]:
+    return {k: v for k, v in headers.items() if k.lower() not in HOP_HEADERS}
+
+async def _call(request: Request, shard: int, method: str, path: str,
+                json: Any = None, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+    """Send one buffered request to a shard."""
+    try:
+        return await request.app.state.client.request(
+            method, request.app.state.shards[shard] + path,
+            json=json,
+            params=params if params is not None else request.query_params
+        )
+    except httpx.HTTPError as e:
+        logger.error(f"Shard {shard} unavailable: {str(e)}")
+        raise HTTPException(status_code=502, detail=f"Shard {shard} unavailable: {str(e)}")
+
+async def _fan_out(request: Request, method: str, path: str, json: Any = None) -> List[Any]:
+    """
+    Send the same request to every shard and return the JSON bodies of those that answered.
+
+    Shards that are unreachable or fail with a server error are left out of
+    the merge, as placement leaves out a dead agent, and recorded in
+    request.state.unavailable_shards for the response to report.
+
+    Returns:
+        List[Any]: Bodies of the shards that answered, or a Response if a
+        shard rejected the request or none answered
+    """
+    shards = range(len(request.app.state.shards))
+    responses = await asyncio.gather(*(
+        _call(request, shard, method, path, json=json) for shard in shards
+    ), return_exceptions=True)
+    results, unavailable = [], []
+    for shard, response in zip(shards, responses):
+        if isinstance(response, HTTPException):
+            unavailable.append(shard)
+        elif isinstance(response, BaseException):
+            raise response
+        elif response.status_code >= 500:
+            logger.error(f"Shard {shard} failed {method} {path} with {response.status_code}")
+            unavailable.append(shard)
+        elif response.status_code >= 400:
+            return _relay(response)
+        else:
+            results.append(response.json())
+    request.state.unavailable_shards = unavailable
+    if not results:
+        failed = next((r for r in responses if isinstance(r, httpx.Response)), None)
+        if failed is not None:
+            return _relay(failed)
+        return JSONResponse(status_code=502, content={"detail": "No shard is reachable"})
+    return results
+
+def _unavailable(request: Request) -> List[int]:
+    """Shards the request's fan-out left out."""
+    return getattr(request.state, 'unavailable_shards', [])
+
+def _relay(response: httpx.Response) -> Response:
+    return Response(
+        content=response.content,
+        status_code=response.status_code,
+        headers=_forward_headers(response.headers)
+    )
+
+def _owner(path: str, params) -> int:
+    """Pick the shard a request belongs to."""
+    if 'shard' in params:
+        if not params['shard'].isdigit():
+            raise HTTPException(status_code=400, detail="shard must be a shard index")
+        return int(params['shard']) % Config.SHARD_COUNT
+    parts = path[len(API):].strip('/').split('/')
+    if parts[:2] == ['browser', 'instances'] and len(parts) > 2 and parts[2].isdigit():
+        return sharding.shard_of(parts[2])
+    if parts[:2] == ['browser', 'jobs'] and len(parts) > 2:
+        return sharding.shard_of_job(parts[2]) or 0
+    if parts[0] == 'tasks' and len(parts) > 1:
+        return sharding.shard_of_job(parts[1]) or 0
+    if parts[0] == 'profiles':
+        if params.get('profile_id'):
+            return sharding.shard_of(params['profile_id'])
+        if len(parts) > 2 and parts[2] == 'snapshots' and parts[1] != 'snapshots':
+            return sharding.shard_of(parts[1])
+        if parts[1:2] == ['snapshots'] and len(parts) > 3 and parts[3] == 'restore':
+            # Snapshot ids start with the id of the profile they were taken from
+            return sharding.shard_of(parts[2].split('-', 1)[0])
+    return 0
+
+@app.get("/")
+async def root():
+    return RedirectResponse(url="/docs")
+
+@app.get("/health")
+async def health_check(request: Request):
+    """检查所有分片的健康状态"""
+    results = await asyncio.gather(*(
+        request.app.state.client.get(url + "/health") for url in request.app.state.shards
+    ), return_exceptions=True)
+    shards = [
+        {'shard': index, 'healthy': not isinstance(r, Exception) and r.status_code == 200}
+        for index, r in enumerate(results)
+    ]
+    return {
+        "status": "healthy" if all(s['healthy'] for s in shards) else "degraded",
+        "version": "1.0.0",
+        "shards": shards
+    }
+
+@app.get(f"{API}/browser/instances")
+async def list_instances(request: Request):
+    """合并所有分片的实例列表"""
+    results = await _fan_out(request, "GET", f"{API}/browser/instances")
+    if isinstance(results, Response):
+        return results
+    instances = [instance for shard in results for instance in shard]
+    return sorted(instances, key=lambda i: int(i['id']) if str(i['id']).isdigit() else 0)
+
+@app.get(f"{API}/browser/instances/metrics")
+async def list_instance_metrics(request: Request):
+    """合并所有分片的实例资源占用（按内存从高到低排序）"""
+    results = await _fan_out(request, "GET", f"{API}/browser/instances/metrics")
+    if isinstance(results, Response):
+        return results
+    return sorted((m for shard in results for m in shard), key=lambda m: m['rss_mb'], reverse=True)
+
+@app.get(f"{API}/browser/instances/resources")
+async def resource_stats(request: Request):
+    """合并所有分片的资源拦截计数"""
+    results = await _fan_out(request, "GET", f"{API}/browser/instances/resources")
+    if isinstance(results, Response):
+        return results
+    return {
+        'blocked': sum(r['blocked'] for r in results),
+        'allowed': sum(r['allowed'] for r in results),
+        'instances': [entry for r in results for entry in r['instances']],
+        'unavailable_shards': _unavailable(request)
+    }
+
+@app.get(f"{API}/browser/jobs")
+async def list_jobs(request: Request):
+    """合并所有分片的实例创建任务"""
+    results = await _fan_out(request, "GET", f"{API}/browser/jobs")
+    if isinstance(results, Response):
+        return results
+    return sorted((job for shard in results for job in shard),
+                  key=lambda job: job['created_at'], reverse=True)
+
+async def _capacities(request: Request, refresh: bool = False) -> Dict[int, Dict[str, Any]]:
+    """Capacity reports of the reachable shards, refreshed every CLUSTER_CAPACITY_TTL seconds."""
+    state = request.app.state
+    async with state.capacity_lock:
+        if refresh or time.monotonic() - state.capacity_at >= Config.CLUSTER_CAPACITY_TTL:
+            results = await asyncio.gather(*(
+                state.client.get(url + f"{API}/system/capacity", timeout=5)
+                for url in state.shards
+            ), return_exceptions=True)
+            state.capacity = {}
+            for shard, result in enumerate(results):
+                if isinstance(result, Exception) or result.status_code != 200:
+                    logger.warning(f"Shard {shard} did not report capacity: {result}")
+                    continue
+                state.capacity[shard] = result.json()
+            state.capacity_at = time.monotonic()
+        return state.capacity
+
+@app.get(f"{API}/cluster/agents")
+async def list_agents(request: Request):
+    """获取各分片（集群节点）的地址与最新容量报告"""
+    capacities = await _capacities(request, refresh=True)
+    return [
+        {'shard': shard, 'url': url, 'healthy': shard in capacities,
+         'capacity': capacities.get(shard)}
+        for shard, url in enumerate(request.app.state.shards)
+    ]
+
+@app.post(f"{API}/browser/instances")
+async def create_instances(launch: CreateInstanceRequest, request: Request):
+    """按各分片的内存余量、实例数与启动队列分配新实例；跨多个分片时返回组合任务"""
+    # Validated here as well: split across shards, each part would pass on its own
+    body = launch.model_dump(mode='json', exclude_unset=True)
+    count = launch.count
+    capacities = await _capacities(request)
+    if not capacities:
+        raise HTTPException(status_code=503, detail="No shard is reachable",
+                            headers={"Retry-After": str(Config.ADMISSION_RETRY_AFTER)})
+    plan = placement.plan_placement(capacities, count)
+    placement.charge(capacities, plan)
+    logger.info(f"Placing instances {plan}")
+
+    async def submit(shard: int, count: int):
+        tried = [shard]
+        while True:
+            try:
+                response = await _call(request, shard, "POST", f"{API}/browser/instances",
+                                       json=dict(body, count=count))
+                if response.status_code < 400:
+                    return response
+            except HTTPException as e:
+                response = JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+            # The shard refused; try the next best one
+            candidates = placement.fallback_order(capacities, tried)
+            if not candidates:
+                return response
+            shard = candidates[0]
+            tried.append(shard)
+
+    responses = await asyncio.gather(*(submit(shard, n) for shard, n in plan.items()))
+    jobs = [r.json() for r in responses if isinstance(r, httpx.Response) and r.status_code < 400]
+    if not jobs:
+        failed = responses[0]
+        return _relay(failed) if isinstance(failed, httpx.Response) else failed
+    if len(jobs) < len(responses):
+        logger.warning(f"Only {len(jobs)} of {len(responses)} placements were accepted")
+    return JSONResponse(status_code=202, content=_merge_jobs(jobs))
+
+def _merge_jobs(jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine launch jobs running on several shards into one job."""
+    if len(jobs) == 1:
+        return jobs[0]
+    instances = [item for job in jobs for item in job['instances']]
+    statuses = [item['status'] for item in instances]
+    finished = all(job['finished_at'] for job in jobs)
+    if not finished:
+        status = 'running' if any(s != 'pending' for s in statuses) else 'pending'
+    elif all(s == 'running' for s in statuses):
+        status = 'completed'
+    elif all(s == 'failed' for s in statuses):
+        status = 'failed'
+    else:
+        status = 'partial'
+    return {
+        'job_id': '+'.join(job['job_id'] for job in jobs),
+        'status': status,
+        'created_at': min(job['created_at'] for job in jobs),
+        'finished_at': max(job['finished_at'] for job in jobs) if finished else None,
+        'instances': instances
+    }
+
+async def _get_job(request: Request, job_id: str):
+    """Fetch a possibly combined job from the shards running its parts."""
+    parts = job_id.split('+')
+    responses = await asyncio.gather(*(
+        _call(request, sharding.shard_of_job(part) or 0, "GET", f"{API}/browser/jobs/{part}")
+        for part in parts
+    ))
+    for response in responses:
+        if response.status_code >= 400:
+            return _relay(response)
+    return _merge_jobs([response.json() for response in responses])
+
+@app.get(f"{API}/browser/jobs/{{job_id}}")
+async def get_job(job_id: str, request: Request):
+    """获取实例创建任务的进度（组合任务合并各分片的进度）"""
+    return await _get_job(request, job_id)
+
+@app.get(f"{API}/browser/jobs/{{job_id}}/events")
+async def stream_job(job_id: str, request: Request):
+    """以 Server-Sent Events 推送实例创建任务的进度"""
+    if '+' not in job_id:
+        return await proxy(f"{API.lstrip('/')}/browser/jobs/{job_id}/events", request)
+    job = await _get_job(request, job_id)
+    if isinstance(job, Response):
+        return job
+
+    async def events():
+        last = None
+        while True:
+            current = await _get_job(request, job_id)
+            if isinstance(current, Response):
+                return
+            if current != last:
+                last = current
+                yield f"data: {json.dumps(current)}\n\n"
+            if current['finished_at']:
+                return
+            await asyncio.sleep(0.25)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+@app.post(f"{API}/browser/instances/batch/visit")
+async def batch_visit(request: Request):
+    """按分片拆分批量访问请求并按原顺序合并结果"""
+    body = await request.json()
+    return await _split_batch(request, "POST", f"{API}/browser/instances/batch/visit",
+                              body.get('instance_ids') or [],
+                              lambda ids: dict(body, instance_ids=ids))
+
+@app.delete(f"{API}/browser/instances/batch")
+async def batch_delete(request: Request):
+    """按分片拆分批量删除请求并按原顺序合并结果"""
+    instance_ids = await request.json()
+    return await _split_batch(request, "DELETE", f"{API}/browser/instances/batch",
+                              instance_ids or [], lambda ids: ids)
+
+async def _split_batch(request: Request, method: str, path: str,
+                       instance_ids: List[str], make_body) -> Any:
+    """
+    Send each shard the part of a batch it owns and merge results in request order.
+
+    Instances on a shard that is unreachable or fails with a server error get
+    a failed result of their own, so the other shards' results still return.
+    """
+    if not instance_ids:
+        raise HTTPException(status_code=400, detail="No instance IDs provided")
+    groups: Dict[int, List[str]] = {}
+    for instance_id in instance_ids:
+        groups.setdefault(sharding.shard_of(instance_id), []).append(instance_id)
+    shards = list(groups)
+    responses = await asyncio.gather(*(
+        _call(request, shard, method, path, json=make_body(groups[shard])) for shard in shards
+    ), return_exceptions=True)
+    by_id, unavailable = {}, []
+    for shard, response in zip(shards, responses):
+        if isinstance(response, HTTPException):
+            error = response.detail
+        elif isinstance(response, BaseException):
+            raise response
+        elif response.status_code >= 500:
+            logger.error(f"Shard {shard} failed {method} {path} with {response.status_code}")
+            error = f"Shard {shard} failed with status {response.status_code}"
+        elif response.status_code >= 400:
+            return _relay(response)
+        else:
+            for result in response.json():
+                by_id[result['instance_id']] = result
+            continue
+        unavailable.append(shard)
+        for instance_id in groups[shard]:
+            by_id[instance_id] = {'instance_id': instance_id, 'success': False, 'error': error}
+    request.state.unavailable_shards = unavailable
+    return [by_id[instance_id] for instance_id in instance_ids if instance_id in by_id]
+
+async def _task_shards(request: Request, tasks: List[Dict[str, Any]]) -> List[int]:
+    """
+    Pick the shard for each task: its target instance's owner, else shard 0.
+
+    Local shards share one task store, so any shard can queue a task. Cluster
+    agents each have their own, so unpinned tasks are spread over the agents
+    in proportion to their instance counts.
+    """
+    weighted: List[int] = [0]
+    if Config.CLUSTER_AGENTS and any(not task.get('instance_id') for task in tasks):
+        capacities = await _capacities(request)
+        weighted = [
+            shard for shard, report in sorted(capacities.items())
+            for _ in range(max(1, report['instances']))
+        ] or [0]
+    shards, spread = [], 0
+    for task in tasks:
+        if task.get('instance_id'):
+            shards.append(sharding.shard_of(task['instance_id']))
+        else:
+            shards.append(weighted[spread % len(weighted)])
+            spread += 1
+    return shards
+
+@app.post(f"{API}/tasks")
+async def submit_task(request: Request):
+    """提交访问任务到目标实例所属的分片"""
+    body = await request.json()
+    shard = (await _task_shards(request, [body]))[0]
+    return _relay(await _call(request, shard, "POST", f"{API}/tasks", json=body))
+
+@app.post(f"{API}/tasks/batch")
+async def submit_tasks(request: Request):
+    """按分片拆分批量任务并按原顺序合并任务ID"""
+    body = await request.json()
+    tasks = body.get('tasks') or []
+    if not tasks:
+        raise HTTPException(status_code=400, detail="No tasks provided")
+    groups: Dict[int, List[int]] = {}
+    for index, shard in enumerate(await _task_shards(request, tasks)):
+        groups.setdefault(shard, []).append(index)
+    shards = list(groups)
+    responses = await asyncio.gather(*(
+        _call(request, shard, "POST", f"{API}/tasks/batch",
+              json=dict(body, tasks=[tasks[i] for i in groups[shard]]))
+        for shard in shards
+    ))
+    task_ids: List[Optional[str]] = [None] * len(tasks)
+    for shard, response in zip(shards, responses):
+        if response.status_code >= 400:
+            return _relay(response)
+        for index, task_id in zip(groups[shard], response.json()['task_ids']):
+            task_ids[index] = task_id
+    return JSONResponse(status_code=202, content={"count": len(task_ids), "task_ids": task_ids})
+
+@app.get(f"{API}/tasks")
+async def list_tasks(request: Request):
+    """合并各集群节点的任务列表（本机分片共享同一任务库，直接转发）"""
+    if not Config.CLUSTER_AGENTS:
+        return await proxy(f"{API.lstrip('/')}/tasks", request)
+    results = await _fan_out(request, "GET", f"{API}/tasks")
+    if isinstance(results, Response):
+        return results
+    limit = int(request.query_params.get('limit', 100))
+    return sorted((t for shard in results for t in shard),
+                  key=lambda t: t['created_at'], reverse=True)[:limit]
+
+@app.get(f"{API}/tasks/stats")
+async def task_stats(request: Request):
+    """合并各集群节点的队列深度与吞吐量"""
+    if not Config.CLUSTER_AGENTS:
+        return await proxy(f"{API.lstrip('/')}/tasks/stats", request)
+    results = await _fan_out(request, "GET", f"{API}/tasks/stats")
+    if isinstance(results, Response):
+        return results
+    merged = {
+        key: round(sum(r[key] for r in results), 3)
+        for key in ('depth', 'ready', 'running', 'finished_per_second', 'succeeded_per_second')
+    }
+    by_status: Dict[str, int] = {}
+    for r in results:
+        for status, count in r['by_status'].items():
+            by_status[status] = by_status.get(status, 0) + count
+    merged['by_status'] = by_status
+    merged['throughput_window'] = results[0]['throughput_window']
+    merged['shards'] = results
+    merged['unavailable_shards'] = _unavailable(request)
+    return merged
+
+@app.get(f"{API}/system/stats")
+async def system_stats(request: Request):
+    """合并所有分片的实例数量；主机指标取各分片的平均值"""
+    results = await _fan_out(request, "GET", f"{API}/system/stats")
+    if isinstance(results, Response):
+        return results
+    return dict(_merge_stats(results), unavailable_shards=_unavailable(request))
+
+@app.get(f"{API}/system/cache")
+async def cache_stats(request: Request):
+    """合并所有分片的缓存代理计数；本机分片共用一个缓存目录，存储占用只计一次"""
+    results = await _fan_out(request, "GET", f"{API}/system/cache")
+    if isinstance(results, Response):
+        return results
+    merged = {
+        key: sum(r[key] for r in results)
+        for key in (
+            'requests', 'hits', 'revalidated', 'misses', 'coalesced', 'bypassed', 'tunnels',
+            'errors', 'bytes_saved', 'bytes_from_origin', 'evictions'
+        )
+    }
+    store_shards = results if Config.CLUSTER_AGENTS else results[:1]
+    for key in ('entries', 'stored_bytes', 'max_bytes'):
+        merged[key] = sum(r[key] for r in store_shards)
+    hits, misses = merged['hits'], merged['misses']
+    saved, fetched = merged['bytes_saved'], merged['bytes_from_origin']
+    merged['enabled'] = any(r['enabled'] for r in results)
+    merged['hit_ratio'] = round(hits / (hits + misses), 3) if hits + misses else None
+    merged['byte_hit_ratio'] = round(saved / (saved + fetched), 3) if saved + fetched else None
+    merged['shards'] = results
+    merged['unavailable_shards'] = _unavailable(request)
+    return merged
+
+@app.get(f"{API}/system/event-loop")
+async def event_loop_stats(request: Request):
+    """合并所有分片的事件循环阻塞情况：阻塞时间与卡顿次数求和，延迟取各分片最大值"""
+    results = await _fan_out(request, "GET", f"{API}/system/event-loop")
+    if isinstance(results, Response):
+        return results
+    merged = {key: sum(r[key] for r in results) for key in ('probes', 'stalls')}
+    merged['blocked_seconds'] = round(sum(r['blocked_seconds'] for r in results), 4)
+    for key in ('max_lag_ms', 'lag_p50_ms', 'lag_p95_ms', 'lag_p99_ms'):
+        values = [r[key] for r in results if r[key] is not None]
+        merged[key] = max(values) if values else None
+    merged['shards'] = results
+    merged['unavailable_shards'] = _unavailable(request)
+    return merged
+
+def _merge_stats(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    merged = {
+        key: round(sum(r[key] for r in results) / len(results), 1)
+        for key in ('cpu_usage', 'memory_usage', 'disk_usage')
+    }
+    merged['total_instances'] = sum(r['total_instances'] for r in results)
+    merged['running_instances'] = sum(r['running_instances'] for r in results)
+    return merged
+
+@app.websocket(f"{API}/events/ws")
+async def event_stream(websocket: WebSocket):
+    """
+    合并所有分片的事件流
+
+    先发送合并后的快照，再转发各分片的事件（重新编号并附带 shard 字段）；
+    metrics 事件中的系统指标替换为合并后的变化值。任一分片重新同步或断开时
+    以 4000 关闭连接，客户端重连即可获得新的快照。
+    """
+    await websocket.accept()
+    shards = websocket.app.state.shards
+    upstreams = []
+    pumps: List[asyncio.Task] = []
+    receiver = asyncio.create_task(websocket.receive_text())
+    try:
+        try:
+            for url in shards:
+                upstreams.append(await websockets.connect(
+                    "ws" + url[len("http"):] + f"{API}/events/ws", max_size=None
+                ))
+            snapshots = [json.loads(await upstream.recv()) for upstream in upstreams]
+        except (OSError, websockets.WebSocketException) as e:
+            logger.error(f"Shard event stream unavailable: {str(e)}")
+            await websocket.close(code=1011)
+            return
+
+        stats = {shard: snapshot['stats'] for shard, snapshot in enumerate(snapshots)}
+        merged_stats = _merge_stats(list(stats.values()))
+        seq = 0
+        await websocket.send_json({
+            'type': 'snapshot',
+            'seq': seq,
+            'instances': [
+                {**instance, 'shard': shard}
+                for shard, snapshot in enumerate(snapshots) for instance in snapshot['instances']
+            ],
+            'metrics': {k: v for snapshot in snapshots for k, v in snapshot['metrics'].items()},
+            'stats': merged_stats
+        })
+
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def pump(shard: int, upstream):
+            try:
+                async for message in upstream:
+                    await queue.put((shard, json.loads(message)))
+            except websockets.WebSocketException:
+                pass
+            await queue.put((shard, None))
+
+        pumps = [asyncio.create_task(pump(shard, upstream)) for shard, upstream in enumerate(upstreams)]
+        while True:
+            getter = asyncio.create_task(queue.get())
+            done, _ = await asyncio.wait({getter, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            if receiver in done:
+                getter.cancel()
+                receiver.result()
+                receiver = asyncio.create_task(websocket.receive_text())
+                continue
+            shard, event = getter.result()
+            if event is None or event['type'] == 'snapshot':
+                # 分片断开或重新同步后，合并视图无法再以增量方式维持
+                await websocket.close(code=4000)
+                return
+            seq += 1
+            event.update(seq=seq, shard=shard)
+            if event['type'] == 'metrics':
+                stats[shard].update(event['stats'])
+                combined = _merge_stats(list(stats.values()))
+                event['stats'] = {k: v for k, v in combined.items() if merged_stats.get(k) != v}
+                merged_stats = combined
+            await websocket.send_json(event)
+    except (WebSocketDisconnect, websockets.WebSocketException):
+        # 客户端断开时发送可能先于接收端发现
+        pass
+    finally:
+        receiver.cancel()
+        for task in pumps:
+            task.cancel()
+        for upstream in upstreams:
+            await upstream.close()
+
+@app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH"])
+async def proxy(path: str, request: Request):
+    """将其余请求以流式方式转发到所属分片"""
+    shard = _owner("/" + path, request.query_params)
+    params = [(k, v) for k, v in request.query_params.multi_items() if k != 'shard']
+    client: httpx.AsyncClient = request.app.state.client
+    upstream = client.build_request(
+        request.method,
+        request.app.state.shards[shard] + "/" + path,
+        params=params,
+        headers=_forward_headers(request.headers),
+        content=request.stream()
+    )
+    try:
+        response = await client.send(upstream, stream=True)
+    except httpx.HTTPError as e:
+        logger.error(f"Shard {shard} unavailable: {str(e)}")
+        return JSONResponse(status_code=502, content={"detail": f"Shard {shard} unavailable"})
+    return StreamingResponse(
+        response.aiter_raw(),
+        status_code=response.status_code,
+        headers=_forward_headers(response.headers),
+        background=BackgroundTask(response.aclose)
+    )
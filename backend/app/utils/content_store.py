@@ -0,0 +1,250 @@
+# File: backend/app/utils/content_store.py
+"""
+Content store module.
+Keeps HTTP responses cached by the caching proxy on disk: bodies as files,
+their metadata in SQLite (WAL mode), evicted least recently used first.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from loguru import logger
+
+from .profile_store import _Transaction
+
+class ContentStore:
+    """
+    Shared on-disk store of cached HTTP responses.
+
+    Entries are keyed by URL and, for responses with a Vary header, by the
+    request header values they vary on; the header names an URL varies on
+    are kept per URL. Bodies are written to a temporary file and renamed
+    into place, and every connection is per thread, so several threads and
+    processes can share one store. When the bodies exceed the size limit the
+    least recently used entries are evicted.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS variants (
+            url TEXT PRIMARY KEY,
+            vary TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            status INTEGER NOT NULL,
+            headers TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            stored_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            revalidate INTEGER NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            last_access REAL NOT NULL,
+            hits INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_entries_url ON entries(url);
+        CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access);
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        """
+        Initialize the store, creating its directory and database if needed.
+
+        Args:
+            root: Directory holding the database and bodies
+            max_bytes: Total body size above which entries are evicted
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.bodies = self.root / "bodies"
+        self.bodies.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._conn.executescript(self.SCHEMA)
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Get this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.root / "index.db"), timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _key(url: str, vary: List[str], request_headers: Dict[str, str]) -> str:
+        """Key of the variant of a URL selected by the request headers."""
+        selected = '\n'.join(f"{name}:{request_headers.get(name, '')}" for name in vary)
+        return hashlib.sha256(f"{url}\n{selected}".encode('utf-8')).hexdigest()
+
+    def _body_path(self, key: str) -> Path:
+        return self.bodies / key[:2] / key
+
+    def lookup(self, url: str, request_headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        Find the stored response for a request.
+
+        Args:
+            url: Absolute request URL
+            request_headers: Request headers with lower-case names
+
+        Returns:
+            Optional[Dict[str, Any]]: Entry metadata, or None if nothing matches
+        """
+        row = self._conn.execute('SELECT vary FROM variants WHERE url = ?', (url,)).fetchone()
+        if not row:
+            return None
+        key = self._key(url, json.loads(row['vary']), request_headers)
+        entry = self._conn.execute('SELECT * FROM entries WHERE key = ?', (key,)).fetchone()
+        if not entry:
+            return None
+        entry = dict(entry)
+        entry['headers'] = json.loads(entry['headers'])
+        return entry
+
+    def read_body(self, entry: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Read an entry's body and record the access.
+
+        Returns:
+            Optional[bytes]: Body, or None if the file has been evicted
+        """
+        try:
+            body = self._body_path(entry['key']).read_bytes()
+        except OSError:
+            self._conn.execute('DELETE FROM entries WHERE key = ?', (entry['key'],))
+            return None
+        self._conn.execute(
+            'UPDATE entries SET last_access = ?, hits = hits + 1 WHERE key = ?',
+            (time.time(), entry['key'])
+        )
+        return body
+
+    def put(self, url: str, request_headers: Dict[str, str], vary: List[str], status: int,
+            headers: List[Tuple[str, str]], body: bytes, stored_at: float, expires_at: float,
+            revalidate: bool) -> int:
+        """
+        Store a response, replacing variants that vary on other headers.
+
+        Args:
+            url: Absolute request URL
+            request_headers: Request headers with lower-case names
+            vary: Lower-case names of the headers the response varies on
+            status: Response status code
+            headers: End-to-end response headers
+            body: Response body as received, still content-encoded
+            stored_at: Time the response was generated, less its initial age
+            expires_at: Time the response stops being fresh
+            revalidate: Whether the response must be revalidated before every use
+
+        Returns:
+            int: Number of entries evicted to make room
+        """
+        key = self._key(url, vary, request_headers)
+        path = self._body_path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f"{key}.{uuid.uuid4().hex}.tmp")
+        tmp.write_bytes(body)
+        os.replace(tmp, path)
+
+        lookup = {name.lower(): value for name, value in headers}
+        now = time.time()
+        with _Transaction(self._conn) as conn:
+            row = conn.execute('SELECT vary FROM variants WHERE url = ?', (url,)).fetchone()
+            if row and json.loads(row['vary']) != vary:
+                stale = [r['key'] for r in conn.execute('SELECT key FROM entries WHERE url = ?', (url,))]
+                conn.execute('DELETE FROM entries WHERE url = ?', (url,))
+                for old in stale:
+                    if old != key:
+                        self._body_path(old).unlink(missing_ok=True)
+            conn.execute(
+                'INSERT OR REPLACE INTO variants (url, vary) VALUES (?, ?)', (url, json.dumps(vary))
+            )
+            conn.execute(
+                'INSERT OR REPLACE INTO entries (key, url, status, headers, size, stored_at, '
+                'expires_at, revalidate, etag, last_modified, last_access) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    key, url, status, json.dumps(headers), len(body), stored_at, expires_at,
+                    int(revalidate), lookup.get('etag'), lookup.get('last-modified'), now
+                )
+            )
+        return self.evict()
+
+    def refresh(self, entry: Dict[str, Any], headers: List[Tuple[str, str]], stored_at: float,
+                expires_at: float, revalidate: bool) -> None:
+        """
+        Update an entry's headers and freshness after a 304 Not Modified.
+
+        Args:
+            entry: Entry returned by lookup
+            headers: Merged response headers
+            stored_at: Time the validation response was generated, less its age
+            expires_at: Time the entry stops being fresh
+            revalidate: Whether the entry must be revalidated before every use
+        """
+        lookup = {name.lower(): value for name, value in headers}
+        self._conn.execute(
+            'UPDATE entries SET headers = ?, stored_at = ?, expires_at = ?, revalidate = ?, '
+            'etag = ?, last_modified = ? WHERE key = ?',
+            (
+                json.dumps(headers), stored_at, expires_at, int(revalidate),
+                lookup.get('etag'), lookup.get('last-modified'), entry['key']
+            )
+        )
+
+    def evict(self) -> int:
+        """
+        Evict least recently used entries until the bodies fit the size limit.
+
+        Returns:
+            int: Number of entries evicted
+        """
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return 0
+        evicted = 0
+        with _Transaction(self._conn) as conn:
+            for row in conn.execute('SELECT key, size FROM entries ORDER BY last_access').fetchall():
+                if total <= self.max_bytes:
+                    break
+                conn.execute('DELETE FROM entries WHERE key = ?', (row['key'],))
+                self._body_path(row['key']).unlink(missing_ok=True)
+                total -= row['size']
+                evicted += 1
+            conn.execute('DELETE FROM variants WHERE url NOT IN (SELECT url FROM entries)')
+        logger.info(f"Evicted {evicted} cached responses")
+        return evicted
+
+    def total_bytes(self) -> int:
+        """Total size of the stored bodies."""
+        return self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    def count(self) -> int:
+        """Number of stored responses."""
+        return self._conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def clear(self) -> None:
+        """Delete every stored response."""
+        with _Transaction(self._conn) as conn:
+            conn.execute('DELETE FROM entries')
+            conn.execute('DELETE FROM variants')
+        shutil.rmtree(self.bodies, ignore_errors=True)
+        self.bodies.mkdir(parents=True, exist_ok=True)
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
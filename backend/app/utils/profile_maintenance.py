@@ -0,0 +1,317 @@
+# File: backend/app/utils/profile_maintenance.py
+"""
+Profile maintenance module.
+Prunes regenerable caches, enforces disk quotas and reclaims deleted
+profiles in the background.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Set
+from pathlib import Path
+from datetime import datetime
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from loguru import logger
+
+from ..config import Config
+
+class ProfileMaintenance:
+    """
+    Background disk maintenance for profile directories.
+
+    Deleting a profile only renames it into a trash directory, which is
+    constant time; the files are removed later on the maintenance thread.
+    Each maintenance run also prunes caches Chrome can regenerate from
+    profiles that are not in use, and enforces the per-profile and total
+    disk quotas by evicting stopped profiles. Profiles in use or retained
+    for hibernated instances are never evicted, only reported.
+
+    The owner wires in which profiles are active, retained and owned by
+    this process, and how many processes share PROFILES_DIR.
+    """
+
+    TRASH_DIR = '_trash'
+
+    # Cache directories Chrome rebuilds on demand
+    CACHE_DIRS = (
+        'Default/Cache', 'Default/Code Cache', 'Default/GPUCache',
+        'GrShaderCache', 'ShaderCache', 'GraphiteDawnCache', 'Crashpad', 'Crash Reports'
+    )
+
+    # Warm pool profiles younger than this may belong to a launch in progress
+    ORPHAN_MIN_AGE = 600
+
+    def __init__(self, profile_manager):
+        """
+        Initialize maintenance.
+
+        Args:
+            profile_manager: ChromeProfileManager whose profiles are maintained
+        """
+        self.profile_manager = profile_manager
+        self.active_profiles: Callable[[], Set[str]] = set
+        self.retained_profiles: Callable[[], Set[str]] = set
+        self.owns_profile: Callable[[str], bool] = lambda name: True
+        self.processes_per_host: Callable[[], int] = lambda: 1
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._run_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self.last_run: Optional[Dict[str, Any]] = None
+        self.runs = 0
+        self.total_bytes_reclaimed = 0
+        self.total_seconds = 0.0
+
+    @property
+    def trash_dir(self) -> Path:
+        """Directory deleted profiles are moved into."""
+        return Path(Config.PROFILES_DIR) / self.TRASH_DIR
+
+    def trash(self, path: Path) -> bool:
+        """
+        Move a directory into the trash for asynchronous deletion.
+
+        Args:
+            path: Directory to delete
+
+        Returns:
+            bool: True if the directory was moved
+        """
+        path = Path(path)
+        if not path.exists():
+            return False
+        self.trash_dir.mkdir(parents=True, exist_ok=True)
+        target = self.trash_dir / f"{path.name}.{uuid.uuid4().hex[:8]}"
+        try:
+            path.rename(target)
+        except OSError as e:
+            # Not on the same filesystem as the trash; delete in place
+            logger.warning(f"Cannot move {path} to trash, deleting directly: {str(e)}")
+            shutil.rmtree(path, ignore_errors=True)
+            return True
+        self._wake.set()
+        return True
+
+    def start(self, interval: float) -> None:
+        """
+        Start the maintenance thread.
+
+        Args:
+            interval: Seconds between full maintenance runs
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, args=(interval,), name="profile-maintenance", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Profile maintenance started with interval {interval}s")
+
+    def stop(self) -> None:
+        """Stop the maintenance thread."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    def _loop(self, interval: float) -> None:
+        """Reclaim trash as soon as it fills and run full maintenance every interval."""
+        next_run = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                if time.monotonic() >= next_run:
+                    self.run()
+                    next_run = time.monotonic() + interval
+                else:
+                    self._account(self._empty_trash(), 0.0)
+            except Exception as e:
+                logger.error(f"Profile maintenance failed: {str(e)}")
+                next_run = time.monotonic() + interval
+            self._wake.wait(max(0.0, next_run - time.monotonic()))
+            self._wake.clear()
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run one full maintenance pass.
+
+        Returns:
+            Dict[str, Any]: Report of the run
+        """
+        with self._run_lock:
+            started = time.monotonic()
+            report = {
+                'started_at': datetime.now().isoformat(),
+                'profiles_scanned': 0,
+                'caches_pruned': 0,
+                'orphans_removed': 0,
+                'profiles_evicted': 0,
+                'over_quota': [],
+                'total_bytes': 0,
+                'bytes_reclaimed': 0,
+                'duration': None
+            }
+            active = self.active_profiles()
+            retained = self.retained_profiles()
+            protected = active | retained
+
+            sizes: Dict[str, int] = {}
+            for entry in self._profile_dirs():
+                report['profiles_scanned'] += 1
+                name = entry.name
+                if name not in active:
+                    if self._is_orphan(entry, retained):
+                        self.trash(entry)
+                        report['orphans_removed'] += 1
+                        continue
+                    if name.startswith('pool_'):
+                        # A recent warm pool profile may still be launching
+                        protected.add(name)
+                    report['caches_pruned'] += self._prune_caches(entry)
+                sizes[name] = self._dir_size(entry)
+
+            # Stopped profiles still over quota once their caches are pruned
+            # hold data Chrome cannot regenerate, so they are evicted
+            quota = Config.PROFILE_QUOTA_MB * 1024 * 1024
+            if quota > 0:
+                for name in [n for n, size in sizes.items() if size > quota]:
+                    if name in protected:
+                        report['over_quota'].append(name)
+                        continue
+                    logger.warning(
+                        f"Evicting profile {name} of {sizes[name]} bytes to meet the per-profile quota"
+                    )
+                    self._delete(name)
+                    sizes.pop(name)
+                    report['profiles_evicted'] += 1
+                report['over_quota'].sort()
+
+            # Each shard enforces its share of the total over the profiles it owns
+            total_quota = Config.PROFILES_TOTAL_QUOTA_MB * 1024 * 1024 / self.processes_per_host()
+            total = sum(sizes.values())
+            if total_quota > 0 and total > total_quota:
+                for name in self._eviction_order(sizes, protected):
+                    if total <= total_quota:
+                        break
+                    logger.warning(f"Evicting profile {name} to meet the total disk quota")
+                    self._delete(name)
+                    total -= sizes.pop(name)
+                    report['profiles_evicted'] += 1
+            report['total_bytes'] = total
+
+            report['bytes_reclaimed'] = self._empty_trash()
+            report['duration'] = round(time.monotonic() - started, 3)
+            self._account(report['bytes_reclaimed'], report['duration'])
+            self.runs += 1
+            self.last_run = report
+            logger.info(
+                f"Profile maintenance reclaimed {report['bytes_reclaimed']} bytes "
+                f"in {report['duration']}s"
+            )
+            return report
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the last report and cumulative totals."""
+        return {
+            'runs': self.runs,
+            'total_bytes_reclaimed': self.total_bytes_reclaimed,
+            'total_seconds': round(self.total_seconds, 3),
+            'last_run': self.last_run
+        }
+
+    def _account(self, reclaimed: int, seconds: float) -> None:
+        """Add to the cumulative totals."""
+        self.total_bytes_reclaimed += reclaimed
+        self.total_seconds += seconds
+
+    def _profile_dirs(self) -> List[Path]:
+        """List profile directories, skipping the trash and the template."""
+        root = Path(Config.PROFILES_DIR)
+        if not root.exists():
+            return []
+        return [
+            entry for entry in root.iterdir()
+            if entry.is_dir() and not entry.name.startswith(('_', '.'))
+            and self.owns_profile(entry.name)
+        ]
+
+    def _is_orphan(self, entry: Path, retained: Set[str]) -> bool:
+        """Whether a warm pool profile was left behind by an instance that has quit."""
+        if not entry.name.startswith('pool_') or entry.name in retained:
+            return False
+        return time.time() - entry.stat().st_mtime > self.ORPHAN_MIN_AGE
+
+    def _prune_caches(self, profile_dir: Path) -> int:
+        """Move a stopped profile's cache directories to the trash."""
+        pruned = 0
+        for relative in self.CACHE_DIRS:
+            cache = profile_dir / relative
+            if cache.is_dir() and self.trash(cache):
+                pruned += 1
+        return pruned
+
+    def _eviction_order(self, sizes: Dict[str, int], protected: Set[str]) -> List[str]:
+        """Stopped, unretained profiles ordered from least to most recently used."""
+        def last_used(name: str) -> str:
+            match = re.fullmatch(r'profile_(\d+)', name)
+            info = self.profile_manager.get_profile_info(match.group(1)) if match else None
+            if info and info.get('last_used'):
+                return info['last_used']
+            mtime = (Path(Config.PROFILES_DIR) / name).stat().st_mtime
+            return datetime.fromtimestamp(mtime).isoformat()
+
+        return sorted((n for n in sizes if n not in protected), key=last_used)
+
+    def _delete(self, name: str) -> None:
+        """Delete an evicted profile together with its stored state."""
+        match = re.fullmatch(r'profile_(\d+)', name)
+        if match:
+            self.profile_manager.delete_profile(match.group(1))
+        else:
+            self.trash(Path(Config.PROFILES_DIR) / name)
+
+    def _empty_trash(self) -> int:
+        """Delete everything in the trash and return the bytes freed."""
+        if not self.trash_dir.exists():
+            return 0
+        reclaimed = 0
+        for entry in list(self.trash_dir.iterdir()):
+            if self._stop.is_set():
+                break
+            # Other processes sharing PROFILES_DIR may empty the trash concurrently
+            try:
+                size = self._dir_size(entry) if entry.is_dir() else entry.stat().st_size
+                if entry.is_dir() and not entry.is_symlink():
+                    shutil.rmtree(entry, ignore_errors=True)
+                else:
+                    entry.unlink()
+            except FileNotFoundError:
+                continue
+            reclaimed += size
+        return reclaimed
+
+    @staticmethod
+    def _dir_size(path: Path) -> int:
+        """Total size in bytes of the files under a directory."""
+        total = 0
+        stack = [str(path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                total += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return total
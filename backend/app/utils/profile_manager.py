@@ -5,10 +5,15 @@ Handles browser profile saving, loading and management.
 
 import os
 import json
-import shutil
 from pathlib import Path
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
+
+from ..config import Config
+from .profile_store import ProfileStateStore
+from .profile_template import ProfileTemplate
+from .profile_maintenance import ProfileMaintenance
+from .profile_snapshot import ProfileSnapshotStore, SnapshotError
 
 class ChromeProfileManager:
    """
@@ -25,27 +30,37 @@ class ChromeProfileManager:
            self.profiles_dir = Path(self.profiles_dir)
        self.profiles_dir.mkdir(parents=True, exist_ok=True)
        self.state_file = self.profiles_dir / "profile_states.json"
+       self.store = ProfileStateStore(self.profiles_dir / "profile_states.db")
+       self.template = ProfileTemplate()
+       self.maintenance = ProfileMaintenance(self)
+       self.snapshots = ProfileSnapshotStore()
        self.load_states()
 
    def load_states(self):
-       """Load saved profile states."""
+       """Migrate states from the legacy JSON file into the state store."""
+       if not self.state_file.exists():
+           return
        try:
-           if self.state_file.exists():
-               with open(self.state_file, 'r', encoding='utf-8') as f:
-                   self.states = json.load(f)
-           else:
-               self.states = {}
+           with open(self.state_file, 'r', encoding='utf-8') as f:
+               states = json.load(f)
+           if self.store.count() == 0:
+               for state in states.values():
+                   state.setdefault('status', 'hibernated' if state.get('hibernated') else 'saved')
+               self.store.import_states(states)
+           self.state_file.rename(self.state_file.with_name(self.state_file.name + '.migrated'))
        except Exception as e:
-           print(f"Error loading profile states: {e}")
-           self.states = {}
+           print(f"Error migrating profile states: {e}")
 
-   def save_states(self):
-       """Save profile states to file."""
-       try:
-           with open(self.state_file, 'w', encoding='utf-8') as f:
-               json.dump(self.states, f, indent=2)
-       except Exception as e:
-           print(f"Error saving profile states: {e}")
+   @staticmethod
+   def _new_state() -> Dict[str, Any]:
+       """Initial state of a profile."""
+       return {
+           'created_at': datetime.now().isoformat(),
+           'last_used': None,
+           'url': None,
+           'status': 'created',
+           'settings': {}
+       }
 
    def get_profile_path(self, profile_id: str) -> Path:
        """
@@ -70,15 +85,11 @@ class ChromeProfileManager:
            Path: Path to created profile directory
        """
        profile_path = self.get_profile_path(profile_id)
+       if Config.PROFILE_TEMPLATE_ENABLED:
+           self.template.clone_into(profile_path)
        profile_path.mkdir(parents=True, exist_ok=True)
        
-       self.states[profile_id] = {
-           'created_at': datetime.now().isoformat(),
-           'last_used': None,
-           'url': None,
-           'settings': {}
-       }
-       self.save_states()
+       self.store.put(profile_id, self._new_state())
        
        return profile_path
 
@@ -93,13 +104,10 @@ class ChromeProfileManager:
            bool: True if profile was deleted successfully
        """
        try:
-           profile_path = self.get_profile_path(profile_id)
-           if profile_path.exists():
-               shutil.rmtree(profile_path)
+           # Moved aside now, removed from disk by the maintenance thread
+           self.maintenance.trash(self.get_profile_path(profile_id))
            
-           if profile_id in self.states:
-               del self.states[profile_id]
-               self.save_states()
+           self.store.delete(profile_id)
            
            return True
        except Exception as e:
@@ -118,20 +126,13 @@ class ChromeProfileManager:
            bool: True if profile was saved successfully
        """
        try:
-           if profile_id not in self.states:
-               self.states[profile_id] = {
-                   'created_at': datetime.now().isoformat(),
-                   'last_used': None,
-                   'url': None,
-                   'settings': {}
-               }
-           
-           self.states[profile_id].update({
-               'last_used': datetime.now().isoformat(),
-               'settings': profile_data or {}
-           })
-           
-           self.save_states()
+           self.store.update(
+               profile_id,
+               defaults=self._new_state(),
+               last_used=datetime.now().isoformat(),
+               status='saved',
+               settings=profile_data or {}
+           )
            return True
        except Exception as e:
            print(f"Error saving profile {profile_id}: {e}")
@@ -147,7 +148,59 @@ class ChromeProfileManager:
        Returns:
            Optional[Dict[str, Any]]: Profile information if exists
        """
-       return self.states.get(str(profile_id))
+       return self.store.get(str(profile_id))
+
+   def save_hibernation(self, profile_id: str, record: Dict[str, Any]) -> bool:
+       """
+       Record the state of an instance that is being hibernated.
+
+       The URL and zoom level are also stored as the profile's own settings,
+       so they are restored when the profile is loaded again.
+
+       Args:
+           profile_id: Profile identifier
+           record: URL, zoom level, window geometry and fingerprint to restore
+
+       Returns:
+           bool: True if the state was saved successfully
+       """
+       try:
+           self.store.update(
+               profile_id,
+               defaults=self._new_state(),
+               last_used=datetime.now().isoformat(),
+               url=record.get('url'),
+               zoom_level=record.get('zoom_level'),
+               status='hibernated',
+               hibernated=record
+           )
+           return True
+       except Exception as e:
+           print(f"Error saving hibernation state for {profile_id}: {e}")
+           return False
+
+   def clear_hibernation(self, profile_id: str) -> None:
+       """
+       Forget the hibernation record of a profile.
+
+       Args:
+           profile_id: Profile identifier
+       """
+       if self.store.get(profile_id) is not None:
+           self.store.update(profile_id, status='saved', hibernated=None)
+
+   def list_hibernated(self) -> Dict[str, Dict[str, Any]]:
+       """
+       Get the hibernation records of all hibernated profiles.
+
+       Returns:
+           Dict[str, Dict[str, Any]]: Hibernation records keyed by profile id
+       """
+       return {
+           profile_id: info['hibernated']
+           for profile_id, info in self.store.query(status='hibernated').items()
+           if info.get('hibernated')
+       }
 
    def list_profiles(self) -> Dict[str, Any]:
        """
@@ -156,7 +209,80 @@ class ChromeProfileManager:
        Returns:
            Dict[str, Any]: Dictionary of profile information
        """
-       return self.states
+       return self.store.all()
+
+   def list_profile_ids(self) -> list:
+       """
+       Get the ids of all profiles without loading their states.
+
+       Returns:
+           list: Profile identifiers
+       """
+       return self.store.ids()
+
+   def snapshot_profile(self, profile_id: str) -> Dict[str, Any]:
+       """
+       Snapshot a stopped profile into the deduplicated snapshot store.
+
+       Args:
+           profile_id: Profile identifier
+
+       Returns:
+           Dict[str, Any]: Manifest of the new snapshot
+
+       Raises:
+           SnapshotError: If the profile directory does not exist
+       """
+       return self.snapshots.create(
+           profile_id, self.get_profile_path(profile_id), self.store.get(profile_id)
+       )
+
+   def restore_snapshot(self, snapshot_id: str, profile_id: Optional[str] = None) -> Dict[str, Any]:
+       """
+       Replace a stopped profile's directory and state with a snapshot.
+
+       Args:
+           snapshot_id: Snapshot identifier
+           profile_id: Profile to restore into (defaults to the snapshot's own profile)
+
+       Returns:
+           Dict[str, Any]: Manifest of the restored snapshot
+
+       Raises:
+           SnapshotError: If the snapshot is unknown or incomplete
+       """
+       manifest = self.snapshots.get(snapshot_id)
+       if manifest is None:
+           raise SnapshotError(f"Snapshot {snapshot_id} not found")
+       profile_id = str(profile_id or manifest['profile_id'])
+       self.snapshots.restore(snapshot_id, self.get_profile_path(profile_id), self.maintenance.trash)
+
+       state = dict(manifest.get('state') or self._new_state())
+       state.pop('hibernated', None)
+       state['status'] = 'saved'
+       self.store.put(profile_id, state)
+       return manifest
+
+   def import_snapshot(self, fileobj, profile_id: Optional[str] = None,
+                       restore: bool = True) -> Dict[str, Any]:
+       """
+       Import a snapshot archive and optionally restore it into a profile.
+
+       Args:
+           fileobj: Readable binary stream of an exported snapshot archive
+           profile_id: Profile to restore into (defaults to the snapshot's own profile)
+           restore: Whether to restore the profile after importing
+
+       Returns:
+           Dict[str, Any]: Manifest of the imported snapshot
+
+       Raises:
+           SnapshotError: If the archive is invalid or references missing blobs
+       """
+       manifest = self.snapshots.import_stream(fileobj)
+       if restore:
+           self.restore_snapshot(manifest['snapshot_id'], profile_id)
+       return manifest
 
    def clean_unused_profiles(self, max_age_days: int = 30) -> int:
        """
@@ -168,13 +294,11 @@ class ChromeProfileManager:
        Returns:
            int: Number of profiles cleaned
        """
-       now = datetime.now()
+       cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
        cleaned_count = 0
        
-       for profile_id, info in list(self.states.items()):
-           last_used = datetime.fromisoformat(info['last_used']) if info['last_used'] else None
-           if last_used and (now - last_used).days > max_age_days:
-               if self.delete_profile(profile_id):
-                   cleaned_count += 1
+       for profile_id in self.store.query(last_used_before=cutoff):
+           if self.delete_profile(profile_id):
+               cleaned_count += 1
        
        return cleaned_count
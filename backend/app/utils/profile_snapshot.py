@@ -0,0 +1,515 @@
+# File: backend/app/utils/profile_snapshot.py
+"""
+Profile snapshot module.
+Stores profile snapshots as content-addressed blobs plus a manifest, and
+exports and imports them as streamed, compressed tar archives.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional
+from pathlib import Path
+from datetime import datetime
+import hashlib
+import json
+import os
+import queue
+import shutil
+import tarfile
+import threading
+import time
+import uuid
+from loguru import logger
+
+from ..config import Config
+from .profile_maintenance import ProfileMaintenance
+
+CHUNK_SIZE = 1024 * 1024
+
+class SnapshotError(Exception):
+    """Raised when a snapshot cannot be read, written or restored."""
+
+class ProfileSnapshotStore:
+    """
+    Deduplicated store of profile snapshots.
+
+    Every file is stored once under the SHA-256 of its content, and a
+    snapshot is a manifest mapping relative paths to those hashes. Files
+    whose size and modification time match the profile's previous snapshot
+    are not hashed again, so repeated snapshots only read and store what
+    changed. Archives list the manifest first and then only the blobs the
+    receiver is not known to have.
+    """
+
+    # Caches and runtime files that are not worth carrying between hosts
+    EXCLUDED = ProfileMaintenance.CACHE_DIRS + (
+        'SingletonLock', 'SingletonSocket', 'SingletonCookie',
+        'DevToolsActivePort', 'BrowserMetrics'
+    )
+
+    def __init__(self, name: str = '_snapshots'):
+        """
+        Initialize the store.
+
+        Args:
+            name: Directory name of the store under PROFILES_DIR
+        """
+        self.name = name
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        """Store directory."""
+        return Path(Config.PROFILES_DIR) / self.name
+
+    @property
+    def blob_dir(self) -> Path:
+        return self.root / 'blobs'
+
+    @property
+    def manifest_dir(self) -> Path:
+        return self.root / 'manifests'
+
+    def blob_path(self, digest: str) -> Path:
+        """Path of the blob with the given hash."""
+        return self.blob_dir / digest[:2] / digest
+
+    def has_blob(self, digest: str) -> bool:
+        return self.blob_path(digest).exists()
+
+    def create(self, profile_id: str, profile_dir: Path,
+               state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Snapshot a profile directory.
+
+        Args:
+            profile_id: Profile identifier
+            profile_dir: Directory to snapshot; must not be in use by Chrome
+            state: Stored profile state to carry along
+
+        Returns:
+            Dict[str, Any]: Manifest of the new snapshot
+        """
+        profile_dir = Path(profile_dir)
+        if not profile_dir.is_dir():
+            raise SnapshotError(f"Profile directory {profile_dir} does not exist")
+        # Blobs are only collected while no snapshot is being written
+        with self._lock:
+            started = time.monotonic()
+            previous = self.latest(profile_id)
+            known = {
+                entry['path']: entry for entry in (previous or {}).get('files', [])
+            }
+
+            files = []
+            new_blobs = new_bytes = 0
+            for path in self._walk(profile_dir):
+                relative = path.relative_to(profile_dir).as_posix()
+                stat = path.stat()
+                entry = {
+                    'path': relative,
+                    'size': stat.st_size,
+                    'mode': stat.st_mode & 0o777,
+                    'mtime_ns': stat.st_mtime_ns
+                }
+                old = known.get(relative)
+                if (old and old['size'] == entry['size'] and old['mtime_ns'] == entry['mtime_ns']
+                        and self.has_blob(old['sha256'])):
+                    entry['sha256'] = old['sha256']
+                else:
+                    entry['sha256'], stored = self._store_file(path)
+                    if stored:
+                        new_blobs += 1
+                        new_bytes += entry['size']
+                files.append(entry)
+
+            manifest = {
+                'snapshot_id': f"{profile_id}-{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6]}",
+                'profile_id': str(profile_id),
+                'created_at': datetime.now().isoformat(),
+                'parent': previous['snapshot_id'] if previous else None,
+                'state': state,
+                'files': files,
+                'total_bytes': sum(entry['size'] for entry in files),
+                'new_blobs': new_blobs,
+                'new_bytes': new_bytes,
+                'duration': round(time.monotonic() - started, 3)
+            }
+            self._save_manifest(manifest)
+        logger.info(
+            f"Snapshot {manifest['snapshot_id']}: {len(files)} files, "
+            f"{new_bytes} new bytes in {manifest['duration']}s"
+        )
+        return manifest
+
+    def get(self, snapshot_id: str) -> Optional[Dict[str, Any]]:
+        """Get a snapshot's manifest, or None if unknown."""
+        path = self.manifest_dir / f"{snapshot_id}.json"
+        if '/' in snapshot_id or not path.exists():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def list(self, profile_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List snapshots without their file lists, newest first.
+
+        Args:
+            profile_id: Only snapshots of this profile
+
+        Returns:
+            List[Dict[str, Any]]: Snapshot summaries
+        """
+        if not self.manifest_dir.exists():
+            return []
+        summaries = []
+        for path in self.manifest_dir.glob('*.json'):
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if profile_id is not None and manifest['profile_id'] != str(profile_id):
+                continue
+            summary = {k: v for k, v in manifest.items() if k not in ('files', 'state')}
+            summary['files'] = len(manifest['files'])
+            summaries.append(summary)
+        return sorted(summaries, key=lambda s: s['created_at'], reverse=True)
+
+    def latest(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        """Get the manifest of a profile's newest snapshot."""
+        snapshots = self.list(profile_id)
+        return self.get(snapshots[0]['snapshot_id']) if snapshots else None
+
+    def delete(self, snapshot_id: str) -> bool:
+        """
+        Delete a snapshot and any blobs no other snapshot references.
+
+        Args:
+            snapshot_id: Snapshot identifier
+
+        Returns:
+            bool: True if the snapshot existed
+        """
+        if self.get(snapshot_id) is None:
+            return False
+        with self._lock:
+            (self.manifest_dir / f"{snapshot_id}.json").unlink()
+            referenced = set()
+            for path in self.manifest_dir.glob('*.json'):
+                with open(path, 'r', encoding='utf-8') as f:
+                    referenced.update(entry['sha256'] for entry in json.load(f)['files'])
+            removed = 0
+            for blob in self.blob_dir.glob('*/*'):
+                if blob.name not in referenced:
+                    blob.unlink()
+                    removed += 1
+        logger.info(f"Deleted snapshot {snapshot_id} and {removed} unreferenced blobs")
+        return True
+
+    def restore(self, snapshot_id: str, profile_dir: Path, trash=None) -> Dict[str, Any]:
+        """
+        Materialize a snapshot into a profile directory, replacing its content.
+
+        Args:
+            snapshot_id: Snapshot identifier
+            profile_dir: Target profile directory; must not be in use by Chrome
+            trash: Callable used to dispose of the replaced directory
+
+        Returns:
+            Dict[str, Any]: Manifest of the restored snapshot
+        """
+        manifest = self.get(snapshot_id)
+        if manifest is None:
+            raise SnapshotError(f"Snapshot {snapshot_id} not found")
+        missing = self.missing_blobs(manifest)
+        if missing:
+            raise SnapshotError(f"Snapshot {snapshot_id} is missing {len(missing)} blobs")
+
+        profile_dir = Path(profile_dir)
+        staging = profile_dir.with_name(profile_dir.name + '.restoring')
+        shutil.rmtree(staging, ignore_errors=True)
+        root = staging.resolve()
+        try:
+            for entry in manifest['files']:
+                target = staging / entry['path']
+                if root not in target.resolve().parents:
+                    raise SnapshotError(f"Invalid path in snapshot: {entry['path']}")
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(self.blob_path(entry['sha256']), target)
+                os.chmod(target, entry['mode'])
+                os.utime(target, ns=(entry['mtime_ns'], entry['mtime_ns']))
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        if profile_dir.exists():
+            (trash or shutil.rmtree)(profile_dir)
+        staging.rename(profile_dir)
+        logger.info(f"Restored snapshot {snapshot_id} into {profile_dir}")
+        return manifest
+
+    def missing_blobs(self, manifest: Dict[str, Any]) -> List[str]:
+        """Hashes a manifest references that are not in the store."""
+        return sorted({
+            entry['sha256'] for entry in manifest['files'] if not self.has_blob(entry['sha256'])
+        })
+
+    def export_stream(self, snapshot_id: str, base_id: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Stream a snapshot as a gzip-compressed tar archive.
+
+        The archive holds manifest.json followed by blobs/<sha256> entries.
+        Blobs already contained in the base snapshot are left out, so an
+        archive against the receiver's latest snapshot only carries changes.
+
+        Args:
+            snapshot_id: Snapshot to export
+            base_id: Snapshot the receiver already has
+
+        Returns:
+            Iterator[bytes]: Archive chunks; memory use is bounded regardless
+            of profile size
+        """
+        manifest = self.get(snapshot_id)
+        if manifest is None:
+            raise SnapshotError(f"Snapshot {snapshot_id} not found")
+        skip = set()
+        if base_id:
+            base = self.get(base_id)
+            if base is None:
+                raise SnapshotError(f"Base snapshot {base_id} not found")
+            skip = {entry['sha256'] for entry in base['files']}
+
+        writer = _QueueWriter()
+
+        def produce():
+            try:
+                with tarfile.open(fileobj=writer, mode='w|gz') as tar:
+                    data = json.dumps(dict(manifest, base=base_id)).encode('utf-8')
+                    info = tarfile.TarInfo('manifest.json')
+                    info.size = len(data)
+                    info.mtime = int(time.time())
+                    tar.addfile(info, _BytesReader(data))
+                    sent = set()
+                    for entry in manifest['files']:
+                        digest = entry['sha256']
+                        if digest in skip or digest in sent:
+                            continue
+                        sent.add(digest)
+                        path = self.blob_path(digest)
+                        info = tarfile.TarInfo(f"blobs/{digest}")
+                        info.size = path.stat().st_size
+                        info.mtime = int(time.time())
+                        with open(path, 'rb') as f:
+                            tar.addfile(info, f)
+                writer.close()
+            except Exception as e:
+                writer.close(e)
+
+        threading.Thread(target=produce, name=f"snapshot-export-{snapshot_id}", daemon=True).start()
+        return writer.chunks()
+
+    def import_stream(self, fileobj) -> Dict[str, Any]:
+        """
+        Import a snapshot archive produced by export_stream.
+
+        Blobs are verified against their hashes while being written. The
+        snapshot is only recorded once every blob it references is present.
+
+        Args:
+            fileobj: Readable binary stream of the archive
+
+        Returns:
+            Dict[str, Any]: Manifest of the imported snapshot
+        """
+        with self._lock:
+            manifest = None
+            received = 0
+            try:
+                with tarfile.open(fileobj=fileobj, mode='r|gz') as tar:
+                    for member in tar:
+                        if not member.isfile():
+                            continue
+                        source = tar.extractfile(member)
+                        if member.name == 'manifest.json':
+                            manifest = json.loads(source.read().decode('utf-8'))
+                        elif member.name.startswith('blobs/'):
+                            digest = member.name[len('blobs/'):]
+                            self._store_blob(source, digest)
+                            received += 1
+            except (tarfile.TarError, OSError, ValueError) as e:
+                raise SnapshotError(f"Invalid snapshot archive: {str(e)}")
+
+            if manifest is None or 'snapshot_id' not in manifest:
+                raise SnapshotError("Snapshot archive has no manifest")
+            if '/' in manifest['snapshot_id'] or manifest['snapshot_id'].startswith('.'):
+                raise SnapshotError(f"Invalid snapshot id: {manifest['snapshot_id']}")
+            missing = self.missing_blobs(manifest)
+            if missing:
+                raise SnapshotError(
+                    f"Snapshot {manifest['snapshot_id']} is missing {len(missing)} blobs; "
+                    f"export it against a base snapshot this host has"
+                )
+            manifest.pop('base', None)
+            self._save_manifest(manifest)
+        logger.info(f"Imported snapshot {manifest['snapshot_id']} with {received} blobs")
+        return manifest
+
+    def _walk(self, profile_dir: Path) -> Iterator[Path]:
+        """Files of a profile directory, skipping excluded entries."""
+        excluded = {profile_dir / relative for relative in self.EXCLUDED}
+        for root, dirs, names in os.walk(profile_dir):
+            root_path = Path(root)
+            dirs[:] = sorted(d for d in dirs if root_path / d not in excluded)
+            for name in sorted(names):
+                path = root_path / name
+                if path not in excluded and not path.is_symlink():
+                    yield path
+
+    def _store_file(self, path: Path):
+        """Hash a file into the blob store; returns (digest, whether it was new)."""
+        with open(path, 'rb') as f:
+            return self._store_blob(f)
+
+    def _store_blob(self, source, expected: Optional[str] = None):
+        """
+        Copy a stream into the blob store under its SHA-256.
+
+        Returns:
+            tuple: Digest and whether the blob was new
+        """
+        if expected is not None and (len(expected) != 64
+                                     or any(c not in '0123456789abcdef' for c in expected)):
+            raise SnapshotError(f"Invalid blob name: {expected}")
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        temp = self.blob_dir / f".tmp-{uuid.uuid4().hex}"
+        digest = hashlib.sha256()
+        try:
+            with open(temp, 'wb') as out:
+                while True:
+                    chunk = source.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    out.write(chunk)
+            hexdigest = digest.hexdigest()
+            if expected is not None and hexdigest != expected:
+                raise SnapshotError(f"Blob {expected} failed verification")
+            target = self.blob_path(hexdigest)
+            if target.exists():
+                return hexdigest, False
+            target.parent.mkdir(exist_ok=True)
+            temp.rename(target)
+            return hexdigest, True
+        finally:
+            if temp.exists():
+                temp.unlink()
+
+    def _save_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Write a manifest atomically."""
+        self.manifest_dir.mkdir(parents=True, exist_ok=True)
+        path = self.manifest_dir / f"{manifest['snapshot_id']}.json"
+        temp = path.with_suffix('.tmp')
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        temp.rename(path)
+
+class _BytesReader:
+    """Minimal readable wrapper for in-memory tar members."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.offset = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            size = len(self.data) - self.offset
+        chunk = self.data[self.offset:self.offset + size]
+        self.offset += len(chunk)
+        return chunk
+
+class _QueueWriter:
+    """Writable file handing chunks to a consumer thread through a bounded queue."""
+
+    def __init__(self, max_chunks: int = 16):
+        self._queue: queue.Queue = queue.Queue(max_chunks)
+        self._cancelled = threading.Event()
+
+    def write(self, data: bytes) -> int:
+        while True:
+            if self._cancelled.is_set():
+                raise SnapshotError("Snapshot export was cancelled")
+            try:
+                self._queue.put(bytes(data), timeout=1)
+                return len(data)
+            except queue.Full:
+                continue
+
+    def close(self, error: Optional[Exception] = None) -> None:
+        """Signal the end of the stream, optionally with the error that ended it."""
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(error, timeout=1)
+                return
+            except queue.Full:
+                continue
+
+    def chunks(self) -> Iterator[bytes]:
+        """Yield written chunks until the producer closes the stream."""
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    logger.error(f"Snapshot export failed: {str(item)}")
+                    raise item
+                yield item
+        finally:
+            self._cancelled.set()
+
+class ChunkReader:
+    """
+    Readable file fed with chunks from another thread.
+
+    Lets a blocking reader such as tarfile consume a request body that
+    arrives on the event loop without buffering all of it. If the body
+    breaks off, cancel() makes a blocked or later read raise SnapshotError,
+    so the reader is never left waiting for chunks that will not come.
+    """
+
+    def __init__(self, max_chunks: int = 16):
+        self._queue: queue.Queue = queue.Queue(max_chunks)
+        self._buffer = b''
+        self._eof = False
+        self._cancelled = threading.Event()
+
+    def feed(self, chunk: Optional[bytes]) -> bool:
+        """
+        Add a chunk, or None to mark the end of the stream, without blocking.
+
+        Returns:
+            bool: False if the reader is full and the chunk should be retried
+        """
+        try:
+            self._queue.put_nowait(chunk)
+            return True
+        except queue.Full:
+            return False
+
+    def cancel(self) -> None:
+        """Abort the stream; the reader fails instead of waiting for more chunks."""
+        self._cancelled.set()
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            if self._cancelled.is_set():
+                raise SnapshotError("Snapshot upload was aborted")
+            try:
+                chunk = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if chunk is None:
+                self._eof = True
+            else:
+                self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
@@ -0,0 +1,228 @@
+# File: backend/app/utils/profile_store.py
+"""
+Profile state store module.
+Keeps profile metadata in SQLite (WAL mode) so each update is a single
+atomic row write instead of a rewrite of every profile.
+"""
+
+from typing import Any, Dict, List, Optional
+from pathlib import Path
+import json
+import sqlite3
+import threading
+from loguru import logger
+
+class ProfileStateStore:
+    """
+    SQLite-backed store of profile states.
+
+    Each state is a JSON document; created_at, last_used, url and status are
+    also kept as indexed columns for queries. Every thread uses its own
+    connection, and WAL mode lets readers proceed while a write commits, so
+    the store is safe to share between threads and processes.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS profiles (
+            profile_id TEXT PRIMARY KEY,
+            created_at TEXT,
+            last_used TEXT,
+            url TEXT,
+            status TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_profiles_last_used ON profiles(last_used);
+        CREATE INDEX IF NOT EXISTS idx_profiles_status ON profiles(status);
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the store, creating the database if needed.
+
+        Args:
+            db_path: Path of the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        self._conn.executescript(self.SCHEMA)
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Get this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _transaction(self):
+        """Open a write transaction that takes the write lock up front."""
+        return _Transaction(self._conn)
+
+    def get(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a profile's state.
+
+        Args:
+            profile_id: Profile identifier
+
+        Returns:
+            Optional[Dict[str, Any]]: Profile state, or None if unknown
+        """
+        row = self._conn.execute(
+            'SELECT data FROM profiles WHERE profile_id = ?', (str(profile_id),)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, profile_id: str, state: Dict[str, Any]) -> None:
+        """
+        Insert or replace a profile's state.
+
+        Args:
+            profile_id: Profile identifier
+            state: Complete profile state
+        """
+        with self._transaction() as conn:
+            self._write(conn, str(profile_id), state)
+
+    def update(self, profile_id: str, defaults: Optional[Dict[str, Any]] = None,
+               **fields: Any) -> Dict[str, Any]:
+        """
+        Atomically merge fields into a profile's state.
+
+        Args:
+            profile_id: Profile identifier
+            defaults: State to start from if the profile does not exist yet
+            **fields: Top-level fields to replace; a value of None removes the field
+
+        Returns:
+            Dict[str, Any]: Updated profile state
+        """
+        profile_id = str(profile_id)
+        with self._transaction() as conn:
+            row = conn.execute(
+                'SELECT data FROM profiles WHERE profile_id = ?', (profile_id,)
+            ).fetchone()
+            state = json.loads(row[0]) if row else dict(defaults or {})
+            for key, value in fields.items():
+                if value is None:
+                    state.pop(key, None)
+                else:
+                    state[key] = value
+            self._write(conn, profile_id, state)
+        return state
+
+    def delete(self, profile_id: str) -> bool:
+        """
+        Delete a profile's state.
+
+        Args:
+            profile_id: Profile identifier
+
+        Returns:
+            bool: True if a state was deleted
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute('DELETE FROM profiles WHERE profile_id = ?', (str(profile_id),))
+            return cursor.rowcount > 0
+
+    def ids(self) -> List[str]:
+        """Get the ids of all stored profiles."""
+        return [row[0] for row in self._conn.execute('SELECT profile_id FROM profiles')]
+
+    def count(self) -> int:
+        """Get the number of stored profiles."""
+        return self._conn.execute('SELECT COUNT(*) FROM profiles').fetchone()[0]
+
+    def all(self) -> Dict[str, Dict[str, Any]]:
+        """Get every profile state keyed by profile id."""
+        return {
+            row[0]: json.loads(row[1])
+            for row in self._conn.execute('SELECT profile_id, data FROM profiles')
+        }
+
+    def query(self, status: Optional[str] = None,
+              last_used_before: Optional[str] = None,
+              limit: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Find profiles by status and last use, least recently used first.
+
+        Args:
+            status: Only profiles with this status
+            last_used_before: Only profiles last used before this ISO timestamp
+            limit: Maximum number of profiles
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Matching profile states keyed by profile id
+        """
+        sql = 'SELECT profile_id, data FROM profiles WHERE 1 = 1'
+        params: List[Any] = []
+        if status is not None:
+            sql += ' AND status = ?'
+            params.append(status)
+        if last_used_before is not None:
+            sql += ' AND last_used IS NOT NULL AND last_used < ?'
+            params.append(last_used_before)
+        sql += ' ORDER BY last_used'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        return {row[0]: json.loads(row[1]) for row in self._conn.execute(sql, params)}
+
+    def import_states(self, states: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Bulk insert profile states in one transaction.
+
+        Args:
+            states: Profile states keyed by profile id
+
+        Returns:
+            int: Number of states imported
+        """
+        with self._transaction() as conn:
+            for profile_id, state in states.items():
+                self._write(conn, str(profile_id), state)
+        logger.info(f"Imported {len(states)} profile states into {self.db_path}")
+        return len(states)
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    @staticmethod
+    def _write(conn: sqlite3.Connection, profile_id: str, state: Dict[str, Any]) -> None:
+        """Upsert one state row inside an open transaction."""
+        conn.execute(
+            'INSERT OR REPLACE INTO profiles '
+            '(profile_id, created_at, last_used, url, status, data) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (
+                profile_id,
+                state.get('created_at'),
+                state.get('last_used'),
+                state.get('url'),
+                state.get('status'),
+                json.dumps(state)
+            )
+        )
+
+class _Transaction:
+    """Context manager running a BEGIN IMMEDIATE ... COMMIT block."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute('BEGIN IMMEDIATE')
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.conn.execute('COMMIT')
+        else:
+            self.conn.execute('ROLLBACK')
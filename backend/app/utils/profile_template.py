@@ -0,0 +1,261 @@
+# File: backend/app/utils/profile_template.py
+"""
+Profile template module.
+Builds a pre-initialized Chrome profile once and clones it into new
+profile directories, sharing blocks through reflinks where supported.
+"""
+
+from typing import Any, Callable, Dict, Optional
+from pathlib import Path
+from datetime import datetime
+import ctypes
+import errno
+import os
+import shutil
+import sys
+import threading
+import time
+import uuid
+from loguru import logger
+
+from ..config import Config
+
+# ioctl request that clones a file's extents (Linux btrfs, XFS, bcachefs, ...)
+FICLONE = 0x40049409
+
+class ProfileTemplate:
+    """
+    Golden template profile cloned into new profile directories.
+
+    The template is produced by launching Chrome once against an empty
+    profile, letting it write its first-run state, and stripping caches,
+    locks and session files. Files are cloned with copy-on-write reflinks
+    when the filesystem supports them and copied otherwise. Hardlinks are
+    not used because Chrome rewrites its databases in place, which would
+    leak changes between profiles.
+    """
+
+    MARKER = '.template_ready'
+
+    # Attempts a clone makes when the template is rebuilt underneath it
+    CLONE_ATTEMPTS = 3
+
+    # Files and directories that must not be shared between profiles
+    VOLATILE = (
+        'SingletonLock', 'SingletonSocket', 'SingletonCookie', 'DevToolsActivePort',
+        'Crashpad', 'Crash Reports', 'BrowserMetrics', 'ShaderCache', 'GrShaderCache',
+        'GraphiteDawnCache', 'Default/Cache', 'Default/Code Cache', 'Default/GPUCache',
+        'Default/Sessions', 'Default/Current Session', 'Default/Current Tabs',
+        'Default/Last Session', 'Default/Last Tabs'
+    )
+
+    def __init__(self, name: str = '_template'):
+        """
+        Initialize the template.
+
+        Args:
+            name: Directory name of the template under PROFILES_DIR
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        # Whether reflinks work, by device of the clone target: one process
+        # clones both into PROFILES_DIR and onto RAM-backed ephemeral storage
+        self._reflink_supported: Dict[int, bool] = {}
+
+        # Statistics
+        self.clones = 0
+        self.files_cloned = 0
+        self.files_reflinked = 0
+        self.bytes_cloned = 0
+        self.last_build_duration: Optional[float] = None
+
+    @property
+    def path(self) -> Path:
+        """Template directory."""
+        return Path(Config.PROFILES_DIR) / self.name
+
+    @property
+    def ready(self) -> bool:
+        """Whether a complete template exists."""
+        return (self.path / self.MARKER).exists()
+
+    def build(self, launch: Callable[[str], Any], settle_time: float = 3) -> bool:
+        """
+        Build the template by running Chrome once against an empty profile.
+
+        Args:
+            launch: Callable taking a profile directory name and returning a
+                started WebDriver using it
+            settle_time: Seconds to let Chrome finish writing first-run state
+
+        Returns:
+            bool: True if the template was built
+        """
+        with self._lock:
+            staging = self.path.with_name(self.name + '.building')
+            shutil.rmtree(staging, ignore_errors=True)
+            staging.mkdir(parents=True)
+            started = time.monotonic()
+            logger.info(f"Building profile template in {staging}")
+            try:
+                driver = launch(staging.name)
+                try:
+                    driver.get('about:blank')
+                    time.sleep(settle_time)
+                finally:
+                    driver.quit()
+            except Exception as e:
+                logger.error(f"Failed to build profile template: {str(e)}")
+                shutil.rmtree(staging, ignore_errors=True)
+                return False
+
+            for relative in self.VOLATILE:
+                target = staging / relative
+                if target.is_dir() and not target.is_symlink():
+                    shutil.rmtree(target, ignore_errors=True)
+                elif target.exists() or target.is_symlink():
+                    target.unlink()
+            (staging / self.MARKER).write_text(datetime.now().isoformat())
+
+            # Swap the finished template in with two renames, then delete the
+            # old one; a clone still walking it notices the new build marker
+            # and starts over (see clone_into)
+            for leftover in self.path.parent.glob(self.name + '.retired.*'):
+                shutil.rmtree(leftover, ignore_errors=True)
+            retired = self.path.with_name(f"{self.name}.retired.{uuid.uuid4().hex[:8]}")
+            if self.path.exists():
+                self.path.rename(retired)
+            staging.rename(self.path)
+            shutil.rmtree(retired, ignore_errors=True)
+            self.last_build_duration = round(time.monotonic() - started, 2)
+            logger.info(f"Profile template ready in {self.last_build_duration}s")
+            return True
+
+    def clone_into(self, profile_dir: Path) -> bool:
+        """
+        Seed an empty profile directory from the template.
+
+        The template may be rebuilt by another thread or process while it is
+        being walked; the build marker is compared before and after, and the
+        clone starts over if it changed.
+
+        Args:
+            profile_dir: Profile directory to fill; left untouched if it
+                already has content
+
+        Returns:
+            bool: True if the template was cloned
+        """
+        profile_dir = Path(profile_dir)
+        if profile_dir.exists() and any(profile_dir.iterdir()):
+            return False
+
+        for attempt in range(self.CLONE_ATTEMPTS):
+            build = self._build_marker()
+            if build is None:
+                return False
+            error = None
+            files = reflinked = size = 0
+            try:
+                profile_dir.mkdir(parents=True, exist_ok=True)
+                device = profile_dir.stat().st_dev
+                for root, dirs, names in os.walk(self.path):
+                    relative = Path(root).relative_to(self.path)
+                    (profile_dir / relative).mkdir(parents=True, exist_ok=True)
+                    for name in names:
+                        source = Path(root) / name
+                        if name == self.MARKER or source.is_symlink():
+                            continue
+                        if self._clone_file(source, profile_dir / relative / name, device):
+                            reflinked += 1
+                        files += 1
+                        size += source.stat().st_size
+            except Exception as e:
+                error = e
+            if self._build_marker() == build and error is None:
+                break
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            if self._build_marker() == build:
+                logger.error(f"Failed to clone profile template into {profile_dir}: {str(error)}")
+                return False
+            logger.info(f"Profile template was rebuilt while cloning into {profile_dir}, retrying")
+        else:
+            logger.error(f"Profile template kept changing while cloning into {profile_dir}")
+            return False
+
+        self.clones += 1
+        self.files_cloned += files
+        self.files_reflinked += reflinked
+        self.bytes_cloned += size
+        logger.info(f"Seeded {profile_dir} from template ({files} files, {reflinked} reflinked)")
+        return True
+
+    def _build_marker(self) -> Optional[str]:
+        """Build time recorded in the template's marker, or None if no template is ready."""
+        try:
+            return (self.path / self.MARKER).read_text()
+        except OSError:
+            return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get template status and clone statistics."""
+        try:
+            device = Path(Config.PROFILES_DIR).stat().st_dev
+        except OSError:
+            device = None
+        return {
+            'ready': self.ready,
+            'path': str(self.path),
+            'reflink_supported': self._reflink_supported.get(device),
+            'clones': self.clones,
+            'files_cloned': self.files_cloned,
+            'files_reflinked': self.files_reflinked,
+            'bytes_cloned': self.bytes_cloned,
+            'last_build_duration': self.last_build_duration
+        }
+
+    def _clone_file(self, source: Path, target: Path, device: int) -> bool:
+        """
+        Clone one file, preferring a copy-on-write reflink.
+
+        Args:
+            source: Template file
+            target: File to create
+            device: Device of the target directory
+
+        Returns:
+            bool: True if the file was reflinked rather than copied
+        """
+        if self._reflink_supported.get(device) is not False:
+            try:
+                _reflink(source, target)
+                self._reflink_supported[device] = True
+                shutil.copystat(source, target)
+                return True
+            except OSError as e:
+                if e.errno not in (errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL,
+                                   errno.ENOTTY, errno.ENOSYS):
+                    raise
+                self._reflink_supported[device] = False
+                try:
+                    target.unlink()
+                except FileNotFoundError:
+                    pass
+        shutil.copy2(source, target)
+        return False
+
+def _reflink(source: Path, target: Path) -> None:
+    """Create target as a copy-on-write clone of source, raising OSError if unsupported."""
+    if sys.platform == 'darwin':
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(source), os.fsencode(target), 0) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        return
+    if not sys.platform.startswith('linux'):
+        raise OSError(errno.ENOSYS, 'Reflinks are not supported on this platform')
+
+    import fcntl
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
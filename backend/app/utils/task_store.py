@@ -0,0 +1,344 @@
+# File: backend/app/utils/task_store.py
+"""
+Task store module.
+Keeps queued URL visit tasks in SQLite (WAL mode) so they survive client
+disconnects and server restarts.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+from pathlib import Path
+from datetime import datetime
+import sqlite3
+import threading
+import time
+import uuid
+from loguru import logger
+
+from .profile_store import _Transaction
+
+class TaskStore:
+    """
+    SQLite-backed store of visit tasks.
+
+    A task is queued until a worker claims it, which marks it running inside
+    the same write transaction, so several processes sharing the database
+    never claim the same task. Tasks are claimed by priority, then in
+    submission order.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            task_id TEXT UNIQUE NOT NULL,
+            url TEXT NOT NULL,
+            instance_id TEXT,
+            priority INTEGER NOT NULL DEFAULT 0,
+            deadline REAL,
+            max_attempts INTEGER NOT NULL,
+            retry_delay REAL NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            status TEXT NOT NULL,
+            not_before REAL NOT NULL,
+            created_at REAL NOT NULL,
+            started_at REAL,
+            finished_at REAL,
+            claimed_by TEXT,
+            assigned_instance TEXT,
+            elapsed REAL,
+            error TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_claim ON tasks(status, priority DESC, seq);
+        CREATE INDEX IF NOT EXISTS idx_tasks_instance ON tasks(instance_id, status);
+        CREATE INDEX IF NOT EXISTS idx_tasks_finished ON tasks(finished_at);
+    """
+
+    # Statuses of tasks that will not run again
+    FINISHED = ('succeeded', 'failed', 'expired', 'cancelled')
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the store, creating the database if needed.
+
+        Args:
+            db_path: Path of the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._conn.executescript(self.SCHEMA)
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Get this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def add(self, tasks: Iterable[Dict[str, Any]]) -> List[str]:
+        """
+        Queue tasks in one transaction.
+
+        Args:
+            tasks: Task specs with url, instance_id, priority, deadline (epoch
+                seconds), max_attempts, retry_delay and optionally task_id
+
+        Returns:
+            List[str]: Ids of the queued tasks, in order
+        """
+        now = time.time()
+        task_ids = []
+        with _Transaction(self._conn) as conn:
+            for task in tasks:
+                task_id = task.get('task_id') or uuid.uuid4().hex
+                conn.execute(
+                    'INSERT INTO tasks (task_id, url, instance_id, priority, deadline, '
+                    'max_attempts, retry_delay, status, not_before, created_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (
+                        task_id, task['url'], task.get('instance_id'), task.get('priority', 0),
+                        task.get('deadline'), task['max_attempts'], task['retry_delay'],
+                        'queued', now, now
+                    )
+                )
+                task_ids.append(task_id)
+        return task_ids
+
+    def claim(self, instance_id: str, worker: str, pinned_only: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Claim the most urgent ready task an instance may run.
+
+        Args:
+            instance_id: Instance that will run the task
+            worker: Identifier of the claiming process, used to recover its
+                tasks after a restart
+            pinned_only: Only claim tasks targeting this instance
+
+        Returns:
+            Optional[Dict[str, Any]]: Claimed task, or None if nothing is ready
+        """
+        now = time.time()
+        target = 'instance_id = ?' if pinned_only else '(instance_id = ? OR instance_id IS NULL)'
+        with _Transaction(self._conn) as conn:
+            row = conn.execute(
+                f"SELECT * FROM tasks WHERE status = 'queued' AND not_before <= ? AND {target} "
+                'ORDER BY priority DESC, seq LIMIT 1',
+                (now, instance_id)
+            ).fetchone()
+            if not row:
+                return None
+            conn.execute(
+                "UPDATE tasks SET status = 'running', attempts = attempts + 1, started_at = ?, "
+                'claimed_by = ?, assigned_instance = ?, error = NULL WHERE seq = ?',
+                (now, worker, instance_id, row['seq'])
+            )
+        task = dict(row)
+        task.update(status='running', attempts=row['attempts'] + 1, started_at=now,
+                    claimed_by=worker, assigned_instance=instance_id, error=None)
+        return task
+
+    def finish(self, task: Dict[str, Any], success: bool, elapsed: float,
+               error: Optional[str] = None) -> str:
+        """
+        Record the outcome of a claimed task, requeueing it if it may be retried.
+
+        Args:
+            task: Task returned by claim
+            success: Whether the visit succeeded
+            elapsed: Seconds the attempt took
+            error: Reason of a failure
+
+        Returns:
+            str: New status of the task
+        """
+        now = time.time()
+        if success:
+            status, not_before = 'succeeded', None
+        elif task['deadline'] is not None and now >= task['deadline']:
+            status, not_before = 'expired', None
+        elif task['attempts'] < task['max_attempts']:
+            # Exponential backoff between attempts
+            status = 'queued'
+            not_before = now + task['retry_delay'] * (2 ** (task['attempts'] - 1))
+        else:
+            status, not_before = 'failed', None
+        with _Transaction(self._conn) as conn:
+            conn.execute(
+                'UPDATE tasks SET status = ?, not_before = COALESCE(?, not_before), '
+                'finished_at = ?, elapsed = ?, error = ? WHERE seq = ?',
+                (status, not_before, None if status == 'queued' else now, round(elapsed, 3),
+                 error, task['seq'])
+            )
+        return status
+
+    def cancel(self, task_id: str) -> bool:
+        """
+        Cancel a task that has not started.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            bool: True if the task was cancelled
+        """
+        with _Transaction(self._conn) as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = 'cancelled', finished_at = ? "
+                "WHERE task_id = ? AND status = 'queued'",
+                (time.time(), task_id)
+            )
+            return cursor.rowcount > 0
+
+    def expire(self) -> int:
+        """Mark queued tasks whose deadline has passed as expired."""
+        now = time.time()
+        with _Transaction(self._conn) as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = 'expired', finished_at = ?, "
+                "error = COALESCE(error, 'Deadline passed before the task could run') "
+                "WHERE status = 'queued' AND deadline IS NOT NULL AND deadline <= ?",
+                (now, now)
+            )
+            return cursor.rowcount
+
+    def fail_pinned(self, instance_ids: Iterable[str], error: str) -> int:
+        """Fail queued tasks targeting instances that no longer exist."""
+        now = time.time()
+        with _Transaction(self._conn) as conn:
+            return sum(
+                conn.execute(
+                    "UPDATE tasks SET status = 'failed', finished_at = ?, error = ? "
+                    "WHERE status = 'queued' AND instance_id = ?",
+                    (now, error, instance_id)
+                ).rowcount
+                for instance_id in instance_ids
+            )
+
+    def pinned_instances(self) -> List[str]:
+        """Get the instances queued tasks are waiting for."""
+        return [
+            row[0] for row in self._conn.execute(
+                "SELECT DISTINCT instance_id FROM tasks "
+                "WHERE status = 'queued' AND instance_id IS NOT NULL"
+            )
+        ]
+
+    def recover(self, worker: str) -> int:
+        """
+        Requeue tasks a previous run of a worker left running.
+
+        Args:
+            worker: Identifier the worker claimed tasks with
+
+        Returns:
+            int: Number of tasks recovered
+        """
+        now = time.time()
+        with _Transaction(self._conn) as conn:
+            failed = conn.execute(
+                "UPDATE tasks SET status = 'failed', finished_at = ?, "
+                "error = 'Interrupted by a restart' "
+                "WHERE status = 'running' AND claimed_by = ? AND attempts >= max_attempts",
+                (now, worker)
+            ).rowcount
+            requeued = conn.execute(
+                "UPDATE tasks SET status = 'queued', not_before = ? "
+                "WHERE status = 'running' AND claimed_by = ?",
+                (now, worker)
+            ).rowcount
+        if failed or requeued:
+            logger.info(f"Recovered interrupted tasks: {requeued} requeued, {failed} failed")
+        return requeued
+
+    def purge(self, finished_before: float) -> int:
+        """Delete finished tasks older than a timestamp."""
+        with _Transaction(self._conn) as conn:
+            return conn.execute(
+                'DELETE FROM tasks WHERE finished_at IS NOT NULL AND finished_at < ? '
+                f"AND status IN ({','.join('?' * len(self.FINISHED))})",
+                (finished_before, *self.FINISHED)
+            ).rowcount
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a task.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Optional[Dict[str, Any]]: Task, or None if unknown
+        """
+        row = self._conn.execute('SELECT * FROM tasks WHERE task_id = ?', (task_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        List tasks, most recently submitted first.
+
+        Args:
+            status: Only tasks with this status
+            limit: Maximum number of tasks
+
+        Returns:
+            List[Dict[str, Any]]: Tasks
+        """
+        sql = 'SELECT * FROM tasks'
+        params: List[Any] = []
+        if status is not None:
+            sql += ' WHERE status = ?'
+            params.append(status)
+        sql += ' ORDER BY seq DESC LIMIT ?'
+        params.append(limit)
+        return [self._to_dict(row) for row in self._conn.execute(sql, params)]
+
+    def counts(self) -> Dict[str, int]:
+        """Count tasks by status."""
+        return {
+            row[0]: row[1]
+            for row in self._conn.execute('SELECT status, COUNT(*) FROM tasks GROUP BY status')
+        }
+
+    def ready_count(self) -> int:
+        """Count queued tasks that may run now, excluding those waiting to be retried."""
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE status = 'queued' AND not_before <= ?",
+            (time.time(),)
+        ).fetchone()[0]
+
+    def finished_since(self, since: float) -> Dict[str, Any]:
+        """Count tasks finished since a timestamp and their mean duration."""
+        row = self._conn.execute(
+            "SELECT COUNT(*), SUM(status = 'succeeded'), AVG(elapsed) FROM tasks "
+            'WHERE finished_at >= ?',
+            (since,)
+        ).fetchone()
+        return {
+            'finished': row[0],
+            'succeeded': row[1] or 0,
+            'mean_elapsed': round(row[2], 3) if row[2] is not None else None
+        }
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a row to the task format returned by the API."""
+        def iso(value: Optional[float]) -> Optional[str]:
+            return datetime.fromtimestamp(value).isoformat() if value is not None else None
+
+        task = dict(row)
+        del task['seq']
+        for key in ('deadline', 'created_at', 'started_at', 'finished_at'):
+            task[key] = iso(task[key])
+        task['not_before'] = iso(task['not_before']) if task['status'] == 'queued' else None
+        return task
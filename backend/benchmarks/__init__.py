@@ -0,0 +1,6 @@
+"""
+Benchmarks for the instance management service; see each module for usage.
+
+launch_profiles runs real Chrome. micro and load run on the simulated driver
+by default, and compare diffs two result files from different versions.
+"""
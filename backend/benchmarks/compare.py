@@ -0,0 +1,52 @@
+# File: backend/benchmarks/compare.py
+"""
+Compare two benchmark result files.
+
+Prints the change of one latency metric for every fleet size and operation
+present in both files and exits non-zero if any slowed down by more than
+the threshold.
+
+Run from the backend directory:
+    python -m benchmarks.compare results/base.json results/micro.json --metric p95_ms
+"""
+
+from pathlib import Path
+import click
+
+from .reporting import compare, load_results
+
+@click.command()
+@click.argument('baseline', type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument('current', type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option('--metric', default='p95_ms', help="Summary field to compare.")
+@click.option('--threshold', default=0.2, help="Relative slowdown reported as a regression.")
+def main(baseline: Path, current: Path, metric: str, threshold: float):
+    """比较两次基准测试结果，延迟回退超过阈值时以非零状态退出"""
+    before, after = load_results(baseline), load_results(current)
+    if before['benchmark'] != after['benchmark']:
+        raise click.ClickException(
+            f"Cannot compare {before['benchmark']} results with {after['benchmark']} results"
+        )
+    rows = compare(before, after, metric)
+    if not rows:
+        raise click.ClickException("The files have no fleet size and operation in common")
+
+    click.echo(f"{metric}: {before.get('version') or '?'} -> {after.get('version') or '?'}")
+    header = f"{'fleet':>5} {'operation':<36} {'baseline':>10} {'current':>10} {'change':>8}"
+    click.echo(header)
+    click.echo('-' * len(header))
+    regressions = 0
+    for row in rows:
+        change = row['change']
+        regressed = change is not None and change > threshold
+        regressions += regressed
+        click.echo(
+            f"{row['fleet']:>5} {row['operation']:<36} {row['baseline']:>10} {row['current']:>10} "
+            f"{f'{change:+.1%}' if change is not None else '-':>8}{'  REGRESSION' if regressed else ''}"
+        )
+    if regressions:
+        click.echo(f"{regressions} operation(s) slowed down by more than {threshold:.0%}", err=True)
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# File: backend/benchmarks/launch_profiles.py
+"""
+Launch profile benchmark.
+
+Launches instances with each launch profile, loads a page in every one of
+them and reports the memory attributed to each instance's process tree,
+together with how many such instances fit in a gigabyte.
+
+Run from the backend directory:
+    python -m benchmarks.launch_profiles --instances 5 --url https://example.com
+"""
+
+from typing import Any, Dict, List
+import json
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+import click
+from loguru import logger
+
+from app.config import Config
+from app.browser import ChromeDriverManager, LaunchProfiles
+from app.core.process_metrics import ProcessTreeAccountant
+
+def run_profile(manager: ChromeDriverManager, launch_profile: str, instances: int,
+                url: str, settle: float, include_pss: bool) -> Dict[str, Any]:
+    """
+    Measure one launch profile.
+
+    Args:
+        manager: Driver manager used to launch the instances
+        launch_profile: Launch profile name
+        instances: Number of instances to run side by side
+        url: Page loaded in every instance before measuring
+        settle: Seconds to wait after loading before measuring
+        include_pss: Measure proportional set size as well as RSS
+
+    Returns:
+        Dict[str, Any]: Per-instance averages for the profile
+    """
+    accountant = ProcessTreeAccountant(interval=1, include_pss=include_pss)
+    drivers = []
+    launch_times: List[float] = []
+    try:
+        for index in range(1, instances + 1):
+            started = time.monotonic()
+            driver = manager.create_driver(
+                index, profile_name=f"bench_{launch_profile}_{index}", load_profile=False,
+                use_template=False, ephemeral=True, launch_profile=launch_profile
+            )
+            drivers.append(driver)
+            driver.get(url)
+            launch_times.append(time.monotonic() - started)
+            accountant.track(str(index), driver.service.process.pid)
+
+        # The first sample only establishes the CPU baseline
+        accountant.sample()
+        time.sleep(settle)
+        metrics = list(accountant.sample().values())
+    finally:
+        for driver in drivers:
+            manager.quit_driver(driver)
+        for index in range(1, instances + 1):
+            manager.discard_ephemeral_profile(f"bench_{launch_profile}_{index}")
+            manager.fingerprints.pop(index, None)
+
+    rss = statistics.mean(m['rss_mb'] for m in metrics)
+    pss = statistics.mean(m['pss_mb'] for m in metrics) if include_pss and metrics[0]['pss_mb'] else None
+    # PSS splits shared pages between processes, so it does not overcount like RSS
+    per_instance = pss or rss
+    return {
+        'launch_profile': launch_profile,
+        'instances': len(metrics),
+        'launch_seconds': round(statistics.mean(launch_times), 2),
+        'rss_mb': round(rss, 1),
+        'pss_mb': round(pss, 1) if pss else None,
+        'processes': round(statistics.mean(m['processes'] for m in metrics), 1),
+        'renderers': round(statistics.mean(m['renderers'] for m in metrics), 1),
+        'cpu_percent': round(statistics.mean(m['cpu_percent'] or 0 for m in metrics), 1),
+        'instances_per_gb': round(1024 / per_instance, 2) if per_instance else None
+    }
+
+@click.command()
+@click.option('--profile', 'profiles', multiple=True, type=click.Choice(LaunchProfiles.names()),
+              help="Launch profile to measure (repeatable; default all).")
+@click.option('--instances', default=3, help="Instances run side by side per profile.")
+@click.option('--url', default="https://example.com", help="Page loaded in every instance.")
+@click.option('--settle', default=5.0, help="Seconds to wait after loading before measuring.")
+@click.option('--no-pss', is_flag=True, help="Only measure RSS, which overcounts shared memory.")
+@click.option('--json', 'as_json', is_flag=True, help="Print results as JSON.")
+def main(profiles, instances: int, url: str, settle: float, no_pss: bool, as_json: bool):
+    """测量各启动配置下每个实例的内存占用和每GB可运行的实例数"""
+    Config.initialize()
+    logger.remove()
+    Config.EPHEMERAL_PROFILES_DIR = Path(tempfile.mkdtemp(prefix="launch_profile_bench_"))
+    manager = ChromeDriverManager()
+    results = []
+    try:
+        for launch_profile in profiles or LaunchProfiles.names():
+            click.echo(f"Measuring {launch_profile} with {instances} instances...", err=True)
+            results.append(
+                run_profile(manager, launch_profile, instances, url, settle, not no_pss)
+            )
+    finally:
+        shutil.rmtree(Config.EPHEMERAL_PROFILES_DIR, ignore_errors=True)
+
+    if as_json:
+        click.echo(json.dumps(results, indent=2))
+        return
+
+    baseline = next((r for r in results if r['launch_profile'] == 'standard'), results[0])
+    header = (f"{'profile':<10} {'launch s':>9} {'RSS MB':>8} {'PSS MB':>8} {'procs':>6} "
+              f"{'renderers':>10} {'CPU %':>6} {'inst/GB':>8} {'vs ' + baseline['launch_profile']:>12}")
+    click.echo(header)
+    click.echo('-' * len(header))
+    for r in results:
+        ratio = (r['instances_per_gb'] / baseline['instances_per_gb']
+                 if r['instances_per_gb'] and baseline['instances_per_gb'] else None)
+        click.echo(
+            f"{r['launch_profile']:<10} {r['launch_seconds']:>9} {r['rss_mb']:>8} "
+            f"{r['pss_mb'] if r['pss_mb'] is not None else '-':>8} {r['processes']:>6} "
+            f"{r['renderers']:>10} {r['cpu_percent']:>6} {r['instances_per_gb'] or '-':>8} "
+            f"{f'{ratio:.2f}x' if ratio else '-':>12}"
+        )
+
+if __name__ == "__main__":
+    main()
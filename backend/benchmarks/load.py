@@ -0,0 +1,272 @@
+# File: backend/benchmarks/load.py
+"""
+HTTP load generator for the instance management API.
+
+For each fleet size, grows the fleet through POST /browser/instances, then
+drives the instance and system endpoints one at a time at the requested
+concurrency and reports latency percentiles, throughput and how long the
+server's event loop was blocked meanwhile (from GET /system/event-loop).
+Without --base-url it starts its own server on the simulated driver, so
+no Chrome is needed.
+
+Run from the backend directory:
+    python -m benchmarks.load --fleet 10 --fleet 50 --concurrency 32 --output results/load.json
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from pathlib import Path
+import asyncio
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import click
+import httpx
+
+from .reporting import PROJECT_DIR, format_table, save_results, summarize
+
+API = "/api/v1"
+
+# Read endpoints driven at every fleet size; {id} is replaced by instance ids in turn
+READ_ENDPOINTS = [
+    ('GET', '/browser/instances'),
+    ('GET', '/browser/instances/{id}'),
+    ('GET', '/browser/instances/metrics'),
+    ('GET', '/system/stats'),
+    ('GET', '/system/performance'),
+    ('GET', '/system/capacity'),
+]
+
+class LoadGenerator:
+    """Drives one server and measures it from the client side."""
+
+    def __init__(self, client: httpx.AsyncClient, concurrency: int):
+        """
+        Initialize the generator.
+
+        Args:
+            client: Client whose base URL is the server root
+            concurrency: Requests in flight at once
+        """
+        self.client = client
+        self.concurrency = concurrency
+
+    async def loop_stats(self) -> Optional[Dict[str, Any]]:
+        """Server event loop statistics, or None if the server does not report them."""
+        try:
+            response = await self.client.get(f"{API}/system/event-loop")
+            return response.json() if response.status_code == 200 else None
+        except httpx.HTTPError:
+            return None
+
+    async def drive(self, requests: List[Callable[[], Any]], concurrency: int) -> Dict[str, Any]:
+        """
+        Send requests with bounded concurrency.
+
+        Args:
+            requests: Factories of request coroutines
+            concurrency: Requests in flight at once
+
+        Returns:
+            Dict[str, Any]: Latency summary with the server's event loop
+            blocking over the same period
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        latencies: List[float] = []
+        errors = 0
+
+        async def send(request: Callable[[], Any]) -> None:
+            nonlocal errors
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await request()
+                except httpx.HTTPError:
+                    errors += 1
+                    return
+                if response.status_code >= 400:
+                    errors += 1
+                    return
+                latencies.append(time.perf_counter() - started)
+
+        before = await self.loop_stats()
+        started = time.perf_counter()
+        await asyncio.gather(*(send(request) for request in requests))
+        elapsed = time.perf_counter() - started
+        after = await self.loop_stats()
+
+        summary = summarize(latencies, elapsed, errors)
+        if before and after:
+            summary['loop_blocked_ms'] = round((after['blocked_seconds'] - before['blocked_seconds']) * 1000, 1)
+            summary['loop_stalls'] = after['stalls'] - before['stalls']
+            summary['loop_max_lag_ms'] = after['max_lag_ms']
+        return summary
+
+    async def grow_fleet(self, size: int, timeout: float) -> Dict[str, Any]:
+        """
+        Launch instances until the fleet has the given size.
+
+        Returns:
+            Dict[str, Any]: Summary of the per-instance launch durations
+            reported by the launch job
+        """
+        response = await self.client.get(f"{API}/browser/instances")
+        missing = size - len(response.json())
+        if missing <= 0:
+            return summarize([])
+        started = time.perf_counter()
+        response = await self.client.post(f"{API}/browser/instances", json={'count': missing})
+        response.raise_for_status()
+        job_id = response.json()['job_id']
+        deadline = time.monotonic() + timeout
+        while True:
+            job = (await self.client.get(f"{API}/browser/jobs/{job_id}")).json()
+            if job['status'] in ('completed', 'failed', 'partial'):
+                break
+            if time.monotonic() > deadline:
+                raise click.ClickException(f"Launch job {job_id} did not finish within {timeout}s")
+            await asyncio.sleep(0.2)
+        items = job['instances']
+        durations = [i['duration'] for i in items if i['status'] == 'running' and i['duration'] is not None]
+        return summarize(durations, time.perf_counter() - started, len(items) - len(durations))
+
+    async def run_fleet(self, size: int, requests: int, visits: int, url: str,
+                        launch_timeout: float) -> Dict[str, Any]:
+        """Benchmark one fleet size."""
+        operations: Dict[str, Dict[str, Any]] = {}
+        click.echo(f"Fleet of {size}: launching instances...", err=True)
+        operations['POST /browser/instances'] = await self.grow_fleet(size, launch_timeout)
+        instances = (await self.client.get(f"{API}/browser/instances")).json()
+        ids = [i['id'] for i in instances]
+        if not ids:
+            raise click.ClickException("No instances are running")
+
+        for method, path in READ_ENDPOINTS:
+            click.echo(f"Fleet of {size}: {method} {path}", err=True)
+            operations[f"{method} {path}"] = await self.drive([
+                lambda m=method, p=f"{API}{path}".replace('{id}', ids[n % len(ids)]): self.client.request(m, p)
+                for n in range(requests)
+            ], self.concurrency)
+
+        click.echo(f"Fleet of {size}: visiting {url} with {min(visits, len(ids))} instances", err=True)
+        operations['POST /browser/instances/{id}/visit'] = await self.drive([
+            lambda i=i: self.client.post(f"{API}/browser/instances/{i}/visit", json={'url': url})
+            for i in ids[:visits]
+        ], visits)
+        return {'fleet': size, 'instances': len(ids), 'operations': operations}
+
+    async def teardown(self) -> None:
+        """Delete every instance."""
+        instances = (await self.client.get(f"{API}/browser/instances")).json()
+        if instances:
+            await self.client.request(
+                "DELETE", f"{API}/browser/instances/batch", json=[i['id'] for i in instances]
+            )
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def start_server(workdir: Path, max_fleet: int) -> Tuple[subprocess.Popen, str]:
+    """
+    Start the API on the simulated driver in a child process.
+
+    Returns:
+        Tuple[subprocess.Popen, str]: Server process and its base URL
+    """
+    port = _free_port()
+    env = dict(
+        os.environ,
+        SIMULATED_DRIVER='true',
+        PROFILES_DIR=str(workdir / "profiles"),
+        EPHEMERAL_PROFILES_DIR=str(workdir / "ephemeral"),
+        ADMISSION_ENABLED='false',
+        PROFILE_TEMPLATE_ENABLED='false',
+        TASK_QUEUE_ENABLED='false',
+        PROFILE_MAINTENANCE_INTERVAL='0',
+        LAUNCH_JOB_HISTORY=str(max(100, max_fleet)),
+        LOG_LEVEL='WARNING'
+    )
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'app.main:app', '--host', '127.0.0.1',
+         '--port', str(port), '--log-level', 'warning'],
+        cwd=PROJECT_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise click.ClickException("Benchmark server exited during startup")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return process, base_url
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise click.ClickException("Benchmark server did not start within 60s")
+
+async def run(base_url: str, fleets: List[int], concurrency: int, requests: int, visits: int,
+              url: str, launch_timeout: float, keep: bool) -> List[Dict[str, Any]]:
+    """Benchmark each fleet size in ascending order, growing one fleet."""
+    limits = httpx.Limits(max_connections=concurrency + 8, max_keepalive_connections=concurrency + 8)
+    async with httpx.AsyncClient(base_url=base_url, timeout=300, limits=limits) as client:
+        generator = LoadGenerator(client, concurrency)
+        try:
+            return [
+                await generator.run_fleet(size, requests, visits, url, launch_timeout)
+                for size in sorted(fleets)
+            ]
+        finally:
+            if not keep:
+                await generator.teardown()
+
+@click.command()
+@click.option('--base-url', help="Server to load (default: start one on the simulated driver).")
+@click.option('--fleet', 'fleets', multiple=True, type=int,
+              help="Fleet size to benchmark (repeatable; default 10, 50 and 200).")
+@click.option('--concurrency', default=16, help="Requests in flight at once.")
+@click.option('--requests', default=500, help="Requests per read endpoint and fleet size.")
+@click.option('--visits', default=20, help="Concurrent visits per fleet size (at most the fleet size).")
+@click.option('--url', default="https://example.com", help="URL visited.")
+@click.option('--launch-timeout', default=600.0, help="Seconds to wait for a fleet to launch.")
+@click.option('--keep', is_flag=True, help="Leave the instances running against --base-url.")
+@click.option('--output', type=click.Path(dir_okay=False, path_type=Path),
+              help="Write results as JSON to this file.")
+def main(base_url: Optional[str], fleets, concurrency: int, requests: int, visits: int,
+         url: str, launch_timeout: float, keep: bool, output: Optional[Path]):
+    """以可配置的并发和实例规模压测实例与系统接口，报告延迟分位数、吞吐量和事件循环阻塞时间"""
+    fleets = list(fleets or (10, 50, 200))
+    server = workdir = None
+    if not base_url:
+        workdir = Path(tempfile.mkdtemp(prefix="load_bench_"))
+        click.echo("Starting a server on the simulated driver...", err=True)
+        server, base_url = start_server(workdir, max(fleets))
+    try:
+        results = asyncio.run(
+            run(base_url, fleets, concurrency, requests, visits, url, launch_timeout, keep)
+        )
+    finally:
+        if server:
+            server.terminate()
+            server.wait(timeout=30)
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    click.echo(format_table(results))
+    if output:
+        save_results(output, 'load', {
+            'base_url': None if server else base_url,
+            'driver': 'simulated' if server else 'server',
+            'fleets': fleets,
+            'concurrency': concurrency,
+            'requests': requests,
+            'visits': visits
+        }, results)
+        click.echo(f"Results written to {output}", err=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+# File: backend/benchmarks/micro.py
+"""
+Instance management micro-benchmarks.
+
+Builds fleets of the requested sizes in-process and times BrowserManager,
+WindowManager and ChromeProfileManager operations against them, together
+with how long each operation kept the event loop from running anything
+else. Runs on the simulated driver unless --chrome is given.
+
+Run from the backend directory:
+    python -m benchmarks.micro --fleet 10 --fleet 50 --output results/micro.json
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from pathlib import Path
+import asyncio
+import shutil
+import tempfile
+import time
+import click
+from loguru import logger
+
+from app.config import Config
+from app.browser import WindowManager
+from app.core.browser_manager import BrowserManager
+from app.core.loop_monitor import EventLoopMonitor
+from .reporting import format_table, save_results, summarize
+
+async def run_operation(monitor: EventLoopMonitor, calls: List[Callable[[], Awaitable[Any]]],
+                        concurrency: int) -> Dict[str, Any]:
+    """
+    Run calls with bounded concurrency and summarize them.
+
+    Args:
+        monitor: Monitor probing the running event loop
+        calls: Coroutine factories, one per call
+        concurrency: Calls in flight at once
+
+    Returns:
+        Dict[str, Any]: Latency summary with the event loop time blocked meanwhile
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    latencies: List[float] = []
+    errors = 0
+
+    async def timed(call: Callable[[], Awaitable[Any]]) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await call()
+            except Exception as e:
+                logger.debug(f"Benchmark call failed: {str(e)}")
+                errors += 1
+                return
+            # Operations report failure by returning False
+            if result is False:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - started)
+
+    # Let the probe observe the loop before the operation starts
+    await asyncio.sleep(monitor.interval * 2)
+    blocked, stalls = monitor.blocked_seconds, monitor.stalls
+    started = time.perf_counter()
+    await asyncio.gather(*(timed(call) for call in calls))
+    elapsed = time.perf_counter() - started
+    await asyncio.sleep(monitor.interval * 2)
+
+    summary = summarize(latencies, elapsed, errors)
+    summary['loop_blocked_ms'] = round((monitor.blocked_seconds - blocked) * 1000, 1)
+    summary['loop_stalls'] = monitor.stalls - stalls
+    return summary
+
+def in_executor(func: Callable, *args) -> Callable[[], Awaitable[Any]]:
+    """Call factory running a blocking function in the default executor, as the API does."""
+    return lambda: asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+def on_loop(func: Callable, *args) -> Callable[[], Awaitable[Any]]:
+    """Call factory running a blocking function directly on the event loop, as the API does."""
+    async def call():
+        return func(*args)
+    return call
+
+async def bench_fleet(manager: BrowserManager, monitor: EventLoopMonitor, fleet: int,
+                      iterations: int, concurrency: int, visits: int,
+                      url: str) -> Dict[str, Any]:
+    """
+    Benchmark every operation against one fleet size.
+
+    Args:
+        manager: Browser manager with background tasks running
+        monitor: Monitor probing the running event loop
+        fleet: Number of instances to run
+        iterations: Calls per read operation
+        concurrency: Read calls in flight at once
+        visits: Number of concurrent visits
+        url: URL visited
+
+    Returns:
+        Dict[str, Any]: Operation summaries for the fleet size
+    """
+    ids = [str(i) for i in range(1, fleet + 1)]
+    pick = [ids[i % fleet] for i in range(iterations)]
+    operations: Dict[str, Dict[str, Any]] = {}
+    click.echo(f"Fleet of {fleet}: creating instances...", err=True)
+
+    operations['manager.create_instance'] = await run_operation(
+        monitor, [in_executor(manager.create_instance, i) for i in ids], Config.LAUNCH_CONCURRENCY
+    )
+    operations['manager.get_instance_info'] = await run_operation(
+        monitor, [lambda i=i: manager.get_instance_info(i) for i in pick], concurrency
+    )
+    operations['manager.get_instance_info.fresh'] = await run_operation(
+        monitor, [lambda i=i: manager.get_instance_info(i, max_age=0) for i in pick], concurrency
+    )
+    operations['manager.get_all_instances'] = await run_operation(
+        monitor, [manager.get_all_instances for _ in range(iterations)], concurrency
+    )
+    operations['manager.get_system_stats'] = await run_operation(
+        monitor, [on_loop(manager.get_system_stats) for _ in range(iterations)], concurrency
+    )
+    operations['manager.visit_url'] = await run_operation(
+        monitor, [lambda i=i: manager.visit_url(i, url) for i in ids[:visits]], visits
+    )
+
+    driver = manager.chrome_processes[ids[0]]
+    operations['window.position_window'] = await run_operation(
+        monitor, [on_loop(WindowManager.position_window, driver, 1) for _ in range(iterations)], 1
+    )
+    operations['window.set_zoom_level'] = await run_operation(
+        monitor, [on_loop(WindowManager.set_zoom_level, driver, 90) for _ in range(iterations)], 1
+    )
+    operations['window.get_window_state'] = await run_operation(
+        monitor, [on_loop(WindowManager.get_window_state, driver) for _ in range(iterations)], 1
+    )
+
+    profiles = manager.driver_manager.profile_manager
+    operations['profiles.save_profile'] = await run_operation(
+        monitor, [in_executor(profiles.save_profile, i, {'bench': True}) for i in pick], concurrency
+    )
+    operations['profiles.get_profile_info'] = await run_operation(
+        monitor, [in_executor(profiles.get_profile_info, i) for i in pick], concurrency
+    )
+    operations['profiles.list_profiles'] = await run_operation(
+        monitor, [in_executor(profiles.list_profiles) for _ in range(iterations)], concurrency
+    )
+
+    click.echo(f"Fleet of {fleet}: deleting instances...", err=True)
+    operations['manager.delete_instance'] = await run_operation(
+        monitor, [in_executor(manager.delete_instance, i) for i in ids], Config.LAUNCH_CONCURRENCY
+    )
+    return {'fleet': fleet, 'operations': operations}
+
+async def run(fleets: List[int], iterations: int, concurrency: int, visits: int,
+              url: str) -> List[Dict[str, Any]]:
+    """Benchmark each fleet size in turn with one browser manager."""
+    manager = BrowserManager()
+    manager.start_background_tasks()
+    monitor = EventLoopMonitor(interval=0.01, stall_threshold=Config.LOOP_STALL_THRESHOLD)
+    monitor.start()
+    try:
+        return [
+            await bench_fleet(manager, monitor, fleet, iterations, concurrency,
+                              min(fleet, visits), url)
+            for fleet in fleets
+        ]
+    finally:
+        monitor.stop()
+        await asyncio.get_running_loop().run_in_executor(None, manager.cleanup)
+
+@click.command()
+@click.option('--fleet', 'fleets', multiple=True, type=int,
+              help="Fleet size to benchmark (repeatable; default 10, 50 and 200).")
+@click.option('--iterations', default=200, help="Calls per read operation.")
+@click.option('--concurrency', default=16, help="Read calls in flight at once.")
+@click.option('--visits', default=20, help="Concurrent visits per fleet (at most the fleet size).")
+@click.option('--url', default="https://example.com", help="URL visited.")
+@click.option('--chrome', is_flag=True, help="Launch real Chrome instead of the simulated driver.")
+@click.option('--launch-seconds', type=float, help="Simulated launch latency (default SIMULATED_LAUNCH_SECONDS).")
+@click.option('--navigation-seconds', type=float, help="Simulated navigation latency (default SIMULATED_NAVIGATION_SECONDS).")
+@click.option('--command-seconds', type=float, help="Simulated command latency (default SIMULATED_COMMAND_SECONDS).")
+@click.option('--output', type=click.Path(dir_okay=False, path_type=Path),
+              help="Write results as JSON to this file.")
+def main(fleets, iterations: int, concurrency: int, visits: int, url: str, chrome: bool,
+         launch_seconds: Optional[float], navigation_seconds: Optional[float],
+         command_seconds: Optional[float], output: Optional[Path]):
+    """测量实例管理、窗口管理和配置文件管理操作在不同实例规模下的延迟与事件循环阻塞"""
+    Config.initialize()
+    logger.remove()
+    fleets = list(fleets or (10, 50, 200))
+    Config.SIMULATED_DRIVER = not chrome
+    for name, value in (('SIMULATED_LAUNCH_SECONDS', launch_seconds),
+                        ('SIMULATED_NAVIGATION_SECONDS', navigation_seconds),
+                        ('SIMULATED_COMMAND_SECONDS', command_seconds)):
+        if value is not None:
+            setattr(Config, name, value)
+    # Isolate the run from real profiles and from services that would skew it
+    workdir = Path(tempfile.mkdtemp(prefix="micro_bench_"))
+    Config.PROFILES_DIR = workdir / "profiles"
+    Config.EPHEMERAL_PROFILES_DIR = workdir / "ephemeral"
+    Config.ADMISSION_ENABLED = False
+    Config.WARM_POOL_SIZE = 0
+    Config.PROFILE_TEMPLATE_ENABLED = False
+    Config.PROFILE_MAINTENANCE_INTERVAL = 0
+    Config.TASK_QUEUE_ENABLED = False
+    Config.CACHE_PROXY_ENABLED = False
+    try:
+        results = asyncio.run(run(fleets, iterations, concurrency, visits, url))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    click.echo(format_table(results))
+    if output:
+        save_results(output, 'micro', {
+            'fleets': fleets,
+            'iterations': iterations,
+            'concurrency': concurrency,
+            'visits': visits,
+            'driver': 'chrome' if chrome else 'simulated',
+            'simulated_latency': None if chrome else {
+                'launch': Config.SIMULATED_LAUNCH_SECONDS,
+                'navigation': Config.SIMULATED_NAVIGATION_SECONDS,
+                'command': Config.SIMULATED_COMMAND_SECONDS
+            },
+            'launch_concurrency': Config.LAUNCH_CONCURRENCY
+        }, results)
+        click.echo(f"Results written to {output}", err=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# File: backend/benchmarks/reporting.py
+"""
+Benchmark reporting helpers.
+
+Summarizes latency samples, stores results as JSON tagged with the code
+version they were measured on, and compares two result files.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+from datetime import datetime
+from pathlib import Path
+import json
+import platform
+import subprocess
+import sys
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+def percentile(sorted_samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    index = min(len(sorted_samples) - 1, max(0, int(round(fraction * len(sorted_samples))) - 1))
+    return sorted_samples[index]
+
+def summarize(samples: Iterable[float], elapsed: Optional[float] = None,
+              errors: int = 0) -> Dict[str, Any]:
+    """
+    Summarize latencies of one operation.
+
+    Args:
+        samples: Latencies in seconds of the successful calls
+        elapsed: Wall-clock seconds the calls took together, for throughput
+        errors: Number of failed calls
+
+    Returns:
+        Dict[str, Any]: Count, errors, throughput and latency percentiles in milliseconds
+    """
+    samples = sorted(samples)
+    summary: Dict[str, Any] = {'count': len(samples), 'errors': errors}
+    if elapsed:
+        summary['throughput'] = round(len(samples) / elapsed, 2)
+    if samples:
+        summary.update({
+            'mean_ms': round(sum(samples) / len(samples) * 1000, 3),
+            'p50_ms': round(percentile(samples, 0.50) * 1000, 3),
+            'p95_ms': round(percentile(samples, 0.95) * 1000, 3),
+            'p99_ms': round(percentile(samples, 0.99) * 1000, 3),
+            'max_ms': round(samples[-1] * 1000, 3)
+        })
+    return summary
+
+def code_version() -> Optional[str]:
+    """Commit the benchmark ran on, marked dirty if the tree has local changes."""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_DIR,
+            capture_output=True, text=True, timeout=10
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=no'], cwd=PROJECT_DIR,
+            capture_output=True, text=True, timeout=10
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return f"{commit}-dirty" if commit and dirty else commit or None
+
+def save_results(path: Path, benchmark: str, params: Dict[str, Any],
+                 results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Write results to a JSON file.
+
+    Args:
+        path: Output file
+        benchmark: Benchmark name
+        params: Options the benchmark ran with
+        results: One entry per fleet size, each with an operations mapping
+
+    Returns:
+        Dict[str, Any]: Document that was written
+    """
+    document = {
+        'benchmark': benchmark,
+        'version': code_version(),
+        'created_at': datetime.now().isoformat(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'params': params,
+        'results': results
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2))
+    return document
+
+def load_results(path: Path) -> Dict[str, Any]:
+    """Read a results file written by save_results."""
+    return json.loads(Path(path).read_text())
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            metric: str = 'p95_ms') -> List[Dict[str, Any]]:
+    """
+    Compare one latency metric between two result documents.
+
+    Args:
+        baseline: Earlier results
+        current: Later results
+        metric: Summary field to compare
+
+    Returns:
+        List[Dict[str, Any]]: Rows for every fleet size and operation present
+        in both, with the relative change (positive is slower)
+    """
+    earlier = {r['fleet']: r['operations'] for r in baseline['results']}
+    rows = []
+    for result in current['results']:
+        operations = earlier.get(result['fleet'], {})
+        for name, summary in result['operations'].items():
+            before = operations.get(name, {}).get(metric)
+            after = summary.get(metric)
+            if before is None or after is None:
+                continue
+            rows.append({
+                'fleet': result['fleet'],
+                'operation': name,
+                'baseline': before,
+                'current': after,
+                'change': round((after - before) / before, 3) if before else None
+            })
+    return rows
+
+def format_table(results: List[Dict[str, Any]]) -> str:
+    """Render results as a plain text table, one row per fleet size and operation."""
+    header = (f"{'fleet':>5} {'operation':<36} {'count':>6} {'err':>4} {'ops/s':>8} "
+              f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'blocked ms':>11}")
+    lines = [header, '-' * len(header)]
+    for result in results:
+        for name, s in result['operations'].items():
+            blocked = s.get('loop_blocked_ms')
+            lines.append(
+                f"{result['fleet']:>5} {name:<36} {s['count']:>6} {s['errors']:>4} "
+                f"{s.get('throughput', '-'):>8} {s.get('p50_ms', '-'):>9} {s.get('p95_ms', '-'):>9} "
+                f"{s.get('p99_ms', '-'):>9} {blocked if blocked is not None else '-':>11}"
+            )
+    return '\n'.join(lines)
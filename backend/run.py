@@ -1,3 +1,4 @@
+import os
 import uvicorn
 import click
 from pathlib import Path
@@ -7,9 +8,11 @@ from app.utils.logger import setup_logging
 @click.option('--host', default="127.0.0.1", help="Bind socket to this host.")
 @click.option('--port', default=8000, help="Bind socket to this port.")
 @click.option('--reload', is_flag=True, help="Enable auto-reload.")
-@click.option('--workers', default=1, help="Number of worker processes.")
+@click.option('--workers', default=1, help="Number of worker processes; each owns a shard of the instances.")
+@click.option('--agents', help="Comma-separated agent URLs; run as the cluster coordinator.")
+@click.option('--agent', 'agent', help="Run as cluster agent INDEX/COUNT, e.g. 0/3.")
 @click.option('--log-file', type=click.Path(), help="Log file path.")
-def main(host: str, port: int, reload: bool, workers: int, log_file: str):
+def main(host: str, port: int, reload: bool, workers: int, agents: str, agent: str, log_file: str):
     """启动 Lei Browser API 服务"""
     # 设置日志
     if log_file:
@@ -17,13 +20,31 @@ def main(host: str, port: int, reload: bool, workers: int, log_file: str):
     else:
         setup_logging()
 
+    # 集群协调节点：按容量把实例分配到各代理节点并转发请求
+    if agents:
+        os.environ['CLUSTER_AGENTS'] = agents
+        uvicorn.run("app.shard_router:app", host=host, port=port, log_level="info")
+        return
+
+    # 集群代理节点：拥有实例ID对 COUNT 取模等于 INDEX 的实例
+    if agent:
+        index, _, count = agent.partition('/')
+        if not (index.isdigit() and count.isdigit() and int(index) < int(count)):
+            raise click.BadParameter("expected INDEX/COUNT, e.g. 0/3", param_hint='--agent')
+        os.environ.update(SHARD_INDEX=index, SHARD_COUNT=count, CLUSTER_AGENT='true')
+
+    # 多进程时按实例ID分片：每个工作进程拥有一部分实例，由路由进程转发请求
+    if workers > 1 and not reload:
+        from app.core.sharding import run_cluster
+        run_cluster(host, port, workers)
+        return
+
     # 启动服务器
     uvicorn.run(
         "app.main:app",
         host=host,
         port=port,
         reload=reload,
-        workers=workers,
         log_level="info"
     )
 
@@ -0,0 +1,27 @@
+# File: backend/tests/conftest.py
+"""
+Shared test setup.
+Points every directory at a temporary location and runs instances on the
+simulated driver, so the suite needs neither Chrome nor the repository's
+own profile directory.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+_ROOT = tempfile.mkdtemp(prefix="lieb-tests-")
+os.environ['PROFILES_DIR'] = os.path.join(_ROOT, "profiles")
+os.environ['EPHEMERAL_PROFILES_DIR'] = os.path.join(_ROOT, "ephemeral")
+os.environ['SIMULATED_DRIVER'] = 'true'
+os.environ['SIMULATED_LAUNCH_SECONDS'] = '0'
+os.environ['SIMULATED_NAVIGATION_SECONDS'] = '0'
+os.environ['SIMULATED_COMMAND_SECONDS'] = '0'
+os.environ['PROFILE_TEMPLATE_ENABLED'] = 'false'
+os.environ['WARM_POOL_SIZE'] = '0'
+
+from app.config import Config  # noqa: E402
+
+Config.load_env()
+Config.LOG_DIR = Path(_ROOT) / "logs"
+Config.LOG_FILE = Config.LOG_DIR / "app.log"
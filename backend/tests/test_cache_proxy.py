@@ -0,0 +1,178 @@
+"""Tests of the caching proxy against a local origin server."""
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from app.config import Config
+from app.core.cache_proxy import CachingProxy
+from app.utils.content_store import ContentStore
+
+
+class _Origin(BaseHTTPRequestHandler):
+    """Origin whose responses depend on the request path."""
+
+    protocol_version = 'HTTP/1.1'
+    hits: Counter = Counter()
+    conditional: Counter = Counter()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        self.hits[path] += 1
+        headers = [('Cache-Control', 'max-age=60')]
+        body = f"body of {path}".encode()
+        if path == '/no-store':
+            headers = [('Cache-Control', 'no-store')]
+        elif path == '/private':
+            headers = [('Cache-Control', 'private, max-age=60')]
+        elif path == '/cookie':
+            headers = [('Cache-Control', 'public, max-age=60'), ('Set-Cookie', 'session=secret')]
+        elif path == '/etag':
+            headers = [('Cache-Control', 'max-age=0'), ('ETag', '"v1"')]
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.conditional[path] += 1
+                self.send_response(304)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.end_headers()
+                return
+        elif path == '/vary':
+            headers.append(('Vary', 'Accept-Language'))
+            body = self.headers.get('Accept-Language', '').encode()
+        elif path == '/slow':
+            time.sleep(0.5)
+        self.send_response(200)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def origin():
+    _Origin.hits.clear()
+    _Origin.conditional.clear()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Origin)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def proxy(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'CACHE_PROXY_DIR', str(tmp_path / "http_cache"))
+    proxy = CachingProxy()
+    proxy.start()
+    yield proxy
+    proxy.stop()
+
+
+@pytest.fixture
+def client(proxy):
+    with httpx.Client(proxies=proxy.proxy_url) as client:
+        yield client
+
+
+def test_miss_then_hit(origin, client):
+    first = client.get(origin + "/asset")
+    second = client.get(origin + "/asset")
+    assert first.headers['x-cache'] == 'MISS'
+    assert second.headers['x-cache'] == 'HIT'
+    assert second.content == first.content == b"body of /asset"
+    assert _Origin.hits['/asset'] == 1
+
+
+@pytest.mark.parametrize('path', ['/no-store', '/private'])
+def test_uncacheable_responses_are_not_stored(origin, client, proxy, path):
+    for _ in range(2):
+        assert client.get(origin + path).headers['x-cache'] == 'MISS'
+    assert _Origin.hits[path] == 2
+    assert proxy.get_stats()['entries'] == 0
+
+
+def test_set_cookie_is_never_replayed(origin, client):
+    first = client.get(origin + "/cookie")
+    second = client.get(origin + "/cookie")
+    assert first.headers['set-cookie'] == 'session=secret'
+    assert second.headers['x-cache'] == 'HIT'
+    assert 'set-cookie' not in second.headers
+
+
+def test_requests_with_cookies_are_not_shared(origin, client):
+    for _ in range(2):
+        response = client.get(origin + "/asset", headers={'Cookie': 'session=secret'})
+        assert response.headers['x-cache'] == 'MISS'
+    assert _Origin.hits['/asset'] == 2
+
+
+def test_stale_response_is_revalidated(origin, client, proxy):
+    first = client.get(origin + "/etag")
+    second = client.get(origin + "/etag")
+    assert first.headers['x-cache'] == 'MISS'
+    assert second.status_code == 200
+    assert second.headers['x-cache'] == 'HIT'
+    assert second.content == b"body of /etag"
+    assert _Origin.conditional['/etag'] == 1
+    assert proxy.get_stats()['revalidated'] == 1
+
+
+def test_browser_validators_get_not_modified(origin, client):
+    client.get(origin + "/asset")
+    response = client.get(origin + "/asset", headers={'If-None-Match': '"unknown"'})
+    assert response.status_code == 200
+    client.get(origin + "/etag")
+    response = client.get(origin + "/etag", headers={'If-None-Match': '"v1"'})
+    assert response.status_code == 304
+
+
+def test_vary_selects_variants(origin, client):
+    english = client.get(origin + "/vary", headers={'Accept-Language': 'en'})
+    french = client.get(origin + "/vary", headers={'Accept-Language': 'fr'})
+    again = client.get(origin + "/vary", headers={'Accept-Language': 'en'})
+    assert (english.content, french.content, again.content) == (b"en", b"fr", b"en")
+    assert french.headers['x-cache'] == 'MISS'
+    assert again.headers['x-cache'] == 'HIT'
+    assert _Origin.hits['/vary'] == 2
+
+
+def test_concurrent_misses_are_coalesced(origin, proxy):
+    async def fetch_all():
+        async with httpx.AsyncClient(proxies=proxy.proxy_url) as client:
+            return await asyncio.gather(*(client.get(origin + "/slow") for _ in range(5)))
+
+    responses = asyncio.run(fetch_all())
+    assert all(r.content == b"body of /slow" for r in responses)
+    assert _Origin.hits['/slow'] == 1
+    assert proxy.get_stats()['coalesced'] == 4
+
+
+def _put(store: ContentStore, url: str, size: int) -> int:
+    now = time.time()
+    return store.put(url, {}, [], 200, [('Cache-Control', 'max-age=60')], b'x' * size,
+                     now, now + 60, False)
+
+
+def test_store_evicts_least_recently_used(tmp_path):
+    store = ContentStore(tmp_path, max_bytes=250)
+    _put(store, 'http://a/1', 100)
+    time.sleep(0.01)
+    _put(store, 'http://a/2', 100)
+    time.sleep(0.01)
+    # Reading the first entry makes the second the least recently used
+    assert store.read_body(store.lookup('http://a/1', {})) == b'x' * 100
+    time.sleep(0.01)
+    assert _put(store, 'http://a/3', 100) == 1
+    assert store.lookup('http://a/2', {}) is None
+    assert store.lookup('http://a/1', {}) is not None
+    assert store.lookup('http://a/3', {}) is not None
+    assert store.total_bytes() == 200
@@ -0,0 +1,78 @@
+"""Tests of the per-instance command worker."""
+
+from concurrent.futures import CancelledError, wait
+import asyncio
+import threading
+
+import pytest
+
+from app.core.instance_worker import InstanceWorker
+
+
+def test_commands_run_in_order_on_the_worker_thread():
+    worker = InstanceWorker('1')
+    worker.start()
+    seen = []
+
+    async def async_command(value):
+        await asyncio.sleep(0)
+        seen.append((value, worker.on_worker_thread))
+        return value
+
+    futures = [worker.submit(seen.append, 0), worker.submit(async_command, 1)]
+    assert futures[1].result(5) == 1
+    worker.stop()
+    assert seen == [0, (1, True)]
+    assert worker.commands_run == 2
+    assert not worker.busy
+
+
+def test_submit_after_stop_fails():
+    worker = InstanceWorker('1')
+    worker.start()
+    worker.stop()
+    with pytest.raises(RuntimeError):
+        worker.submit(lambda: None).result(1)
+    assert worker.pending == 0
+
+
+def test_submit_racing_stop_always_resolves():
+    for _ in range(20):
+        worker = InstanceWorker('1')
+        worker.start()
+        futures = []
+        go = threading.Event()
+
+        def submitter():
+            go.wait()
+            for _ in range(200):
+                futures.append(worker.submit(lambda: None))
+
+        threads = [threading.Thread(target=submitter) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        go.set()
+        worker.stop(wait=False)
+        for thread in threads:
+            thread.join()
+        done, not_done = wait(futures, timeout=10)
+        assert not not_done
+        for future in done:
+            try:
+                future.result()
+            except (RuntimeError, CancelledError):
+                pass
+        worker.stop()
+        assert worker.pending == 0
+
+
+def test_submit_after_loop_closed_fails_without_leaking():
+    worker = InstanceWorker('1')
+    worker.start()
+    # Stop the loop behind the worker's back, as if its thread had died
+    worker.loop.call_soon_threadsafe(worker.loop.stop)
+    worker._thread.join(5)
+    assert worker.loop.is_closed()
+    with pytest.raises(RuntimeError):
+        worker.submit(lambda: None).result(1)
+    assert worker.pending == 0
@@ -0,0 +1,88 @@
+"""Tests of background launch jobs, run on the simulated driver."""
+
+import time
+
+import pytest
+
+from app.config import Config
+from app.core.admission import AdmissionRejected
+from app.core.browser_manager import BrowserManager
+
+
+@pytest.fixture
+def manager():
+    manager = BrowserManager()
+    yield manager
+    manager.cleanup()
+
+
+def _wait(jobs, job_id, timeout=10):
+    """Poll a job until it finishes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = jobs.get_job(job_id)
+        if job['finished_at']:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Launch job {job_id} did not finish")
+
+
+def test_job_launches_every_instance(manager):
+    jobs = manager.launch_jobs
+    job = jobs.submit(2)
+    assert len(job['instances']) == 2
+    done = _wait(jobs, job['job_id'])
+    assert done['status'] == 'completed'
+    assert all(item['status'] == 'running' and item['duration'] is not None
+               for item in done['instances'])
+    assert set(manager.chrome_processes) == {item['instance_id'] for item in done['instances']}
+    assert jobs.pending_instance_ids() == []
+
+
+def test_snapshots_are_copies(manager):
+    jobs = manager.launch_jobs
+    job = jobs.submit(1)
+    done = _wait(jobs, job['job_id'])
+    # The first snapshot is frozen at submission
+    assert job['finished_at'] is None
+    assert done['version'] > job['version']
+    done['status'] = 'tampered'
+    done['instances'][0]['status'] = 'tampered'
+    again = jobs.get_job(job['job_id'])
+    assert again['status'] == 'completed'
+    assert again['instances'][0]['status'] == 'running'
+
+
+def test_failures_are_reported_per_instance(manager, monkeypatch):
+    launched = []
+
+    def create_instance(instance_id, **options):
+        launched.append(instance_id)
+        if len(launched) == 2:
+            raise AdmissionRejected("Not enough memory", retry_after=5)
+        return True
+
+    monkeypatch.setattr(Config, 'LAUNCH_CONCURRENCY', 1)
+    monkeypatch.setattr(manager, 'create_instance', create_instance)
+    job = _wait(manager.launch_jobs, manager.launch_jobs.submit(2)['job_id'])
+    assert job['status'] == 'partial'
+    first, second = job['instances']
+    assert (first['status'], first['error']) == ('running', None)
+    assert (second['status'], second['error'], second['retry_after']) == ('failed', "Not enough memory", 5)
+
+
+def test_job_fails_when_no_instance_starts(manager, monkeypatch):
+    monkeypatch.setattr(manager, 'create_instance', lambda instance_id, **options: False)
+    job = _wait(manager.launch_jobs, manager.launch_jobs.submit(1)['job_id'])
+    assert job['status'] == 'failed'
+    assert job['instances'][0]['error'] == f"Failed to create instance {job['instances'][0]['instance_id']}"
+
+
+def test_history_keeps_newest_finished_jobs(manager, monkeypatch):
+    monkeypatch.setattr(Config, 'LAUNCH_JOB_HISTORY', 2)
+    monkeypatch.setattr(manager, 'create_instance', lambda instance_id, **options: True)
+    jobs = manager.launch_jobs
+    job_ids = [_wait(jobs, jobs.submit(1)['job_id'])['job_id'] for _ in range(3)]
+    assert jobs.get_job(job_ids[0]) is None
+    assert [job['job_id'] for job in jobs.list_jobs()] == job_ids[:0:-1]
+    assert jobs.get_job("unknown") is None
@@ -0,0 +1,58 @@
+"""Tests of the event loop lag monitor."""
+
+import asyncio
+import time
+
+from app.core.loop_monitor import EventLoopMonitor
+
+
+def test_record_accumulates_lag_and_stalls():
+    monitor = EventLoopMonitor(interval=0.1, stall_threshold=0.05)
+    for lag in (0.01, 0.05, 0.2, 0.0):
+        monitor.record(lag)
+    stats = monitor.get_stats()
+    assert stats['probes'] == 4
+    assert stats['blocked_seconds'] == 0.26
+    assert stats['stalls'] == 2
+    assert stats['max_lag_ms'] == 200.0
+    assert stats['lag_p50_ms'] == 50.0
+    assert stats['lag_p99_ms'] == 200.0
+    assert not stats['running']
+
+
+def test_percentiles_cover_only_the_recent_window():
+    monitor = EventLoopMonitor(interval=0.1, stall_threshold=1, window=3)
+    for lag in (0.5, 0.001, 0.002, 0.003):
+        monitor.record(lag)
+    stats = monitor.get_stats()
+    assert stats['lag_p99_ms'] == 3.0
+    # Cumulative totals still include the lag that left the window
+    assert stats['max_lag_ms'] == 500.0
+    assert stats['probes'] == 4
+
+
+def test_reset_clears_measurements():
+    monitor = EventLoopMonitor(interval=0.1, stall_threshold=0.05)
+    monitor.record(0.1)
+    monitor.reset()
+    stats = monitor.get_stats()
+    assert (stats['probes'], stats['stalls'], stats['blocked_seconds']) == (0, 0, 0)
+    assert stats['lag_p50_ms'] is None
+
+
+def test_running_monitor_measures_a_blocked_loop():
+    monitor = EventLoopMonitor(interval=0.01, stall_threshold=0.05)
+
+    async def block():
+        monitor.start()
+        await asyncio.sleep(0.05)
+        time.sleep(0.2)
+        await asyncio.sleep(0.05)
+        running = monitor.running
+        monitor.stop()
+        return running
+
+    assert asyncio.run(block())
+    stats = monitor.get_stats()
+    assert stats['stalls'] >= 1
+    assert stats['max_lag_ms'] >= 150
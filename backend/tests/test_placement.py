@@ -0,0 +1,49 @@
+"""Tests of capacity-aware placement across cluster agents."""
+
+from app.core import placement
+
+
+def _report(headroom, instances=0, launch_queue=0):
+    return {'headroom': headroom, 'instances': instances, 'launch_queue': launch_queue}
+
+
+def test_plan_prefers_memory_headroom():
+    plan = placement.plan_placement({0: _report(1), 1: _report(5)}, 4)
+    assert plan == {1: 4}
+
+
+def test_plan_spreads_once_headroom_evens_out():
+    plan = placement.plan_placement({0: _report(1), 1: _report(5)}, 6)
+    assert plan == {1: 5, 0: 1}
+
+
+def test_plan_breaks_ties_by_instances_then_queue():
+    capacities = {0: _report(2, instances=3), 1: _report(2, instances=1), 2: _report(2, instances=1, launch_queue=2)}
+    assert placement.plan_placement(capacities, 1) == {1: 1}
+
+
+def test_plan_places_everything_without_headroom():
+    plan = placement.plan_placement({0: _report(0), 1: _report(0, instances=2)}, 3)
+    assert sum(plan.values()) == 3
+    assert plan[0] >= plan.get(1, 0)
+
+
+def test_plan_leaves_reports_untouched():
+    capacities = {0: _report(3)}
+    placement.plan_placement(capacities, 2)
+    assert capacities == {0: _report(3)}
+
+
+def test_charge_applies_plan():
+    capacities = {0: _report(3, instances=1), 1: _report(1)}
+    placement.charge(capacities, {0: 2, 1: 2, 5: 1})
+    assert capacities[0] == _report(1, instances=3, launch_queue=2)
+    # Headroom never goes negative and unknown shards are ignored
+    assert capacities[1] == _report(0, instances=2, launch_queue=2)
+    assert 5 not in capacities
+
+
+def test_fallback_order_skips_excluded_and_ranks_best_first():
+    capacities = {0: _report(1), 1: _report(4, instances=2), 2: _report(4), 3: _report(9)}
+    assert placement.fallback_order(capacities, [3]) == [2, 1, 0]
+    assert placement.fallback_order(capacities, [0, 1, 2, 3]) == []
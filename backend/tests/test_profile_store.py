@@ -0,0 +1,76 @@
+"""Tests of the SQLite profile state store."""
+
+import threading
+
+import pytest
+
+from app.utils.profile_store import ProfileStateStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ProfileStateStore(tmp_path / "profiles.db")
+    yield store
+    store.close()
+
+
+def test_put_get_and_delete(store):
+    assert store.get('1') is None
+    store.put('1', {'status': 'active', 'url': "https://a/"})
+    assert store.get(1) == {'status': 'active', 'url': "https://a/"}
+    assert store.ids() == ['1']
+    assert store.count() == 1
+    assert store.delete('1')
+    assert not store.delete('1')
+    assert store.all() == {}
+
+
+def test_update_merges_and_removes_fields(store):
+    store.put('1', {'status': 'active', 'url': "https://a/", 'title': 'A'})
+    state = store.update('1', url="https://b/", title=None)
+    assert state == {'status': 'active', 'url': "https://b/"}
+    assert store.get('1') == state
+
+
+def test_update_of_unknown_profile_starts_from_defaults(store):
+    state = store.update('1', defaults={'status': 'new', 'created_at': 't0'}, last_used='t1')
+    assert state == {'status': 'new', 'created_at': 't0', 'last_used': 't1'}
+    # Defaults only apply when the profile does not exist yet
+    assert store.update('1', defaults={'status': 'other'})['status'] == 'new'
+
+
+def test_query_by_status_and_last_use(store):
+    store.import_states({
+        'a': {'status': 'inactive', 'last_used': '2024-01-03'},
+        'b': {'status': 'inactive', 'last_used': '2024-01-01'},
+        'c': {'status': 'active', 'last_used': '2024-01-02'},
+        'd': {'status': 'inactive'},
+    })
+    assert list(store.query(status='inactive', last_used_before='2024-01-05')) == ['b', 'a']
+    assert list(store.query(last_used_before='2024-01-03')) == ['b', 'c']
+    assert list(store.query(status='inactive', last_used_before='2024-01-05', limit=1)) == ['b']
+    assert set(store.query(status='inactive')) == {'a', 'b', 'd'}
+
+
+def test_state_is_shared_between_instances(store, tmp_path):
+    store.put('1', {'status': 'active'})
+    other = ProfileStateStore(tmp_path / "profiles.db")
+    try:
+        assert other.get('1') == {'status': 'active'}
+    finally:
+        other.close()
+
+
+def test_concurrent_updates_are_not_lost(store):
+    store.put('1', {})
+
+    def writer(key):
+        for i in range(20):
+            store.update('1', **{f"{key}{i}": i})
+
+    threads = [threading.Thread(target=writer, args=(key,)) for key in 'abcd']
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(store.get('1')) == 80
@@ -0,0 +1,84 @@
+"""Tests of building and cloning the profile template."""
+
+import pytest
+
+from app.config import Config
+from app.utils.profile_template import ProfileTemplate
+
+
+class _Driver:
+    def get(self, url):
+        pass
+
+    def quit(self):
+        pass
+
+
+def _launcher(files):
+    """Launch callable writing the given first-run files into the profile."""
+    def launch(profile_name):
+        profile = Config.PROFILES_DIR / profile_name
+        for relative, content in files.items():
+            (profile / relative).parent.mkdir(parents=True, exist_ok=True)
+            (profile / relative).write_text(content)
+        return _Driver()
+    return launch
+
+
+@pytest.fixture
+def template(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'PROFILES_DIR', tmp_path)
+    return ProfileTemplate()
+
+
+def test_clone_copies_template_without_volatile_files(template, tmp_path):
+    assert template.build(_launcher({
+        'Local State': 'state', 'Default/Preferences': 'prefs',
+        'SingletonLock': 'lock', 'Default/Cache/data': 'cache'
+    }), settle_time=0)
+    target = tmp_path / "profile_1"
+    assert template.clone_into(target)
+    assert (target / "Local State").read_text() == 'state'
+    assert (target / "Default" / "Preferences").read_text() == 'prefs'
+    assert not (target / "SingletonLock").exists()
+    assert not (target / "Default" / "Cache").exists()
+    assert not (target / ProfileTemplate.MARKER).exists()
+
+
+def test_clone_leaves_existing_profiles_alone(template, tmp_path):
+    template.build(_launcher({'Local State': 'state'}), settle_time=0)
+    target = tmp_path / "profile_1"
+    target.mkdir()
+    (target / "Local State").write_text('mine')
+    assert not template.clone_into(target)
+    assert (target / "Local State").read_text() == 'mine'
+
+
+def test_clone_without_template_does_nothing(template, tmp_path):
+    assert not template.clone_into(tmp_path / "profile_1")
+
+
+def test_rebuild_swaps_template_and_removes_the_old_one(template, tmp_path):
+    template.build(_launcher({'old': 'v1'}), settle_time=0)
+    template.build(_launcher({'new': 'v2'}), settle_time=0)
+    assert (template.path / "new").exists()
+    assert not (template.path / "old").exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['_template']
+
+
+def test_clone_restarts_when_template_is_rebuilt_underneath(template, tmp_path, monkeypatch):
+    template.build(_launcher({'a': 'v1', 'b': 'v1', 'c': 'v1'}), settle_time=0)
+    clone_file = template._clone_file
+    rebuilt = []
+
+    def clone_during_rebuild(source, target, device):
+        if not rebuilt:
+            rebuilt.append(True)
+            template.build(_launcher({'a': 'v2', 'd': 'v2'}), settle_time=0)
+        return clone_file(source, target, device)
+
+    monkeypatch.setattr(template, '_clone_file', clone_during_rebuild)
+    target = tmp_path / "profile_1"
+    assert template.clone_into(target)
+    assert sorted(p.name for p in target.iterdir()) == ['a', 'd']
+    assert (target / "a").read_text() == 'v2'
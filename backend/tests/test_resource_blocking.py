@@ -0,0 +1,79 @@
+"""Tests of resource policy normalization and the WebDriver URL patterns."""
+
+import re
+
+import pytest
+
+from app.browser import resource_blocking
+from app.browser.resource_blocking import blocks_anything, extension_patterns, normalize_policy
+
+
+def _blocked(url, patterns):
+    """Match a URL the way Network.setBlockedURLs does, where only * is a wildcard."""
+    return any(
+        re.fullmatch('.*'.join(re.escape(part) for part in pattern.split('*')), url)
+        for pattern in patterns
+    )
+
+
+def test_no_policy_stays_none():
+    assert normalize_policy(None) is None
+    assert not blocks_anything(None)
+
+
+def test_preset_is_expanded_and_extended():
+    policy = normalize_policy({
+        'preset': 'media', 'block_types': ['script'], 'block_patterns': ['*://ads.test/*']
+    })
+    assert policy == {
+        'preset': 'media',
+        'block_types': ['Image', 'Media', 'Font', 'Script'],
+        'block_patterns': ['*://ads.test/*'],
+        'allow_patterns': []
+    }
+    assert blocks_anything(policy)
+
+
+def test_types_are_case_insensitive_and_deduplicated():
+    policy = normalize_policy({
+        'preset': 'media', 'block_types': ['IMAGE', 'xhr', 'Xhr'],
+        'allow_patterns': ['*://cdn.test/*', '*://cdn.test/*']
+    })
+    assert policy['block_types'] == ['Image', 'Media', 'Font', 'XHR']
+    assert policy['allow_patterns'] == ['*://cdn.test/*']
+
+
+def test_tracker_patterns_are_not_repeated():
+    pattern = resource_blocking.TRACKER_PATTERNS[0]
+    policy = normalize_policy({'preset': 'dom', 'block_patterns': [pattern]})
+    assert policy['block_patterns'] == resource_blocking.TRACKER_PATTERNS
+
+
+def test_empty_policy_blocks_nothing():
+    policy = normalize_policy({'allow_patterns': ['*']})
+    assert policy['preset'] is None
+    assert not blocks_anything(policy)
+
+
+@pytest.mark.parametrize('policy', [
+    {'preset': 'everything'},
+    {'block_types': ['Document']},
+    {'block_types': ['Images']},
+])
+def test_unknown_preset_or_type_is_rejected(policy):
+    with pytest.raises(ValueError):
+        normalize_policy(policy)
+
+
+def test_extension_patterns_match_the_end_of_the_path():
+    patterns = extension_patterns('Media')
+    assert _blocked("https://cdn.test/clip.webm", patterns)
+    assert _blocked("https://cdn.test/clip.webm?v=2", patterns)
+    assert _blocked("https://cdn.test/clip.webm#t=10", patterns)
+    assert not _blocked("https://www.webmd.com/", patterns)
+    assert not _blocked("https://cdn.test/clip.webmanifest", patterns)
+    assert not _blocked("https://cdn.test/mp3s/index.html", patterns)
+
+
+def test_extension_patterns_of_types_without_extensions():
+    assert extension_patterns('XHR') == []
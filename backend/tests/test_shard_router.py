@@ -0,0 +1,153 @@
+"""Tests of the coordinator's routing and merging against stubbed agents."""
+
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import Config
+from app import shard_router
+
+API = "/api/v1"
+
+
+class _Agents:
+    """Two stub agents answering on http://agent0 and http://agent1."""
+
+    def __init__(self):
+        self.down = set()
+        self.refuse = set()
+        self.capacity = {0: {'headroom': 4, 'instances': 0, 'launch_queue': 0},
+                         1: {'headroom': 4, 'instances': 0, 'launch_queue': 0}}
+        self.stats = {
+            0: {'cpu_usage': 10.0, 'memory_usage': 40.0, 'disk_usage': 50.0,
+                'total_instances': 3, 'running_instances': 2},
+            1: {'cpu_usage': 30.0, 'memory_usage': 60.0, 'disk_usage': 50.0,
+                'total_instances': 5, 'running_instances': 5},
+        }
+        self.calls = []
+        self.launches = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        shard = int(request.url.host[len("agent"):])
+        path = request.url.path
+        if shard in self.down:
+            raise httpx.ConnectError("agent is down", request=request)
+        self.calls.append((shard, request.method, path))
+        body = json.loads(request.content) if request.content else None
+        if path == f"{API}/system/capacity":
+            return httpx.Response(200, json=self.capacity[shard])
+        if path == f"{API}/system/stats":
+            return httpx.Response(200, json=self.stats[shard])
+        if path == f"{API}/browser/instances" and request.method == "POST":
+            if shard in self.refuse:
+                return httpx.Response(503, json={'detail': "No memory left"})
+            self.launches.append((shard, body))
+            return httpx.Response(202, json={
+                'job_id': f"s{shard}-job", 'status': 'pending', 'created_at': f"t{shard}",
+                'finished_at': None, 'instances': [{'status': 'pending'}] * body['count']
+            })
+        if path == f"{API}/browser/instances/batch":
+            return httpx.Response(200, json=[{'instance_id': i, 'success': True} for i in body])
+        # Streamed, as the catch-all proxy relays the raw body
+        content = json.dumps({'shard': shard, 'path': path}).encode()
+        return httpx.Response(200, headers={'Content-Type': 'application/json'},
+                              stream=httpx.ByteStream(content))
+
+
+@pytest.fixture
+def agents():
+    return _Agents()
+
+
+@pytest.fixture
+def client(agents, monkeypatch):
+    monkeypatch.setattr(Config, 'CLUSTER_AGENTS', ["http://agent0", "http://agent1"])
+    monkeypatch.setattr(Config, 'SHARD_COUNT', 2)
+    monkeypatch.setattr(Config, 'CLUSTER_CAPACITY_TTL', 0)
+    with TestClient(shard_router.app) as client:
+        state = shard_router.app.state
+        client.portal.call(state.client.aclose)
+        state.client = httpx.AsyncClient(transport=httpx.MockTransport(agents.handle))
+        yield client
+
+
+def test_instance_requests_go_to_the_owning_agent(client):
+    assert client.get(f"{API}/browser/instances/3/screenshot").json()['shard'] == 1
+    assert client.get(f"{API}/browser/instances/4/screenshot").json()['shard'] == 0
+
+
+def test_other_requests_go_to_shard_zero_unless_named(client):
+    assert client.get(f"{API}/profiles").json()['shard'] == 0
+    response = client.get(f"{API}/profiles", params={'shard': 1})
+    assert response.json() == {'shard': 1, 'path': f"{API}/profiles"}
+
+
+def test_system_stats_merges_agents(client):
+    response = client.get(f"{API}/system/stats")
+    assert response.status_code == 200
+    assert 'x-unavailable-shards' not in response.headers
+    assert response.json() == {
+        'cpu_usage': 20.0, 'memory_usage': 50.0, 'disk_usage': 50.0,
+        'total_instances': 8, 'running_instances': 7, 'unavailable_shards': []
+    }
+
+
+def test_system_stats_leaves_out_unreachable_agent(client, agents):
+    agents.down.add(1)
+    response = client.get(f"{API}/system/stats")
+    assert response.status_code == 200
+    assert response.headers['x-unavailable-shards'] == '1'
+    stats = response.json()
+    assert stats['total_instances'] == 3
+    assert stats['cpu_usage'] == 10.0
+    assert stats['unavailable_shards'] == [1]
+
+
+def test_system_stats_without_any_agent(client, agents):
+    agents.down.update({0, 1})
+    assert client.get(f"{API}/system/stats").status_code == 502
+
+
+def test_create_instances_follows_capacity(client, agents):
+    agents.capacity[0]['headroom'] = 1
+    agents.capacity[1]['headroom'] = 5
+    response = client.post(f"{API}/browser/instances", json={'count': 6})
+    assert response.status_code == 202
+    job = response.json()
+    assert sorted(job['job_id'].split('+')) == ["s0-job", "s1-job"]
+    assert len(job['instances']) == 6
+    assert sorted((shard, body['count']) for shard, body in agents.launches) == [(0, 1), (1, 5)]
+
+
+def test_create_instances_falls_back_when_an_agent_refuses(client, agents):
+    agents.capacity[1]['headroom'] = 8
+    agents.refuse.add(1)
+    response = client.post(f"{API}/browser/instances", json={'count': 2})
+    assert response.status_code == 202
+    assert response.json()['job_id'] == "s0-job"
+
+
+def test_batch_keeps_results_of_healthy_agents(client, agents):
+    agents.down.add(1)
+    response = client.request("DELETE", f"{API}/browser/instances/batch", json=['1', '2', '3', '4'])
+    assert response.status_code == 200
+    assert response.headers['x-unavailable-shards'] == '1'
+    results = response.json()
+    assert [r['instance_id'] for r in results] == ['1', '2', '3', '4']
+    assert [r['success'] for r in results] == [False, True, False, True]
+    assert 'Shard 1 unavailable' in results[0]['error']
+
+
+@pytest.mark.parametrize('count', ["abc", None, "1.5", 0, 51])
+def test_create_instances_rejects_invalid_count(client, agents, count):
+    response = client.post(f"{API}/browser/instances", json={'count': count})
+    assert response.status_code == 422
+    assert not agents.launches
+
+
+def test_create_instances_forwards_the_request(client, agents):
+    request = {'count': 1, 'ephemeral': True, 'resource_policy': {'preset': 'media'}}
+    assert client.post(f"{API}/browser/instances", json=request).status_code == 202
+    assert [body for _, body in agents.launches] == [request]
@@ -0,0 +1,51 @@
+"""Tests of the instance state cache and the changes it reports."""
+
+import asyncio
+
+from app.core.state_cache import InstanceStateCache
+
+
+def _cache(loaded):
+    changes = []
+
+    async def loader(instance_id):
+        return dict(loaded, id=instance_id)
+
+    cache = InstanceStateCache(loader, on_change=lambda i, c: changes.append((i, c)))
+    return cache, changes
+
+
+def test_update_of_uncached_instance_is_ignored():
+    cache, changes = _cache({'url': 'https://a/'})
+    cache.update('1', url='https://b/')
+    assert cache.snapshot() == {}
+    assert changes == []
+
+
+def test_seeded_instance_reports_updates_and_reloads_on_read():
+    cache, changes = _cache({'url': 'https://loaded/', 'title': 'Loaded'})
+    cache.seed('1', {'id': '1', 'url': None, 'title': None})
+    assert changes == []
+    cache.update('1', url='https://b/', title='B')
+    assert changes == [('1', {'url': 'https://b/', 'title': 'B'})]
+    assert cache.snapshot()['1']['url'] == 'https://b/'
+    # A seeded entry is stale, so a read goes to the loader
+    assert asyncio.run(cache.get('1', max_age=60))['url'] == 'https://loaded/'
+
+
+def test_invalidated_instance_still_reports_updates():
+    cache, changes = _cache({'url': 'https://loaded/'})
+    asyncio.run(cache.refresh('1'))
+    changes.clear()
+    cache.invalidate('1')
+    assert cache.age('1') == float('inf')
+    cache.update('1', url='https://next/')
+    assert changes == [('1', {'url': 'https://next/'})]
+
+
+def test_dict_fields_are_merged():
+    cache, changes = _cache({})
+    cache.seed('1', {'window_state': {'zoom_level': 100, 'width': 800}})
+    cache.update('1', window_state={'zoom_level': 150})
+    assert cache.snapshot()['1']['window_state'] == {'zoom_level': 150, 'width': 800}
+    assert changes == [('1', {'window_state': {'zoom_level': 150, 'width': 800}})]
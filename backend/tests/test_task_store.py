@@ -0,0 +1,123 @@
+"""Tests of the SQLite task queue."""
+
+import time
+
+import pytest
+
+from app.utils.task_store import TaskStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TaskStore(tmp_path / "tasks.db")
+    yield store
+    store.close()
+
+
+def _task(url, **fields):
+    return dict({'url': url, 'max_attempts': 3, 'retry_delay': 0}, **fields)
+
+
+def test_claim_takes_highest_priority_then_oldest(store):
+    store.add([_task("https://a/"), _task("https://b/", priority=5), _task("https://c/", priority=5)])
+    claimed = [store.claim('1', 'w')['url'] for _ in range(3)]
+    assert claimed == ["https://b/", "https://c/", "https://a/"]
+    assert store.claim('1', 'w') is None
+
+
+def test_claim_marks_task_running(store):
+    task_id, = store.add([_task("https://a/")])
+    task = store.claim('1', 'w')
+    assert task['task_id'] == task_id
+    assert task['attempts'] == 1
+    stored = store.get(task_id)
+    assert stored['status'] == 'running'
+    assert stored['assigned_instance'] == '1'
+    assert stored['claimed_by'] == 'w'
+    assert store.counts() == {'running': 1}
+
+
+def test_pinned_tasks_go_only_to_their_instance(store):
+    store.add([_task("https://pinned/", instance_id='2', priority=9), _task("https://any/")])
+    assert store.claim('1', 'w', pinned_only=True) is None
+    assert store.claim('1', 'w')['url'] == "https://any/"
+    assert store.claim('1', 'w') is None
+    assert store.pinned_instances() == ['2']
+    assert store.claim('2', 'w', pinned_only=True)['url'] == "https://pinned/"
+
+
+def test_finish_success(store):
+    task_id, = store.add([_task("https://a/")])
+    assert store.finish(store.claim('1', 'w'), True, 1.23456) == 'succeeded'
+    task = store.get(task_id)
+    assert task['status'] == 'succeeded'
+    assert task['elapsed'] == 1.235
+    assert task['finished_at'] is not None
+
+
+def test_failed_attempts_are_retried_with_backoff(store):
+    task_id, = store.add([_task("https://a/", retry_delay=10)])
+    before = time.time()
+    assert store.finish(store.claim('1', 'w'), False, 0.1, error='boom') == 'queued'
+    task = store.get(task_id)
+    assert task['error'] == 'boom'
+    assert task['finished_at'] is None
+    assert task['not_before'] is not None
+    # Not ready again until the backoff has passed
+    assert store.claim('1', 'w') is None
+    assert store.ready_count() == 0
+    row = store._conn.execute('SELECT not_before FROM tasks WHERE task_id = ?', (task_id,)).fetchone()
+    assert before + 10 <= row[0] <= time.time() + 10
+
+
+def test_backoff_doubles_per_attempt(store):
+    task_id, = store.add([_task("https://a/", retry_delay=10)])
+    task = store.claim('1', 'w')
+    task['attempts'] = 2
+    before = time.time()
+    store.finish(task, False, 0.1)
+    row = store._conn.execute('SELECT not_before FROM tasks WHERE task_id = ?', (task_id,)).fetchone()
+    assert before + 20 <= row[0] <= time.time() + 20
+
+
+def test_task_fails_after_last_attempt(store):
+    task_id, = store.add([_task("https://a/", max_attempts=2)])
+    assert store.finish(store.claim('1', 'w'), False, 0.1) == 'queued'
+    assert store.finish(store.claim('1', 'w'), False, 0.1, error='still broken') == 'failed'
+    task = store.get(task_id)
+    assert task['attempts'] == 2
+    assert task['error'] == 'still broken'
+    assert store.claim('1', 'w') is None
+
+
+def test_failure_past_deadline_expires(store):
+    task_id, = store.add([_task("https://a/", deadline=time.time() + 60)])
+    task = store.claim('1', 'w')
+    task['deadline'] = time.time() - 1
+    assert store.finish(task, False, 0.1) == 'expired'
+    assert store.get(task_id)['status'] == 'expired'
+
+
+def test_recover_requeues_or_fails_interrupted_tasks(store):
+    store.add([_task("https://retry/"), _task("https://last/", max_attempts=1), _task("https://idle/")])
+    store.claim('1', 'crashed')
+    store.claim('2', 'crashed')
+    store.add([_task("https://other/", priority=9)])
+    store.claim('3', 'alive')
+    assert store.recover('crashed') == 1
+    assert store.counts() == {'queued': 2, 'failed': 1, 'running': 1}
+    failed, = store.list(status='failed')
+    assert failed['url'] == "https://last/"
+    assert failed['error'] == 'Interrupted by a restart'
+    # The recovered task keeps its attempt count and is claimable again
+    recovered = store.claim('1', 'restarted')
+    assert (recovered['url'], recovered['attempts']) == ("https://retry/", 2)
+
+
+def test_cancel_only_queued_tasks(store):
+    first, second = store.add([_task("https://a/"), _task("https://b/")])
+    store.claim('1', 'w')
+    assert not store.cancel(first)
+    assert store.cancel(second)
+    assert store.get(second)['status'] == 'cancelled'
+    assert store.claim('1', 'w') is None
@@ -0,0 +1,92 @@
+import { useEffect, useState } from 'react';
+import { useQueryClient } from 'react-query';
+import { EVENTS_URL } from '../services/api';
+
+// 断线后的重连间隔（毫秒）
+const RECONNECT_DELAY = 3000;
+
+type Instance = Record<string, any>;
+
+/**
+ * 订阅后端的增量事件推送，直接更新 react-query 缓存中的
+ * 'browserInstances' 和 'systemStats'。
+ *
+ * 连接建立后先收到完整快照，之后只收到变化。返回当前是否已连接，
+ * 页面可据此在推送可用时停止轮询。
+ */
+export function useLiveEvents(): boolean {
+  const queryClient = useQueryClient();
+  const [connected, setConnected] = useState(false);
+
+  useEffect(() => {
+    let socket: WebSocket | null = null;
+    let timer: ReturnType<typeof setTimeout> | undefined;
+    let closed = false;
+
+    const updateInstances = (update: (instances: Instance[]) => Instance[]) => {
+      queryClient.setQueryData<Instance[]>('browserInstances', (old = []) => update(old));
+    };
+
+    const handle = (event: Record<string, any>) => {
+      switch (event.type) {
+        case 'snapshot':
+          queryClient.setQueryData('browserInstances', event.instances);
+          queryClient.setQueryData('systemStats', event.stats);
+          break;
+        case 'instance.created':
+        case 'instance.hibernated':
+          updateInstances((instances) => [
+            ...instances.filter((i) => i.id !== event.instance.id),
+            event.instance,
+          ]);
+          break;
+        case 'instance.navigated':
+        case 'instance.updated':
+          updateInstances((instances) =>
+            instances.map((i) => (i.id === event.id ? { ...i, ...event.changes } : i))
+          );
+          break;
+        case 'instance.crashed':
+          updateInstances((instances) =>
+            instances.map((i) => (i.id === event.id ? { ...i, status: 'crashed' } : i))
+          );
+          break;
+        case 'instance.stopped':
+          updateInstances((instances) => instances.filter((i) => i.id !== event.id));
+          break;
+        case 'metrics':
+          if (Object.keys(event.stats).length > 0) {
+            queryClient.setQueryData<Record<string, any>>('systemStats', (old = {}) => ({
+              ...old,
+              ...event.stats,
+            }));
+          }
+          break;
+      }
+    };
+
+    const connect = () => {
+      socket = new WebSocket(EVENTS_URL);
+      socket.onopen = () => setConnected(true);
+      socket.onmessage = (message) => handle(JSON.parse(message.data));
+      socket.onclose = () => {
+        setConnected(false);
+        // 服务端要求重新同步或连接中断时重连，重连后会收到新的快照
+        if (!closed) {
+          timer = setTimeout(connect, RECONNECT_DELAY);
+        }
+      };
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      clearTimeout(timer);
+      socket?.close();
+    };
+  }, [queryClient]);
+
+  return connected;
+}
+
+export default useLiveEvents;
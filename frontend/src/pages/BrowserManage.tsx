@@ -22,6 +22,7 @@ import {
   LinkOutlined 
 } from '@ant-design/icons';
 import { useQuery, useMutation, useQueryClient } from 'react-query';
+import { useLiveEvents } from '../hooks/useLiveEvents';
 import { 
   fetchBrowserInstances,
   createBrowserInstance,
@@ -40,12 +41,13 @@ const BrowserManageContent: React.FC = () => {
   const [urlForm] = Form.useForm();
   const queryClient = useQueryClient();
 
-  // 获取浏览器实例列表
+  // 获取浏览器实例列表（推送可用时由事件流更新，否则每5秒轮询）
+  const live = useLiveEvents();
   const { data: instances = [], isLoading } = useQuery<BrowserInstance[]>(
     'browserInstances',
     fetchBrowserInstances,
     {
-      refetchInterval: 5000 // 每5秒自动刷新
+      refetchInterval: live ? false : 5000
     }
   );
 
@@ -1,6 +1,7 @@
 import React from 'react';
 import { Card, Statistic, Row, Col, Progress } from 'antd';
 import { useQuery } from 'react-query';
+import { useLiveEvents } from '../hooks/useLiveEvents';
 import { fetchSystemStats, type SystemStats as SystemStatsType } from '../services/api';
 import {
   DesktopOutlined,
@@ -11,11 +12,13 @@ import {
 } from '@ant-design/icons';
 
 const SystemStats: React.FC = () => {
+  // 推送可用时由事件流更新，否则每5秒轮询
+  const live = useLiveEvents();
   const { data: stats, isLoading } = useQuery<SystemStatsType>(
     'systemStats',
     fetchSystemStats,
     {
-      refetchInterval: 5000, // 每5秒自动刷新
+      refetchInterval: live ? false : 5000,
     }
   );
 
@@ -20,14 +20,30 @@ export interface SystemStats {
     diskUsage: number;
 }
 
+export interface MetricsPoint {
+    timestamp: number;
+    cpu_usage: number | null;
+    memory_usage: number | null;
+    disk_usage: number | null;
+    net_sent_rate: number | null;
+    net_recv_rate: number | null;
+}
+
+export interface SystemHistory {
+    interval: number;
+    window: number;
+    points: MetricsPoint[];
+}
+
 export interface BrowserInstance {
     id: string;
-    status: 'running' | 'stopped';
+    status: 'running' | 'stopped' | 'hibernated';
     currentUrl: string;
     startTime: string;
     memoryUsage: number;
     fingerprint: Record<string, any>;
     performance: Record<string, any>;
+    ephemeral?: boolean;
 }
 
 export interface Settings {
@@ -56,6 +72,24 @@ export interface CreateInstanceParams {
     instanceCount: number;
 }
 
+export interface LaunchJobItem {
+    instance_id: string;
+    status: 'pending' | 'launching' | 'running' | 'failed';
+    error?: string | null;
+    started_at?: string | null;
+    finished_at?: string | null;
+    duration?: number | null;
+    retry_after?: number | null;
+}
+
+export interface LaunchJob {
+    job_id: string;
+    status: 'pending' | 'running' | 'completed' | 'partial' | 'failed';
+    created_at: string;
+    finished_at?: string | null;
+    instances: LaunchJobItem[];
+}
+
 export interface VisitUrlParams {
     id: string;
     url: string;
@@ -125,16 +159,29 @@ export const fetchSystemStats = async (): Promise<SystemStats> => {
     return response.data;
 };
 
+export const fetchSystemHistory = async (window = 300, points = 120): Promise<SystemHistory> => {
+    const response = await api.get('/system/history', { params: { window, points } });
+    return response.data;
+};
+
+// 增量事件推送地址（WebSocket）
+export const EVENTS_URL = `${api.defaults.baseURL!.replace(/^http/, 'ws')}/events/ws`;
+
 export const fetchBrowserInstances = async (): Promise<BrowserInstance[]> => {
     const response = await api.get('/browser/instances');
     return response.data;
 };
 
-export const createBrowserInstance = async (params: CreateInstanceParams): Promise<BrowserInstance[]> => {
+export const createBrowserInstance = async (params: CreateInstanceParams): Promise<LaunchJob> => {
     const response = await api.post('/browser/instances', params);
     return response.data;
 };
 
+export const fetchLaunchJob = async (jobId: string): Promise<LaunchJob> => {
+    const response = await api.get(`/browser/jobs/${jobId}`);
+    return response.data;
+};
+
 export const deleteBrowserInstance = async (id: string): Promise<void> => {
     await api.delete(`/browser/instances/${id}`);
 };